@@ -64,6 +64,21 @@ async def show_status():
         exists = path.exists()
         print(f"  {name}: {'OK' if exists else 'MISSING'} ({path})")
 
+    # HTTP response cache (counters accumulate across runs)
+    from integrations.http_cache import get_response_cache
+    print("\nHTTP Response Cache:")
+    cache = get_response_cache()
+    if cache is None:
+        print("  Disabled (CIPHER_HTTP_CACHE=0)")
+        return
+    print(f"  Mode: {'offline replay' if cache.offline else 'online'}")
+    print(f"  Stored responses: {cache.entries():,}")
+    for source, counts in sorted(cache.stats().items()):
+        served = counts.get('hit', 0) + counts.get('stale', 0) + counts.get('revalidated', 0)
+        total = served + counts.get('miss', 0)
+        print(f"  {source:<17} hits {counts.get('hit', 0):>6}  revalidated {counts.get('revalidated', 0):>5}  "
+              f"misses {counts.get('miss', 0):>6}  ({100 * served / total if total else 0:.0f}% served from cache)")
+
 
 async def show_stats():
     """Show knowledge base statistics."""
@@ -144,6 +159,7 @@ async def show_insights(limit: int = 10):
 async def search_claims(query: str, limit: int = 20):
     """Search claims in the knowledge base."""
     import asyncpg
+    from tools.claim_search import search_claims as find_claims
 
     print(f"Searching for: '{query}'")
     print("=" * 50)
@@ -151,15 +167,7 @@ async def search_claims(query: str, limit: int = 20):
     try:
         conn = await asyncpg.connect(config.db.connection_string)
 
-        rows = await conn.fetch("""
-            SELECT c.claim_text, c.claim_type, c.confidence,
-                   s.title as source_title
-            FROM synthesis.claims c
-            JOIN synthesis.sources s ON c.source_id = s.id
-            WHERE LOWER(c.claim_text) LIKE $1
-            ORDER BY c.confidence DESC
-            LIMIT $2
-        """, f"%{query.lower()}%", limit)
+        rows = await find_claims(conn, query, limit)
 
         if not rows:
             print(f"\nNo claims found matching '{query}'")
@@ -169,7 +177,7 @@ async def search_claims(query: str, limit: int = 20):
         for row in rows:
             print(f"[{row['claim_type']}] (conf: {row['confidence']:.2f})")
             print(f"  {row['claim_text'][:150]}...")
-            print(f"  Source: {row['source_title'][:50]}...")
+            print(f"  Source: {(row['source_title'] or 'unknown')[:50]}...")
             print()
 
         await conn.close()
@@ -233,20 +241,32 @@ async def trigger_learn(domain: str):
     print(f"Starting learning session for: {target.name}")
     print("=" * 50)
 
-    brain = CipherBrain(config.db.connection_string)
+    brain = CipherBrain(
+        config.db.connection_string,
+        nlp_processes=config.learning.nlp_processes,
+        nlp_batch_size=config.learning.nlp_batch_size
+    )
     await brain.connect()
 
     learner = DomainLearner(brain, {
         'email': config.api.openalex_email,
+        'fetch_concurrency': config.learning.fetch_concurrency,
+        'extract_workers': config.learning.extract_workers,
+        'fetch_queue_size': config.learning.fetch_queue_size,
+        'persist_queue_size': config.learning.persist_queue_size,
+        'persist_batch_size': config.learning.persist_batch_size,
+        'extract_batch_size': config.learning.extract_batch_size,
     })
 
     try:
         session = await learner.learn_domain(target, max_papers=50)
         print(f"\nResults:")
         print(f"  Papers fetched: {session.papers_fetched}")
+        print(f"  Already known: {session.papers_known}")
         print(f"  Claims extracted: {session.claims_extracted}")
         print(f"  Connections found: {session.connections_found}")
         print(f"  Patterns detected: {session.patterns_detected}")
+        print(f"\nPipeline throughput:\n{session.throughput_report()}")
         if session.errors:
             print(f"  Errors: {len(session.errors)}")
     finally:
@@ -258,30 +278,59 @@ async def trigger_learn(domain: str):
 # SEMANTIC EMBEDDING COMMANDS
 # =========================================================================
 
-async def semantic_search(query: str, limit: int = 20, threshold: float = 0.5):
-    """Semantic search using embeddings."""
-    from tools.cipher_brain import CipherBrain
+async def semantic_search(query: str, limit: int = 20, threshold: float = 0.5,
+                          domains: list = None, rebuild_index: bool = False):
+    """Semantic search using the persistent vector index."""
+    import time
+    from tools.cipher_brain import CipherBrain, Domain
+
+    domain_map = {
+        'math': Domain.MATHEMATICS,
+        'neuro': Domain.NEUROSCIENCES,
+        'bio': Domain.BIOLOGY,
+        'psych': Domain.PSYCHOLOGY,
+        'med': Domain.MEDICINE,
+        'art': Domain.ART,
+    }
+    filter_domains = None
+    if domains:
+        unknown = [d for d in domains if d.lower() not in domain_map]
+        if unknown:
+            print(f"Unknown domain(s): {unknown}")
+            print(f"Available: {list(domain_map.keys())}")
+            return
+        filter_domains = [domain_map[d.lower()] for d in domains]
 
     print(f"Semantic search for: '{query}'")
     print(f"Threshold: {threshold}, Limit: {limit}")
+    if filter_domains:
+        print(f"Domains: {[d.name for d in filter_domains]}")
     print("=" * 50)
 
-    brain = CipherBrain(config.db.connection_string)
+    brain = CipherBrain(config.db.connection_string, index_path=config.paths.index_path)
     await brain.connect()
 
     try:
+        index = await brain.get_vector_index(rebuild=rebuild_index)
+        stats = index.stats()
+        print(f"Index: {stats['vectors']:,} vectors, "
+              f"{'IVF ' + str(stats['lists']) + ' lists' if stats['trained'] else 'flat'}")
+
+        start = time.perf_counter()
         results = await brain.semantic_search_claims(
             query=query,
             limit=limit,
-            threshold=threshold
+            threshold=threshold,
+            domains=filter_domains
         )
+        elapsed = (time.perf_counter() - start) * 1000
 
         if not results:
             print(f"\nNo semantically similar claims found.")
             print("Try lowering the threshold with --threshold 0.3")
             return
 
-        print(f"\nFound {len(results)} similar claims:\n")
+        print(f"\nFound {len(results)} similar claims in {elapsed:.1f}ms:\n")
         for claim_id, claim_text, similarity in results:
             print(f"[{similarity:.3f}] (ID: {claim_id})")
             print(f"  {claim_text[:150]}...")
@@ -291,8 +340,8 @@ async def semantic_search(query: str, limit: int = 20, threshold: float = 0.5):
         await brain.close()
 
 
-async def embed_backfill(batch_size: int = 100, limit: int = None):
-    """Backfill embeddings for existing claims."""
+async def embed_backfill(batch_size: int = 100, limit: int = None, restart: bool = False):
+    """Backfill embeddings for existing claims (resumes an interrupted run)."""
     from tools.cipher_brain import CipherBrain
 
     print("Backfilling embeddings for existing claims")
@@ -302,16 +351,42 @@ async def embed_backfill(batch_size: int = 100, limit: int = None):
     await brain.connect()
 
     try:
-        updated = await brain.embed_existing_claims(
+        result = await brain.embed_existing_claims(
             batch_size=batch_size,
-            limit=limit
+            limit=limit,
+            resume=not restart
         )
-        print(f"\nCompleted! Updated {updated} claims with embeddings.")
+        if result.resumed_from:
+            print(f"Resumed after claim {result.resumed_from}")
+        print(f"\nCompleted! Updated {result.updated:,} claims with embeddings "
+              f"in {result.seconds:.1f}s ({result.rate:.1f} claims/sec).")
+        if not result.completed:
+            print(f"Stopped at claim {result.last_id}; run again to continue.")
+        if result.errors:
+            print(f"{len(result.errors)} batches failed and will be retried on the next full run.")
 
     finally:
         await brain.close()
 
 
+async def index_entities():
+    """Post claims missing from the entity index (synthesis.claim_entities)."""
+    import asyncpg
+    from tools.entity_index import EntityIndex
+
+    print("Indexing claim entities")
+    print("=" * 50)
+
+    pool = await asyncpg.create_pool(config.db.connection_string, min_size=1, max_size=1)
+    try:
+        added = await EntityIndex.backfill(pool)
+        print(f"\nAdded {added:,} entity postings.")
+    except (asyncpg.UndefinedTableError, asyncpg.UndefinedFunctionError):
+        print("\nEntity index not set up; apply sql/migrations/003_entity_index.sql first.")
+    finally:
+        await pool.close()
+
+
 async def find_bridges(threshold: float = 0.75, limit: int = 20):
     """Find cross-domain connections using embedding similarity."""
     from tools.cipher_brain import CipherBrain
@@ -405,6 +480,9 @@ async def embedding_stats():
         service = get_embedding_service()
         print(f"\nEmbedding Model: {service.model_name}")
         print(f"Dimensions: {service.dimensions}")
+        cache = service.cache_stats()
+        if cache:
+            print(f"Cache entries: {cache['entries']:,} / {cache['capacity']:,}")
 
         await conn.close()
 
@@ -866,11 +944,21 @@ async def active_learn(strategy: str = 'ucb', max_papers: int = 50):
     learner = ActiveLearner(config.db.connection_string)
     await learner.connect()
 
-    brain = CipherBrain(config.db.connection_string)
+    brain = CipherBrain(
+        config.db.connection_string,
+        nlp_processes=config.learning.nlp_processes,
+        nlp_batch_size=config.learning.nlp_batch_size
+    )
     await brain.connect()
 
     domain_learner = DomainLearner(brain, {
         'email': config.api.openalex_email,
+        'fetch_concurrency': config.learning.fetch_concurrency,
+        'extract_workers': config.learning.extract_workers,
+        'fetch_queue_size': config.learning.fetch_queue_size,
+        'persist_queue_size': config.learning.persist_queue_size,
+        'persist_batch_size': config.learning.persist_batch_size,
+        'extract_batch_size': config.learning.extract_batch_size,
     })
 
     try:
@@ -949,14 +1037,14 @@ async def active_learn(strategy: str = 'ucb', max_papers: int = 50):
 # GRAPH ENGINE COMMANDS
 # =========================================================================
 
-async def graph_stats():
+async def graph_stats(backend: str = 'auto'):
     """Show knowledge graph statistics."""
     from tools.graph_engine import GraphEngine
 
     print("Knowledge Graph Statistics")
     print("=" * 60)
 
-    engine = GraphEngine(config.db.connection_string)
+    engine = GraphEngine(config.db.connection_string, backend)
     await engine.connect()
 
     try:
@@ -976,14 +1064,15 @@ async def graph_stats():
         await engine.close()
 
 
-async def find_path(source_id: int, target_id: int, path_type: str = 'shortest'):
+async def find_path(source_id: int, target_id: int, path_type: str = 'shortest',
+                    backend: str = 'auto'):
     """Find path between two claims."""
     from tools.graph_engine import GraphEngine
 
     print(f"Finding {path_type} path from claim {source_id} to {target_id}")
     print("=" * 60)
 
-    engine = GraphEngine(config.db.connection_string)
+    engine = GraphEngine(config.db.connection_string, backend)
     await engine.connect()
 
     try:
@@ -1017,13 +1106,14 @@ async def find_path(source_id: int, target_id: int, path_type: str = 'shortest')
         conn = await asyncpg.connect(config.db.connection_string)
         try:
             print("\nClaims in path:")
+            rows = await conn.fetch(
+                "SELECT id, claim_text FROM synthesis.claims WHERE id = ANY($1::int[])",
+                path.nodes
+            )
+            texts = {row['id']: row['claim_text'] for row in rows}
             for i, node_id in enumerate(path.nodes):
-                row = await conn.fetchrow(
-                    "SELECT claim_text FROM synthesis.claims WHERE id = $1",
-                    node_id
-                )
-                if row:
-                    print(f"  {i+1}. [{node_id}] {row['claim_text'][:80]}...")
+                if node_id in texts:
+                    print(f"  {i+1}. [{node_id}] {texts[node_id][:80]}...")
         finally:
             await conn.close()
 
@@ -1031,19 +1121,28 @@ async def find_path(source_id: int, target_id: int, path_type: str = 'shortest')
         await engine.close()
 
 
-async def centrality(metric: str = 'pagerank', limit: int = 20):
+async def centrality(metric: str = 'pagerank', limit: int = 20, recompute: bool = False,
+                     backend: str = 'auto'):
     """Show top claims by centrality metric."""
     from tools.graph_engine import GraphEngine
 
     print(f"Top Claims by {metric.title()} Centrality")
     print("=" * 60)
 
-    engine = GraphEngine(config.db.connection_string)
+    engine = GraphEngine(config.db.connection_string, backend)
     await engine.connect()
 
     try:
-        await engine.load_graph()
-        top_nodes = engine.get_top_nodes_by_centrality(metric, limit)
+        # Stored scores are served without loading the graph when current
+        top_nodes = None
+        if metric != 'degree' and not recompute:
+            top_nodes = await engine.get_stored_centrality(metric, limit)
+
+        if top_nodes is None:
+            await engine.load_graph()
+            if metric != 'degree':
+                await engine.refresh_scores(metric, full=recompute)
+            top_nodes = engine.get_top_nodes_by_centrality(metric, limit)
 
         if not top_nodes:
             print("\nNo nodes found in graph.")
@@ -1059,7 +1158,7 @@ async def centrality(metric: str = 'pagerank', limit: int = 20):
         await engine.close()
 
 
-async def communities(limit: int = 20):
+async def communities(limit: int = 20, backend: str = 'auto'):
     """Detect and show knowledge communities."""
     from tools.graph_engine import GraphEngine
     from tools.cipher_brain import Domain
@@ -1067,7 +1166,7 @@ async def communities(limit: int = 20):
     print("Knowledge Graph Communities")
     print("=" * 60)
 
-    engine = GraphEngine(config.db.connection_string)
+    engine = GraphEngine(config.db.connection_string, backend)
     await engine.connect()
 
     try:
@@ -1100,7 +1199,8 @@ async def communities(limit: int = 20):
         await engine.close()
 
 
-async def domain_bridges(domain_a: str, domain_b: str, limit: int = 10):
+async def domain_bridges(domain_a: str, domain_b: str, limit: int = 10, use_cte: bool = False,
+                         backend: str = 'auto'):
     """Find paths bridging two domains."""
     from tools.graph_engine import GraphEngine
     from tools.cipher_brain import Domain
@@ -1124,11 +1224,15 @@ async def domain_bridges(domain_a: str, domain_b: str, limit: int = 10):
     print(f"Finding paths between {da.name} and {db.name}")
     print("=" * 60)
 
-    engine = GraphEngine(config.db.connection_string)
+    engine = GraphEngine(config.db.connection_string, backend)
     await engine.connect()
 
     try:
-        paths = await engine.find_domain_bridges(da.value, db.value)
+        if use_cte:
+            paths = await engine.find_domain_bridges(da.value, db.value)
+        else:
+            await engine.load_graph()
+            paths = engine.find_domain_bridges_memory(da.value, db.value, limit)
 
         if not paths:
             print(f"\nNo paths found bridging {da.name} and {db.name}")
@@ -1391,6 +1495,7 @@ async def llm_analogies(domain_a: str, domain_b: str, num: int = 5):
 async def llm_synthesis(topic: str):
     """Generate a synthesis report using LLM."""
     from tools.llm_integration import LLMIntegration, LLMConfig
+    from tools.claim_search import search_claims as find_claims
     import asyncpg
 
     print(f"Generating synthesis report on: {topic}")
@@ -1400,13 +1505,7 @@ async def llm_synthesis(topic: str):
         conn = await asyncpg.connect(config.db.connection_string)
 
         # Search for relevant claims
-        claims = await conn.fetch("""
-            SELECT claim_text, claim_type, domains, confidence
-            FROM synthesis.claims
-            WHERE LOWER(claim_text) LIKE $1
-            ORDER BY confidence DESC
-            LIMIT 50
-        """, f"%{topic.lower()}%")
+        claims = await find_claims(conn, topic, limit=50)
 
         patterns = await conn.fetch("""
             SELECT pattern_name, pattern_type, description, confidence, novelty_score
@@ -1585,6 +1684,9 @@ LLM Integration Commands:
         """
     )
 
+    parser.add_argument('--offline', action='store_true',
+                        help='Serve API requests from the HTTP cache only (deterministic replay)')
+
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
     # Status
@@ -1619,15 +1721,23 @@ LLM Integration Commands:
     sem_search.add_argument('query', help='Natural language query')
     sem_search.add_argument('-n', type=int, default=20, help='Max results')
     sem_search.add_argument('--threshold', type=float, default=0.5, help='Similarity threshold (0-1)')
+    sem_search.add_argument('--domain', action='append', default=None,
+                            help='Restrict to domain (math, neuro, bio, psych, med, art); repeatable')
+    sem_search.add_argument('--rebuild-index', action='store_true', help='Rebuild the vector index first')
 
     # Embed Backfill
     backfill = subparsers.add_parser('embed-backfill', help='Generate embeddings for existing claims')
     backfill.add_argument('--batch-size', type=int, default=100, help='Batch size')
     backfill.add_argument('--limit', type=int, default=None, help='Max claims to process')
+    backfill.add_argument('--restart', action='store_true',
+                          help='Ignore the checkpoint of an interrupted run')
 
     # Embedding Stats
     subparsers.add_parser('embed-stats', help='Show embedding statistics')
 
+    # Entity Index Backfill
+    subparsers.add_parser('index-entities', help='Index entities of claims missing from the entity index')
+
     # Find Bridges
     bridges = subparsers.add_parser('find-bridges', help='Find cross-domain connections via embeddings')
     bridges.add_argument('--threshold', type=float, default=0.75, help='Similarity threshold')
@@ -1713,8 +1823,13 @@ LLM Integration Commands:
     # GRAPH ENGINE COMMANDS
     # =========================================================================
 
+    # In-memory graph backend for the analysis commands
+    backend_help = "Graph backend: dict, csr (compact arrays), or auto (csr for large graphs)"
+
     # Graph Stats
-    subparsers.add_parser('graph-stats', help='Show knowledge graph statistics')
+    stats_parser = subparsers.add_parser('graph-stats', help='Show knowledge graph statistics')
+    stats_parser.add_argument('--backend', type=str, default='auto',
+                             choices=['dict', 'csr', 'auto'], help=backend_help)
 
     # Find Path
     path_parser = subparsers.add_parser('find-path', help='Find path between two claims')
@@ -1723,6 +1838,8 @@ LLM Integration Commands:
     path_parser.add_argument('--type', type=str, default='shortest',
                             choices=['shortest', 'strongest', 'cross_domain', 'cte'],
                             help='Path type')
+    path_parser.add_argument('--backend', type=str, default='auto',
+                            choices=['dict', 'csr', 'auto'], help=backend_help)
 
     # All Paths
     all_paths_parser = subparsers.add_parser('all-paths', help='Find all paths between two claims')
@@ -1737,16 +1854,26 @@ LLM Integration Commands:
                             choices=['pagerank', 'betweenness', 'degree', 'clustering'],
                             help='Centrality metric')
     cent_parser.add_argument('-n', type=int, default=20, help='Max results')
+    cent_parser.add_argument('--recompute', action='store_true',
+                            help='Ignore stored scores and recompute from scratch')
+    cent_parser.add_argument('--backend', type=str, default='auto',
+                            choices=['dict', 'csr', 'auto'], help=backend_help)
 
     # Communities
     comm_parser = subparsers.add_parser('communities', help='Detect knowledge communities')
     comm_parser.add_argument('-n', type=int, default=20, help='Max communities to show')
+    comm_parser.add_argument('--backend', type=str, default='auto',
+                            choices=['dict', 'csr', 'auto'], help=backend_help)
 
     # Graph Bridges
     bridges_parser = subparsers.add_parser('graph-bridges', help='Find paths bridging two domains')
     bridges_parser.add_argument('domain_a', type=str, help='First domain (math/neuro/bio/psych/med/art)')
     bridges_parser.add_argument('domain_b', type=str, help='Second domain')
     bridges_parser.add_argument('-n', type=int, default=10, help='Max paths to show')
+    bridges_parser.add_argument('--cte', action='store_true',
+                               help='Search in the database instead of loading the graph')
+    bridges_parser.add_argument('--backend', type=str, default='auto',
+                               choices=['dict', 'csr', 'auto'], help=backend_help)
 
     # Graph Hubs
     hubs_parser = subparsers.add_parser('graph-hubs', help='Find cross-domain hub claims')
@@ -1781,6 +1908,10 @@ LLM Integration Commands:
 
     args = parser.parse_args()
 
+    if args.offline:
+        # Read when the first API client creates the response cache
+        os.environ['CIPHER_HTTP_OFFLINE'] = '1'
+
     if args.command == 'status':
         asyncio.run(show_status())
     elif args.command == 'stats':
@@ -1795,11 +1926,14 @@ LLM Integration Commands:
         asyncio.run(show_thoughts(args.n))
     # Semantic Embedding Commands
     elif args.command == 'semantic-search':
-        asyncio.run(semantic_search(args.query, args.n, args.threshold))
+        asyncio.run(semantic_search(args.query, args.n, args.threshold,
+                                    args.domain, args.rebuild_index))
     elif args.command == 'embed-backfill':
-        asyncio.run(embed_backfill(args.batch_size, args.limit))
+        asyncio.run(embed_backfill(args.batch_size, args.limit, args.restart))
     elif args.command == 'embed-stats':
         asyncio.run(embedding_stats())
+    elif args.command == 'index-entities':
+        asyncio.run(index_entities())
     elif args.command == 'find-bridges':
         asyncio.run(find_bridges(args.threshold, args.n))
     elif args.command == 'similar':
@@ -1841,17 +1975,17 @@ LLM Integration Commands:
         asyncio.run(active_learn(args.strategy, args.max_papers))
     # Graph Engine Commands
     elif args.command == 'graph-stats':
-        asyncio.run(graph_stats())
+        asyncio.run(graph_stats(args.backend))
     elif args.command == 'find-path':
-        asyncio.run(find_path(args.source, args.target, args.type))
+        asyncio.run(find_path(args.source, args.target, args.type, args.backend))
     elif args.command == 'all-paths':
         asyncio.run(all_paths(args.source, args.target, args.max_depth, args.n))
     elif args.command == 'centrality':
-        asyncio.run(centrality(args.metric, args.n))
+        asyncio.run(centrality(args.metric, args.n, args.recompute, args.backend))
     elif args.command == 'communities':
-        asyncio.run(communities(args.n))
+        asyncio.run(communities(args.n, args.backend))
     elif args.command == 'graph-bridges':
-        asyncio.run(domain_bridges(args.domain_a, args.domain_b, args.n))
+        asyncio.run(domain_bridges(args.domain_a, args.domain_b, args.n, args.cte, args.backend))
     elif args.command == 'graph-hubs':
         asyncio.run(cross_domain_hubs(args.min_domains, args.n))
     # LLM Integration Commands
@@ -122,6 +122,20 @@ class LearningConfig:
     min_pattern_claims: int = 3
     min_pattern_confidence: float = 0.6
 
+    # Ingest pipeline (fetch -> extract -> persist)
+    fetch_concurrency: int = 8       # HTTP requests in flight across all sources
+    extract_workers: int = 4         # Concurrent NLP + embedding workers
+    fetch_queue_size: int = 200      # Papers buffered ahead of extraction
+    persist_queue_size: int = 50     # Extracted papers buffered ahead of writes
+    persist_batch_size: int = 50     # Papers per batch writer flush
+    extract_batch_size: int = 16     # Papers per extraction worker call
+
+    # spaCy extraction runs in worker processes (0 = in the main process,
+    # on a worker thread). Each process loads its own model, so the default
+    # stays small.
+    nlp_processes: int = int(os.getenv("CIPHER_NLP_PROCESSES", str(min(2, os.cpu_count() or 1))))
+    nlp_batch_size: int = 32         # Documents per nlp.pipe batch
+
 
 @dataclass
 class PathConfig:
@@ -148,6 +162,14 @@ class PathConfig:
     def logs_path(self) -> Path:
         return self.base_path / "logs"
 
+    @property
+    def data_path(self) -> Path:
+        return self.base_path / "data"
+
+    @property
+    def index_path(self) -> Path:
+        return self.data_path / "index" / "claims.npz"
+
 
 @dataclass
 class CipherConfig:
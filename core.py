@@ -276,6 +276,7 @@ class DB:
     def __init__(self, url: str = DB_URL):
         self.url = url
         self.pool = None
+        self.entity_index = True  # False without migration 003
 
     async def connect(self):
         if HAS_ASYNCPG:
@@ -310,6 +311,101 @@ class DB:
         ''', claim.source_id, claim.text, claim.ctype, claim.confidence,
             "moderate", claim.domains, json.dumps(claim.entities), claim.hash)
 
+    async def save_claims(self, claims: list) -> list:
+        """Bulk insert claims, dedup on entropy_hash. Returns ids in input order."""
+        if not self.pool or not claims:
+            return [0] * len(claims)
+        hashes = list({c.hash for c in claims})
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch('''
+                    SELECT entropy_hash, MIN(id) AS id FROM synthesis.claims
+                    WHERE entropy_hash = ANY($1) GROUP BY entropy_hash
+                ''', hashes)
+                ids = {r['entropy_hash']: r['id'] for r in rows}
+
+                new = list({c.hash: c for c in claims if c.hash not in ids}.values())
+                if new:
+                    # One multi-row INSERT; domains go through text since
+                    # unnest() would flatten a 2-D int array
+                    rows = await conn.fetch('''
+                        INSERT INTO synthesis.claims (source_id, claim_text, claim_type,
+                            confidence, evidence_strength, domains, entities, entropy_hash)
+                        SELECT s, t, ct, cf, 'moderate', d::int[], e::jsonb, h
+                        FROM unnest($1::int[], $2::text[], $3::text[], $4::float8[],
+                                    $5::text[], $6::text[], $7::text[]) AS u(s, t, ct, cf, d, e, h)
+                        RETURNING id, entropy_hash
+                    ''', [c.source_id for c in new], [c.text for c in new],
+                        [c.ctype for c in new], [c.confidence for c in new],
+                        ['{' + ','.join(str(d) for d in c.domains) + '}' for c in new],
+                        [json.dumps(c.entities) for c in new], [c.hash for c in new])
+                    ids.update({r['entropy_hash']: r['id'] for r in rows})
+        return [ids[c.hash] for c in claims]
+
+    async def index_entities(self, ids: list, claims: list):
+        """Post claims in synthesis.claim_entities (entity -> claim index)"""
+        if not self.pool or not self.entity_index:
+            return
+        rows = {(e.strip().lower(), cid) for cid, c in zip(ids, claims) for e in c.entities if e.strip()}
+        if rows:
+            try:
+                await self.pool.executemany('''
+                    INSERT INTO synthesis.claim_entities (entity, claim_id) VALUES ($1, $2)
+                    ON CONFLICT DO NOTHING
+                ''', list(rows))
+            except asyncpg.UndefinedTableError:
+                self.no_entity_index()
+
+    def no_entity_index(self):
+        print("[!] synthesis.claim_entities missing (migration 003), scanning claims for entities")
+        self.entity_index = False
+
+    # Postings read from the claims' JSON when the index table is missing (full scan)
+    SCANNED_ENTITIES = '''(
+        SELECT DISTINCT c.id AS claim_id, LOWER(BTRIM(e)) AS entity
+        FROM synthesis.claims c, jsonb_array_elements_text(c.entities) AS e
+        WHERE jsonb_typeof(c.entities) = 'array' AND BTRIM(e) <> ''
+    )'''
+
+    async def entity_matches(self, ids: list, per_claim: int = 500) -> list:
+        """
+        Claims sharing entities with each of ids, via the entity index.
+        Returns (new_id, old_id, overlap, old_domains), most overlap first.
+        """
+        if not self.pool or not ids:
+            return []
+        postings = "synthesis.claim_entities" if self.entity_index else self.SCANNED_ENTITIES
+        try:
+            rows = await self.pool.fetch(f'''
+                SELECT new_id, old_id, overlap, domains FROM (
+                    SELECT a.claim_id AS new_id, b.claim_id AS old_id, COUNT(*) AS overlap,
+                           ROW_NUMBER() OVER (PARTITION BY a.claim_id ORDER BY COUNT(*) DESC) AS rank
+                    FROM {postings} a
+                    JOIN {postings} b ON b.entity = a.entity AND b.claim_id <> a.claim_id
+                    WHERE a.claim_id = ANY($1)
+                    GROUP BY a.claim_id, b.claim_id
+                ) m
+                JOIN synthesis.claims c ON c.id = m.old_id
+                WHERE rank <= $2
+            ''', list(set(ids)), per_claim)
+        except asyncpg.UndefinedTableError:
+            if not self.entity_index:
+                raise
+            self.no_entity_index()
+            return await self.entity_matches(ids, per_claim)
+        return [(r['new_id'], r['old_id'], r['overlap'], r['domains']) for r in rows]
+
+    async def save_connections(self, rows: list):
+        """Bulk insert (src, tgt, ctype, strength, cross) tuples."""
+        if not self.pool or not rows:
+            return
+        await self.pool.executemany('''
+            INSERT INTO synthesis.connections (source_claim_id, target_claim_id, connection_type,
+                strength, cross_domain, reasoning, discovered_by)
+            VALUES ($1, $2, $3, $4, $5, 'entity_match', 'cipher_core')
+            ON CONFLICT DO NOTHING
+        ''', rows)
+
     async def save_connection(self, src: int, tgt: int, ctype: str, strength: float, cross: bool):
         if not self.pool:
             return
@@ -365,7 +461,7 @@ class Brain:
         papers = fetch_papers(query, limit)
         print(f"[+] Fetched {len(papers)} papers for '{query}'")
 
-        new_claims = []
+        pending = []
         for paper in papers:
             if not paper.abstract:
                 continue
@@ -373,34 +469,29 @@ class Brain:
             # Save source
             src_id = await self.db.save_source(paper)
 
-            # Extract and save claims
+            # Extract claims, saved below in one batch
             claims = extract_claims(paper.title, paper.abstract, paper.domains)
             for claim in claims:
                 claim.source_id = src_id
-                claim_id = await self.db.save_claim(claim)
-                new_claims.append((claim_id, claim))
+                pending.append(claim)
+
+        ids = await self.db.save_claims(pending)
+        new_claims = list(zip(ids, pending))
 
         print(f"[+] Extracted {len(new_claims)} claims")
 
-        # Find connections
-        existing = await self.db.get_claims(500)
-        connections = 0
-
-        for new_id, new_claim in new_claims:
-            for old_id, old_text, old_domains, old_entities in existing:
-                if new_id == old_id:
-                    continue
-
-                # Entity overlap
-                new_ent = set(e.lower() for e in new_claim.entities)
-                old_ent = set(e.lower() for e in old_entities)
-                overlap = new_ent & old_ent
-
-                if overlap:
-                    cross = set(new_claim.domains) != set(old_domains)
-                    strength = min(0.9, 0.3 + len(overlap) * 0.15)
-                    await self.db.save_connection(old_id, new_id, "supports", strength, cross)
-                    connections += 1
+        # Find connections: candidates are claims sharing an entity (whole corpus)
+        await self.db.index_entities(ids, pending)
+        domains = {new_id: set(c.domains or []) for new_id, c in new_claims}
+        links = []
+
+        for new_id, old_id, overlap, old_domains in await self.db.entity_matches(ids):
+            cross = domains[new_id] != set(old_domains or [])
+            strength = min(0.9, 0.3 + overlap * 0.15)
+            links.append((old_id, new_id, "supports", strength, cross))
+
+        await self.db.save_connections(links)
+        connections = len(links)
 
         print(f"[+] Found {connections} connections")
         return len(new_claims), connections
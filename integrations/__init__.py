@@ -3,11 +3,13 @@ CIPHER API Integrations
 Academic paper sources: OpenAlex, arXiv, PubMed, Semantic Scholar
 """
 
-from .base import AcademicSource, Paper
+from .base import AcademicSource, Paper, RequestStats
 from .openalex import OpenAlexClient
 from .arxiv import ArxivClient
 from .pubmed import PubMedClient
 from .semantic_scholar import SemanticScholarClient
+from .scheduler import FetchJob, FetchScheduler, FetchStats
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
 
 __all__ = [
     'AcademicSource',
@@ -16,4 +18,11 @@ __all__ = [
     'ArxivClient',
     'PubMedClient',
     'SemanticScholarClient',
+    'RequestStats',
+    'FetchJob',
+    'FetchScheduler',
+    'FetchStats',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'RetryPolicy',
 ]
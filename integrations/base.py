@@ -4,12 +4,22 @@ Base classes for academic API integrations
 
 import asyncio
 import aiohttp
+import contextvars
+import json
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any, AsyncIterator
+from typing import Optional, List, Dict, Any, AsyncIterator, Mapping, Tuple
 from enum import Enum
 import logging
+from urllib.parse import urlparse
+
+from .http_cache import CacheMiss, CachedResponse, ResponseCache, cache_key, get_response_cache
+from .resilience import (
+    RETRYABLE_ERRORS, CircuitBreaker, CircuitOpenError, RetryPolicy,
+    get_circuit_breaker, parse_retry_after
+)
 
 logger = logging.getLogger(__name__)
 
@@ -89,21 +99,87 @@ class Paper:
         }
 
 
+@dataclass
+class Page:
+    """One page of search results"""
+    papers: List[Paper]
+    cursor: Any = None  # Continuation for the next page; None on the last page
+
+
+@dataclass
+class RequestStats:
+    """Where one source's request time went"""
+    requests: int = 0
+    errors: int = 0
+    rate_wait_seconds: float = 0.0   # Waiting for a token bucket
+    slot_wait_seconds: float = 0.0   # Waiting for the global in-flight cap
+    network_seconds: float = 0.0     # Request sent until body read
+    backoff_seconds: float = 0.0     # Sleeping between retries
+    retries: int = 0
+    throttled: int = 0               # 429 responses
+    cached: int = 0                  # Served from the response cache
+
+    def add(self, other: 'RequestStats'):
+        self.requests += other.requests
+        self.errors += other.errors
+        self.backoff_seconds += other.backoff_seconds
+        self.retries += other.retries
+        self.throttled += other.throttled
+        self.cached += other.cached
+        self.rate_wait_seconds += other.rate_wait_seconds
+        self.slot_wait_seconds += other.slot_wait_seconds
+        self.network_seconds += other.network_seconds
+
+
+@dataclass
+class RequestScope:
+    """
+    Per-task request accounting, set by FetchScheduler.
+
+    ``stats`` is keyed by source type value. ``slots`` caps requests in
+    flight across every source sharing the scope.
+    """
+    stats: Dict[str, RequestStats] = field(default_factory=dict)
+    slots: Optional[asyncio.Semaphore] = None
+
+
+# Scope of the running task; inherited by tasks it creates
+request_scope: contextvars.ContextVar[Optional[RequestScope]] = contextvars.ContextVar(
+    'request_scope', default=None
+)
+
+
 class RateLimiter:
     """
     Token bucket rate limiter for API calls.
+
+    The rate adapts to server pushback: slow_down() halves it (and can hold
+    every request for a Retry-After delay), speed_up() climbs back towards
+    the configured rate a step at a time.
     """
 
+    # Floor for slow_down(), as a fraction of the configured rate
+    MIN_RATE_FRACTION = 0.1
+    # Fraction of the configured rate regained per successful request
+    RECOVERY_STEP = 0.05
+
     def __init__(self, requests_per_second: float):
+        self.max_rate = requests_per_second
         self.rate = requests_per_second
         self.tokens = requests_per_second
         self.last_update = asyncio.get_event_loop().time() if asyncio.get_event_loop().is_running() else 0
+        self.blocked_until = 0.0
         self._lock = asyncio.Lock()
 
-    async def acquire(self):
-        """Wait until a request can be made."""
+    async def acquire(self) -> float:
+        """Wait until a request can be made. Returns the seconds waited."""
+        started = asyncio.get_event_loop().time()
         async with self._lock:
             now = asyncio.get_event_loop().time()
+            if self.blocked_until > now:
+                # No refill while the server asked us to hold off
+                await asyncio.sleep(self.blocked_until - now)
+                now = self.last_update = asyncio.get_event_loop().time()
             elapsed = now - self.last_update
             self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
             self.last_update = now
@@ -111,9 +187,25 @@ class RateLimiter:
             if self.tokens < 1:
                 wait_time = (1 - self.tokens) / self.rate
                 await asyncio.sleep(wait_time)
+                # The slept interval paid for this token; don't refill from it
+                self.last_update = asyncio.get_event_loop().time()
                 self.tokens = 0
             else:
                 self.tokens -= 1
+        return asyncio.get_event_loop().time() - started
+
+    def slow_down(self, retry_after: Optional[float] = None):
+        """Halve the rate after a 429, pausing for ``retry_after`` seconds if given."""
+        self.rate = max(self.max_rate * self.MIN_RATE_FRACTION, self.rate / 2)
+        self.tokens = min(self.tokens, 0)
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, asyncio.get_event_loop().time() + retry_after)
+        logger.warning(f"Rate limited, slowing to {self.rate:.2f} requests/s")
+
+    def speed_up(self):
+        """Recover part of the configured rate after a successful request."""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.RECOVERY_STEP)
 
 
 class AcademicSource(ABC):
@@ -131,8 +223,15 @@ class AcademicSource(ABC):
     ):
         self.base_url = base_url.rstrip('/')
         self.rate_limiter = RateLimiter(requests_per_second)
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker: CircuitBreaker = get_circuit_breaker(urlparse(self.base_url).netloc)
+        # Requests that failed for good (after retries); lets stream() tell
+        # an error swallowed by search() from the end of the results
+        self.failed_requests = 0
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self._session: Optional[aiohttp.ClientSession] = None
+        # GET response cache (None = always hit the network)
+        self.cache: Optional[ResponseCache] = get_response_cache()
 
     @property
     @abstractmethod
@@ -160,35 +259,200 @@ class AcademicSource(ABC):
         if self._session and not self._session.closed:
             await self._session.close()
 
-    async def _get(self, url: str, params: Optional[Dict] = None) -> Dict:
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json_body: Optional[Any] = None,
+        as_text: bool = False,
+        use_cache: bool = True
+    ) -> Any:
         """
-        Make a rate-limited GET request.
+        Make a rate-limited request and return the decoded body.
+
+        GET requests go through the response cache unless ``use_cache`` is
+        False: fresh entries are returned without a request, stale ones are
+        revalidated with their ETag / Last-Modified, and in offline mode
+        nothing is sent at all. ``use_cache=False`` only skips the cache;
+        offline mode still refuses the request with CacheMiss.
+        """
+        source = self.source_type.value
+        cache = self.cache if method == 'GET' else None
+        entry: Optional[CachedResponse] = None
+
+        if cache is not None and not use_cache:
+            if cache.offline:
+                cache.record(source, 'miss')
+                raise CacheMiss(f"Not cacheable (offline mode): {url}")
+            cache = None
+
+        if cache is not None:
+            key = cache_key(method, url, params)
+            entry = await asyncio.to_thread(cache.lookup, key)
+            if entry is not None and (entry.fresh or cache.offline):
+                cache.record(source, 'hit' if entry.fresh else 'stale')
+                self._record(RequestStats(cached=1))
+                return entry.body if as_text else json.loads(entry.body)
+            if cache.offline:
+                cache.record(source, 'miss')
+                raise CacheMiss(f"Not cached (offline mode): {url}")
+
+        status, body, headers = await self._send(
+            method, url, params, json_body,
+            headers=entry.conditional_headers() if entry is not None else None
+        )
+
+        if cache is not None:
+            if status == 304 and entry is not None:
+                await asyncio.to_thread(cache.refresh, source, entry)
+                cache.record(source, 'revalidated')
+                body = entry.body
+            else:
+                await asyncio.to_thread(
+                    cache.store, source, key, url, body, headers.get('ETag'), headers.get('Last-Modified')
+                )
+                cache.record(source, 'miss')
+
+        return body if as_text else json.loads(body)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json_body: Optional[Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str, Mapping[str, str]]:
         """
-        await self.rate_limiter.acquire()
+        Send a request, retrying transient failures; returns (status, body, headers).
+
+        Connection errors, timeouts, 429 and 5xx responses are retried with
+        jittered exponential backoff. A 429 slows the rate limiter down and
+        waits at least its Retry-After. 5xx and connection failures count
+        towards the host's circuit breaker; while it is open this raises
+        CircuitOpenError without sending anything.
+        """
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+
+        for attempt in range(policy.max_attempts):
+            final = attempt == policy.max_attempts - 1
+            try:
+                breaker.check()
+            except CircuitOpenError:
+                self.failed_requests += 1
+                raise
+            try:
+                status, body, response_headers = await self._attempt(
+                    method, url, params, json_body, headers, raise_retryable=final
+                )
+            except RETRYABLE_ERRORS as e:
+                breaker.failure()
+                if final:
+                    self.failed_requests += 1
+                    logger.error(f"API request failed after {policy.max_attempts} attempts: {url} - {e!r}")
+                    raise
+                delay = policy.delay(attempt)
+                logger.warning(f"Request to {url} failed ({e!r}), retrying in {delay:.1f}s")
+            except aiohttp.ClientResponseError as e:
+                if e.status >= 500:
+                    breaker.failure()
+                elif e.status == 429:
+                    self.rate_limiter.slow_down(parse_retry_after((e.headers or {}).get('Retry-After')))
+                else:
+                    breaker.success()
+                self.failed_requests += 1
+                logger.error(f"API request failed: {url} - {e}")
+                raise
+            else:
+                if status not in policy.retry_statuses:
+                    breaker.success()
+                    self.rate_limiter.speed_up()
+                    return status, body, response_headers
+                delay = policy.delay(attempt)
+                if status == 429:
+                    retry_after = parse_retry_after(response_headers.get('Retry-After'))
+                    self.rate_limiter.slow_down(retry_after)
+                    delay = max(delay, retry_after or 0.0)
+                    self._record(RequestStats(throttled=1))
+                else:
+                    breaker.failure()
+                logger.warning(f"{url} returned {status}, retrying in {delay:.1f}s")
+
+            self._record(RequestStats(retries=1, backoff_seconds=delay))
+            await asyncio.sleep(delay)
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json_body: Optional[Any],
+        headers: Optional[Dict[str, str]],
+        raise_retryable: bool
+    ) -> Tuple[int, str, Mapping[str, str]]:
+        """
+        One request after the rate limiter.
+
+        Retryable statuses are returned rather than raised unless
+        ``raise_retryable``. Time spent on the token bucket, on the in-flight
+        cap of the current RequestScope and on the network is recorded in
+        that scope.
+        """
+        loop = asyncio.get_event_loop()
+        scope = request_scope.get()
+        stats = RequestStats(requests=1)
+
+        stats.rate_wait_seconds = await self.rate_limiter.acquire()
         session = await self.get_session()
 
+        queued = loop.time()
         try:
-            async with session.get(url, params=params) as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientError as e:
-            logger.error(f"API request failed: {url} - {e}")
+            async with scope.slots if scope and scope.slots else nullcontext():
+                sent = loop.time()
+                stats.slot_wait_seconds = sent - queued
+                try:
+                    async with session.request(
+                        method, url, params=params, json=json_body, headers=headers
+                    ) as response:
+                        if response.status == 304:
+                            return 304, '', response.headers
+                        if response.status in self.retry_policy.retry_statuses and not raise_retryable:
+                            return response.status, '', response.headers
+                        response.raise_for_status()
+                        return response.status, await response.text(), response.headers
+                finally:
+                    stats.network_seconds = loop.time() - sent
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            stats.errors = 1
             raise
+        finally:
+            self._record(stats)
+
+    def _record(self, stats: RequestStats):
+        """Add request timings to the current RequestScope, if any."""
+        scope = request_scope.get()
+        if scope is not None:
+            scope.stats.setdefault(self.source_type.value, RequestStats()).add(stats)
+
+    async def _get(self, url: str, params: Optional[Dict] = None, use_cache: bool = True) -> Dict:
+        """
+        Make a rate-limited GET request.
+        """
+        return await self._request('GET', url, params, use_cache=use_cache)
 
-    async def _get_xml(self, url: str, params: Optional[Dict] = None) -> str:
+    async def _get_xml(self, url: str, params: Optional[Dict] = None, use_cache: bool = True) -> str:
         """
         Make a rate-limited GET request expecting XML response.
         """
-        await self.rate_limiter.acquire()
-        session = await self.get_session()
+        return await self._request('GET', url, params, as_text=True, use_cache=use_cache)
 
-        try:
-            async with session.get(url, params=params) as response:
-                response.raise_for_status()
-                return await response.text()
-        except aiohttp.ClientError as e:
-            logger.error(f"API request failed: {url} - {e}")
-            raise
+    async def _post(self, url: str, params: Optional[Dict] = None, json_body: Any = None) -> Any:
+        """
+        Make a rate-limited POST request with a JSON body.
+        """
+        return await self._request('POST', url, params, json_body=json_body)
 
     @abstractmethod
     async def search(
@@ -225,55 +489,118 @@ class AcademicSource(ABC):
         """
         pass
 
+    async def search_page(
+        self,
+        query: str,
+        limit: int = 100,
+        cursor: Any = None,
+        **kwargs
+    ) -> Page:
+        """
+        Fetch one page of results and the cursor of the next.
+
+        The default pages by offset over search(); sources with native
+        cursors override this. Request errors propagate unless search()
+        swallows them.
+
+        Args:
+            query: Search query
+            limit: Results per page (sources may cap it)
+            cursor: Value from the previous Page, None for the first page
+            **kwargs: Source-specific parameters
+
+        Returns:
+            Page of papers
+        """
+        offset = cursor or 0
+        papers = await self.search(query=query, limit=limit, offset=offset, **kwargs)
+        return Page(papers, offset + len(papers) if papers else None)
+
     async def stream(
         self,
         query: str,
         max_results: int = 1000,
         batch_size: int = 100,
+        prefetch: int = 2,
         **kwargs
     ) -> AsyncIterator[Paper]:
         """
         Stream papers matching a query (handles pagination).
 
         This is the preferred method for large-scale fetching.
-        Yields papers one at a time to minimize memory usage.
+        Yields papers one at a time to minimize memory usage. Pages are
+        fetched by a background task up to ``prefetch`` pages ahead of the
+        consumer, so requests go out at the rate limit rather than at the
+        consumer's pace, following the source's native cursor (see
+        search_page). A failed page is retried from the same cursor.
 
         Args:
             query: Search query
             max_results: Maximum total results
             batch_size: Results per API call
+            prefetch: Pages buffered ahead of the consumer
             **kwargs: Source-specific parameters
 
         Yields:
             Paper objects
         """
-        offset = 0
-        total_yielded = 0
-
-        while total_yielded < max_results:
-            try:
-                papers = await self.search(
-                    query=query,
-                    limit=min(batch_size, max_results - total_yielded),
-                    offset=offset,
-                    **kwargs
-                )
-
-                if not papers:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+        done = object()
+
+        async def produce():
+            cursor = None
+            fetched = 0
+            failures = 0
+            while fetched < max_results:
+                # search() implementations log and swallow request errors, so
+                # an empty page only means the end if no request failed meanwhile
+                failed_before = self.failed_requests
+                try:
+                    page = await self.search_page(
+                        query, limit=min(batch_size, max_results - fetched),
+                        cursor=cursor, **kwargs
+                    )
+                    error = None
+                    if not page.papers and self.failed_requests != failed_before:
+                        error = 'request failed'
+                except Exception as e:
+                    page, error = None, e
+
+                if error is not None:
+                    failures += 1
+                    if failures >= self.retry_policy.max_attempts:
+                        logger.error(
+                            f"Stream for '{query}' truncated after {fetched} results "
+                            f"and {failures} failed pages: {error}"
+                        )
+                        break
+                    delay = max(self.circuit_breaker.retry_in(), self.retry_policy.delay(failures))
+                    logger.warning(
+                        f"Stream error after {fetched} results ({error}), retrying page in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                failures = 0
+
+                if page.papers:
+                    await queue.put(page.papers[:max_results - fetched])
+                    fetched += len(page.papers)
+                if not page.papers or page.cursor is None:
                     break
+                cursor = page.cursor
+            await queue.put(done)
 
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                papers = await queue.get()
+                if papers is done:
+                    break
                 for paper in papers:
                     yield paper
-                    total_yielded += 1
-
-                    if total_yielded >= max_results:
-                        break
-
-                offset += len(papers)
-
-            except Exception as e:
-                logger.error(f"Stream error at offset {offset}: {e}")
-                break
+            await producer
+        finally:
+            producer.cancel()
 
     async def search_by_concepts(
         self,
@@ -0,0 +1,311 @@
+"""
+HTTP response cache for academic API clients
+
+GET responses are stored keyed by URL + query parameters (credentials
+such as ``api_key`` and ``email`` are left out of the key and never
+stored). Each source has its own TTL. Within it a cached page is served
+without touching the network or the rate limiter; after it the request is
+revalidated with If-None-Match / If-Modified-Since, and a 304 refreshes the
+entry without downloading the body again.
+
+Offline mode never goes to the network: every cached entry is served
+regardless of age and anything else raises CacheMiss. Replaying a learning
+cycle offline gives the same papers in the same order, which makes
+benchmarks deterministic.
+
+Hit/miss counters are stored with the responses so ``cli.py status`` can
+report them across runs. They are counted in memory and written out every
+few seconds and at exit, not once per request.
+
+Configuration (environment):
+    CIPHER_HTTP_CACHE=0        disable the cache
+    CIPHER_HTTP_OFFLINE=1      offline replay mode
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_PATH = Path(
+    os.getenv("CIPHER_BASE_PATH", str(Path.home() / "projects" / "cipher"))
+) / "data" / "http_cache.sqlite"
+
+# Seconds a response is served without revalidation, per source type
+DEFAULT_TTLS = {
+    'openalex': 24 * 3600,
+    'pubmed': 24 * 3600,
+    'arxiv': 6 * 3600,           # New submissions appear daily
+    'semantic_scholar': 24 * 3600,
+}
+DEFAULT_TTL = 6 * 3600
+
+# Entries not fetched or revalidated for this long are dropped on open
+DEFAULT_RETENTION = 30 * 24 * 3600
+
+# Query parameters that identify the caller, not the resource
+CREDENTIAL_PARAMS = frozenset({'api_key', 'email', 'mailto', 'tool'})
+
+
+class CacheMiss(aiohttp.ClientError):
+    """Raised in offline mode for a request that was never cached."""
+
+
+def cache_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable key for a request, ignoring parameter order and credentials."""
+    query = urlencode(sorted(
+        (k, str(v)) for k, v in (params or {}).items()
+        if k not in CREDENTIAL_PARAMS and v is not None
+    ))
+    return hashlib.sha256(f"{method} {url}?{query}".encode('utf-8')).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body and its validators"""
+    key: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache(ABC):
+    """
+    Storage interface used by AcademicSource._request.
+
+    lookup(), store() and refresh() do I/O and are called from worker
+    threads, so they must be thread-safe; record() is called on the event
+    loop and must not block.
+
+    Counted events: ``hit`` (served fresh), ``stale`` (served expired,
+    offline), ``revalidated`` (304), ``miss`` (fetched or offline miss).
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, offline: bool = False):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.offline = offline
+
+    def ttl(self, source: str) -> float:
+        return self.ttls.get(source, DEFAULT_TTL)
+
+    @abstractmethod
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Stored response for a key, fresh or not."""
+
+    @abstractmethod
+    def store(self, source: str, key: str, url: str, body: str,
+              etag: Optional[str], last_modified: Optional[str]):
+        """Store a response body with its validators."""
+
+    @abstractmethod
+    def refresh(self, source: str, entry: CachedResponse):
+        """Extend an entry's lifetime after a 304."""
+
+    @abstractmethod
+    def record(self, source: str, event: str):
+        """Count a cache event for a source."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """{source: {event: count}}"""
+
+    @abstractmethod
+    def entries(self) -> int:
+        """Number of stored responses."""
+
+    @abstractmethod
+    def clear(self):
+        """Drop every stored response and counter."""
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    ResponseCache in one SQLite file, bodies zlib-compressed.
+
+    WAL mode lets several processes (e.g. parallel learning runs) share
+    the file. The connection is shared by the worker threads the client
+    runs lookups and stores on, behind a lock. Counters are kept in memory
+    and added to the file every ``COUNTER_FLUSH_INTERVAL`` seconds (on the
+    next lookup or store), by stats(), and on close.
+    """
+
+    COUNTER_FLUSH_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        offline: bool = False,
+        retention: float = DEFAULT_RETENTION
+    ):
+        super().__init__(ttls, offline)
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self.retention = retention
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # (source, event) -> count not yet written
+        self._counts: Counter = Counter()
+        self._counts_flushed = time.monotonic()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Callers hold self._lock
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(
+                str(self.path), timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_responses_fetched_at ON responses(fetched_at);
+                CREATE TABLE IF NOT EXISTS counters (
+                    source TEXT NOT NULL,
+                    event TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (source, event)
+                );
+            """)
+            if self.retention and not self.offline:
+                db.execute(
+                    "DELETE FROM responses WHERE fetched_at < ?",
+                    (time.time() - self.retention,)
+                )
+            self._db = db
+        return self._db
+
+    def _flush_counts(self, force: bool = False):
+        """Add the in-memory counters to the file (callers hold self._lock)."""
+        if not self._counts or (
+            not force and time.monotonic() - self._counts_flushed < self.COUNTER_FLUSH_INTERVAL
+        ):
+            return
+        counts, self._counts = self._counts, Counter()
+        self._connect().executemany("""
+            INSERT INTO counters (source, event, count) VALUES (?, ?, ?)
+            ON CONFLICT (source, event) DO UPDATE SET count = count + excluded.count
+        """, [(source, event, n) for (source, event), n in counts.items()])
+        self._counts_flushed = time.monotonic()
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            self._flush_counts()
+            row = self._connect().execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, expires_at = row
+        return CachedResponse(key, zlib.decompress(body).decode('utf-8'), etag, last_modified, expires_at)
+
+    def store(self, source: str, key: str, url: str, body: str,
+              etag: Optional[str], last_modified: Optional[str]):
+        now = time.time()
+        compressed = zlib.compress(body.encode('utf-8'))
+        with self._lock:
+            self._connect().execute("""
+                INSERT OR REPLACE INTO responses
+                    (key, source, url, body, etag, last_modified, fetched_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, source, url, compressed, etag, last_modified,
+                  now, now + self.ttl(source)))
+            self._flush_counts()
+
+    def refresh(self, source: str, entry: CachedResponse):
+        now = time.time()
+        entry.expires_at = now + self.ttl(source)
+        with self._lock:
+            self._connect().execute(
+                "UPDATE responses SET fetched_at = ?, expires_at = ? WHERE key = ?",
+                (now, entry.expires_at, entry.key)
+            )
+            self._flush_counts()
+
+    def record(self, source: str, event: str):
+        with self._lock:
+            self._counts[source, event] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        result: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            self._flush_counts(force=True)
+            rows = self._connect().execute("SELECT source, event, count FROM counters").fetchall()
+        for source, event, count in rows:
+            result.setdefault(source, {})[event] = count
+        return result
+
+    def entries(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+            db = self._connect()
+            db.execute("DELETE FROM responses")
+            db.execute("DELETE FROM counters")
+
+    def close(self):
+        with self._lock:
+            self._flush_counts(force=True)
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# Singleton instance for global use
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get or create the global response cache.
+
+    Returns None when disabled with CIPHER_HTTP_CACHE=0.
+    """
+    global _response_cache
+
+    if _response_cache is None and os.getenv("CIPHER_HTTP_CACHE", "1") != "0":
+        _response_cache = SQLiteResponseCache(
+            offline=os.getenv("CIPHER_HTTP_OFFLINE", "0") == "1"
+        )
+        # Write out buffered counters
+        atexit.register(_response_cache.close)
+
+    return _response_cache
@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from .base import AcademicSource, Paper, Author, SourceType
+from .base import AcademicSource, Paper, Page, Author, SourceType
 
 logger = logging.getLogger(__name__)
 
@@ -170,6 +170,57 @@ class OpenAlexClient(AcademicSource):
         Returns:
             List of Paper objects
         """
+        params = self._works_params(query, limit, concept_ids, from_date, to_date, is_oa, sort)
+        params['page'] = (offset // min(limit, 200)) + 1
+
+        url = f"{self.base_url}/works"
+
+        try:
+            data = await self._get(url, params)
+            works = data.get('results', [])
+            return [self._parse_work(w) for w in works]
+        except Exception as e:
+            logger.error(f"OpenAlex search failed: {e}")
+            return []
+
+    async def search_page(
+        self,
+        query: str,
+        limit: int = 200,
+        cursor: Any = None,
+        **kwargs
+    ) -> Page:
+        """
+        One page of works via cursor paging (``cursor=*`` then meta.next_cursor).
+
+        Unlike page numbers, cursors are not capped at 10,000 results.
+        Accepts the same filters as search().
+        """
+        params = self._works_params(
+            query, limit, kwargs.get('concept_ids'), kwargs.get('from_date'),
+            kwargs.get('to_date'), kwargs.get('is_oa'),
+            kwargs.get('sort', "relevance_score:desc")
+        )
+        params['cursor'] = cursor or '*'
+
+        data = await self._get(f"{self.base_url}/works", params)
+        works = data.get('results', [])
+        return Page(
+            [self._parse_work(w) for w in works],
+            (data.get('meta') or {}).get('next_cursor') if works else None
+        )
+
+    def _works_params(
+        self,
+        query: str,
+        limit: int,
+        concept_ids: Optional[List[str]],
+        from_date: Optional[str],
+        to_date: Optional[str],
+        is_oa: Optional[bool],
+        sort: str
+    ) -> Dict[str, Any]:
+        """Query parameters for /works, without pagination."""
         # Build filter string
         filters = []
         search_query = None
@@ -193,7 +244,6 @@ class OpenAlexClient(AcademicSource):
 
         params = {
             'per_page': min(limit, 200),
-            'page': (offset // min(limit, 200)) + 1,
             'sort': sort,
             'mailto': self.email
         }
@@ -204,15 +254,7 @@ class OpenAlexClient(AcademicSource):
         if filters:
             params['filter'] = ','.join(filters)
 
-        url = f"{self.base_url}/works"
-
-        try:
-            data = await self._get(url, params)
-            works = data.get('results', [])
-            return [self._parse_work(w) for w in works]
-        except Exception as e:
-            logger.error(f"OpenAlex search failed: {e}")
-            return []
+        return params
 
     async def fetch(self, paper_id: str) -> Optional[Paper]:
         """
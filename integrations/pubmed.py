@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 import asyncio
 
-from .base import AcademicSource, Paper, Author, SourceType
+from .base import AcademicSource, Paper, Page, Author, SourceType
 
 logger = logging.getLogger(__name__)
 
@@ -321,12 +321,7 @@ class PubMedClient(AcademicSource):
             - "neuroscience[MeSH Terms]" - MeSH term search
         """
         # Add MeSH terms to query if specified
-        if mesh_terms:
-            mesh_query = ' AND '.join(f'{term}[MeSH Terms]' for term in mesh_terms)
-            if query:
-                query = f'({query}) AND ({mesh_query})'
-            else:
-                query = mesh_query
+        query = self._with_mesh_terms(query, mesh_terms)
 
         # Search for IDs first
         pmids = await self._search_ids(
@@ -356,6 +351,76 @@ class PubMedClient(AcademicSource):
 
         return papers
 
+    def _with_mesh_terms(self, query: str, mesh_terms: Optional[List[str]]) -> str:
+        """AND a list of MeSH terms onto a query."""
+        if not mesh_terms:
+            return query
+        mesh_query = ' AND '.join(f'{term}[MeSH Terms]' for term in mesh_terms)
+        return f'({query}) AND ({mesh_query})' if query else mesh_query
+
+    async def search_page(
+        self,
+        query: str,
+        limit: int = 200,
+        cursor: Any = None,
+        **kwargs
+    ) -> Page:
+        """
+        One page of papers from the E-utilities history server.
+
+        The first call runs esearch with ``usehistory=y`` and keeps only the
+        WebEnv / query_key of the result set; every page after that is a
+        single efetch against it, instead of an esearch + efetch pair per
+        page. The cursor is (web_env, query_key, retstart, count).
+
+        Accepts mesh_terms, from_date, to_date and sort like search().
+        """
+        if cursor is None:
+            params = {
+                **self._base_params(),
+                'db': 'pubmed',
+                'term': self._with_mesh_terms(query, kwargs.get('mesh_terms')),
+                'usehistory': 'y',
+                'retmax': 0,
+                'retmode': 'json',
+                'sort': kwargs.get('sort', 'relevance')
+            }
+            if kwargs.get('from_date'):
+                params['mindate'] = kwargs['from_date']
+                params['datetype'] = 'pdat'
+            if kwargs.get('to_date'):
+                params['maxdate'] = kwargs['to_date']
+                params['datetype'] = 'pdat'
+
+            # WebEnv sessions expire, so history searches are never cached
+            data = await self._get(f"{self.base_url}/esearch.fcgi", params, use_cache=False)
+            result = data.get('esearchresult', {})
+            if not result.get('webenv'):
+                return Page([], None)
+            cursor = (result['webenv'], result['querykey'], 0, int(result.get('count', 0)))
+
+        web_env, query_key, retstart, count = cursor
+        if retstart >= count:
+            return Page([], None)
+
+        retmax = min(limit, 200)
+        params = {
+            **self._base_params(),
+            'db': 'pubmed',
+            'WebEnv': web_env,
+            'query_key': query_key,
+            'retstart': retstart,
+            'retmax': retmax,
+            'retmode': 'xml',
+            'rettype': 'full'
+        }
+        xml_response = await self._get_xml(f"{self.base_url}/efetch.fcgi", params, use_cache=False)
+        root = ET.fromstring(xml_response)
+        papers = [self._parse_article(article) for article in root.findall('.//PubmedArticle')]
+
+        retstart += retmax
+        return Page(papers, (web_env, query_key, retstart, count) if retstart < count else None)
+
     async def fetch(self, paper_id: str) -> Optional[Paper]:
         """
         Fetch a single paper by PMID.
@@ -0,0 +1,146 @@
+"""
+Retry and circuit breaking for academic API requests
+
+AcademicSource._send retries transient failures (connection errors,
+timeouts, 429 and 5xx responses) with capped exponential backoff and
+full jitter. A 429 also slows the source's RateLimiter down, honouring
+Retry-After, so the client settles just under the server's limit instead
+of hammering it; successful requests raise the rate back up gradually.
+
+Each host has a CircuitBreaker. After ``failure_threshold`` consecutive
+failures it opens and requests fail fast with CircuitOpenError until
+``reset_timeout`` has passed; then one trial request is let through and
+its outcome closes or re-opens the circuit.
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+# Connection-level errors worth another attempt
+RETRYABLE_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before retrying a request"""
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    retry_statuses: FrozenSet[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+
+    def delay(self, attempt: int) -> float:
+        """Full-jitter backoff for a 0-based attempt number."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one host.
+
+    States: closed (normal), open (fail fast), half-open (one trial).
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        # Start of the half-open trial request; a trial that never reports
+        # back (e.g. cancelled) stops blocking after reset_timeout
+        self._trial: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def retry_in(self) -> float:
+        """Seconds until the circuit lets a trial request through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def check(self):
+        """Raise CircuitOpenError unless a request may be sent now."""
+        state = self.state
+        now = time.monotonic()
+        trial_pending = self._trial is not None and now - self._trial < self.reset_timeout
+        if state == 'open' or (state == 'half-open' and trial_pending):
+            raise CircuitOpenError(self.host, max(self.retry_in(), 1.0))
+        if state == 'half-open':
+            self._trial = now
+
+    def success(self):
+        if self.opened_at is not None:
+            logger.info(f"Circuit closed for {self.host}")
+        self.failures = 0
+        self.opened_at = None
+        self._trial = None
+
+    def failure(self):
+        self.failures += 1
+        # Requests already in flight when the circuit opened don't extend it
+        if self._trial is not None or (
+            self.opened_at is None and self.failures >= self.failure_threshold
+        ):
+            logger.warning(
+                f"Circuit open for {self.host} after {self.failures} failures, "
+                f"pausing {self.reset_timeout:.0f}s"
+            )
+            self.opened_at = time.monotonic()
+            self._trial = None
+
+
+# One breaker per host, shared by every client talking to it
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Get or create the circuit breaker for a host."""
+    if host not in _breakers:
+        _breakers[host] = CircuitBreaker(host)
+    return _breakers[host]
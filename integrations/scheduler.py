@@ -0,0 +1,131 @@
+"""
+Concurrent fetch scheduling across academic sources
+
+Every (source, query) search is an independent FetchJob. FetchScheduler
+starts all of them at once; what actually paces them is each source's
+own RateLimiter (one token bucket per host) plus a global cap on HTTP
+requests in flight, so a domain's fetch takes as long as its slowest
+source rather than the sum of all of them.
+
+Request timings are collected through a RequestScope set on each job's
+task, split into rate-limit wait, in-flight cap wait and network time.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from .base import Paper, RequestScope, RequestStats, request_scope
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchJob:
+    """One search against one source"""
+    source: str                                  # Source type value, e.g. 'openalex'
+    label: str                                   # Query description for logs
+    call: Callable[[], Awaitable[List[Paper]]]
+
+
+@dataclass
+class FetchStats:
+    """Fetch timings for one scheduler run, per source"""
+    jobs: int = 0
+    failed: int = 0
+    papers: int = 0
+    wall_seconds: float = 0.0
+    sources: Dict[str, RequestStats] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    def report(self) -> str:
+        """One line per source: requests, rate-limit wait, cap wait, network, backoff."""
+        lines = [
+            f"  {name:<17} {s.requests:>4} requests, rate-limit wait {s.rate_wait_seconds:6.1f}s, "
+            f"cap wait {s.slot_wait_seconds:5.1f}s, network {s.network_seconds:6.1f}s"
+            + (f", backoff {s.backoff_seconds:.1f}s ({s.retries} retries, {s.throttled} throttled)"
+               if s.retries else "")
+            + (f", {s.cached} cached" if s.cached else "")
+            + (f", {s.errors} errors" if s.errors else "")
+            for name, s in sorted(self.sources.items())
+        ]
+        lines.append(
+            f"  {self.jobs} searches ({self.failed} failed), "
+            f"{self.papers} papers in {self.wall_seconds:.1f}s"
+        )
+        return "\n".join(lines)
+
+
+class FetchScheduler:
+    """
+    Runs fetch jobs concurrently under a global in-flight request cap.
+
+    One scheduler is meant to be shared by everything fetching at the same
+    time (e.g. all domains of a parallel learning cycle), so the cap holds
+    across them.
+
+    Usage:
+        scheduler = FetchScheduler(max_in_flight=8)
+        stats = await scheduler.run(jobs, on_papers)
+        print(stats.report())
+    """
+
+    def __init__(self, max_in_flight: int = 8):
+        self.max_in_flight = max_in_flight
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        # One semaphore per event loop: asyncio primitives are bound to the
+        # loop they first wait on
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._loop = loop
+        return self._slots
+
+    async def run(
+        self,
+        jobs: Sequence[FetchJob],
+        on_papers: Callable[[FetchJob, List[Paper]], Awaitable[None]],
+        stop: Optional[Callable[[], bool]] = None
+    ) -> FetchStats:
+        """
+        Run every job concurrently.
+
+        Args:
+            jobs: Searches to run
+            on_papers: Called with each job's papers as soon as it finishes
+            stop: Optional predicate; jobs that have not started their search
+                when it returns True are skipped
+
+        Returns:
+            FetchStats for this run. A failing job is logged and counted,
+            never raised.
+        """
+        stats = FetchStats()
+        scope = RequestScope(stats=stats.sources, slots=self.slots)
+        started = time.perf_counter()
+
+        async def run_job(job: FetchJob):
+            if stop is not None and stop():
+                return
+            request_scope.set(scope)
+            stats.jobs += 1
+            try:
+                papers = await job.call()
+            except Exception as e:
+                error_msg = f"{job.source} search failed for {job.label}: {e}"
+                logger.error(error_msg)
+                stats.failed += 1
+                stats.errors.append(error_msg)
+                return
+            stats.papers += len(papers)
+            await on_papers(job, papers)
+
+        await asyncio.gather(*(run_job(job) for job in jobs))
+        stats.wall_seconds = time.perf_counter() - started
+        return stats
@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from .base import AcademicSource, Paper, Author, SourceType
+from .base import AcademicSource, Paper, Page, Author, SourceType
 
 logger = logging.getLogger(__name__)
 
@@ -168,9 +168,31 @@ class SemanticScholarClient(AcademicSource):
             'query': query,
             'limit': min(limit, 100),
             'offset': offset,
-            'fields': ','.join(fields)
+            'fields': ','.join(fields),
+            **self._filter_params(year, fields_of_study, open_access_only, min_citation_count)
         }
 
+        url = f"{self.base_url}/paper/search"
+
+        try:
+            data = await self._get(url, params)
+            papers_data = data.get('data', [])
+            return [self._parse_paper(p) for p in papers_data]
+
+        except Exception as e:
+            logger.error(f"Semantic Scholar search failed: {e}")
+            return []
+
+    def _filter_params(
+        self,
+        year: Optional[str] = None,
+        fields_of_study: Optional[List[str]] = None,
+        open_access_only: bool = False,
+        min_citation_count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Search filters shared by relevance and bulk search."""
+        params: Dict[str, Any] = {}
+
         if year:
             params['year'] = year
 
@@ -183,16 +205,44 @@ class SemanticScholarClient(AcademicSource):
         if min_citation_count is not None:
             params['minCitationCount'] = min_citation_count
 
-        url = f"{self.base_url}/paper/search"
+        return params
 
-        try:
-            data = await self._get(url, params)
-            papers_data = data.get('data', [])
-            return [self._parse_paper(p) for p in papers_data]
+    async def search_page(
+        self,
+        query: str,
+        limit: int = 1000,
+        cursor: Any = None,
+        **kwargs
+    ) -> Page:
+        """
+        One page of papers from the bulk search endpoint.
 
-        except Exception as e:
-            logger.error(f"Semantic Scholar search failed: {e}")
-            return []
+        /paper/search/bulk pages with a continuation token instead of an
+        offset, so it is not capped at 1,000 results like /paper/search.
+        The server picks the page size (up to 1,000); stream() trims the
+        last page to max_results. tldr is not available in bulk search.
+
+        Accepts year, fields_of_study, open_access_only and
+        min_citation_count like search().
+        """
+        fields = [
+            'paperId', 'title', 'abstract', 'authors', 'year',
+            'publicationDate', 'venue', 'journal', 'citationCount',
+            'referenceCount', 'influentialCitationCount', 'isOpenAccess',
+            'openAccessPdf', 'fieldsOfStudy', 'url', 'externalIds'
+        ]
+
+        params = {
+            'query': query,
+            'fields': ','.join(fields),
+            **self._filter_params(**kwargs)
+        }
+        if cursor:
+            params['token'] = cursor
+
+        data = await self._get(f"{self.base_url}/paper/search/bulk", params)
+        papers = [self._parse_paper(p) for p in data.get('data', []) or []]
+        return Page(papers, data.get('token') if papers else None)
 
     async def fetch(self, paper_id: str) -> Optional[Paper]:
         """
@@ -404,17 +454,8 @@ class SemanticScholarClient(AcademicSource):
         params = {'fields': ','.join(fields)}
 
         # POST request for batch
-        await self.rate_limiter.acquire()
-        session = await self.get_session()
-
         try:
-            async with session.post(
-                url,
-                params=params,
-                json={'ids': clean_ids}
-            ) as response:
-                response.raise_for_status()
-                papers_data = await response.json()
+            papers_data = await self._post(url, params, {'ids': clean_ids})
 
             return [
                 self._parse_paper(p) for p in papers_data
@@ -469,13 +510,8 @@ class SemanticScholarClient(AcademicSource):
 
         params = {'fields': ','.join(fields)}
 
-        await self.rate_limiter.acquire()
-        session = await self.get_session()
-
         try:
-            async with session.post(url, params=params, json=body) as response:
-                response.raise_for_status()
-                data = await response.json()
+            data = await self._post(url, params, body)
 
             papers_data = data.get('recommendedPapers', [])
             return [self._parse_paper(p) for p in papers_data]
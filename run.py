@@ -49,7 +49,11 @@ async def run_full_cycle(max_papers: int = 100):
     logger.info("=" * 60)
 
     # Initialize brain
-    brain = CipherBrain(config.db.connection_string)
+    brain = CipherBrain(
+        config.db.connection_string,
+        nlp_processes=config.learning.nlp_processes,
+        nlp_batch_size=config.learning.nlp_batch_size
+    )
     await brain.connect()
 
     # Initialize learner
@@ -57,7 +61,13 @@ async def run_full_cycle(max_papers: int = 100):
         'email': config.api.openalex_email,
         'pubmed_api_key': config.api.pubmed_api_key,
         's2_api_key': config.api.semantic_scholar_api_key,
-        'max_papers_per_domain': max_papers
+        'max_papers_per_domain': max_papers,
+        'fetch_concurrency': config.learning.fetch_concurrency,
+        'extract_workers': config.learning.extract_workers,
+        'fetch_queue_size': config.learning.fetch_queue_size,
+        'persist_queue_size': config.learning.persist_queue_size,
+        'persist_batch_size': config.learning.persist_batch_size,
+        'extract_batch_size': config.learning.extract_batch_size,
     })
 
     try:
@@ -163,13 +173,23 @@ async def run_single_domain(domain_name: str, max_papers: int = 100):
 
     logger.info(f"Learning from domain: {domain.name}")
 
-    brain = CipherBrain(config.db.connection_string)
+    brain = CipherBrain(
+        config.db.connection_string,
+        nlp_processes=config.learning.nlp_processes,
+        nlp_batch_size=config.learning.nlp_batch_size
+    )
     await brain.connect()
 
     learner = DomainLearner(brain, {
         'email': config.api.openalex_email,
         'pubmed_api_key': config.api.pubmed_api_key,
         's2_api_key': config.api.semantic_scholar_api_key,
+        'fetch_concurrency': config.learning.fetch_concurrency,
+        'extract_workers': config.learning.extract_workers,
+        'fetch_queue_size': config.learning.fetch_queue_size,
+        'persist_queue_size': config.learning.persist_queue_size,
+        'persist_batch_size': config.learning.persist_batch_size,
+        'extract_batch_size': config.learning.extract_batch_size,
     })
 
     try:
@@ -252,13 +272,23 @@ async def run_daemon():
     logger.info("=" * 60)
 
     # Initialize components
-    brain = CipherBrain(config.db.connection_string)
+    brain = CipherBrain(
+        config.db.connection_string,
+        nlp_processes=config.learning.nlp_processes,
+        nlp_batch_size=config.learning.nlp_batch_size
+    )
     await brain.connect()
 
     learner = DomainLearner(brain, {
         'email': config.api.openalex_email,
         'pubmed_api_key': config.api.pubmed_api_key,
         's2_api_key': config.api.semantic_scholar_api_key,
+        'fetch_concurrency': config.learning.fetch_concurrency,
+        'extract_workers': config.learning.extract_workers,
+        'fetch_queue_size': config.learning.fetch_queue_size,
+        'persist_queue_size': config.learning.persist_queue_size,
+        'persist_batch_size': config.learning.persist_batch_size,
+        'extract_batch_size': config.learning.extract_batch_size,
     })
 
     bridge = SensesBridge()
@@ -0,0 +1,47 @@
+-- ============================================================================
+-- CIPHER Migration: Entity Inverted Index
+-- Version: 003
+-- Date: 2026-10-17
+-- Description: entity -> claim postings for connection candidate generation
+-- ============================================================================
+
+-- One row per (normalized entity, claim). Mirrors the in-memory EntityIndex
+-- so it can be loaded without re-parsing every claim's entities JSON.
+CREATE TABLE IF NOT EXISTS synthesis.claim_entities (
+    entity TEXT NOT NULL,
+    claim_id INTEGER NOT NULL REFERENCES synthesis.claims(id) ON DELETE CASCADE,
+    PRIMARY KEY (entity, claim_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_claim_entities_claim ON synthesis.claim_entities(claim_id);
+
+-- Entity normalization used by every writer of the table; matches
+-- tools.entity_index.normalize_entities (strip, lowercase, drop empties)
+CREATE OR REPLACE FUNCTION synthesis.normalize_entity(entity TEXT)
+RETURNS TEXT AS $$
+    SELECT NULLIF(LOWER(BTRIM(entity, E' \t\n\r\f\x0B')), '')
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Rows posted before entities were trimmed
+INSERT INTO synthesis.claim_entities (entity, claim_id)
+SELECT synthesis.normalize_entity(entity), claim_id
+FROM synthesis.claim_entities
+WHERE entity IS DISTINCT FROM synthesis.normalize_entity(entity)
+  AND synthesis.normalize_entity(entity) IS NOT NULL
+ON CONFLICT DO NOTHING;
+
+DELETE FROM synthesis.claim_entities
+WHERE entity IS DISTINCT FROM synthesis.normalize_entity(entity);
+
+-- Backfill claims without postings. Runs once here; after bulk imports
+-- that bypass the index, run `python cli.py index-entities`.
+INSERT INTO synthesis.claim_entities (entity, claim_id)
+SELECT DISTINCT synthesis.normalize_entity(e), c.id
+FROM synthesis.claims c,
+     jsonb_array_elements_text(c.entities) AS e
+WHERE jsonb_typeof(c.entities) = 'array'
+  AND synthesis.normalize_entity(e) IS NOT NULL
+  AND NOT EXISTS (
+      SELECT 1 FROM synthesis.claim_entities ce WHERE ce.claim_id = c.id
+  )
+ON CONFLICT DO NOTHING;
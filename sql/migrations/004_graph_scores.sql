@@ -0,0 +1,62 @@
+-- ============================================================================
+-- CIPHER Migration: Stored Graph Scores
+-- Version: 004
+-- Date: 2026-10-17
+-- Description: Persist centrality scores and log connection changes so
+--              PageRank can be updated incrementally
+-- ============================================================================
+
+-- Latest centrality scores per claim
+CREATE TABLE IF NOT EXISTS synthesis.graph_scores (
+    claim_id INTEGER PRIMARY KEY REFERENCES synthesis.claims(id) ON DELETE CASCADE,
+    pagerank FLOAT,
+    betweenness FLOAT,
+    clustering FLOAT,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_graph_scores_pagerank ON synthesis.graph_scores(pagerank DESC);
+CREATE INDEX IF NOT EXISTS idx_graph_scores_betweenness ON synthesis.graph_scores(betweenness DESC);
+CREATE INDEX IF NOT EXISTS idx_graph_scores_clustering ON synthesis.graph_scores(clustering DESC);
+
+-- One row per stored metric: how far into the change log it is up to date.
+-- The 'change_log' row records how far connection_changes has been pruned.
+CREATE TABLE IF NOT EXISTS synthesis.graph_state (
+    metric VARCHAR(30) PRIMARY KEY,
+    last_change_id BIGINT NOT NULL DEFAULT 0,
+    node_count INTEGER NOT NULL DEFAULT 0,
+    computed_at TIMESTAMP DEFAULT NOW()
+);
+
+-- Log of connection inserts and deletes. Rows up to the position stored
+-- for PageRank are deleted when PageRank is saved (GraphEngine._prune_changes).
+CREATE TABLE IF NOT EXISTS synthesis.connection_changes (
+    id BIGSERIAL PRIMARY KEY,
+    op CHAR(1) NOT NULL,              -- I = insert, D = delete
+    connection_id INTEGER NOT NULL,
+    source_claim_id INTEGER,
+    target_claim_id INTEGER,
+    connection_type VARCHAR(50),
+    changed_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION synthesis.log_connection_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO synthesis.connection_changes
+            (op, connection_id, source_claim_id, target_claim_id, connection_type)
+        VALUES ('I', NEW.id, NEW.source_claim_id, NEW.target_claim_id, NEW.connection_type);
+        RETURN NEW;
+    END IF;
+    INSERT INTO synthesis.connection_changes
+        (op, connection_id, source_claim_id, target_claim_id, connection_type)
+    VALUES ('D', OLD.id, OLD.source_claim_id, OLD.target_claim_id, OLD.connection_type);
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_connection_changes ON synthesis.connections;
+CREATE TRIGGER trg_connection_changes
+    AFTER INSERT OR DELETE ON synthesis.connections
+    FOR EACH ROW EXECUTE FUNCTION synthesis.log_connection_change();
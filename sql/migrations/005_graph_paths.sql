@@ -0,0 +1,35 @@
+-- ============================================================================
+-- CIPHER Migration: Graph Path Queries
+-- Version: 005
+-- Date: 2026-10-17
+-- Description: Adjacency indexes on connections and a denormalized edge view
+--              so recursive path queries return edges and domains directly
+-- ============================================================================
+
+-- Out-edges: covering index so each recursion step is an index-only scan
+CREATE INDEX IF NOT EXISTS idx_connections_source
+    ON synthesis.connections(source_claim_id)
+    INCLUDE (target_claim_id, connection_type, strength, cross_domain);
+
+-- In-edges: reverse traversal, and ON DELETE CASCADE from claims
+CREATE INDEX IF NOT EXISTS idx_connections_target
+    ON synthesis.connections(target_claim_id)
+    INCLUDE (source_claim_id, connection_type, strength, cross_domain);
+
+-- One row per connection with both endpoints' domains. A plain view rather
+-- than a materialized one: connections are written on every ingest and path
+-- results must not lag behind them. Joins resolve through claims' primary key.
+CREATE OR REPLACE VIEW synthesis.graph_edges AS
+SELECT
+    c.id,
+    c.source_claim_id,
+    c.target_claim_id,
+    COALESCE(c.connection_type, 'related') AS connection_type,
+    COALESCE(c.strength, 0.5) AS strength,
+    COALESCE(c.cross_domain, FALSE) AS cross_domain,
+    c.reasoning,
+    COALESCE(s.domains, '{}') AS source_domains,
+    COALESCE(t.domains, '{}') AS target_domains
+FROM synthesis.connections c
+JOIN synthesis.claims s ON s.id = c.source_claim_id
+JOIN synthesis.claims t ON t.id = c.target_claim_id;
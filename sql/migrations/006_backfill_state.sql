@@ -0,0 +1,22 @@
+-- ============================================================================
+-- CIPHER Migration: Resumable Backfills
+-- Version: 006
+-- Date: 2026-10-17
+-- Description: Checkpoint table for long-running backfill jobs and a partial
+--              index so keyset scans over unembedded claims stay cheap
+-- ============================================================================
+
+-- One row per backfill job: the highest id written and when it finished.
+-- completed_at IS NULL means the last run stopped early and can resume.
+CREATE TABLE IF NOT EXISTS synthesis.backfill_state (
+    job VARCHAR(100) PRIMARY KEY,
+    last_id BIGINT NOT NULL DEFAULT 0,
+    processed BIGINT NOT NULL DEFAULT 0,
+    started_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW(),
+    completed_at TIMESTAMP
+);
+
+-- Keyset pages: WHERE embedding IS NULL AND id > $1 ORDER BY id LIMIT $2
+CREATE INDEX IF NOT EXISTS idx_claims_embedding_missing
+    ON synthesis.claims(id) WHERE embedding IS NULL;
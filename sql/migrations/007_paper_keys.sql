@@ -0,0 +1,20 @@
+-- ============================================================================
+-- CIPHER Migration: Paper Dedup Keys
+-- Version: 007
+-- Date: 2026-10-17
+-- Description: identifier, title and MinHash band keys of stored sources, so
+--              papers already ingested are rejected before extraction
+-- ============================================================================
+
+-- One row per (key, source). Keys look like 'id:W2741809807', 'doi:10.1000/x',
+-- 'arxiv:2301.12345', 'pmid:123', 'title:<hash>' or 'band:<i>:<hash>' (see
+-- tools/paper_index.py). Band keys can be shared by distinct sources with
+-- similar titles, hence the composite key. Existing sources are indexed by
+-- PaperIndex.load() on first use, since keys are computed in Python.
+CREATE TABLE IF NOT EXISTS synthesis.paper_keys (
+    key TEXT NOT NULL,
+    source_id INTEGER NOT NULL REFERENCES synthesis.sources(id) ON DELETE CASCADE,
+    PRIMARY KEY (key, source_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_paper_keys_source ON synthesis.paper_keys(source_id);
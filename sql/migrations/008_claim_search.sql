@@ -0,0 +1,23 @@
+-- ============================================================================
+-- CIPHER Migration: Claim Full-Text Search
+-- Version: 008
+-- Date: 2026-10-17
+-- Description: indexed keyword and substring search over claim_text,
+--              replacing LIKE '%term%' scans (see tools/claim_search.py)
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Stemmed lexemes of the claim, maintained by Postgres on every write.
+-- Adding a stored generated column rewrites synthesis.claims once.
+ALTER TABLE synthesis.claims
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', COALESCE(claim_text, ''))) STORED;
+
+-- Word queries: search_vector @@ to_tsquery('english', ...)
+CREATE INDEX IF NOT EXISTS idx_claims_search_vector
+    ON synthesis.claims USING GIN (search_vector);
+
+-- Substring queries: claim_text ILIKE '%...%'
+CREATE INDEX IF NOT EXISTS idx_claims_text_trgm
+    ON synthesis.claims USING GIN (claim_text gin_trgm_ops);
@@ -0,0 +1,123 @@
+-- ============================================================================
+-- CIPHER Migration: Concept Domain Statistics
+-- Version: 009
+-- Date: 2026-10-17
+-- Description: per-token domain and claim counts, maintained on claim insert,
+--              so cross-domain concept hunts are indexed top-N reads instead
+--              of tokenizing every claim on every run
+-- ============================================================================
+
+-- Concept tokens of a claim: words stripped to letters, lowercased, at least
+-- 6 letters long, each token once
+CREATE OR REPLACE FUNCTION synthesis.claim_tokens(claim_text TEXT)
+RETURNS SETOF TEXT AS $$
+    SELECT DISTINCT token
+    FROM (
+        SELECT LOWER(regexp_replace(word, '[^a-zA-Z]', '', 'g')) AS token
+        FROM unnest(string_to_array(claim_text, ' ')) AS word
+    ) words
+    WHERE length(token) > 5
+$$ LANGUAGE SQL IMMUTABLE;
+
+-- Claims containing a token, per domain. No foreign key on domain_id: like
+-- claims.domains it is unchecked, and a bad id must not fail claim inserts.
+CREATE TABLE IF NOT EXISTS synthesis.concept_domain_stats (
+    token TEXT NOT NULL,
+    domain_id INTEGER NOT NULL,
+    claim_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (token, domain_id)
+);
+
+-- Per token: number of domains, claims (with at least one domain) and the
+-- first few claims seen, as examples
+CREATE TABLE IF NOT EXISTS synthesis.concept_stats (
+    token TEXT PRIMARY KEY,
+    domain_count INTEGER NOT NULL DEFAULT 0,
+    claim_count INTEGER NOT NULL DEFAULT 0,
+    sample_claim_ids INTEGER[] NOT NULL DEFAULT '{}'
+);
+
+CREATE INDEX IF NOT EXISTS idx_concept_stats_spread
+    ON synthesis.concept_stats(domain_count DESC, claim_count DESC);
+
+-- Add a batch of new claims to the statistics
+CREATE OR REPLACE FUNCTION synthesis.add_concept_stats(claim_ids INTEGER[])
+RETURNS VOID AS $$
+BEGIN
+    CREATE TEMP TABLE IF NOT EXISTS _concept_tokens (
+        claim_id INTEGER, token TEXT, domain_id INTEGER
+    ) ON COMMIT DROP;
+    TRUNCATE _concept_tokens;
+
+    INSERT INTO _concept_tokens (claim_id, token, domain_id)
+    SELECT DISTINCT c.id, t.token, d.domain_id
+    FROM synthesis.claims c
+    CROSS JOIN LATERAL synthesis.claim_tokens(c.claim_text) AS t(token)
+    CROSS JOIN LATERAL unnest(c.domains) AS d(domain_id)
+    WHERE c.id = ANY(claim_ids)
+      AND d.domain_id IS NOT NULL;
+
+    -- Upsert in key order: concurrent flushes then lock shared rows in the
+    -- same order and wait for each other instead of deadlocking
+    INSERT INTO synthesis.concept_domain_stats AS s (token, domain_id, claim_count)
+    SELECT token, domain_id, COUNT(*)
+    FROM _concept_tokens
+    GROUP BY token, domain_id
+    ORDER BY token, domain_id
+    ON CONFLICT (token, domain_id) DO UPDATE
+        SET claim_count = s.claim_count + EXCLUDED.claim_count;
+
+    INSERT INTO synthesis.concept_stats AS s (token, claim_count, sample_claim_ids)
+    SELECT token, COUNT(DISTINCT claim_id), (array_agg(DISTINCT claim_id))[1:5]
+    FROM _concept_tokens
+    GROUP BY token
+    ORDER BY token
+    ON CONFLICT (token) DO UPDATE
+        SET claim_count = s.claim_count + EXCLUDED.claim_count,
+            sample_claim_ids = (s.sample_claim_ids || EXCLUDED.sample_claim_ids)[1:5];
+
+    UPDATE synthesis.concept_stats s
+    SET domain_count = (
+        SELECT COUNT(*) FROM synthesis.concept_domain_stats cds WHERE cds.token = s.token
+    )
+    WHERE s.token IN (SELECT DISTINCT token FROM _concept_tokens);
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level trigger: one call per INSERT (the batch writer inserts a
+-- whole flush in one statement)
+CREATE OR REPLACE FUNCTION synthesis.claims_concept_stats_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM synthesis.add_concept_stats(ARRAY(SELECT id FROM new_claims));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_claims_concept_stats ON synthesis.claims;
+CREATE TRIGGER trg_claims_concept_stats
+    AFTER INSERT ON synthesis.claims
+    REFERENCING NEW TABLE AS new_claims
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION synthesis.claims_concept_stats_trigger();
+
+-- Recompute everything from synthesis.claims. Only inserts are tracked
+-- incrementally; run this after bulk deletes or edits of claim_text/domains.
+CREATE OR REPLACE FUNCTION synthesis.rebuild_concept_stats(batch_size INTEGER DEFAULT 50000)
+RETURNS VOID AS $$
+DECLARE
+    lo INTEGER;
+BEGIN
+    TRUNCATE synthesis.concept_domain_stats, synthesis.concept_stats;
+    FOR lo IN
+        SELECT generate_series(0, COALESCE(MAX(id), 0), batch_size) FROM synthesis.claims
+    LOOP
+        PERFORM synthesis.add_concept_stats(ARRAY(
+            SELECT id FROM synthesis.claims WHERE id > lo AND id <= lo + batch_size
+        ));
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Backfill
+SELECT synthesis.rebuild_concept_stats();
@@ -0,0 +1,69 @@
+-- ============================================================================
+-- CIPHER Migration: Domain Bitmask
+-- Version: 010
+-- Date: 2026-10-17
+-- Description: SMALLINT domain bitmask on claims, kept in sync with the
+--              domains array, so domain overlap and cross-domain tests are
+--              single integer operations (see tools/domain_mask.py)
+-- ============================================================================
+
+-- Bit d set for domain id d, same layout as tools/domain_mask.domain_mask().
+-- NULL for NULL domains, so NULL keeps failing comparisons as with arrays.
+CREATE OR REPLACE FUNCTION synthesis.domain_mask(domains INTEGER[])
+RETURNS SMALLINT AS $$
+    SELECT COALESCE(bit_or(1::SMALLINT << d), 0::SMALLINT)
+    FROM unnest(domains) AS d
+    WHERE d BETWEEN 0 AND 14
+$$ LANGUAGE SQL IMMUTABLE STRICT;
+
+-- Maintained by Postgres on every write of domains.
+-- Adding a stored generated column rewrites synthesis.claims once.
+ALTER TABLE synthesis.claims
+    ADD COLUMN IF NOT EXISTS domain_mask SMALLINT
+    GENERATED ALWAYS AS (synthesis.domain_mask(domains)) STORED;
+
+-- Cross-domain similarity search: "no domain in common" is now a mask test
+-- instead of an array overlap per candidate row
+CREATE OR REPLACE FUNCTION synthesis.find_cross_domain_similar(
+    source_claim_id int,
+    match_threshold float DEFAULT 0.75,
+    match_count int DEFAULT 10
+)
+RETURNS TABLE (
+    claim_id int,
+    claim_text text,
+    source_domains int[],
+    target_domains int[],
+    similarity float
+) AS $$
+DECLARE
+    source_embedding vector(384);
+    source_domains int[];
+    source_mask smallint;
+BEGIN
+    -- Get source claim embedding and domains
+    SELECT c.embedding, c.domains, c.domain_mask
+    INTO source_embedding, source_domains, source_mask
+    FROM synthesis.claims c
+    WHERE c.id = source_claim_id;
+
+    IF source_embedding IS NULL THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        c.id,
+        c.claim_text,
+        source_domains as source_domains,
+        c.domains as target_domains,
+        (1 - (c.embedding <=> source_embedding))::float as similarity
+    FROM synthesis.claims c
+    WHERE c.embedding IS NOT NULL
+    AND c.id != source_claim_id
+    AND c.domain_mask & source_mask = 0  -- Different domains
+    AND (1 - (c.embedding <=> source_embedding)) > match_threshold
+    ORDER BY c.embedding <=> source_embedding
+    LIMIT match_count;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,27 @@
+-- ============================================================================
+-- CIPHER Migration: Claim MinHash Signatures
+-- Version: 011
+-- Date: 2026-10-17
+-- Description: stored MinHash signatures of claim shingle sets, so the LSH
+--              index used by pattern detection (tools/claim_lsh.py) only
+--              hashes claims added since the last run
+-- ============================================================================
+
+-- One row per claim and shingle kind ('words', 'relations', ...).
+-- signature: num_perm little-endian uint32 values; empty for claims whose
+-- shingle set is empty.
+-- text_hash: 64-bit hash of the claim text the signature was computed from;
+-- signatures whose hash no longer matches the claim text are recomputed.
+CREATE TABLE IF NOT EXISTS synthesis.claim_minhash (
+    kind TEXT NOT NULL,
+    claim_id INTEGER NOT NULL REFERENCES synthesis.claims(id) ON DELETE CASCADE,
+    signature BYTEA NOT NULL,
+    text_hash BIGINT,
+    PRIMARY KEY (kind, claim_id)
+);
+
+-- Tables created before text_hash existed; their rows are rehashed once
+ALTER TABLE synthesis.claim_minhash ADD COLUMN IF NOT EXISTS text_hash BIGINT;
+
+CREATE INDEX IF NOT EXISTS idx_claim_minhash_claim
+    ON synthesis.claim_minhash (claim_id);
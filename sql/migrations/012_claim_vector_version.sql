@@ -0,0 +1,31 @@
+-- ============================================================================
+-- CIPHER Migration: Claim Vector Version
+-- Version: 012
+-- Date: 2026-10-17
+-- Description: version stamp bumped whenever a claim's embedding or domains
+--              change, so the vector index (tools/vector_index.py) re-adds
+--              re-embedded and reclassified claims on sync
+-- ============================================================================
+
+CREATE SEQUENCE IF NOT EXISTS synthesis.claim_vector_version_seq;
+
+-- NULL for claims stored before this migration (indexed as version 0)
+ALTER TABLE synthesis.claims
+    ADD COLUMN IF NOT EXISTS vector_version BIGINT;
+ALTER TABLE synthesis.claims
+    ALTER COLUMN vector_version SET DEFAULT nextval('synthesis.claim_vector_version_seq');
+
+CREATE OR REPLACE FUNCTION synthesis.bump_vector_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.vector_version := nextval('synthesis.claim_vector_version_seq');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_claims_vector_version ON synthesis.claims;
+CREATE TRIGGER trg_claims_vector_version
+    BEFORE UPDATE OF embedding, domains ON synthesis.claims
+    FOR EACH ROW
+    WHEN (OLD.embedding IS DISTINCT FROM NEW.embedding OR OLD.domains IS DISTINCT FROM NEW.domains)
+    EXECUTE FUNCTION synthesis.bump_vector_version();
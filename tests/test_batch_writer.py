@@ -0,0 +1,133 @@
+"""BatchWriter.flush keeps staged rows and resolved IDs intact when a flush fails."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from tools.batch_writer import BatchWriter
+
+
+class FakeConnection:
+    """Just enough of asyncpg.Connection for BatchWriter, failing on demand."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.ids = itertools.count(1)
+        self.staged = {}
+        self.committed = False
+
+    def transaction(self):
+        conn = self
+
+        class Transaction:
+            async def __aenter__(self):
+                return None
+
+            async def __aexit__(self, exc_type, exc, tb):
+                conn.committed = exc_type is None
+                return False
+
+        return Transaction()
+
+    def _check(self, sql):
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError(f"forced failure on {self.fail_on}")
+
+    async def execute(self, sql, *args):
+        self._check(sql)
+        return 'INSERT 0 1'
+
+    async def executemany(self, sql, records):
+        self._check(sql)
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.staged[table] = list(records)
+        await asyncio.sleep(0)  # Let other tasks run mid-flush
+
+    async def fetch(self, sql, *args):
+        self._check(sql)
+        if 'INSERT INTO synthesis.sources' in sql:
+            return [{'id': next(self.ids), 'external_id': r[0]}
+                    for r in self.staged['_stage_sources']]
+        if 'INSERT INTO synthesis.claims' in sql:
+            return [{'id': next(self.ids), 'entropy_hash': r[11]}
+                    for r in self.staged['_stage_claims']]
+        return []
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        conn = self.conn
+
+        class Acquire:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Acquire()
+
+
+def stage_rows(writer):
+    src = writer.add_source(external_id='W1', source_type='openalex', title='Paper')
+    a = writer.add_claim(src, 'claim a', 'finding', 0.8, 'strong', [1])
+    b = writer.add_claim(src, 'claim b', 'finding', 0.7, 'weak', [2])
+    writer.add_connection(a, b, 'supports', 0.6, True, 'shared entities')
+    writer.add_pattern('p', 'convergence', 'd', [1, 2], [a, b], 0.5, 0.5, '', [])
+    return src, a, b
+
+
+@pytest.mark.parametrize('fail_on', [
+    'synthesis.claims (',      # claim insert, after sources were written
+    'synthesis.connections',   # after sources and claims
+    'synthesis.patterns',      # last statement
+])
+def test_failed_flush_keeps_rows_staged(fail_on):
+    conn = FakeConnection(fail_on=fail_on)
+    writer = BatchWriter(FakePool(conn))
+    src, a, b = stage_rows(writer)
+    pending = writer.pending
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(writer.flush())
+
+    assert not conn.committed
+    assert writer.pending == pending
+    assert writer.source_ids == {}
+    assert writer.claim_ids == {}
+    # Claim rows still reference their source by key, not a rolled-back ID
+    assert writer._claims[a][0] == src
+
+    # A retry writes everything and resolves the keys
+    conn.fail_on = None
+    result = asyncio.run(writer.flush())
+    assert conn.committed
+    assert writer.pending == 0
+    assert result.claims_inserted == 2
+    assert result.connections == 1
+    assert result.patterns == 1
+    assert writer.claim_id(a) is not None and writer.claim_id(b) is not None
+    assert conn.staged['_stage_claims'][0][0] == writer.source_id(src)
+
+
+def test_rows_staged_during_flush_are_kept():
+    conn = FakeConnection()
+    writer = BatchWriter(FakePool(conn))
+    stage_rows(writer)
+
+    async def flush_and_stage():
+        flushing = asyncio.create_task(writer.flush())
+        await asyncio.sleep(0)
+        assert writer._flush_lock.locked()
+        late = writer.add_claim(None, 'claim c', 'finding', 0.9, 'strong', [3])
+        await flushing
+        return late
+
+    late = asyncio.run(flush_and_stage())
+    assert late in writer._claims
+    assert writer.claim_id(late) is None
@@ -0,0 +1,126 @@
+"""ClaimLSH finds similar claims and rehashes only new or edited ones."""
+
+import asyncio
+
+import asyncpg
+
+from tools.claim_lsh import ClaimLSH
+from tools.pattern_detector import meaningful_words
+
+
+class FakePool:
+    """synthesis.claim_minhash as {(kind, claim_id): (signature, text_hash)}."""
+
+    def __init__(self, claim_ids, exists=True):
+        self.claim_ids = set(claim_ids)
+        self.exists = exists
+        self.rows = {}
+
+    def acquire(self):
+        pool = self
+
+        class Acquire:
+            async def __aenter__(self):
+                return pool
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Acquire()
+
+    def transaction(self):
+        class Transaction:
+            async def __aenter__(self):
+                return None
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Transaction()
+
+    async def _cursor(self, kind):
+        if not self.exists:
+            raise asyncpg.UndefinedTableError('relation "synthesis.claim_minhash" does not exist')
+        for (k, claim_id), (signature, text_hash) in sorted(self.rows.items()):
+            if k == kind:
+                yield {'claim_id': claim_id, 'signature': signature, 'text_hash': text_hash}
+
+    def cursor(self, sql, kind, prefetch=None):
+        return self._cursor(kind)
+
+    async def execute(self, sql, kind, ids, signatures, hashes):
+        for claim_id, signature, text_hash in zip(ids, signatures, hashes):
+            if claim_id in self.claim_ids:
+                self.rows[(kind, claim_id)] = (signature, text_hash)
+
+
+CLAIMS = {
+    1: 'dopamine release increases reward prediction error signals',
+    2: 'dopamine release increases reward prediction error signals in striatum',
+    3: 'coral reefs host diverse fish communities',
+    4: 'the of and',  # Only stopwords: indexed, never a candidate
+}
+
+
+def make_index():
+    return ClaimLSH('words', meaningful_words, num_perm=32, bands=32)
+
+
+def test_candidates_and_queries():
+    index = make_index()
+    assert index.update(list(CLAIMS), list(CLAIMS.values())) == 4
+    assert index.candidates(1).tolist() == [2]
+    assert index.candidates(4).tolist() == []
+    assert 3 in index.query('diverse fish communities on coral reefs').tolist()
+    assert index.stats()['indexed'] == 3
+
+
+def test_only_new_or_edited_claims_are_rehashed():
+    index = make_index()
+    index.update(list(CLAIMS), list(CLAIMS.values()))
+    index._pending.clear()
+    assert index.update(list(CLAIMS), list(CLAIMS.values())) == 0
+
+    edited = dict(CLAIMS)
+    edited[3] = 'dopamine release increases reward prediction error signals in cortex'
+    edited[5] = 'coral reefs host diverse fish communities worldwide'
+    assert index.update(list(edited), list(edited.values())) == 2
+    assert sorted(index._pending) == [3, 5]
+    assert index.ids.tolist() == [1, 2, 3, 4, 5]
+    assert sorted(index.candidates(1).tolist()) == [2, 3]
+    assert index.candidates(5).tolist() == []
+
+    index.restrict([1, 3])
+    assert index.ids.tolist() == [1, 3]
+    assert index.candidates(1).tolist() == [3]
+
+
+def test_signatures_round_trip_through_the_table():
+    pool = FakePool(CLAIMS)
+    index = make_index()
+    asyncio.run(index.load(pool))
+    index.update(list(CLAIMS), list(CLAIMS.values()))
+    asyncio.run(index.persist(pool))
+    assert len(pool.rows) == 4 and index.stats()['pending'] == 0
+
+    loaded = make_index()
+    asyncio.run(loaded.load(pool))
+    assert loaded.ids.tolist() == index.ids.tolist()
+    assert loaded.candidates(1).tolist() == [2]
+    assert loaded.update(list(CLAIMS), list(CLAIMS.values())) == 0
+
+    # Rows stored without a text hash are rehashed once
+    pool.rows = {key: (signature, 0) for key, (signature, _) in pool.rows.items()}
+    stale = make_index()
+    asyncio.run(stale.load(pool))
+    assert stale.update(list(CLAIMS), list(CLAIMS.values())) == 4
+
+
+def test_missing_table_keeps_the_index_in_memory():
+    pool = FakePool(CLAIMS, exists=False)
+    index = make_index()
+    asyncio.run(index.load(pool))
+    assert not index.persistent
+    index.update(list(CLAIMS), list(CLAIMS.values()))
+    asyncio.run(index.persist(pool))
+    assert pool.rows == {} and index.candidates(1).tolist() == [2]
@@ -0,0 +1,63 @@
+"""DomainLearner ingest pipeline keeps the paper index in step with what is stored."""
+
+import asyncio
+from datetime import datetime
+
+from integrations.base import Paper, SourceType
+from integrations.scheduler import FetchJob
+from tools.cipher_brain import Domain, PreparedPaper
+from tools.domain_learner import DomainLearner, LearningSession
+from tools.paper_index import PaperIndex
+
+
+class FakeBrain:
+    """prepare_papers / ingest_paper fail or skip papers by title."""
+
+    def __init__(self):
+        self.paper_index = PaperIndex(min_capacity=1000)
+        self.ingested = []
+
+    async def prepare_papers(self, papers):
+        if any(p['title'].startswith('broken') for p in papers):
+            raise RuntimeError('extraction failed')
+        return [PreparedPaper(paper=p, skipped=p['title'].startswith('empty')) for p in papers]
+
+    async def ingest_paper(self, prepared, flush=True):
+        if prepared.paper['title'].startswith('unstorable'):
+            raise RuntimeError('ingest failed')
+        self.ingested.append(prepared.paper['external_id'])
+        return {'claims_extracted': 0, 'connections_found': 0, 'patterns_detected': 0}
+
+    async def flush(self):
+        pass
+
+
+def paper(external_id, title):
+    return Paper(external_id=external_id, source_type=SourceType.OPENALEX, title=title)
+
+
+def test_pipeline_releases_papers_that_are_not_staged():
+    brain = FakeBrain()
+    learner = DomainLearner(brain, {'extract_batch_size': 1, 'extract_workers': 1})
+    papers = [
+        paper('W1', 'stored paper one'),
+        paper('W2', 'broken extraction paper'),
+        paper('W3', 'empty abstract paper'),
+        paper('W4', 'unstorable paper here'),
+        paper('W5', 'stored paper five'),
+    ]
+    # What _filter_known does when the papers are admitted
+    for p in papers:
+        brain.paper_index.stage(p.to_dict())
+
+    async def fetch():
+        return papers
+
+    session = LearningSession('s', Domain(1), datetime.now())
+    asyncio.run(learner._run_pipeline(
+        session, [FetchJob('openalex', 'test', fetch)], max_papers=10, deduplicate=False
+    ))
+
+    assert brain.ingested == ['W1', 'W5']
+    assert sorted(fp.external_id for fp in brain.paper_index.pending) == ['W1', 'W5']
+    assert len(session.errors) == 2
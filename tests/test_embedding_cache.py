@@ -0,0 +1,90 @@
+"""EmbeddingCache reads without the write lock and keeps LRU order."""
+
+import asyncio
+import sqlite3
+import threading
+
+import numpy as np
+
+from tools.embedding_cache import EmbeddingCache
+from tools.embeddings import EmbeddingBackend, EmbeddingService
+
+
+def make_cache(tmp_path, max_entries=3):
+    cache = EmbeddingCache('test-model', cache_dir=tmp_path, max_entries=max_entries)
+    cache.LOCK_TIMEOUT = 0.1
+    return cache
+
+
+def test_roundtrip(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put_many(['a', 'b'], np.eye(2, 4))
+    assert cache.get_many(['b', 'x', 'a']) == {0: [0.0, 1.0, 0.0, 0.0], 2: [1.0, 0.0, 0.0, 0.0]}
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_lookup_does_not_wait_for_a_writer(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put_many(['a'], np.ones((1, 4)))
+
+    writer = sqlite3.connect(str(cache.path / 'index.sqlite'), isolation_level=None)
+    writer.execute('BEGIN IMMEDIATE')
+    try:
+        assert cache.get_many(['a']) == {0: [1.0] * 4}
+    finally:
+        writer.execute('ROLLBACK')
+        writer.close()
+
+
+def test_hits_count_for_eviction(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put_many(['a', 'b', 'c'], np.eye(3, 4))
+    # 'a' is the oldest entry, but a hit makes it the most recent
+    cache.get_many(['a'])
+    cache.put_many(['d'], np.ones((1, 4)))
+    assert sorted(cache.get_many(['a', 'b', 'c', 'd'])) == [0, 2, 3]
+
+
+def test_pending_touches_are_written_on_close(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put_many(['a', 'b'], np.eye(2, 4))
+    db = sqlite3.connect(str(cache.path / 'index.sqlite'))
+    before = dict(db.execute('SELECT key, last_used FROM entries').fetchall())
+
+    cache.get_many(['a'])
+    assert dict(db.execute('SELECT key, last_used FROM entries').fetchall()) == before
+    cache.close()
+    after = dict(db.execute('SELECT key, last_used FROM entries').fetchall())
+    assert sum(after[k] > before[k] for k in before) == 1
+
+
+class FakeBackend(EmbeddingBackend):
+    dimensions = 4
+    model_name = 'test-model'
+
+    async def embed(self, text):
+        return [float(len(text))] * 4
+
+    async def embed_batch(self, texts):
+        return [[float(len(t))] * 4 for t in texts]
+
+
+def test_service_uses_the_cache_off_the_event_loop(tmp_path):
+    service = EmbeddingService(FakeBackend(), cache_dir=tmp_path)
+    threads = set()
+    for name in ('get_many', 'put_many'):
+        method = getattr(service.cache, name)
+
+        def tracked(*args, method=method):
+            threads.add(threading.current_thread())
+            return method(*args)
+
+        setattr(service.cache, name, tracked)
+
+    async def run():
+        await service.embed_batch(['ab', 'abc'])
+        return await service.embed('ab')
+
+    assert asyncio.run(run()).vector == [2.0] * 4
+    assert threads and threading.main_thread() not in threads
+    assert service.cache.hits == 1
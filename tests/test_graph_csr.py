@@ -0,0 +1,110 @@
+"""The CSR backend of GraphEngine agrees with the dict backend."""
+
+import random
+
+import numpy as np
+import pytest
+
+from tools.graph_csr import CSRGraph, louvain
+from tools.graph_engine import GraphEngine
+
+
+def random_engine(seed, nodes=40, edges=90):
+    """Dict-backend engine over a random multigraph with typed edges."""
+    rng = random.Random(seed)
+    engine = GraphEngine('postgresql://unused')
+    engine._loaded = True
+    for i in range(1, nodes + 1):
+        engine._add_node({
+            'id': i * 7, 'claim_text': f'claim {i}', 'claim_type': 'finding',
+            'domains': rng.sample(range(1, 7), rng.randint(1, 2)), 'confidence': 0.5,
+        })
+    for _ in range(edges):
+        engine._add_edge({
+            'source_claim_id': rng.randint(1, nodes) * 7,
+            'target_claim_id': rng.randint(1, nodes) * 7,
+            'connection_type': rng.choice(['supports', 'extends']),
+            'strength': round(rng.uniform(0.05, 1.0), 3),
+            'cross_domain': rng.random() < 0.2,
+            'reasoning': None,
+        })
+    return engine
+
+
+def csr_engine(engine):
+    csr = GraphEngine('postgresql://unused', backend='csr')
+    csr._loaded = True
+    csr._csr = CSRGraph.from_engine(engine)
+    return csr
+
+
+def path_cost(path):
+    return sum(1 - edge.strength for edge in path.edges) if path else None
+
+
+def assert_well_formed(path, source, target):
+    assert path.nodes[0] == source and path.nodes[-1] == target
+    for edge, (u, v) in zip(path.edges, zip(path.nodes, path.nodes[1:])):
+        assert (edge.source_id, edge.target_id) == (u, v)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_paths_match(seed):
+    engine = random_engine(seed)
+    csr = csr_engine(engine)
+    rng = random.Random(seed)
+    ids = list(engine._nodes)
+    for _ in range(60):
+        source, target = rng.choice(ids), rng.choice(ids)
+
+        expected, found = engine.find_shortest_path(source, target), csr.find_shortest_path(source, target)
+        assert (expected is None) == (found is None)
+        if found:
+            assert len(found.nodes) == len(expected.nodes)
+            assert_well_formed(found, source, target)
+
+        expected, found = engine.find_strongest_path(source, target), csr.find_strongest_path(source, target)
+        assert (expected is None) == (found is None)
+        if found:
+            assert path_cost(found) == pytest.approx(path_cost(expected))
+            assert_well_formed(found, source, target)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_scores_match(seed):
+    engine = random_engine(seed)
+    csr = csr_engine(engine)
+    ids = list(engine._nodes)
+
+    # Every node a source, so both backends compute exact betweenness
+    expected = engine.compute_betweenness_centrality(sample_size=len(ids))
+    found = csr.compute_betweenness_centrality(sample_size=len(ids))
+    assert [found[i] for i in ids] == pytest.approx([expected[i] for i in ids])
+
+    expected = engine.compute_clustering_coefficients()
+    found = csr.compute_clustering_coefficients()
+    assert [found[i] for i in ids] == pytest.approx([expected[i] for i in ids])
+
+    expected = engine.compute_pagerank()
+    found = csr.compute_pagerank()
+    assert [found[i] for i in ids] == pytest.approx([expected[i] for i in ids], abs=1e-4)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_louvain_communities_are_connected(seed):
+    engine = random_engine(seed, nodes=120, edges=300)
+    indptr, indices, weights = CSRGraph.from_engine(engine).undirected()
+    labels = louvain(indptr, indices, weights, seed=seed)
+    assert sorted(set(labels.tolist())) == list(range(labels.max() + 1))
+
+    for community in range(labels.max() + 1):
+        members = set(np.flatnonzero(labels == community).tolist())
+        start = min(members)
+        seen, stack = {start}, [start]
+        while stack:
+            v = stack.pop()
+            for u in indices[indptr[v]:indptr[v + 1]].tolist():
+                if u in members and u not in seen:
+                    seen.add(u)
+                    stack.append(u)
+        assert seen == members
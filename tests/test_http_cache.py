@@ -0,0 +1,71 @@
+"""Response cache behaviour of AcademicSource._request."""
+
+import asyncio
+import threading
+
+import pytest
+
+from integrations.http_cache import CacheMiss, SQLiteResponseCache, cache_key
+from integrations.pubmed import PubMedClient
+
+
+def offline_client(tmp_path):
+    client = PubMedClient()
+    client.cache = SQLiteResponseCache(tmp_path / 'cache.db', offline=True)
+
+    async def no_network(*args, **kwargs):
+        raise AssertionError('offline mode sent a request')
+
+    client._send = no_network
+    return client
+
+
+def test_offline_refuses_uncacheable_requests(tmp_path):
+    async def run():
+        # RateLimiter wants a running loop, so build the client inside one
+        client = offline_client(tmp_path)
+        with pytest.raises(CacheMiss):
+            await client._request('GET', 'https://example.org/esearch', {'term': 'x'}, use_cache=False)
+        # search_page goes through the history server, which is never cached
+        with pytest.raises(CacheMiss):
+            await client.search_page('crispr')
+        return client.cache.stats()
+
+    assert asyncio.run(run()) == {'pubmed': {'miss': 2}}
+
+
+def test_counters_are_buffered_until_flushed(tmp_path):
+    cache = SQLiteResponseCache(tmp_path / 'cache.db')
+    cache.store('pubmed', 'k', 'https://example.org', '{}', None, None)
+    for _ in range(3):
+        cache.record('pubmed', 'hit')
+    # Nothing written yet; a second connection sees no counters
+    other = SQLiteResponseCache(tmp_path / 'cache.db')
+    assert other.stats() == {}
+
+    cache.close()
+    assert other.stats() == {'pubmed': {'hit': 3}}
+
+
+def test_cache_io_runs_off_the_event_loop(tmp_path):
+    url = 'https://example.org/a'
+    cache = SQLiteResponseCache(tmp_path / 'cache.db')
+    cache.store('pubmed', cache_key('GET', url, None), url, '{"ok": true}', None, None)
+
+    threads = set()
+    lookup = cache.lookup
+
+    def tracked_lookup(key):
+        threads.add(threading.current_thread())
+        return lookup(key)
+
+    cache.lookup = tracked_lookup
+
+    async def run():
+        client = offline_client(tmp_path)
+        client.cache = cache
+        return await asyncio.gather(*[client._request('GET', url) for _ in range(20)])
+
+    assert asyncio.run(run()) == [{'ok': True}] * 20
+    assert threading.main_thread() not in threads
+    assert cache.stats() == {'pubmed': {'hit': 20}}
@@ -0,0 +1,114 @@
+"""PaperIndex recognizes papers seen before, in this run or stored, under any key."""
+
+import asyncio
+
+import numpy as np
+
+from tools.minhash import MinHasher, jaccard, shingles
+from tools.paper_index import BloomFilter, PaperIndex
+
+
+class FakePool:
+    """synthesis.paper_keys as {key: [source_id]} plus source titles."""
+
+    def __init__(self):
+        self.keys = {}
+        self.titles = {}
+        self.probes = []
+
+    def acquire(self):
+        pool = self
+
+        class Acquire:
+            async def __aenter__(self):
+                return pool
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Acquire()
+
+    async def fetch(self, sql, probe):
+        self.probes.append(list(probe))
+        return [
+            {'key': key, 'title': self.titles[source_id]}
+            for key in probe for source_id in self.keys.get(key, ())
+        ]
+
+    async def execute(self, sql, keys, ids):
+        for key, source_id in zip(keys, ids):
+            self.keys.setdefault(key, []).append(source_id)
+
+
+def paper(external_id, title, **metadata):
+    return {'external_id': external_id, 'title': title, 'metadata': metadata}
+
+
+def test_signatures_match_signature():
+    hasher = MinHasher(num_perm=32)
+    sets = [shingles('Dopamine and reward prediction'), set(), {'a', 'b'}, shingles('x' * 40)]
+    expected = np.array([hasher.signature(s) for s in sets])
+    assert np.array_equal(hasher.signatures(sets), expected)
+    assert np.array_equal(
+        hasher.band_hashes(expected, 8)[0], hasher.band_hashes(hasher.signature(sets[0]), 8)[0]
+    )
+
+
+def test_signature_agreement_estimates_jaccard():
+    hasher = MinHasher(num_perm=256)
+    a = shingles('Grid cells in the entorhinal cortex encode spatial position')
+    b = shingles('Grid cells of the entorhinal cortex encode spatial location')
+    agreement = float(np.mean(hasher.signature(a) == hasher.signature(b)))
+    assert abs(agreement - jaccard(a, b)) < 0.1
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000)
+    keys = [f"id:W{i}" for i in range(1000)]
+    bloom.add_many(keys)
+    assert all(key in bloom for key in keys)
+    assert sum(f"id:X{i}" in bloom for i in range(1000)) < 50
+
+
+def test_duplicates_within_a_run():
+    index = PaperIndex(min_capacity=1000)
+    pool = FakePool()
+    title = 'Hippocampal replay supports memory consolidation during sleep'
+    admitted = asyncio.run(index.admit(pool, [
+        paper('arxiv:1', title, doi='10.1/ABC'),
+        paper('pubmed:2', 'Unrelated: a study of coral reef acoustics', doi='https://doi.org/10.1/abc'),
+        paper('openalex:3', title.upper() + '.'),
+        paper('openalex:4', 'Protein folding landscapes and funnel theory'),
+    ]))
+    # Same DOI under another resolver prefix; same title up to case and punctuation
+    assert admitted == [True, False, False, True]
+    assert index.rejected == 2
+    assert sorted(fp.external_id for fp in index.pending) == ['arxiv:1', 'openalex:4']
+
+
+def test_released_papers_can_be_admitted_again():
+    index = PaperIndex(min_capacity=1000)
+    pool = FakePool()
+    first = paper('W1', 'Cortical oscillations coordinate attention and memory')
+    assert asyncio.run(index.admit(pool, [first])) == [True]
+    index.release(['W1'])
+    assert asyncio.run(index.admit(pool, [first])) == [True]
+
+
+def test_persisted_papers_are_confirmed_against_the_table():
+    index = PaperIndex(min_capacity=1000)
+    pool = FakePool()
+    title = 'Neural population dynamics during reaching movements'
+    pool.titles[10] = title
+    asyncio.run(index.admit(pool, [paper('W1', title, pmid='123')]))
+    asyncio.run(index.persist(pool, {'W1': 10}))
+    assert index.pending == [] and pool.keys['pmid:123'] == [10]
+
+    admitted = asyncio.run(index.admit(pool, [
+        paper('arxiv:9', 'Another paper entirely', pmid='123'),
+        paper('W2', 'Neural population dynamics during reaching movement'),
+        paper('W3', 'Metabolic scaling laws across species'),
+    ]))
+    assert admitted == [False, False, True]
+    # Only keys the Bloom filter may hold were looked up
+    assert all(key in index.bloom for key in pool.probes[-1])
@@ -0,0 +1,82 @@
+"""VectorIndex.sync follows inserts, deletes and re-embedded claims."""
+
+import asyncio
+
+import asyncpg
+import numpy as np
+
+from tools.vector_index import VectorIndex
+
+
+class FakeClaims:
+    """synthesis.claims as {id: (embedding, domains, vector_version)}."""
+
+    def __init__(self, claims, versioned=True):
+        self.claims = claims
+        self.versioned = versioned
+        self.fetched = []
+
+    def acquire(self):
+        pool = self
+
+        class Acquire:
+            async def __aenter__(self):
+                return pool
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Acquire()
+
+    async def fetch(self, sql, *args):
+        if 'vector_version' in sql and not self.versioned:
+            raise asyncpg.UndefinedColumnError('column "vector_version" does not exist')
+        if args:
+            self.fetched.extend(args[0])
+            return [
+                {'id': i, 'embedding': self.claims[i][0], 'domains': self.claims[i][1],
+                 'version': self.claims[i][2]}
+                for i in args[0] if i in self.claims
+            ]
+        return [{'id': i, 'version': c[2]} for i, c in self.claims.items()]
+
+
+def unit(i, dims=8):
+    v = np.zeros(dims, dtype=np.float32)
+    v[i] = 1.0
+    return v
+
+
+def test_sync_readds_changed_claims(tmp_path):
+    pool = FakeClaims({1: (unit(0), [1], 1), 2: (unit(1), [2], 2), 3: (unit(2), [3], 3)})
+    index = VectorIndex(dimensions=8, path=tmp_path / 'claims.npz')
+    assert asyncio.run(index.sync(pool)) == 3
+
+    # Claim 2 re-embedded, claim 3 reclassified, claim 1 deleted, claim 4 new
+    pool.claims = {2: (unit(5), [2], 7), 3: (unit(2), [4], 8), 4: (unit(3), [1], 9)}
+    pool.fetched = []
+    assert asyncio.run(index.sync(pool)) == 3
+    assert sorted(pool.fetched) == [2, 3, 4]
+    assert sorted(index.ids.tolist()) == [2, 3, 4]
+    assert index.search(unit(5), k=1) == [(2, 1.0)]
+    assert index.search(unit(2), k=1, domains=[4])[0][0] == 3
+
+    # Nothing changed: nothing is read
+    pool.fetched = []
+    assert asyncio.run(index.sync(pool)) == 0
+    assert pool.fetched == []
+
+    # Versions survive a save/load round trip
+    index.save()
+    loaded = VectorIndex.load(index.path, dimensions=8)
+    pool.fetched = []
+    assert asyncio.run(loaded.sync(pool)) == 0
+
+
+def test_sync_without_version_column(tmp_path):
+    pool = FakeClaims({1: (unit(0), [1], 0), 2: (unit(1), [2], 0)}, versioned=False)
+    index = VectorIndex(dimensions=8, path=tmp_path / 'claims.npz')
+    assert asyncio.run(index.sync(pool)) == 2
+    del pool.claims[1]
+    assert asyncio.run(index.sync(pool)) == 0
+    assert index.ids.tolist() == [2]
@@ -16,6 +16,7 @@ from .embeddings import (
     embed_texts,
     compute_similarity
 )
+from .vector_index import VectorIndex
 from .nlp_extractor import (
     NLPExtractor,
     get_nlp_extractor,
@@ -104,6 +105,7 @@ __all__ = [
     'embed_text',
     'embed_texts',
     'compute_similarity',
+    'VectorIndex',
 
     # NLP Extraction
     'NLPExtractor',
@@ -119,8 +119,8 @@ class ActiveLearner:
 
     async def connect(self):
         """Establish database connection."""
-        import asyncpg
-        self._conn = await asyncpg.connect(self.db_connection_string)
+        from .pgvector_codec import connect
+        self._conn = await connect(self.db_connection_string)
         await self._load_learning_history()
 
     async def close(self):
@@ -0,0 +1,408 @@
+"""
+CIPHER Batch Writer
+
+Buffered bulk persistence for sources, claims, connections and patterns.
+
+Instead of one INSERT ... RETURNING per row, rows are collected per table
+and flushed in a single transaction:
+1. COPY (copy_records_to_table) into a temp staging table
+2. INSERT ... SELECT from staging into synthesis.*, returning IDs in bulk
+
+Rows that reference not-yet-written rows use keys instead of IDs:
+- a source is referenced by its external_id
+- a claim is referenced by its entropy_hash
+
+Keys are resolved to database IDs at flush time. Claims are deduplicated
+on entropy_hash, both within the batch and against existing claims.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Union, Tuple
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# A reference to a claim/source: database ID or pending key
+Ref = Union[int, str]
+
+
+SOURCE_COLUMNS = (
+    'external_id', 'source_type', 'title', 'authors', 'abstract',
+    'publication_date', 'journal', 'citation_count', 'domains', 'url',
+    'pdf_url', 'metadata', 'quality_score', 'entropy_hash',
+)
+
+CLAIM_COLUMNS = (
+    'source_id', 'claim_text', 'claim_type', 'confidence', 'evidence_strength',
+    'domains', 'entities', 'methodology', 'sample_size', 'p_value',
+    'effect_size', 'entropy_hash', 'embedding',
+)
+
+CONNECTION_COLUMNS = (
+    'source_claim_id', 'target_claim_id', 'connection_type', 'strength',
+    'cross_domain', 'reasoning', 'entropy_score', 'discovered_by',
+)
+
+PATTERN_COLUMNS = (
+    'pattern_name', 'pattern_type', 'description', 'domains', 'claim_ids',
+    'confidence', 'novelty_score', 'implications', 'questions_raised',
+    'entropy_hash',
+)
+
+
+@dataclass
+class FlushResult:
+    """Outcome of a flush"""
+    sources: int = 0
+    claims_inserted: int = 0
+    claims_deduplicated: int = 0
+    connections: int = 0
+    patterns: int = 0
+    # entropy_hash -> id for claims inserted by this flush
+    new_claim_ids: Dict[str, int] = field(default_factory=dict)
+
+
+class BatchWriter:
+    """
+    Collects rows per table and writes them with COPY + INSERT ... SELECT.
+
+    Usage:
+        writer = BatchWriter(pool)
+        src = writer.add_source(external_id='W123', ...)
+        key = writer.add_claim(source=src, text='...', ...)
+        writer.add_connection(existing_id, key, 'supports', 0.6, False, '...')
+        result = await writer.flush()
+        writer.claim_id(key)  # -> database id
+    """
+
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        flush_threshold: int = 5000,
+        discovered_by: str = 'cipher_brain'
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            pool: asyncpg pool
+            flush_threshold: Pending row count at which maybe_flush() writes
+            discovered_by: Default discovered_by for connections
+        """
+        self.pool = pool
+        self.flush_threshold = flush_threshold
+        self.discovered_by = discovered_by
+
+        self._sources: Dict[str, tuple] = {}
+        self._claims: Dict[str, list] = {}
+        self._connections: Dict[Tuple[Ref, Ref, str], list] = {}
+        self._patterns: List[list] = []
+
+        # Resolved keys, kept across flushes so later rows can reference them
+        self.source_ids: Dict[str, int] = {}
+        self.claim_ids: Dict[str, int] = {}
+
+        # One flush at a time, so two flushes never take the same rows
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of rows waiting to be flushed."""
+        return (len(self._sources) + len(self._claims) +
+                len(self._connections) + len(self._patterns))
+
+    def source_id(self, external_id: str) -> Optional[int]:
+        return self.source_ids.get(external_id)
+
+    def claim_id(self, key: Ref) -> Optional[int]:
+        if isinstance(key, int):
+            return key
+        return self.claim_ids.get(key)
+
+    # =========================================================================
+    # STAGING
+    # =========================================================================
+
+    def add_source(
+        self,
+        external_id: str,
+        source_type: str,
+        title: str,
+        authors: List[Any] = None,
+        abstract: Optional[str] = None,
+        publication_date=None,
+        journal: Optional[str] = None,
+        citation_count: int = 0,
+        domains: List[int] = None,
+        url: Optional[str] = None,
+        pdf_url: Optional[str] = None,
+        metadata: Dict[str, Any] = None,
+        quality_score: Optional[float] = None,
+        entropy_hash: Optional[str] = None
+    ) -> str:
+        """Stage a source. Returns its key (the external_id)."""
+        self._sources[external_id] = (
+            external_id, source_type, title, json.dumps(authors or []),
+            abstract, publication_date, journal, citation_count or 0,
+            list(domains or []), url, pdf_url, json.dumps(metadata or {}),
+            quality_score, entropy_hash,
+        )
+        return external_id
+
+    def add_claim(
+        self,
+        source: Optional[Ref],
+        text: str,
+        claim_type: str,
+        confidence: float,
+        evidence_strength: str,
+        domains: List[int],
+        entities: List[str] = None,
+        methodology: Optional[str] = None,
+        sample_size: Optional[int] = None,
+        p_value: Optional[float] = None,
+        effect_size: Optional[float] = None,
+        entropy_hash: Optional[str] = None,
+        embedding=None
+    ) -> str:
+        """
+        Stage a claim.
+
+        Args:
+            source: Source ID or pending source key (external_id)
+
+        Returns:
+            The claim's key (entropy_hash, derived from text if missing)
+        """
+        key = entropy_hash or hashlib.shake_256(text.encode('utf-8')).hexdigest(64)
+        if key in self._claims or key in self.claim_ids:
+            return key
+        self._claims[key] = [
+            source, text, claim_type, confidence, evidence_strength,
+            list(domains or []), json.dumps(entities or []), methodology,
+            sample_size, p_value, effect_size, key,
+            embedding,
+        ]
+        return key
+
+    def add_connection(
+        self,
+        source_claim: Ref,
+        target_claim: Ref,
+        connection_type: str,
+        strength: float,
+        cross_domain: bool,
+        reasoning: str = '',
+        entropy_score: Optional[float] = None,
+        discovered_by: Optional[str] = None
+    ):
+        """Stage a connection. Endpoints may be claim IDs or pending claim keys."""
+        self._connections[(source_claim, target_claim, connection_type)] = [
+            source_claim, target_claim, connection_type, strength,
+            cross_domain, reasoning, entropy_score,
+            discovered_by or self.discovered_by,
+        ]
+
+    def add_pattern(
+        self,
+        name: str,
+        pattern_type: str,
+        description: str,
+        domains: List[int],
+        claim_ids: List[Ref],
+        confidence: float,
+        novelty_score: float,
+        implications: str,
+        questions_raised: List[str],
+        entropy_hash: Optional[str] = None
+    ):
+        """Stage a pattern. claim_ids may contain pending claim keys."""
+        self._patterns.append([
+            name, pattern_type, description, list(domains or []), list(claim_ids),
+            confidence, novelty_score, implications, list(questions_raised or []),
+            entropy_hash,
+        ])
+
+    # =========================================================================
+    # FLUSH
+    # =========================================================================
+
+    async def maybe_flush(self) -> Optional[FlushResult]:
+        """Flush if the pending row count reached the threshold."""
+        if self.pending >= self.flush_threshold:
+            return await self.flush()
+        return None
+
+    async def flush(self) -> FlushResult:
+        """
+        Write all staged rows in one transaction.
+
+        Works on a snapshot of the buffers: rows staged while the flush
+        runs wait for the next one. Buffers and resolved IDs are only
+        updated once the transaction has committed, so a failed flush
+        leaves everything staged for a retry.
+        """
+        result = FlushResult()
+        async with self._flush_lock:
+            if not self.pending:
+                return result
+
+            batch = _Batch(
+                sources=dict(self._sources),
+                claims=dict(self._claims),
+                connections=dict(self._connections),
+                patterns=list(self._patterns)
+            )
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    result.sources = await self._flush_sources(conn, batch)
+                    await self._flush_claims(conn, batch, result)
+                    result.connections = await self._flush_connections(conn, batch)
+                    result.patterns = await self._flush_patterns(conn, batch)
+
+            # Committed: publish IDs and drop the written rows (unless
+            # they were restaged with new values meanwhile)
+            self.source_ids.update(batch.source_ids)
+            self.claim_ids.update(batch.claim_ids)
+            for buffer, written in ((self._sources, batch.sources),
+                                    (self._claims, batch.claims),
+                                    (self._connections, batch.connections)):
+                for key, row in written.items():
+                    if buffer.get(key) is row:
+                        del buffer[key]
+            del self._patterns[:len(batch.patterns)]
+
+        logger.debug(
+            f"Batch flush: {result.sources} sources, {result.claims_inserted} claims "
+            f"(+{result.claims_deduplicated} dup), {result.connections} connections, "
+            f"{result.patterns} patterns"
+        )
+        return result
+
+    async def _stage(self, conn, table: str, columns: Tuple[str, ...], records: List[tuple]) -> str:
+        """COPY records into a temp staging table shaped like ``table``."""
+        stage = f"_stage_{table.split('.')[-1]}"
+        cols = ', '.join(columns)
+        await conn.execute(f'''
+            CREATE TEMP TABLE {stage} ON COMMIT DROP AS
+            SELECT {cols} FROM {table} WITH NO DATA
+        ''')
+        await conn.copy_records_to_table(stage, records=records, columns=list(columns))
+        return stage
+
+    async def _flush_sources(self, conn, batch: '_Batch') -> int:
+        if not batch.sources:
+            return 0
+        cols = ', '.join(SOURCE_COLUMNS)
+        stage = await self._stage(conn, 'synthesis.sources', SOURCE_COLUMNS,
+                                  list(batch.sources.values()))
+        rows = await conn.fetch(f'''
+            INSERT INTO synthesis.sources ({cols})
+            SELECT {cols} FROM {stage}
+            ON CONFLICT (external_id) DO UPDATE SET
+                citation_count = EXCLUDED.citation_count,
+                quality_score = EXCLUDED.quality_score,
+                updated_at = NOW()
+            RETURNING id, external_id
+        ''')
+        for row in rows:
+            batch.source_ids[row['external_id']] = row['id']
+        return len(rows)
+
+    async def _flush_claims(self, conn, batch: '_Batch', result: FlushResult):
+        if not batch.claims:
+            return
+
+        # Deduplicate against claims already in the database
+        existing = await conn.fetch('''
+            SELECT entropy_hash, MIN(id) AS id
+            FROM synthesis.claims
+            WHERE entropy_hash = ANY($1)
+            GROUP BY entropy_hash
+        ''', list(batch.claims.keys()))
+        for row in existing:
+            batch.claim_ids[row['entropy_hash']] = row['id']
+        result.claims_deduplicated = len(existing)
+
+        records = []
+        for key, row in batch.claims.items():
+            if key in batch.claim_ids:
+                continue
+            source = row[0]
+            if isinstance(source, str):
+                source = batch.source_ids.get(source, self.source_ids.get(source))
+            records.append((source, *row[1:]))
+        if not records:
+            return
+
+        cols = ', '.join(CLAIM_COLUMNS)
+        stage = await self._stage(conn, 'synthesis.claims', CLAIM_COLUMNS, records)
+        rows = await conn.fetch(f'''
+            INSERT INTO synthesis.claims ({cols})
+            SELECT {cols} FROM {stage}
+            RETURNING id, entropy_hash
+        ''')
+        for row in rows:
+            batch.claim_ids[row['entropy_hash']] = row['id']
+            result.new_claim_ids[row['entropy_hash']] = row['id']
+        result.claims_inserted = len(rows)
+
+    async def _flush_connections(self, conn, batch: '_Batch') -> int:
+        if not batch.connections:
+            return 0
+
+        records = {}
+        for row in batch.connections.values():
+            src, tgt = batch.claim_id(row[0], self), batch.claim_id(row[1], self)
+            if src is None or tgt is None or src == tgt:
+                continue
+            records[(src, tgt, row[2])] = (src, tgt, *row[2:])
+        if not records:
+            return 0
+
+        cols = ', '.join(CONNECTION_COLUMNS)
+        stage = await self._stage(conn, 'synthesis.connections', CONNECTION_COLUMNS,
+                                  list(records.values()))
+        status = await conn.execute(f'''
+            INSERT INTO synthesis.connections ({cols})
+            SELECT {cols} FROM {stage}
+            ON CONFLICT (source_claim_id, target_claim_id, connection_type) DO NOTHING
+        ''')
+        return int(status.split()[-1])
+
+    async def _flush_patterns(self, conn, batch: '_Batch') -> int:
+        if not batch.patterns:
+            return 0
+
+        records = []
+        for row in batch.patterns:
+            ids = [batch.claim_id(ref, self) for ref in row[4]]
+            records.append((*row[:4], [i for i in ids if i is not None], *row[5:]))
+
+        placeholders = ', '.join(f'${i}' for i in range(1, len(PATTERN_COLUMNS) + 1))
+        await conn.executemany(f'''
+            INSERT INTO synthesis.patterns ({', '.join(PATTERN_COLUMNS)})
+            VALUES ({placeholders})
+        ''', records)
+        return len(records)
+
+
+@dataclass
+class _Batch:
+    """Rows taken by one flush, and the IDs it resolved (published on commit)"""
+    sources: Dict[str, tuple]
+    claims: Dict[str, list]
+    connections: Dict[Tuple[Ref, Ref, str], list]
+    patterns: List[list]
+    source_ids: Dict[str, int] = field(default_factory=dict)
+    claim_ids: Dict[str, int] = field(default_factory=dict)
+
+    def claim_id(self, key: Ref, writer: BatchWriter) -> Optional[int]:
+        if isinstance(key, int):
+            return key
+        return self.claim_ids.get(key, writer.claim_ids.get(key))
@@ -19,16 +19,26 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
 from enum import Enum
 import json
 import re
+import time
 
 import asyncpg
+import numpy as np
 
 from .hash_learning import HashLearning, EntropyScore
-from .embeddings import EmbeddingService, get_embedding_service
+from .embeddings import EmbeddingService, get_embedding_service, to_matrix
+from .vector_index import VectorIndex, parse_vector
+from .domain_mask import DomainMask, domain_mask, mask_domain_ids, lowest_domain, is_cross_domain
+from .pgvector_codec import create_pool
+from .batch_writer import BatchWriter
+from .entity_index import EntityIndex
+from .paper_index import PaperIndex
 from .nlp_extractor import (
-    NLPExtractor, get_nlp_extractor,
+    NLPExtractor, NLPProcessPool, get_nlp_extractor,
     ExtractedClaim as NLPClaim,
     ClaimType as NLPClaimType,
     EvidenceStrength as NLPEvidenceStrength,
@@ -123,6 +133,11 @@ class Claim:
     status: str = "active"  # active, superseded, retracted, deprecated
     superseded_by: Optional[int] = None
 
+    @cached_property
+    def domain_mask(self) -> DomainMask:
+        """Bitmask of ``domains`` (fixed once the claim is built)."""
+        return domain_mask(self.domains)
+
 
 @dataclass
 class Connection:
@@ -150,6 +165,33 @@ class Pattern:
     questions_raised: List[str]
 
 
+@dataclass
+class PreparedPaper:
+    """A paper after quality scoring and claim extraction, ready to ingest"""
+    paper: Dict[str, Any]
+    quality_score: float = 0.0
+    domains: List[Domain] = field(default_factory=list)
+    claims: List[Claim] = field(default_factory=list)
+    skipped: bool = False  # No abstract or below the quality threshold
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of an embedding backfill run"""
+    updated: int = 0
+    batches: int = 0
+    resumed_from: int = 0  # Checkpoint id the run started after
+    last_id: int = 0
+    completed: bool = False  # Reached the end rather than the limit
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def rate(self) -> float:
+        """Claims written per wall-clock second."""
+        return self.updated / self.seconds if self.seconds > 0 else 0.0
+
+
 @dataclass
 class Thought:
     """An internal cognitive event"""
@@ -167,7 +209,11 @@ class CipherBrain:
     and generates new hypotheses through cross-domain synthesis.
     """
 
-    def __init__(self, db_url: str, embedding_model: str = "all-MiniLM-L6-v2", use_nlp: bool = True):
+    # Most-overlapping claims considered per new claim when finding connections
+    MAX_CANDIDATES = 1000
+
+    def __init__(self, db_url: str, embedding_model: str = "all-MiniLM-L6-v2", use_nlp: bool = True,
+                 index_path: Optional[str] = None, nlp_processes: int = 0, nlp_batch_size: int = 32):
         """
         Initialize the brain.
 
@@ -175,6 +221,9 @@ class CipherBrain:
             db_url: PostgreSQL connection string
             embedding_model: Sentence transformer model for embeddings
             use_nlp: Whether to use NLP-based extraction (requires spaCy)
+            index_path: File for the persistent vector index (optional)
+            nlp_processes: Worker processes for spaCy extraction (0 = in-process)
+            nlp_batch_size: Documents per nlp.pipe batch
         """
         self.db_url = db_url
         self.pool: Optional[asyncpg.Pool] = None
@@ -185,13 +234,40 @@ class CipherBrain:
         self.embedding_service = get_embedding_service(embedding_model)
         self._embeddings_enabled = True
 
+        # Buffered bulk writes, created on connect()
+        self.writer: Optional[BatchWriter] = None
+        self._pending_claims: List[Tuple[str, Claim]] = []
+        self._ingest_lock = asyncio.Lock()
+
+        # ANN index over claim embeddings, loaded lazily on first search
+        self._index_path = index_path
+        self.vector_index: Optional[VectorIndex] = None
+
+        # entity -> claim postings for connection candidates, loaded lazily
+        self.entity_index: Optional[EntityIndex] = None
+
+        # Keys of stored papers for cross-run dedup, loaded lazily
+        self.paper_index: Optional[PaperIndex] = None
+        self._paper_index_lock = asyncio.Lock()
+
         # NLP extractor for advanced claim extraction
         self._use_nlp = use_nlp
         self._nlp_extractor: Optional[NLPExtractor] = None
+        self._nlp_pool: Optional[NLPProcessPool] = None
+        # In-process spaCy runs on one thread, off the event loop
+        self._nlp_thread: Optional[ThreadPoolExecutor] = None
+        self._nlp_batch_size = nlp_batch_size
         if use_nlp:
             try:
                 self._nlp_extractor = get_nlp_extractor()
                 logger.info("NLP extractor initialized")
+                if nlp_processes > 0:
+                    self._nlp_pool = NLPProcessPool(
+                        processes=nlp_processes, batch_size=nlp_batch_size
+                    )
+                    logger.info(f"NLP process pool started ({nlp_processes} workers)")
+                else:
+                    self._nlp_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cipher-nlp')
             except ImportError as e:
                 logger.warning(f"NLP extractor not available: {e}. Falling back to regex.")
                 self._use_nlp = False
@@ -206,17 +282,26 @@ class CipherBrain:
 
     async def connect(self):
         """Establish database connection pool."""
-        self.pool = await asyncpg.create_pool(
+        self.pool = await create_pool(
             self.db_url,
             min_size=2,
             max_size=10
         )
+        self.writer = BatchWriter(self.pool)
         logger.info("Brain connected to database")
 
     async def close(self):
         """Close all connections."""
+        if self.writer and self.writer.pending:
+            await self.flush()
+        if self.vector_index:
+            self.vector_index.save_if_dirty()
         if self.pool:
             await self.pool.close()
+        if self._nlp_pool:
+            self._nlp_pool.close()
+        if self._nlp_thread:
+            self._nlp_thread.shutdown(wait=False)
         for client in self._api_clients.values():
             await client.close()
 
@@ -313,18 +398,52 @@ class CipherBrain:
         - Definitions (new terms or concepts)
         - Observations and Conclusions
         """
-        claims = []
+        return (await self.extract_claims_batch([(title, abstract, domains)]))[0]
 
-        if not abstract:
-            return claims
+    async def extract_claims_batch(
+        self,
+        papers: List[Tuple[str, str, List[Domain]]]
+    ) -> List[List[Claim]]:
+        """
+        Extract claims from many (title, abstract, domains) at once.
+
+        The NLP pass runs as one nlp.pipe batch (in the process pool when
+        configured) and embeddings are computed in one batch for all claims.
+
+        Returns:
+            One list of claims per paper, in input order
+        """
+        results: List[List[Claim]] = [[] for _ in papers]
+        todo = [i for i, (_, abstract, _) in enumerate(papers) if abstract]
+        if not todo:
+            return results
 
         # Use NLP extractor if available
+        nlp_results = None
         if self._use_nlp and self._nlp_extractor:
-            claims = await self._extract_claims_nlp(title, abstract, domains)
-        else:
-            claims = await self._extract_claims_regex(title, abstract, domains)
+            try:
+                items = [(papers[i][1], papers[i][0]) for i in todo]
+                if self._nlp_pool:
+                    nlp_results = await self._nlp_pool.extract_claims_batch(items)
+                else:
+                    nlp_results = await asyncio.get_running_loop().run_in_executor(
+                        self._nlp_thread, partial(
+                            self._nlp_extractor.extract_claims_batch,
+                            items, batch_size=self._nlp_batch_size
+                        )
+                    )
+            except Exception as e:
+                logger.warning(f"NLP extraction failed: {e}. Falling back to regex.")
+
+        for n, i in enumerate(todo):
+            title, abstract, domains = papers[i]
+            if nlp_results is not None:
+                results[i] = await self._extract_claims_nlp(title, abstract, domains, nlp_results[n])
+            else:
+                results[i] = await self._extract_claims_regex(title, abstract, domains)
 
         # Generate embeddings for all claims in batch
+        claims = [claim for i in todo for claim in results[i]]
         if claims and self._embeddings_enabled:
             try:
                 claim_texts = [c.text for c in claims]
@@ -334,21 +453,25 @@ class CipherBrain:
             except Exception as e:
                 logger.warning(f"Failed to generate embeddings: {e}")
 
-        await self.think(
-            'observation',
-            f"Extracted {len(claims)} claims from '{title[:50]}...' using {'NLP' if self._use_nlp else 'regex'}",
-            domains=domains,
-            importance=0.4
-        )
+        for i in todo:
+            title, _, domains = papers[i]
+            await self.think(
+                'observation',
+                f"Extracted {len(results[i])} claims from '{title[:50]}...' using "
+                f"{'NLP' if nlp_results is not None else 'regex'}",
+                domains=domains,
+                importance=0.4
+            )
 
-        return claims
+        return results
 
     async def _extract_claims_nlp(self, title: str, abstract: str,
-                                   domains: List[Domain]) -> List[Claim]:
+                                   domains: List[Domain],
+                                   nlp_claims: List[NLPClaim]) -> List[Claim]:
         """
-        Extract claims using NLP-based analysis.
+        Convert NLP-extracted claims for one paper.
 
-        Uses spaCy for:
+        ``nlp_claims`` come from NLPExtractor, which uses spaCy for:
         - Named Entity Recognition
         - Dependency parsing for causal relations
         - Linguistic feature analysis for confidence scoring
@@ -356,8 +479,6 @@ class CipherBrain:
         claims = []
 
         try:
-            nlp_claims = self._nlp_extractor.extract_claims(abstract, title)
-
             for nlp_claim in nlp_claims:
                 # Apply systematic doubt
                 doubt_result = await self.question(nlp_claim.text)
@@ -542,6 +663,9 @@ class CipherBrain:
         """
         Find connections between a new claim and existing claims.
 
+        ``existing_claims`` are normally the entity index candidates for
+        ``claim`` (see learn_from_paper), not the whole corpus.
+
         Looks for:
         - Supporting evidence (similar findings)
         - Contradictions (opposing findings)
@@ -549,6 +673,7 @@ class CipherBrain:
         - Analogies (similar patterns in different domains)
         """
         connections = []
+        claim_mask = claim.domain_mask
 
         for claim_id, existing in existing_claims:
             # Skip if same claim
@@ -556,9 +681,8 @@ class CipherBrain:
                 continue
 
             # Check for cross-domain (the interesting cases)
-            claim_domains = set(claim.domains)
-            existing_domains = set(existing.domains)
-            cross_domain = bool(claim_domains) and bool(existing_domains) and claim_domains != existing_domains
+            existing_mask = existing.domain_mask
+            cross_domain = is_cross_domain(claim_mask, existing_mask)
 
             # Calculate entity overlap
             claim_entities = set(e.lower() for e in claim.entities)
@@ -590,12 +714,12 @@ class CipherBrain:
             elif cross_domain and entity_overlap >= 1:
                 connection_type = 'analogous'
                 strength = 0.6 + entity_overlap * 0.1
-                reasoning = f"Cross-domain ({[d.name for d in claim_domains]} <-> {[d.name for d in existing_domains]}) with shared concepts"
+                reasoning = f"Cross-domain ({[d.name for d in claim.domains]} <-> {[d.name for d in existing.domains]}) with shared concepts"
 
                 await self.think(
                     'connection',
                     f"Found cross-domain analogy: {claim.text[:50]}... <-> {existing.text[:50]}...",
-                    domains=list(claim_domains | existing_domains),
+                    domains=[Domain(d) for d in mask_domain_ids(claim_mask | existing_mask)],
                     importance=0.8
                 )
 
@@ -811,7 +935,7 @@ class CipherBrain:
 
         return hypotheses
 
-    async def learn_from_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+    async def learn_from_paper(self, paper: Dict[str, Any], flush: bool = True) -> Dict[str, Any]:
         """
         Full learning pipeline for a single paper.
 
@@ -821,78 +945,140 @@ class CipherBrain:
         4. Detect patterns
         5. Generate hypotheses
         6. Update knowledge base
+
+        Steps 1-2 are prepare_paper(), 3-6 are ingest_paper(); callers that
+        pipeline many papers run them separately.
+
+        Sources, claims, connections and patterns are staged in the batch
+        writer. With ``flush=False`` they stay buffered so many papers can be
+        written in one round trip; call ``flush()`` when the batch is done.
+        ``source_id`` is only filled in the result when flushed.
+        """
+        prepared = await self.prepare_paper(paper)
+        return await self.ingest_paper(prepared, flush=flush)
+
+    async def prepare_paper(self, paper: Dict[str, Any]) -> PreparedPaper:
+        """Score a paper and extract its claims (see prepare_papers)."""
+        return (await self.prepare_papers([paper]))[0]
+
+    async def prepare_papers(self, papers: List[Dict[str, Any]]) -> List[PreparedPaper]:
+        """
+        Score papers and extract their claims (with embeddings).
+
+        Claims for all papers are extracted in one batch. Does not touch the
+        batch writer or the indexes, so several batches can be prepared
+        concurrently.
+        """
+        prepared = [PreparedPaper(paper=paper) for paper in papers]
+
+        for item in prepared:
+            paper = item.paper
+
+            # Score quality
+            abstract = paper.get('abstract', '')
+            citations = paper.get('citation_count', 0)
+
+            if not abstract:
+                await self.think(
+                    'doubt',
+                    f"Paper '{paper.get('title', 'Unknown')[:50]}...' has no abstract, skipping",
+                    importance=0.3
+                )
+                item.skipped = True
+                continue
+
+            item.quality_score = self.hash_learner.quality_score(abstract, citations)
+
+            if item.quality_score < 0.3:
+                await self.think(
+                    'observation',
+                    f"Low quality score ({item.quality_score:.2f}) for '{paper.get('title', '')[:50]}...', skipping",
+                    importance=0.3
+                )
+                item.skipped = True
+                continue
+
+            # Determine domains
+            item.domains = self._classify_domains(paper)
+
+        # Extract claims
+        todo = [item for item in prepared if not item.skipped]
+        claims = await self.extract_claims_batch([
+            (item.paper.get('title', ''), item.paper.get('abstract', ''), item.domains)
+            for item in todo
+        ])
+        for item, paper_claims in zip(todo, claims):
+            item.claims = paper_claims
+
+        return prepared
+
+    async def ingest_paper(self, prepared: PreparedPaper, flush: bool = True) -> Dict[str, Any]:
+        """
+        Connect, stage and (optionally) flush a prepared paper.
+
+        Mutates the batch writer and the indexes, so calls are serialized.
         """
+        async with self._ingest_lock:
+            return await self._ingest_paper(prepared, flush)
+
+    async def _ingest_paper(self, prepared: PreparedPaper, flush: bool) -> Dict[str, Any]:
         result = {
             'source_id': None,
             'claims_extracted': 0,
             'connections_found': 0,
             'patterns_detected': 0,
             'hypotheses_generated': 0,
-            'quality_score': 0.0
+            'quality_score': prepared.quality_score
         }
-
-        # Score quality
-        abstract = paper.get('abstract', '')
-        citations = paper.get('citation_count', 0)
-
-        if not abstract:
-            await self.think(
-                'doubt',
-                f"Paper '{paper.get('title', 'Unknown')[:50]}...' has no abstract, skipping",
-                importance=0.3
-            )
+        if prepared.skipped:
             return result
 
-        quality_score = self.hash_learner.quality_score(abstract, citations)
-        result['quality_score'] = quality_score
+        paper = prepared.paper
+        domains = prepared.domains
+        claims = prepared.claims
 
-        if quality_score < 0.3:
-            await self.think(
-                'observation',
-                f"Low quality score ({quality_score:.2f}) for '{paper.get('title', '')[:50]}...', skipping",
-                importance=0.3
-            )
-            return result
-
-        # Determine domains
-        domains = self._classify_domains(paper)
-
-        # Save source
-        source_id = await self._save_source(paper, quality_score, domains)
-        result['source_id'] = source_id
-
-        # Extract claims
-        claims = await self.extract_claims(
-            paper.get('title', ''),
-            abstract,
-            domains
-        )
+        # Stage source
+        source_key = self._stage_source(paper, prepared.quality_score, domains)
         result['claims_extracted'] = len(claims)
 
-        # Save claims and find connections
-        existing_claims = await self._get_recent_claims(limit=1000)
+        # Stage claims and find connections. Claims not yet flushed are
+        # referenced by their entropy_hash key until the writer resolves them.
+        # Candidates come from the entity index, so every claim sharing an
+        # entity is considered, not just a window of recent ones.
+        entity_index = await self.get_entity_index()
+        known = await self._get_candidate_claims(claims, entity_index)
 
         for claim in claims:
-            claim.source_id = source_id
-            claim_id = await self._save_claim(claim)
+            claim_key = self._stage_claim(claim, source_key)
+
+            candidates = [
+                (ref, known[ref])
+                for ref, _ in entity_index.candidates(
+                    claim.entities, exclude=claim_key, limit=self.MAX_CANDIDATES
+                )
+                if ref in known
+            ]
 
             # Find connections
-            connections = await self.find_connections(claim, existing_claims)
+            connections = await self.find_connections(claim, candidates)
             for conn in connections:
-                conn.target_claim_id = claim_id
-                await self._save_connection(conn)
+                conn.target_claim_id = claim_key
+                self._stage_connection(conn)
                 result['connections_found'] += 1
 
-            existing_claims.append((claim_id, claim))
+            known[claim_key] = claim
+            self._pending_claims.append((claim_key, claim))
 
         # Detect patterns periodically
         if result['claims_extracted'] > 0:
+            recent_claims = await self._get_recent_claims(limit=100)
+            recent_claims.extend(self._pending_claims)
             all_connections = await self._get_recent_connections(limit=500)
-            patterns = await self.detect_patterns(existing_claims[-100:], all_connections)
+            patterns = await self.detect_patterns(recent_claims[-100:], all_connections)
             result['patterns_detected'] = len(patterns)
 
             for pattern in patterns:
-                await self._save_pattern(pattern)
+                self._stage_pattern(pattern)
 
             # Generate hypotheses
             hypotheses = await self.generate_hypotheses(patterns)
@@ -901,8 +1087,51 @@ class CipherBrain:
             for hypothesis in hypotheses:
                 await self._save_hypothesis(hypothesis, domains)
 
+        if flush:
+            await self._flush()
+            result['source_id'] = self.writer.source_id(source_key)
+        elif self.writer.pending >= self.writer.flush_threshold:
+            await self._flush()
+
         return result
 
+    async def flush(self):
+        """
+        Write all staged sources, claims, connections and patterns.
+
+        Newly inserted claims are added to the vector index. Takes the
+        ingest lock, so a flush from one pipeline never interleaves with
+        another pipeline staging or flushing on the same brain.
+        """
+        async with self._ingest_lock:
+            return await self._flush()
+
+    async def _flush(self):
+        flushed = await self.writer.flush()
+        if self.entity_index is not None:
+            self.entity_index.resolve({
+                key: self.writer.claim_id(key)
+                for key, _ in self._pending_claims
+                if self.writer.claim_id(key) is not None
+            })
+            await self.entity_index.persist(self.pool, flushed.new_claim_ids.values())
+        if self.paper_index is not None and flushed.sources:
+            await self.paper_index.persist(self.pool, self.writer.source_ids)
+        if self.vector_index is not None and flushed.new_claim_ids:
+            new = [
+                (flushed.new_claim_ids[key], claim)
+                for key, claim in self._pending_claims
+                if key in flushed.new_claim_ids and claim.embedding
+            ]
+            if new:
+                self.vector_index.add(
+                    [cid for cid, _ in new],
+                    [claim.embedding for _, claim in new],
+                    [[d.value for d in claim.domains] for _, claim in new]
+                )
+        self._pending_claims = []
+        return flushed
+
     def _classify_domains(self, paper: Dict[str, Any]) -> List[Domain]:
         """Classify paper into Cipher domains based on metadata."""
         domains = []
@@ -957,6 +1186,78 @@ class CipherBrain:
                 return None
         return None
 
+    # Batch staging (see BatchWriter)
+    def _stage_source(self, paper: Dict, quality_score: float, domains: List[Domain]) -> str:
+        """Stage paper source in the batch writer; returns its key."""
+        if self.paper_index is not None:
+            self.paper_index.stage(paper)
+        return self.writer.add_source(
+            external_id=paper.get('external_id'),
+            source_type=paper.get('source_type'),
+            title=paper.get('title'),
+            authors=paper.get('authors', []),
+            abstract=paper.get('abstract'),
+            publication_date=self._parse_date(paper.get('publication_date')),
+            journal=paper.get('journal'),
+            citation_count=paper.get('citation_count', 0),
+            domains=[d.value for d in domains],
+            url=paper.get('url'),
+            pdf_url=paper.get('pdf_url'),
+            metadata=paper.get('metadata', {}),
+            quality_score=quality_score,
+            entropy_hash=self.hash_learner.compute_shake256(paper.get('abstract', ''))
+        )
+
+    def _stage_claim(self, claim: Claim, source_key: str) -> str:
+        """Stage claim in the batch writer; returns its key."""
+        key = self.writer.add_claim(
+            source=claim.source_id or source_key,
+            text=claim.text,
+            claim_type=claim.claim_type,
+            confidence=claim.confidence,
+            evidence_strength=claim.evidence_strength,
+            domains=[d.value for d in claim.domains],
+            entities=claim.entities,
+            methodology=claim.methodology,
+            sample_size=claim.sample_size,
+            p_value=claim.p_value,
+            effect_size=claim.effect_size,
+            entropy_hash=claim.entropy_hash,
+            embedding=claim.embedding
+        )
+        claim.entropy_hash = key
+        if self.entity_index is not None:
+            self.entity_index.add(key, claim.entities)
+        return key
+
+    def _stage_connection(self, conn: Connection):
+        """Stage connection in the batch writer."""
+        self.writer.add_connection(
+            conn.source_claim_id,
+            conn.target_claim_id,
+            conn.connection_type,
+            conn.strength,
+            conn.cross_domain,
+            conn.reasoning,
+            conn.entropy_score,
+            'cipher_brain'
+        )
+
+    def _stage_pattern(self, pattern: Pattern):
+        """Stage pattern in the batch writer."""
+        self.writer.add_pattern(
+            name=pattern.name,
+            pattern_type=pattern.pattern_type,
+            description=pattern.description,
+            domains=[d.value for d in pattern.domains],
+            claim_ids=pattern.claim_ids,
+            confidence=pattern.confidence,
+            novelty_score=pattern.novelty_score,
+            implications=pattern.implications,
+            questions_raised=pattern.questions_raised,
+            entropy_hash=self.hash_learner.compute_shake256(pattern.description)
+        )
+
     # Database operations
     async def _save_source(self, paper: Dict, quality_score: float, domains: List[Domain]) -> int:
         """Save paper source to database."""
@@ -993,17 +1294,12 @@ class CipherBrain:
     async def _save_claim(self, claim: Claim) -> int:
         """Save claim to database with embedding."""
         async with self.pool.acquire() as conn:
-            # Convert embedding to pgvector format if present
-            embedding_str = None
-            if claim.embedding:
-                embedding_str = '[' + ','.join(str(x) for x in claim.embedding) + ']'
-
             result = await conn.fetchrow('''
                 INSERT INTO synthesis.claims
                 (source_id, claim_text, claim_type, confidence, evidence_strength,
                  domains, entities, methodology, sample_size, p_value, effect_size,
                  entropy_hash, embedding)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13::vector)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
                 RETURNING id
             ''',
                 claim.source_id,
@@ -1018,9 +1314,17 @@ class CipherBrain:
                 claim.p_value,
                 claim.effect_size,
                 claim.entropy_hash,
-                embedding_str
+                claim.embedding
             )
-            return result['id']
+
+        if self.vector_index is not None and claim.embedding:
+            self.vector_index.add([result['id']], [claim.embedding], [[d.value for d in claim.domains]])
+
+        if self.entity_index is not None:
+            self.entity_index.add(result['id'], claim.entities)
+            await self.entity_index.persist(self.pool, [result['id']])
+
+        return result['id']
 
     async def _save_connection(self, conn: Connection):
         """Save connection to database."""
@@ -1102,6 +1406,52 @@ class CipherBrain:
 
             return claims
 
+    async def _get_claims_by_ids(self, claim_ids: List[int]) -> Dict[int, Claim]:
+        """Fetch claims by ID."""
+        if not claim_ids:
+            return {}
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch('''
+                SELECT id, claim_text, claim_type, confidence, evidence_strength,
+                       domains, entities, entropy_hash
+                FROM synthesis.claims
+                WHERE id = ANY($1)
+            ''', list(claim_ids))
+
+        return {
+            row['id']: Claim(
+                text=row['claim_text'],
+                claim_type=row['claim_type'],
+                confidence=row['confidence'],
+                evidence_strength=row['evidence_strength'],
+                domains=[Domain(d) for d in (row['domains'] or [])],
+                entities=json.loads(row['entities']) if row['entities'] else [],
+                entropy_hash=row['entropy_hash']
+            )
+            for row in rows
+        }
+
+    async def _get_candidate_claims(self, claims: List[Claim],
+                                    entity_index: EntityIndex) -> Dict[Any, Claim]:
+        """
+        Load every claim that shares an entity with ``claims``.
+
+        Pending (unflushed) claims are served from memory; the rest are
+        fetched in one query.
+        """
+        pending = dict(self._pending_claims)
+        refs = set()
+        for claim in claims:
+            refs.update(ref for ref, _ in entity_index.candidates(
+                claim.entities, limit=self.MAX_CANDIDATES
+            ))
+
+        known = {ref: pending[ref] for ref in refs if ref in pending}
+        known.update(await self._get_claims_by_ids(
+            [ref for ref in refs if isinstance(ref, int)]
+        ))
+        return known
+
     async def _get_recent_connections(self, limit: int = 500) -> List[Connection]:
         """Get recent connections from database."""
         async with self.pool.acquire() as conn:
@@ -1157,6 +1507,60 @@ class CipherBrain:
     # SEMANTIC SEARCH METHODS
     # =========================================================================
 
+    async def get_entity_index(self, reload: bool = False) -> EntityIndex:
+        """Load the entity -> claim inverted index."""
+        if self.entity_index is None or reload:
+            self.entity_index = EntityIndex()
+            await self.entity_index.load(self.pool)
+            for key, claim in self._pending_claims:
+                self.entity_index.add(key, claim.entities)
+        return self.entity_index
+
+    async def get_paper_index(self, reload: bool = False) -> PaperIndex:
+        """
+        Load the known-paper dedup index.
+
+        The index is only published once fully loaded, and concurrent
+        callers wait for that load: a half-built index has an empty Bloom
+        filter and would admit every paper without checking the database.
+        """
+        if self.paper_index is not None and not reload:
+            return self.paper_index
+        async with self._paper_index_lock:
+            if self.paper_index is None or reload:
+                index = PaperIndex()
+                await index.load(self.pool)
+                # Papers staged on the old index while this one loaded
+                if self.paper_index is not None:
+                    for fp in self.paper_index.pending:
+                        index.stage(fp)
+                self.paper_index = index
+        return self.paper_index
+
+    async def get_vector_index(self, rebuild: bool = False) -> VectorIndex:
+        """
+        Load the ANN index over claim embeddings and sync it with the database.
+
+        Args:
+            rebuild: Discard the on-disk index and re-index every claim
+
+        Returns:
+            The synced VectorIndex
+        """
+        if self.vector_index is None or rebuild:
+            kwargs = dict(
+                path=self._index_path,
+                dimensions=self.embedding_service.dimensions,
+                model_name=self.embedding_service.model_name
+            )
+            if rebuild:
+                self.vector_index = VectorIndex(**kwargs)
+            else:
+                self.vector_index = VectorIndex.load(**kwargs)
+            await self.vector_index.sync(self.pool)
+            self.vector_index.save_if_dirty()
+        return self.vector_index
+
     async def semantic_search_claims(
         self,
         query: str,
@@ -1167,6 +1571,9 @@ class CipherBrain:
         """
         Search claims using semantic similarity.
 
+        Answers from the persistent vector index, so the whole corpus is
+        searched rather than only the most recent claims.
+
         Args:
             query: Natural language query
             limit: Maximum results
@@ -1178,49 +1585,30 @@ class CipherBrain:
         """
         # Generate query embedding
         query_result = await self.embedding_service.embed(query)
-        query_vector = query_result.vector
-
-        # Build query with optional domain filter
-        domain_filter = ""
-        params = [limit * 3]  # Fetch more to filter after similarity
 
-        if domains:
-            domain_values = [d.value for d in domains]
-            domain_filter = "AND domains && $2"
-            params.append(domain_values)
+        index = await self.get_vector_index()
+        hits = index.search(
+            query_result.vector,
+            k=limit,
+            threshold=threshold,
+            domains=[d.value for d in domains] if domains else None
+        )
+        if not hits:
+            return []
 
         async with self.pool.acquire() as conn:
-            # Fetch claims with embeddings
-            rows = await conn.fetch(f'''
-                SELECT id, claim_text, embedding
+            rows = await conn.fetch('''
+                SELECT id, claim_text
                 FROM synthesis.claims
-                WHERE embedding IS NOT NULL
-                {domain_filter}
-                ORDER BY created_at DESC
-                LIMIT $1
-            ''', *params)
-
-        # Compute similarities
-        results = []
-        for row in rows:
-            if row['embedding']:
-                # Parse pgvector format
-                emb_str = row['embedding']
-                if isinstance(emb_str, str):
-                    emb_values = [float(x) for x in emb_str.strip('[]').split(',')]
-                else:
-                    emb_values = list(emb_str)
-
-                similarity = self.embedding_service.cosine_similarity(
-                    query_vector, emb_values
-                )
-
-                if similarity >= threshold:
-                    results.append((row['id'], row['claim_text'], similarity))
-
-        # Sort by similarity and return top results
-        results.sort(key=lambda x: x[2], reverse=True)
-        return results[:limit]
+                WHERE id = ANY($1)
+            ''', [claim_id for claim_id, _ in hits])
+        texts = {row['id']: row['claim_text'] for row in rows}
+
+        return [
+            (claim_id, texts[claim_id], similarity)
+            for claim_id, similarity in hits
+            if claim_id in texts
+        ]
 
     async def find_similar_claims(
         self,
@@ -1232,6 +1620,9 @@ class CipherBrain:
         """
         Find claims similar to a given claim.
 
+        Scores the reference claim against the whole indexed corpus with a
+        single batched matmul over the vector index's normalized matrix.
+
         Args:
             claim_id: ID of the reference claim
             limit: Maximum results
@@ -1241,202 +1632,301 @@ class CipherBrain:
         Returns:
             List of (claim_id, claim_text, similarity, domains) tuples
         """
+        index = await self.get_vector_index()
+
+        rows = np.flatnonzero(index.ids == claim_id)
+        if len(rows) == 0:
+            return []
+        ref_row = int(rows[0])
+        ref_mask = index.masks[ref_row]
+
+        def allowed(start: int, stop: int) -> np.ndarray:
+            mask = np.ones(len(index.ids), dtype=bool)
+            mask[ref_row] = False
+            if cross_domain_only:
+                mask &= index.masks != ref_mask
+            return mask[np.newaxis, :]
+
+        hits = self.embedding_service.top_k_similar(
+            index.vectors[ref_row],
+            index.vectors,
+            top_k=limit,
+            threshold=threshold,
+            mask_fn=allowed
+        )[0]
+        if not hits:
+            return []
+
+        hit_ids = [int(index.ids[row]) for row, _ in hits]
         async with self.pool.acquire() as conn:
-            # Get the reference claim
-            ref = await conn.fetchrow('''
-                SELECT claim_text, embedding, domains
+            db_rows = await conn.fetch('''
+                SELECT id, claim_text, domains
                 FROM synthesis.claims
-                WHERE id = $1
-            ''', claim_id)
-
-            if not ref or not ref['embedding']:
-                return []
-
-            ref_embedding = ref['embedding']
-            if isinstance(ref_embedding, str):
-                ref_vector = [float(x) for x in ref_embedding.strip('[]').split(',')]
-            else:
-                ref_vector = list(ref_embedding)
-
-            ref_domains = set(ref['domains'] or [])
-
-            # Fetch candidate claims
-            rows = await conn.fetch('''
-                SELECT id, claim_text, embedding, domains
-                FROM synthesis.claims
-                WHERE embedding IS NOT NULL AND id != $1
-                ORDER BY created_at DESC
-                LIMIT $2
-            ''', claim_id, limit * 5)
+                WHERE id = ANY($1)
+            ''', hit_ids)
+        by_id = {row['id']: row for row in db_rows}
 
         results = []
-        for row in rows:
-            if not row['embedding']:
+        for cid, (_, similarity) in zip(hit_ids, hits):
+            row = by_id.get(cid)
+            if row is None:
                 continue
+            domains = [Domain(d) for d in (row['domains'] or [])]
+            results.append((cid, row['claim_text'], similarity, domains))
+        return results
 
-            emb_str = row['embedding']
-            if isinstance(emb_str, str):
-                emb_values = [float(x) for x in emb_str.strip('[]').split(',')]
-            else:
-                emb_values = list(emb_str)
-
-            claim_domains = set(row['domains'] or [])
-
-            # Filter for cross-domain if requested
-            if cross_domain_only and claim_domains == ref_domains:
-                continue
-
-            similarity = self.embedding_service.cosine_similarity(ref_vector, emb_values)
-
-            if similarity >= threshold:
-                domains = [Domain(d) for d in (row['domains'] or [])]
-                results.append((row['id'], row['claim_text'], similarity, domains))
-
-        results.sort(key=lambda x: x[2], reverse=True)
-        return results[:limit]
+    # Checkpoint row in synthesis.backfill_state
+    EMBEDDING_BACKFILL_JOB = 'claim_embeddings'
 
     async def embed_existing_claims(
         self,
         batch_size: int = 100,
-        limit: int = None
-    ) -> int:
+        limit: int = None,
+        resume: bool = True,
+        queue_size: int = 2
+    ) -> BackfillResult:
         """
         Backfill embeddings for existing claims without embeddings.
 
+        Claims are paged by keyset (``id > last_id``), so rows filled in
+        behind the cursor never shift the next page. A producer task fetches
+        and encodes batches while a consumer writes them, one
+        ``UPDATE ... FROM unnest()`` per batch, so encoding batch N+1
+        overlaps with writing batch N.
+
+        Each write also advances the checkpoint row in
+        synthesis.backfill_state in the same transaction. A run that is
+        killed resumes after the last written id; a run that reaches the
+        end clears the checkpoint, so the next run rescans from the start
+        and retries any batch that failed.
+
         Args:
             batch_size: Number of claims to process at once
             limit: Maximum claims to process (None = all)
+            resume: Continue after the checkpoint of an unfinished run
+            queue_size: Encoded batches buffered ahead of the writer
 
         Returns:
-            Number of claims updated
+            BackfillResult with counts and throughput
         """
-        total_updated = 0
+        result = BackfillResult()
+        checkpoint = await self._load_backfill_checkpoint(self.EMBEDDING_BACKFILL_JOB)
+        if checkpoint is not None and resume and checkpoint['completed_at'] is None:
+            result.resumed_from = checkpoint['last_id']
+        result.last_id = result.resumed_from
 
         async with self.pool.acquire() as conn:
-            # Count claims without embeddings
             count = await conn.fetchval('''
                 SELECT COUNT(*) FROM synthesis.claims
-                WHERE embedding IS NULL
-            ''')
-            logger.info(f"Found {count} claims without embeddings")
+                WHERE embedding IS NULL AND id > $1
+            ''', result.resumed_from)
+        if limit:
+            count = min(count, limit)
+        if result.resumed_from:
+            logger.info(f"Resuming embedding backfill after claim {result.resumed_from}")
+        logger.info(f"Found {count} claims without embeddings")
+
+        persistent = checkpoint is not None
+        if persistent:
+            await self._start_backfill_checkpoint(
+                self.EMBEDDING_BACKFILL_JOB, result.resumed_from, restart=not result.resumed_from
+            )
 
-            if limit:
-                count = min(count, limit)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        done = object()
+        started = time.perf_counter()
 
-        offset = 0
-        while offset < count:
-            async with self.pool.acquire() as conn:
-                # Fetch batch
-                rows = await conn.fetch('''
-                    SELECT id, claim_text
-                    FROM synthesis.claims
-                    WHERE embedding IS NULL
-                    ORDER BY id
-                    LIMIT $1 OFFSET $2
-                ''', batch_size, offset)
-
-                if not rows:
+        async def produce():
+            cursor = result.resumed_from
+            fetched = 0
+            try:
+                while fetched < count:
+                    async with self.pool.acquire() as conn:
+                        rows = await conn.fetch('''
+                            SELECT id, claim_text
+                            FROM synthesis.claims
+                            WHERE embedding IS NULL AND id > $1
+                            ORDER BY id
+                            LIMIT $2
+                        ''', cursor, min(batch_size, count - fetched))
+                    if not rows:
+                        break
+                    cursor = rows[-1]['id']
+                    fetched += len(rows)
+
+                    try:
+                        embedding_results = await self.embedding_service.embed_batch(
+                            [row['claim_text'] for row in rows]
+                        )
+                    except Exception as e:
+                        error_msg = f"Error embedding claims {rows[0]['id']}..{cursor}: {e}"
+                        logger.error(error_msg)
+                        result.errors.append(error_msg)
+                        continue
+                    await queue.put((
+                        [row['id'] for row in rows],
+                        [r.vector for r in embedding_results]
+                    ))
+                result.completed = fetched < count or not limit or count < limit
+            finally:
+                await queue.put(done)
+
+        async def consume():
+            while True:
+                batch = await queue.get()
+                if batch is done:
                     break
-
-                # Generate embeddings
-                texts = [row['claim_text'] for row in rows]
+                ids, vectors = batch
                 try:
-                    embedding_results = await self.embedding_service.embed_batch(
-                        texts, show_progress=True
-                    )
+                    async with self.pool.acquire() as conn:
+                        async with conn.transaction():
+                            await conn.execute('''
+                                UPDATE synthesis.claims c
+                                SET embedding = u.embedding
+                                FROM unnest($1::int[], $2::vector[]) AS u(id, embedding)
+                                WHERE c.id = u.id AND c.embedding IS NULL
+                            ''', ids, vectors)
+                            if persistent:
+                                await conn.execute('''
+                                    UPDATE synthesis.backfill_state
+                                    SET last_id = $2, processed = processed + $3,
+                                        updated_at = NOW()
+                                    WHERE job = $1
+                                ''', self.EMBEDDING_BACKFILL_JOB, ids[-1], len(ids))
+                except Exception as e:
+                    error_msg = f"Error writing embeddings for claims {ids[0]}..{ids[-1]}: {e}"
+                    logger.error(error_msg)
+                    result.errors.append(error_msg)
+                    continue
 
-                    # Update database
-                    for row, emb_result in zip(rows, embedding_results):
-                        embedding_str = '[' + ','.join(str(x) for x in emb_result.vector) + ']'
-                        await conn.execute('''
-                            UPDATE synthesis.claims
-                            SET embedding = $1::vector
-                            WHERE id = $2
-                        ''', embedding_str, row['id'])
+                result.updated += len(ids)
+                result.batches += 1
+                result.last_id = ids[-1]
+                result.seconds = time.perf_counter() - started
+                logger.info(
+                    f"Updated {result.updated}/{count} claims with embeddings "
+                    f"({result.rate:.1f} claims/s)"
+                )
 
-                    total_updated += len(rows)
-                    logger.info(f"Updated {total_updated}/{count} claims with embeddings")
+        await asyncio.gather(produce(), consume())
+        result.seconds = time.perf_counter() - started
 
-                except Exception as e:
-                    logger.error(f"Error embedding batch at offset {offset}: {e}")
+        if persistent and result.completed:
+            async with self.pool.acquire() as conn:
+                await conn.execute('''
+                    UPDATE synthesis.backfill_state
+                    SET last_id = 0, completed_at = NOW(), updated_at = NOW()
+                    WHERE job = $1
+                ''', self.EMBEDDING_BACKFILL_JOB)
+        return result
 
-            offset += batch_size
+    async def _load_backfill_checkpoint(self, job: str) -> Optional[asyncpg.Record]:
+        """
+        Checkpoint row for a backfill job, creating it on first use.
 
-        return total_updated
+        Returns None when synthesis.backfill_state is missing (migration 006
+        not applied); the backfill then runs without checkpoints.
+        """
+        async with self.pool.acquire() as conn:
+            try:
+                await conn.execute('''
+                    INSERT INTO synthesis.backfill_state (job, completed_at)
+                    VALUES ($1, NOW())
+                    ON CONFLICT (job) DO NOTHING
+                ''', job)
+                return await conn.fetchrow(
+                    "SELECT * FROM synthesis.backfill_state WHERE job = $1", job
+                )
+            except asyncpg.UndefinedTableError:
+                logger.warning("synthesis.backfill_state missing, backfill will not be resumable")
+                return None
+
+    async def _start_backfill_checkpoint(self, job: str, last_id: int, restart: bool):
+        """Mark a backfill run as started (and reset its counters on a fresh run)."""
+        async with self.pool.acquire() as conn:
+            await conn.execute('''
+                UPDATE synthesis.backfill_state
+                SET last_id = $2,
+                    processed = CASE WHEN $3 THEN 0 ELSE processed END,
+                    started_at = CASE WHEN $3 THEN NOW() ELSE started_at END,
+                    completed_at = NULL,
+                    updated_at = NOW()
+                WHERE job = $1
+            ''', job, last_id, restart)
 
     async def find_cross_domain_by_embedding(
         self,
         threshold: float = 0.75,
-        limit: int = 50
+        limit: int = 50,
+        max_claims: int = 5000,
+        per_claim: int = 10
     ) -> List[Dict[str, Any]]:
         """
         Find potential cross-domain connections using embedding similarity.
 
         Looks for semantically similar claims across different domains.
+        All pairs among the top ``max_claims`` claims are scored in blocked
+        matmuls rather than one cosine at a time.
 
         Args:
             threshold: Minimum similarity for connection
             limit: Maximum connections to return
+            max_claims: Number of highest-confidence claims to compare
+            per_claim: Maximum partners kept per claim
 
         Returns:
             List of potential cross-domain connections
         """
-        connections = []
-
         async with self.pool.acquire() as conn:
-            # Get claims with embeddings, grouped by domain
+            # Get claims with embeddings, highest confidence first
             rows = await conn.fetch('''
                 SELECT id, claim_text, embedding, domains, confidence
                 FROM synthesis.claims
                 WHERE embedding IS NOT NULL
                 ORDER BY confidence DESC
-                LIMIT 500
-            ''')
-
-        # Group by domain
-        by_domain: Dict[int, List] = {}
-        for row in rows:
-            for domain_id in (row['domains'] or []):
-                if domain_id not in by_domain:
-                    by_domain[domain_id] = []
-                by_domain[domain_id].append(row)
-
-        # Compare across domains
-        domain_ids = list(by_domain.keys())
-        for i, domain_a in enumerate(domain_ids):
-            for domain_b in domain_ids[i+1:]:
-                claims_a = by_domain[domain_a]
-                claims_b = by_domain[domain_b]
-
-                for claim_a in claims_a[:20]:  # Limit comparisons
-                    emb_a = claim_a['embedding']
-                    if isinstance(emb_a, str):
-                        vec_a = [float(x) for x in emb_a.strip('[]').split(',')]
-                    else:
-                        vec_a = list(emb_a)
-
-                    for claim_b in claims_b[:20]:
-                        if claim_a['id'] == claim_b['id']:
-                            continue
-
-                        emb_b = claim_b['embedding']
-                        if isinstance(emb_b, str):
-                            vec_b = [float(x) for x in emb_b.strip('[]').split(',')]
-                        else:
-                            vec_b = list(emb_b)
-
-                        similarity = self.embedding_service.cosine_similarity(vec_a, vec_b)
-
-                        if similarity >= threshold:
-                            connections.append({
-                                'claim_a_id': claim_a['id'],
-                                'claim_a_text': claim_a['claim_text'],
-                                'domain_a': Domain(domain_a).name,
-                                'claim_b_id': claim_b['id'],
-                                'claim_b_text': claim_b['claim_text'],
-                                'domain_b': Domain(domain_b).name,
-                                'similarity': similarity
-                            })
+                LIMIT $1
+            ''', max_claims)
+
+        if not rows:
+            return []
+
+        matrix = to_matrix([parse_vector(row['embedding']) for row in rows])
+        masks = np.array([domain_mask(row['domains'] or []) for row in rows], dtype=np.int64)
+
+        def allowed(start: int, stop: int) -> np.ndarray:
+            # Cross-domain pairs: both classified, different domain sets,
+            # each pair reported once (upper triangle)
+            block = masks[start:stop, np.newaxis]
+            mask = (block != 0) & (masks[np.newaxis, :] != 0) & (block != masks[np.newaxis, :])
+            mask &= np.arange(len(masks))[np.newaxis, :] > np.arange(start, stop)[:, np.newaxis]
+            return mask
+
+        hits = self.embedding_service.top_k_similar(
+            matrix, matrix,
+            top_k=per_claim,
+            threshold=threshold,
+            mask_fn=allowed
+        )
+
+        connections = []
+        for i, row_hits in enumerate(hits):
+            claim_a = rows[i]
+            mask_a = int(masks[i])
+            for j, similarity in row_hits:
+                claim_b = rows[j]
+                mask_b = int(masks[j])
+                # Report the domain each side brings that the other lacks
+                domain_a = lowest_domain(mask_a & ~mask_b or mask_a)
+                domain_b = lowest_domain(mask_b & ~mask_a or mask_b)
+                connections.append({
+                    'claim_a_id': claim_a['id'],
+                    'claim_a_text': claim_a['claim_text'],
+                    'domain_a': Domain(domain_a).name,
+                    'claim_b_id': claim_b['id'],
+                    'claim_b_text': claim_b['claim_text'],
+                    'domain_b': Domain(domain_b).name,
+                    'similarity': similarity
+                })
 
         # Sort by similarity and return top
         connections.sort(key=lambda x: x['similarity'], reverse=True)
@@ -10,11 +10,16 @@ Je chasse LA connexion.
 import asyncio
 import asyncpg
 import math
+import sys
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.claim_search import get_claim_search
+
 MIND_PATH = Path("/opt/cipher/mind")
 
 
@@ -117,8 +122,31 @@ class CipherHunter:
 
         leads = []
 
-        # Trouver les claims qui apparaissent dans des domaines éloignés
+        # Concepts présents dans le plus de domaines, lus dans les
+        # statistiques maintenues à l'insertion (migration 009)
         query = """
+            SELECT
+                cs.token as concept,
+                ARRAY(
+                    SELECT d.name
+                    FROM synthesis.concept_domain_stats cds
+                    JOIN synthesis.domains d ON d.id = cds.domain_id
+                    WHERE cds.token = cs.token
+                    ORDER BY cds.claim_count DESC
+                ) as domains,
+                ARRAY(
+                    SELECT c.claim_text
+                    FROM synthesis.claims c
+                    WHERE c.id = ANY(cs.sample_claim_ids)
+                ) as sample_claims
+            FROM synthesis.concept_stats cs
+            WHERE cs.domain_count >= 2
+            ORDER BY cs.domain_count DESC, cs.claim_count DESC
+            LIMIT 100
+        """
+
+        # Sans la migration : tokeniser tous les claims
+        fallback_query = """
             WITH claim_domains AS (
                 SELECT
                     c.id,
@@ -146,7 +174,11 @@ class CipherHunter:
             LIMIT 100
         """
 
-        rows = await self.conn.fetch(query)
+        try:
+            rows = await self.conn.fetch(query)
+        except asyncpg.UndefinedTableError:
+            print("   synthesis.concept_stats missing, scanning every claim")
+            rows = await self.conn.fetch(fallback_query)
 
         for row in rows:
             concept = row['concept']
@@ -200,15 +232,16 @@ class CipherHunter:
         print("\n🌿 HUNTING: Nature's wisdom...")
 
         leads = []
+        search = await get_claim_search(self.conn)
 
         for pattern in self.NATURE_PATTERNS:
-            rows = await self.conn.fetch("""
+            rows = await self.conn.fetch(f"""
                 SELECT c.claim_text, d.name as domain
                 FROM synthesis.claims c
                 JOIN synthesis.domains d ON d.id = ANY(c.domains)
-                WHERE LOWER(c.claim_text) LIKE $1
+                WHERE {search.where(1)}
                 LIMIT 20
-            """, f'%{pattern}%')
+            """, search.arg(pattern))
 
             if len(rows) >= 2:
                 domains = list(set(r['domain'] for r in rows))
@@ -247,22 +280,23 @@ class CipherHunter:
             ('beneficial', 'harmful'), ('protect', 'damage')
         ]
 
+        search = await get_claim_search(self.conn)
         for word1, word2 in opposites:
-            rows1 = await self.conn.fetch("""
+            rows1 = await self.conn.fetch(f"""
                 SELECT c.claim_text, d.name as domain
                 FROM synthesis.claims c
                 JOIN synthesis.domains d ON d.id = ANY(c.domains)
-                WHERE LOWER(c.claim_text) LIKE $1
+                WHERE {search.where(1)}
                 LIMIT 10
-            """, f'%{word1}%')
+            """, search.arg(word1))
 
-            rows2 = await self.conn.fetch("""
+            rows2 = await self.conn.fetch(f"""
                 SELECT c.claim_text, d.name as domain
                 FROM synthesis.claims c
                 JOIN synthesis.domains d ON d.id = ANY(c.domains)
-                WHERE LOWER(c.claim_text) LIKE $1
+                WHERE {search.where(1)}
                 LIMIT 10
-            """, f'%{word2}%')
+            """, search.arg(word2))
 
             if rows1 and rows2:
                 domains1 = set(r['domain'] for r in rows1)
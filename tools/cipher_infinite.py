@@ -24,6 +24,7 @@ from pathlib import Path
 sys.path.insert(0, '/opt/cipher')
 
 from tools.cipher_understand import CipherUnderstanding
+from tools.claim_search import get_claim_search
 
 MIND_PATH = Path("/opt/cipher/mind")
 
@@ -63,11 +64,15 @@ class CipherInfinite:
                 continue
 
             # Count evidence
-            evidence = await self.conn.fetchval("""
-                SELECT COUNT(*) FROM synthesis.claims
-                WHERE claim_text ILIKE $1
-                AND created_at > (SELECT made_at FROM synthesis.predictions WHERE id = $2)
-            """, f"%{terms[0]}%", pred['id'])
+            search = await get_claim_search(self.conn)
+            query = search.arg(terms[0])
+            if query is None:
+                continue
+            evidence = await self.conn.fetchval(f"""
+                SELECT COUNT(*) FROM synthesis.claims c
+                WHERE {search.where(1)}
+                AND c.created_at > (SELECT made_at FROM synthesis.predictions WHERE id = $2)
+            """, query, pred['id'])
 
             if evidence and evidence > 0:
                 outcome = 'partial' if evidence < 3 else 'supported'
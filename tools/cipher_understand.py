@@ -12,10 +12,15 @@ import asyncio
 import asyncpg
 import json
 import re
+import sys
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.claim_search import search_claims
+
 MIND_PATH = Path("/opt/cipher/mind")
 
 class CipherUnderstanding:
@@ -359,11 +364,7 @@ class CipherUnderstanding:
             return None
 
         # Search for relevant claims
-        relevant_claims = await self.conn.fetch("""
-            SELECT claim_text FROM synthesis.claims
-            WHERE claim_text ILIKE ANY($1)
-            LIMIT 20
-        """, [f'%{t}%' for t in terms[:3]])
+        relevant_claims = await search_claims(self.conn, terms[:3], limit=20)
 
         # Search for relevant causal models
         relevant_causals = await self.conn.fetch("""
@@ -0,0 +1,299 @@
+"""
+CIPHER Claim LSH
+
+MinHash LSH index over claim shingles, for candidate pairs of similar
+claims without comparing every pair.
+
+Each index covers one ``kind`` of shingle set, produced by a function of
+the claim text (the pattern detector uses one index over meaningful words
+and one over relation words). Per claim, the MinHash signature is split
+into ``bands`` and each band hashed to 32 bits; claims sharing a band hash
+are candidates. For every band the hashes are kept sorted, so the
+candidates of a claim are ``bands`` binary searches, and scanning a corpus
+for similar pairs costs about one lookup per claim instead of one
+comparison per pair.
+
+Signatures are stored in ``synthesis.claim_minhash`` (see
+sql/migrations/011_claim_minhash.sql) with a hash of the text they were
+computed from; the next run only hashes claims that are new or whose text
+changed. Candidates are approximate: callers confirm them
+against the real similarity they care about.
+"""
+
+import hashlib
+import logging
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+
+import asyncpg
+import numpy as np
+
+from .minhash import MinHasher, PRIME
+
+logger = logging.getLogger(__name__)
+
+
+def text_hash(text: str) -> int:
+    """Signed 64-bit hash of a claim text, stored next to its signatures."""
+    digest = hashlib.blake2b((text or '').encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+class ClaimLSH:
+    """
+    Banded MinHash index of one shingle kind over claim ids.
+
+    Usage:
+        index = ClaimLSH('words', lambda text: set(text.lower().split()))
+        await index.load(pool)
+        index.update(claim_ids, claim_texts)   # hashes new and edited claims
+        await index.persist(pool)
+        ids = index.candidates(claim_id)
+    """
+
+    # Signatures read per round trip when loading
+    LOAD_BATCH = 50000
+    # Claims hashed per vectorized batch
+    HASH_BATCH = 5000
+
+    def __init__(
+        self,
+        kind: str,
+        shingler: Callable[[str], Set[str]],
+        num_perm: int = 32,
+        bands: int = 16,
+        seed: int = 1
+    ):
+        """
+        Args:
+            kind: Name the signatures are stored under; change it when
+                ``shingler`` changes, or stale signatures are reused
+            shingler: Claim text -> shingle set
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm / bands rows each). Two claims with
+                shingle Jaccard s become candidates with probability
+                1 - (1 - s^rows)^bands
+            seed: Seed of the hash family (part of the stored signatures)
+        """
+        self.kind = kind
+        self.shingler = shingler
+        self.bands = bands
+        self.hasher = MinHasher(num_perm, seed)
+
+        # Parallel arrays sorted by claim id; claims with an empty shingle
+        # set are kept (so they are not rehashed) but never candidates
+        self.ids = np.empty(0, dtype=np.int64)
+        self.keys = np.empty((0, bands), dtype=np.uint32)
+        self.valid = np.empty(0, dtype=bool)
+        self.text_hashes = np.empty(0, dtype=np.int64)
+
+        # Per band: rows ordered by band hash, and the hashes in that order
+        self._order: List[np.ndarray] = []
+        self._sorted: List[np.ndarray] = []
+        self._dirty = True
+
+        # (signature, text hash) computed this run and not yet stored
+        self._pending: Dict[int, Tuple[np.ndarray, int]] = {}
+
+        # False when the table is missing (migration not applied)
+        self.persistent = True
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # =========================================================================
+    # INDEXING
+    # =========================================================================
+
+    def _add(self, ids: np.ndarray, signatures: np.ndarray, text_hashes: np.ndarray):
+        """Add signature rows for claim ids not yet indexed."""
+        if not len(ids):
+            return
+        valid = (signatures != PRIME).any(axis=1)
+        keys = self.hasher.band_hashes(signatures, self.bands)
+        ids = np.concatenate([self.ids, ids])
+        order = np.argsort(ids, kind='stable')
+        self.ids = ids[order]
+        self.keys = np.concatenate([self.keys, keys])[order]
+        self.valid = np.concatenate([self.valid, valid])[order]
+        self.text_hashes = np.concatenate([self.text_hashes, text_hashes])[order]
+        self._dirty = True
+
+    def _keep(self, keep: np.ndarray):
+        """Keep only the indexed rows where ``keep`` is set."""
+        self.ids = self.ids[keep]
+        self.keys = self.keys[keep]
+        self.valid = self.valid[keep]
+        self.text_hashes = self.text_hashes[keep]
+        self._dirty = True
+
+    def restrict(self, claim_ids: Sequence[int]):
+        """
+        Drop indexed claims not in ``claim_ids``.
+
+        Stored signatures can cover claims newer than the caller's view of
+        the corpus (written by another process after it loaded its claims);
+        restricting keeps candidates within that view.
+        """
+        keep = np.isin(self.ids, np.asarray(claim_ids, dtype=np.int64))
+        if not keep.all():
+            self._keep(keep)
+
+    def update(self, claim_ids: Sequence[int], texts: Sequence[str]) -> int:
+        """
+        Hash the claims that are not indexed yet or whose text changed.
+
+        A claim is rehashed when its text hash differs from the one its
+        signature was computed from, so edited claims do not keep matching
+        on their old text.
+
+        Args:
+            claim_ids: Claim ids
+            texts: Claim texts, parallel to ``claim_ids``
+
+        Returns:
+            Number of claims hashed
+        """
+        claim_ids = np.asarray(claim_ids, dtype=np.int64)
+        hashes = np.fromiter((text_hash(t) for t in texts), dtype=np.int64, count=len(claim_ids))
+        if len(self.ids):
+            pos = np.minimum(np.searchsorted(self.ids, claim_ids), len(self.ids) - 1)
+            indexed = self.ids[pos] == claim_ids
+            stale = np.flatnonzero(~indexed | (self.text_hashes[pos] != hashes))
+            # Drop the old signatures of edited claims before re-adding them
+            edited = pos[stale[indexed[stale]]]
+            if len(edited):
+                keep = np.ones(len(self.ids), dtype=bool)
+                keep[edited] = False
+                self._keep(keep)
+        else:
+            stale = np.arange(len(claim_ids))
+
+        batches = []
+        for start in range(0, len(stale), self.HASH_BATCH):
+            rows = stale[start:start + self.HASH_BATCH]
+            signatures = self.hasher.signatures([self.shingler(texts[r] or '') for r in rows])
+            self._pending.update(zip(claim_ids[rows].tolist(), zip(signatures, hashes[rows].tolist())))
+            batches.append(signatures)
+        if batches:
+            self._add(claim_ids[stale], np.concatenate(batches), hashes[stale])
+
+        return len(stale)
+
+    def _build(self):
+        """Sort band hashes for lookup (after additions)."""
+        rows = np.flatnonzero(self.valid)
+        self._order, self._sorted = [], []
+        for b in range(self.bands):
+            order = rows[np.argsort(self.keys[rows, b], kind='stable')]
+            self._order.append(order)
+            self._sorted.append(self.keys[order, b])
+        self._dirty = False
+
+    def _lookup(self, keys: np.ndarray) -> np.ndarray:
+        """Rows sharing at least one band hash with ``keys``, ascending."""
+        if self._dirty:
+            self._build()
+        found = []
+        for b in range(self.bands):
+            lo, hi = np.searchsorted(self._sorted[b], keys[b], side='left'), \
+                np.searchsorted(self._sorted[b], keys[b], side='right')
+            if hi > lo:
+                found.append(self._order[b][lo:hi])
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(found))
+
+    def candidates(self, claim_id: int) -> np.ndarray:
+        """Ids of indexed claims sharing a band with ``claim_id`` (itself excluded)."""
+        pos = int(np.searchsorted(self.ids, claim_id))
+        if pos >= len(self.ids) or self.ids[pos] != claim_id or not self.valid[pos]:
+            return np.empty(0, dtype=np.int64)
+        rows = self._lookup(self.keys[pos])
+        return self.ids[rows[rows != pos]]
+
+    def query(self, text: str) -> np.ndarray:
+        """Ids of indexed claims sharing a band with an arbitrary text."""
+        signature = self.hasher.signatures([self.shingler(text or '')])
+        if (signature == PRIME).all():
+            return np.empty(0, dtype=np.int64)
+        return self.ids[self._lookup(self.hasher.band_hashes(signature, self.bands)[0])]
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    async def load(self, pool: asyncpg.Pool):
+        """
+        Load stored signatures of this kind from synthesis.claim_minhash.
+
+        Claims without a stored signature, or whose text changed since, are
+        left to update(). When the table is missing the index stays in
+        memory only.
+        """
+        width = self.hasher.num_perm * 4
+        ids: List[int] = []
+        blobs: List[bytes] = []
+        hashes: List[int] = []
+
+        async with pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    async for record in conn.cursor('''
+                        SELECT claim_id, signature, COALESCE(text_hash, 0) AS text_hash
+                        FROM synthesis.claim_minhash
+                        WHERE kind = $1
+                    ''', self.kind, prefetch=self.LOAD_BATCH):
+                        # Signatures of another length are rehashed by update()
+                        if len(record['signature']) in (0, width):
+                            ids.append(record['claim_id'])
+                            blobs.append(record['signature'] or PRIME.to_bytes(4, 'little') * self.hasher.num_perm)
+                            hashes.append(record['text_hash'])
+                self.persistent = True
+            except asyncpg.UndefinedTableError:
+                logger.warning("synthesis.claim_minhash missing, keeping the claim LSH index in memory only")
+                self.persistent = False
+
+        self.ids = np.empty(0, dtype=np.int64)
+        self.keys = np.empty((0, self.bands), dtype=np.uint32)
+        self.valid = np.empty(0, dtype=bool)
+        self.text_hashes = np.empty(0, dtype=np.int64)
+        self._add(
+            np.array(ids, dtype=np.int64),
+            np.frombuffer(b''.join(blobs), dtype='<u4').reshape(-1, self.hasher.num_perm),
+            np.array(hashes, dtype=np.int64)
+        )
+        logger.info(f"Claim LSH '{self.kind}' loaded: {len(self.ids)} signatures")
+
+    async def persist(self, pool: asyncpg.Pool):
+        """Store signatures computed by update() since the last persist."""
+        if not self._pending or not self.persistent:
+            self._pending.clear()
+            return
+        ids = list(self._pending)
+        # Empty shingle sets are stored as an empty signature
+        signatures = [
+            b'' if (s == PRIME).all() else s.astype('<u4').tobytes()
+            for s, _ in self._pending.values()
+        ]
+        hashes = [h for _, h in self._pending.values()]
+        async with pool.acquire() as conn:
+            # Claims deleted since they were hashed would fail the foreign key
+            await conn.execute('''
+                INSERT INTO synthesis.claim_minhash (kind, claim_id, signature, text_hash)
+                SELECT $1, t.claim_id, t.signature, t.text_hash
+                FROM unnest($2::int[], $3::bytea[], $4::bigint[]) AS t(claim_id, signature, text_hash)
+                WHERE EXISTS (SELECT 1 FROM synthesis.claims c WHERE c.id = t.claim_id)
+                ON CONFLICT (kind, claim_id) DO UPDATE
+                SET signature = EXCLUDED.signature, text_hash = EXCLUDED.text_hash
+            ''', self.kind, ids, signatures, hashes)
+        logger.info(f"Claim LSH '{self.kind}': stored {len(ids)} signatures")
+        self._pending.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Indexed claims, claims with shingles, and unstored signatures."""
+        return {
+            'claims': len(self.ids),
+            'indexed': int(self.valid.sum()),
+            'bands': self.bands,
+            'pending': len(self._pending),
+        }
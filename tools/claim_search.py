@@ -0,0 +1,172 @@
+"""
+CIPHER Claim Search
+
+Keyword search over synthesis.claims, shared by every component that looks
+claims up by term in the database (CLI search, hunter, understanding
+engine, infinite loop, quick_hunt). The pattern detector matches terms
+against its in-memory claim table instead.
+
+Matching used to be ``LOWER(claim_text) LIKE '%term%'``, a sequential scan
+of the whole table per term. With sql/migrations/008_claim_search.sql
+applied, claims carry a generated ``search_vector`` tsvector with a GIN
+index, so a term lookup reads only the matching postings:
+
+    words      search_vector @@ to_tsquery(...)   stemmed, prefix-matched,
+                                                  ranked with ts_rank_cd
+    substring  claim_text ILIKE ANY(...)          served by the pg_trgm index
+
+Call sites embed the fragments from ClaimSearch in their own SQL, or use
+search_claims() for the common "best matching claims" query. Without the
+migration, ClaimSearch falls back to unindexed ILIKE with a warning.
+"""
+
+import logging
+import re
+from typing import List, Optional, Sequence, Union
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration of the generated column
+TS_CONFIG = 'english'
+
+
+def like_pattern(term: str) -> str:
+    """ILIKE pattern matching ``term`` anywhere, with wildcards escaped."""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+def tsquery_text(terms: Sequence[str], match: str = 'any') -> Optional[str]:
+    """
+    to_tsquery() input for keyword terms.
+
+    Each term is split into words; a multi-word term becomes a phrase.
+    Words are prefix-matched (``network`` also finds ``networks``,
+    ``networked``), and terms are OR-ed for match='any', AND-ed for 'all'.
+    Returns None when no term has a word in it.
+    """
+    parts = []
+    for term in terms:
+        words = re.findall(r'[^\W_]+', (term or '').lower())
+        if words:
+            parts.append('(' + ' <-> '.join(f"{w}:*" for w in words) + ')')
+    if not parts:
+        return None
+    return (' | ' if match == 'any' else ' & ').join(parts)
+
+
+class ClaimSearch:
+    """
+    SQL fragments for matching claims by keyword.
+
+    Usage:
+        search = await get_claim_search(conn)
+        rows = await conn.fetch(f'''
+            SELECT c.claim_text FROM synthesis.claims c
+            WHERE {search.where(1)}
+            LIMIT 20
+        ''', search.arg(['feedback loop']))
+    """
+
+    def __init__(self, indexed: bool):
+        # False when the search_vector column is missing (migration not applied)
+        self.indexed = indexed
+
+    def where(self, param: int, alias: str = 'c', match: str = 'any',
+              substring: bool = False) -> str:
+        """Condition matching claims against query parameter ``$param``."""
+        column = f"{alias}." if alias else ''
+        if self.indexed and not substring:
+            return f"{column}search_vector @@ to_tsquery('{TS_CONFIG}', ${param})"
+        return f"{column}claim_text ILIKE {'ANY' if match == 'any' else 'ALL'}(${param})"
+
+    def rank(self, param: int, alias: str = 'c', substring: bool = False) -> str:
+        """Relevance expression for the same parameter (0 without the index)."""
+        column = f"{alias}." if alias else ''
+        if self.indexed and not substring:
+            return f"ts_rank_cd({column}search_vector, to_tsquery('{TS_CONFIG}', ${param}))"
+        return '0'
+
+    def arg(self, terms: Union[str, Sequence[str]], match: str = 'any',
+            substring: bool = False) -> Optional[Union[str, List[str]]]:
+        """
+        Query parameter for where() / rank().
+
+        Returns None when the terms contain nothing searchable.
+        """
+        if isinstance(terms, str):
+            terms = [terms]
+        if self.indexed and not substring:
+            return tsquery_text(terms, match)
+        patterns = [like_pattern(t) for t in terms if t]
+        return patterns or None
+
+
+# Resolved once per process
+_claim_search: Optional[ClaimSearch] = None
+
+
+async def get_claim_search(conn: Union[asyncpg.Connection, asyncpg.Pool]) -> ClaimSearch:
+    """Get the ClaimSearch for this database (checks for the index once)."""
+    global _claim_search
+
+    if _claim_search is None:
+        indexed = await conn.fetchval('''
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = 'synthesis'
+                  AND table_name = 'claims'
+                  AND column_name = 'search_vector'
+            )
+        ''')
+        if not indexed:
+            logger.warning("synthesis.claims.search_vector missing, claim search falls back to ILIKE scans")
+        _claim_search = ClaimSearch(indexed)
+
+    return _claim_search
+
+
+async def search_claims(
+    conn: Union[asyncpg.Connection, asyncpg.Pool],
+    terms: Union[str, Sequence[str]],
+    limit: int = 20,
+    match: str = 'any'
+) -> List[asyncpg.Record]:
+    """
+    Claims matching keyword terms, most relevant first.
+
+    Every matching claim is ranked (a top-N sort over the GIN matches), so
+    the result is exact; for a very common term that means reading each
+    match once. Sources are joined only for the claims returned.
+
+    Args:
+        conn: Connection or pool
+        terms: A term or list of terms (multi-word terms match as phrases)
+        limit: Max claims returned
+        match: 'any' (at least one term) or 'all'
+
+    Returns:
+        Records with id, claim_text, claim_type, confidence, domains,
+        source_id, source_title and rank; ties broken by confidence
+    """
+    search = await get_claim_search(conn)
+    arg = search.arg(terms, match)
+    if arg is None:
+        return []
+
+    return await conn.fetch(f'''
+        WITH hits AS (
+            SELECT c.id, c.claim_text, c.claim_type, c.confidence, c.domains,
+                   c.source_id, {search.rank(1)} AS rank
+            FROM synthesis.claims c
+            WHERE {search.where(1, match=match)}
+            ORDER BY rank DESC, c.confidence DESC
+            LIMIT $2
+        )
+        SELECT h.*, s.title AS source_title
+        FROM hits h
+        LEFT JOIN synthesis.sources s ON s.id = h.source_id
+        ORDER BY h.rank DESC, h.confidence DESC
+    ''', arg, limit)
@@ -9,13 +9,14 @@ and manages the learning schedule.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Set
 from dataclasses import dataclass, field
 from enum import Enum
 import random
 
-from .cipher_brain import CipherBrain, Domain
+from .cipher_brain import CipherBrain, Domain, PreparedPaper
 from .hash_learning import hash_learner
 
 # Import integrations
@@ -23,7 +24,7 @@ import sys
 sys.path.append('..')
 from integrations import (
     OpenAlexClient, ArxivClient, PubMedClient, SemanticScholarClient,
-    Paper
+    Paper, FetchJob, FetchScheduler, FetchStats
 )
 
 logger = logging.getLogger(__name__)
@@ -170,6 +171,31 @@ DOMAIN_STRATEGIES = {
 }
 
 
+@dataclass
+class StageStats:
+    """Throughput of one ingest pipeline stage"""
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0  # Summed over the stage's workers
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    def record(self, items: int, seconds: float):
+        self.items += items
+        self.busy_seconds += seconds
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Items per wall-clock second."""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+
 @dataclass
 class LearningSession:
     """Track a learning session"""
@@ -177,10 +203,24 @@ class LearningSession:
     domain: Domain
     started_at: datetime
     papers_fetched: int = 0
+    papers_known: int = 0       # Rejected as already stored by an earlier run
     claims_extracted: int = 0
     connections_found: int = 0
     patterns_detected: int = 0
     errors: List[str] = field(default_factory=list)
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    fetch_stats: Optional[FetchStats] = None
+
+    def throughput_report(self) -> str:
+        """One line per pipeline stage (items, wall time, rate), then fetch time by source."""
+        lines = [
+            f"  {s.name:<8} {s.items:>5} items in {s.elapsed:6.1f}s "
+            f"({s.throughput:.1f}/s, busy {s.busy_seconds:.1f}s)"
+            for s in self.stages.values()
+        ]
+        if self.fetch_stats is not None and self.fetch_stats.sources:
+            lines.append(self.fetch_stats.report())
+        return "\n".join(lines)
 
 
 class DomainLearner:
@@ -221,6 +261,17 @@ class DomainLearner:
         self.batch_size = self.config.get('batch_size', 50)
         self.cross_domain_boost = self.config.get('cross_domain_boost', 2.0)
 
+        # Ingest pipeline (see LearningConfig)
+        self.fetch_concurrency = self.config.get('fetch_concurrency', 8)
+        self.extract_workers = self.config.get('extract_workers', 4)
+        self.fetch_queue_size = self.config.get('fetch_queue_size', 200)
+        self.persist_queue_size = self.config.get('persist_queue_size', 50)
+        self.persist_batch_size = self.config.get('persist_batch_size', self.batch_size)
+        self.extract_batch_size = self.config.get('extract_batch_size', 16)
+
+        # Shared by every session so the in-flight cap is global
+        self.fetch_scheduler = FetchScheduler(max_in_flight=self.fetch_concurrency)
+
     @property
     def openalex(self) -> OpenAlexClient:
         if self._openalex is None:
@@ -299,69 +350,38 @@ class DomainLearner:
             importance=0.5
         )
 
-        papers = []
-
-        # Fetch from each source based on strategy weights
-        try:
-            # OpenAlex (if weighted)
-            if strategy.openalex_weight > 0:
-                openalex_papers = await self._fetch_openalex(
-                    strategy,
-                    limit=int(max_papers * strategy.openalex_weight),
-                    days_back=days_back
-                )
-                papers.extend(openalex_papers)
-
-            # arXiv (if weighted)
-            if strategy.arxiv_weight > 0 and strategy.arxiv_categories:
-                arxiv_papers = await self._fetch_arxiv(
-                    strategy,
-                    limit=int(max_papers * strategy.arxiv_weight * 0.5),
-                    days_back=days_back
-                )
-                papers.extend(arxiv_papers)
-
-            # PubMed (if weighted)
-            if strategy.pubmed_weight > 0 and strategy.pubmed_mesh:
-                pubmed_papers = await self._fetch_pubmed(
-                    strategy,
-                    limit=int(max_papers * strategy.pubmed_weight * 0.5),
-                    days_back=days_back
-                )
-                papers.extend(pubmed_papers)
-
+        # One job per source and query, sized by the strategy's weights
+        jobs: List[FetchJob] = []
+        if strategy.openalex_weight > 0:
+            jobs += self._openalex_jobs(
+                strategy,
+                limit=int(max_papers * strategy.openalex_weight),
+                days_back=days_back
+            )
+        if strategy.arxiv_weight > 0 and strategy.arxiv_categories:
+            jobs += self._arxiv_jobs(
+                strategy,
+                limit=int(max_papers * strategy.arxiv_weight * 0.5),
+                days_back=days_back
+            )
+        if strategy.pubmed_weight > 0 and strategy.pubmed_mesh:
+            jobs += self._pubmed_jobs(
+                strategy,
+                limit=int(max_papers * strategy.pubmed_weight * 0.5),
+                days_back=days_back
+            )
+        if strategy.semantic_scholar_weight > 0:
             # Semantic Scholar (for high-impact papers)
-            if strategy.semantic_scholar_weight > 0:
-                s2_papers = await self._fetch_semantic_scholar(
-                    strategy,
-                    limit=int(max_papers * strategy.semantic_scholar_weight * 0.3),
-                    days_back=days_back
-                )
-                papers.extend(s2_papers)
-
-        except Exception as e:
-            error_msg = f"Error fetching papers for {domain.name}: {e}"
-            logger.error(error_msg)
-            session.errors.append(error_msg)
-
-        # Deduplicate
-        unique_papers = self._deduplicate_papers(papers)
-        session.papers_fetched = len(unique_papers)
-
-        logger.info(f"Fetched {len(unique_papers)} unique papers for {domain.name}")
+            jobs += self._semantic_scholar_jobs(
+                strategy,
+                limit=int(max_papers * strategy.semantic_scholar_weight * 0.3),
+                days_back=days_back
+            )
 
-        # Process each paper
-        for paper in unique_papers[:max_papers]:
-            try:
-                result = await self.brain.learn_from_paper(paper.to_dict())
-                session.claims_extracted += result['claims_extracted']
-                session.connections_found += result['connections_found']
-                session.patterns_detected += result['patterns_detected']
+        await self._run_pipeline(session, jobs, max_papers)
 
-            except Exception as e:
-                error_msg = f"Error processing paper {paper.external_id}: {e}"
-                logger.error(error_msg)
-                session.errors.append(error_msg)
+        logger.info(f"Learned from {session.papers_fetched} unique papers for {domain.name}")
+        logger.info(f"{domain.name} pipeline throughput:\n{session.throughput_report()}")
 
         await self.brain.think(
             'observation',
@@ -451,30 +471,26 @@ class DomainLearner:
             importance=0.8
         )
 
-        papers = []
+        # Search each concept across multiple sources concurrently.
+        # Semantic Scholar often has cross-domain content
+        papers: List[Paper] = []
 
-        # Search each concept across multiple sources
-        for concept in concepts:
-            try:
-                # OpenAlex search
-                openalex_results = await self.openalex.search(
-                    query=concept,
-                    limit=max_papers // len(concepts)
-                )
-                papers.extend(openalex_results)
+        async def collect(job: FetchJob, batch: List[Paper]):
+            papers.extend(batch)
 
-                # Semantic Scholar (often has cross-domain content)
-                s2_results = await self.semantic_scholar.search(
-                    query=concept,
-                    limit=max_papers // len(concepts)
+        await self.fetch_scheduler.run([
+            FetchJob(
+                client.source_type.value, f"'{concept}'",
+                lambda client=client, concept=concept: client.search(
+                    query=concept, limit=max_papers // len(concepts)
                 )
-                papers.extend(s2_results)
-
-            except Exception as e:
-                logger.error(f"Error searching for '{concept}': {e}")
+            )
+            for concept in concepts
+            for client in (self.openalex, self.semantic_scholar)
+        ], collect)
 
         # Deduplicate and prioritize papers that span multiple domains
-        unique_papers = self._deduplicate_papers(papers)
+        unique_papers = self._deduplicate_papers(await self._filter_known(session, papers))
 
         # Score papers by domain diversity
         scored_papers = []
@@ -488,18 +504,18 @@ class DomainLearner:
         # Sort by score and take top
         scored_papers.sort(key=lambda x: x[0], reverse=True)
         top_papers = [p for _, p in scored_papers[:max_papers]]
+        top_ids = {p.external_id for p in top_papers}
+        self._release([p for p in unique_papers if p.external_id not in top_ids])
 
-        session.papers_fetched = len(top_papers)
+        # Process (papers are already deduplicated and ranked)
+        async def ranked() -> List[Paper]:
+            return top_papers
 
-        # Process
-        for paper in top_papers:
-            try:
-                result = await self.brain.learn_from_paper(paper.to_dict())
-                session.claims_extracted += result['claims_extracted']
-                session.connections_found += result['connections_found']
-                session.patterns_detected += result['patterns_detected']
-            except Exception as e:
-                session.errors.append(str(e))
+        await self._run_pipeline(
+            session, [FetchJob('ranked', 'cross-domain papers', ranked)],
+            max_papers, deduplicate=False
+        )
+        logger.info(f"Cross-domain pipeline throughput:\n{session.throughput_report()}")
 
         await self.brain.think(
             'insight',
@@ -510,122 +526,283 @@ class DomainLearner:
 
         return session
 
-    async def _fetch_openalex(
+    async def _run_pipeline(
+        self,
+        session: LearningSession,
+        jobs: List[FetchJob],
+        max_papers: int,
+        deduplicate: bool = True
+    ):
+        """
+        Fetch, extract and persist papers as three overlapping stages.
+
+        fetch    every job at once through the shared FetchScheduler, paced by
+                 each source's rate limiter and ``fetch_concurrency`` requests
+                 in flight
+        extract  ``extract_workers`` tasks running brain.prepare_papers (NLP +
+                 embeddings) on up to ``extract_batch_size`` queued papers
+        persist  one task running brain.ingest_paper, flushing the batch
+                 writer every ``persist_batch_size`` papers
+
+        Stages are joined by bounded queues, so a slow stage applies
+        backpressure to the ones before it. Per-stage counts and timings
+        are stored in ``session.stages``.
+        """
+        fetch_q: asyncio.Queue = asyncio.Queue(maxsize=self.fetch_queue_size)
+        persist_q: asyncio.Queue = asyncio.Queue(maxsize=self.persist_queue_size)
+        done = object()
+
+        stages = {name: StageStats(name) for name in ('fetch', 'extract', 'persist')}
+        session.stages = stages
+        seen_titles: Set[str] = set()
+
+        async def produce(job: FetchJob, papers: List[Paper]):
+            stages['fetch'].finished = time.perf_counter()
+            if deduplicate:
+                papers = self._deduplicate_papers(
+                    await self._filter_known(session, papers), seen_titles
+                )
+            for i, paper in enumerate(papers):
+                if session.papers_fetched >= max_papers:
+                    self._release(papers[i:])
+                    break
+                session.papers_fetched += 1
+                stages['fetch'].items += 1
+                await fetch_q.put(paper)
+
+        async def extract():
+            stats = stages['extract']
+            finished = False
+            while not finished:
+                # Block for one paper, then take whatever else is queued.
+                # Each worker consumes exactly one end marker.
+                batch = []
+                item = await fetch_q.get()
+                while True:
+                    if item is done:
+                        finished = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.extract_batch_size or fetch_q.empty():
+                        break
+                    item = fetch_q.get_nowait()
+                if not batch:
+                    continue
+
+                started = time.perf_counter()
+                stats.started = stats.started or started
+                try:
+                    prepared = await self.brain.prepare_papers([p.to_dict() for p in batch])
+                except Exception as e:
+                    error_msg = f"Error extracting {len(batch)} papers: {e}"
+                    logger.error(error_msg)
+                    session.errors.append(error_msg)
+                    self._release(batch)
+                    continue
+                finally:
+                    stats.finished = time.perf_counter()
+                    stats.busy_seconds += stats.finished - started
+                stats.items += len(prepared)
+                # Skipped papers are never staged, so they are not "known"
+                self._release([paper for paper, item in zip(batch, prepared) if item.skipped])
+                for item in prepared:
+                    if not item.skipped:
+                        await persist_q.put(item)
+
+        async def persist():
+            stats = stages['persist']
+            unflushed = 0
+            while True:
+                prepared = await persist_q.get()
+                if prepared is done:
+                    break
+                started = time.perf_counter()
+                stats.started = stats.started or started
+                try:
+                    result = await self.brain.ingest_paper(prepared, flush=False)
+                    session.claims_extracted += result['claims_extracted']
+                    session.connections_found += result['connections_found']
+                    session.patterns_detected += result['patterns_detected']
+                    stats.items += 1
+                    unflushed += 1
+                    if unflushed >= self.persist_batch_size:
+                        await self.brain.flush()
+                        unflushed = 0
+                except Exception as e:
+                    error_msg = f"Error processing paper {prepared.paper.get('external_id')}: {e}"
+                    logger.error(error_msg)
+                    session.errors.append(error_msg)
+                    self._release_ids([prepared.paper.get('external_id')])
+                finally:
+                    stats.finished = time.perf_counter()
+                    stats.busy_seconds += stats.finished - started
+
+            if unflushed:
+                started = time.perf_counter()
+                try:
+                    await self.brain.flush()
+                except Exception as e:
+                    error_msg = f"Error flushing batch for {session.session_id}: {e}"
+                    logger.error(error_msg)
+                    session.errors.append(error_msg)
+                stats.finished = time.perf_counter()
+                stats.busy_seconds += stats.finished - started
+
+        async def fetch_stage():
+            stages['fetch'].started = time.perf_counter()
+            try:
+                fetch_stats = await self.fetch_scheduler.run(
+                    jobs, produce, stop=lambda: session.papers_fetched >= max_papers
+                )
+                session.fetch_stats = fetch_stats
+                session.errors.extend(fetch_stats.errors)
+                stages['fetch'].busy_seconds = sum(
+                    s.network_seconds for s in fetch_stats.sources.values()
+                )
+            finally:
+                stages['fetch'].finished = stages['fetch'].finished or time.perf_counter()
+            for _ in range(self.extract_workers):
+                await fetch_q.put(done)
+
+        async def extract_stage():
+            await asyncio.gather(*(extract() for _ in range(self.extract_workers)))
+            await persist_q.put(done)
+
+        tasks = [
+            asyncio.create_task(fetch_stage()),
+            asyncio.create_task(extract_stage()),
+            asyncio.create_task(persist()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _openalex_jobs(
         self,
         strategy: DomainStrategy,
         limit: int,
         days_back: int
-    ) -> List[Paper]:
-        """Fetch papers from OpenAlex."""
-        papers = []
+    ) -> List[FetchJob]:
+        """OpenAlex searches: top concepts, then keywords."""
+        client = self.openalex
+        source = client.source_type.value
 
         # Calculate date range
         from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
 
         # Search by concepts
-        for concept_id in strategy.openalex_concepts[:2]:  # Limit concepts
-            try:
-                results = await self.openalex.search(
-                    query="",
-                    concept_ids=[concept_id],
-                    limit=limit // len(strategy.openalex_concepts),
-                    from_date=from_date,
-                    is_oa=True,  # Prefer open access
-                    sort="cited_by_count"
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"OpenAlex search failed for concept {concept_id}: {e}")
+        jobs = [
+            FetchJob(source, f"concept {concept_id}", lambda concept_id=concept_id: client.search(
+                query="",
+                concept_ids=[concept_id],
+                limit=limit // len(strategy.openalex_concepts),
+                from_date=from_date,
+                is_oa=True,  # Prefer open access
+                sort="cited_by_count"
+            ))
+            for concept_id in strategy.openalex_concepts[:2]  # Limit concepts
+        ]
 
         # Also search by keywords
-        for keyword in strategy.keywords[:3]:
-            try:
-                results = await self.openalex.search(
-                    query=keyword,
-                    limit=limit // 10,
-                    from_date=from_date
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"OpenAlex keyword search failed for '{keyword}': {e}")
-
-        return papers
-
-    async def _fetch_arxiv(
+        jobs += [
+            FetchJob(source, f"'{keyword}'", lambda keyword=keyword: client.search(
+                query=keyword,
+                limit=limit // 10,
+                from_date=from_date
+            ))
+            for keyword in strategy.keywords[:3]
+        ]
+        return jobs
+
+    def _arxiv_jobs(
         self,
         strategy: DomainStrategy,
         limit: int,
         days_back: int
-    ) -> List[Paper]:
-        """Fetch papers from arXiv."""
-        papers = []
-
-        for category in strategy.arxiv_categories[:3]:
-            try:
-                results = await self.arxiv.search(
-                    query=f"cat:{category}",
-                    limit=limit // len(strategy.arxiv_categories),
-                    sort_by="submittedDate",
-                    sort_order="descending"
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"arXiv search failed for category {category}: {e}")
-
-        return papers
-
-    async def _fetch_pubmed(
+    ) -> List[FetchJob]:
+        """arXiv searches, one per category."""
+        client = self.arxiv
+        return [
+            FetchJob(client.source_type.value, f"category {category}", lambda category=category: client.search(
+                query=f"cat:{category}",
+                limit=limit // len(strategy.arxiv_categories),
+                sort_by="submittedDate",
+                sort_order="descending"
+            ))
+            for category in strategy.arxiv_categories[:3]
+        ]
+
+    def _pubmed_jobs(
         self,
         strategy: DomainStrategy,
         limit: int,
         days_back: int
-    ) -> List[Paper]:
-        """Fetch papers from PubMed."""
-        papers = []
-
+    ) -> List[FetchJob]:
+        """PubMed searches, one per MeSH term."""
+        client = self.pubmed
         from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y/%m/%d')
-
-        for mesh_term in strategy.pubmed_mesh[:3]:
-            try:
-                results = await self.pubmed.search(
-                    query=f"{mesh_term}[MeSH Terms]",
-                    limit=limit // len(strategy.pubmed_mesh),
-                    from_date=from_date
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"PubMed search failed for MeSH term {mesh_term}: {e}")
-
-        return papers
-
-    async def _fetch_semantic_scholar(
+        return [
+            FetchJob(client.source_type.value, f"MeSH term {mesh_term}", lambda mesh_term=mesh_term: client.search(
+                query=f"{mesh_term}[MeSH Terms]",
+                limit=limit // len(strategy.pubmed_mesh),
+                from_date=from_date
+            ))
+            for mesh_term in strategy.pubmed_mesh[:3]
+        ]
+
+    def _semantic_scholar_jobs(
         self,
         strategy: DomainStrategy,
         limit: int,
         days_back: int
-    ) -> List[Paper]:
-        """Fetch papers from Semantic Scholar."""
-        papers = []
-
-        # Search by keywords, filter for high-impact
-        for keyword in strategy.keywords[:2]:
-            try:
-                results = await self.semantic_scholar.search(
-                    query=keyword,
-                    limit=limit // 2,
-                    min_citation_count=10,  # Focus on impactful papers
-                    open_access_only=True
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"Semantic Scholar search failed for '{keyword}': {e}")
+    ) -> List[FetchJob]:
+        """Semantic Scholar keyword searches, filtered for high impact."""
+        client = self.semantic_scholar
+        return [
+            FetchJob(client.source_type.value, f"'{keyword}'", lambda keyword=keyword: client.search(
+                query=keyword,
+                limit=limit // 2,
+                min_citation_count=10,  # Focus on impactful papers
+                open_access_only=True
+            ))
+            for keyword in strategy.keywords[:2]
+        ]
+
+    async def _filter_known(self, session: LearningSession, papers: List[Paper]) -> List[Paper]:
+        """
+        Drop papers already stored, by ID, DOI or near-identical title.
 
-        return papers
+        Checked against the brain's PaperIndex, so papers ingested by
+        earlier runs or fetched from another source are rejected before
+        any extraction work. Admitted papers are remembered for this run.
+        """
+        if not papers:
+            return papers
+        index = await self.brain.get_paper_index()
+        admitted = await index.admit(self.brain.pool, [p.to_dict() for p in papers])
+        session.papers_known += admitted.count(False)
+        return [paper for paper, new in zip(papers, admitted) if new]
+
+    def _release(self, papers: List[Paper]):
+        """Un-admit papers that were filtered but will not be ingested."""
+        self._release_ids([p.external_id for p in papers])
+
+    def _release_ids(self, external_ids: List[str]):
+        """Un-admit papers by external ID."""
+        if self.brain.paper_index is not None and external_ids:
+            self.brain.paper_index.release(external_ids)
+
+    def _deduplicate_papers(self, papers: List[Paper],
+                            seen_titles: Optional[Set[str]] = None) -> List[Paper]:
+        """
+        Remove duplicate papers based on ID and title similarity.
 
-    def _deduplicate_papers(self, papers: List[Paper]) -> List[Paper]:
-        """Remove duplicate papers based on ID and title similarity."""
+        Pass ``seen_titles`` to deduplicate titles across several calls.
+        """
         seen_ids = set()
-        seen_titles = set()
+        seen_titles = seen_titles if seen_titles is not None else set()
         unique = []
 
         for paper in papers:
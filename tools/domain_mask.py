@@ -0,0 +1,53 @@
+"""
+CIPHER Domain Masks
+
+Compact bitmask representation of a claim's domains.
+
+Domains travel as ``List[Domain]`` in Python and ``INTEGER[]`` in Postgres.
+Comparing two claims that way means building and intersecting sets; with
+a bitmask (bit ``d`` set for domain id ``d``) the same tests are single
+integer operations, and whole columns of masks compare in numpy:
+
+    shares_domain(a, b)    a & b != 0
+    is_cross_domain(a, b)  both classified and a != b
+
+Domain ids are 1-7, so a mask fits in a SMALLINT. synthesis.claims keeps
+one in the generated ``domain_mask`` column
+(sql/migrations/010_domain_mask.sql), computed with the same bit layout
+as domain_mask() below.
+"""
+
+from typing import Iterable, List, NewType
+
+# A domain bitmask; plain int at runtime
+DomainMask = NewType('DomainMask', int)
+
+
+def domain_mask(domains: Iterable[int]) -> DomainMask:
+    """Pack domain ids (or Domain members) into a bitmask (bit ``d`` set for domain ``d``)."""
+    mask = 0
+    for d in domains or []:
+        mask |= 1 << int(getattr(d, 'value', d))
+    return DomainMask(mask)
+
+
+def mask_domain_ids(mask: int) -> List[int]:
+    """Domain ids set in a mask, lowest first."""
+    mask = int(mask)
+    return [d for d in range(mask.bit_length()) if mask >> d & 1]
+
+
+def lowest_domain(mask: int) -> int:
+    """Lowest domain id set in a mask, or 0 for an empty mask."""
+    mask = int(mask)
+    return (mask & -mask).bit_length() - 1 if mask else 0
+
+
+def shares_domain(a: int, b: int) -> bool:
+    """True if the masks have a domain in common."""
+    return (a & b) != 0
+
+
+def is_cross_domain(a: int, b: int) -> bool:
+    """True if both masks are classified and their domain sets differ."""
+    return a != 0 and b != 0 and a != b
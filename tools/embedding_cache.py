@@ -0,0 +1,372 @@
+"""
+CIPHER Embedding Cache
+
+Persistent embedding cache shared by every process on the machine.
+
+Vectors are stored in a fixed-capacity float32 memory map, one slot per
+cached text. A SQLite index maps the SHA-256 of the text to its slot and
+tracks the last access time, so the least recently used slot is reused
+once the cache is full. Each embedding model gets its own directory:
+
+    <cache_dir>/<model_name>/vectors.f32   capacity x dimensions float32
+    <cache_dir>/<model_name>/index.sqlite  key -> slot, last_used; meta
+
+Lookups run in a plain (shared) read transaction, so any number of
+processes read at once. Inserts take ``BEGIN EXCLUSIVE``, which waits for
+open readers and keeps new ones out (the index uses the default rollback
+journal, not WAL), so no process can read a slot while another is
+overwriting it. Lookups do not write: last-use times of hits are kept in
+memory and written with the next insert, or every ``TOUCH_INTERVAL``
+seconds. Eviction is therefore approximately LRU across processes.
+
+One connection is shared by the threads the embedding service runs cache
+calls on, behind a lock.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("CIPHER_BASE_PATH", str(Path.home() / "projects" / "cipher"))
+) / "data" / "embedding_cache"
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("CIPHER_EMBEDDING_CACHE_ENTRIES", "1000000"))
+
+
+def text_key(text: str) -> bytes:
+    """Content hash used as the cache key."""
+    return hashlib.sha256(text.encode('utf-8')).digest()
+
+
+class EmbeddingCache:
+    """
+    Disk-backed LRU cache of text embeddings for one model.
+
+    Usage:
+        cache = EmbeddingCache("all-MiniLM-L6-v2", max_entries=500000)
+        hits = cache.get_many(texts)          # {index: vector}
+        cache.put_many(missing_texts, vectors)
+    """
+
+    # Seconds to wait for another process holding the index lock
+    LOCK_TIMEOUT = 60.0
+    # Seconds (or pending keys) before last-use times of hits are written
+    TOUCH_INTERVAL = 60.0
+    TOUCH_BATCH = 10000
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize the cache (files are opened lazily).
+
+        Args:
+            model_name: Embedding model the vectors come from
+            cache_dir: Root directory (default: DEFAULT_CACHE_DIR)
+            max_entries: Capacity in vectors; LRU entries are evicted beyond it
+        """
+        self.model_name = model_name
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)
+        self.path = Path(cache_dir or DEFAULT_CACHE_DIR) / safe_name
+        self.max_entries = max_entries
+
+        self.dimensions: Optional[int] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._vectors: Optional[np.memmap] = None
+        self._capacity = 0
+        self._lock = threading.Lock()
+
+        # key -> last use, for hits not yet written to the index
+        self._touched: Dict[bytes, float] = {}
+        self._touched_flushed = time.monotonic()
+
+        self.hits = 0
+        self.misses = 0
+
+    # =========================================================================
+    # STORAGE
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(
+                str(self.path / "index.sqlite"),
+                timeout=self.LOCK_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False
+            )
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entries (
+                    key BLOB PRIMARY KEY,
+                    slot INTEGER NOT NULL UNIQUE,
+                    last_used REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries(last_used);
+            """)
+            self._db = db
+        return self._db
+
+    @contextmanager
+    def _transaction(self, mode: str = 'IMMEDIATE'):
+        """
+        Transaction on the shared connection.
+
+        ``DEFERRED`` reads alongside other readers, ``IMMEDIATE`` excludes
+        other writers, ``EXCLUSIVE`` also waits out and blocks readers.
+        """
+        with self._lock:
+            db = self._connect()
+            db.execute(f"BEGIN {mode}")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            else:
+                db.execute("COMMIT")
+
+    def _meta(self) -> Dict[str, str]:
+        return dict(self._db.execute("SELECT name, value FROM meta").fetchall())
+
+    def _open(self, dimensions: Optional[int] = None, readonly: bool = False) -> Optional[bool]:
+        """
+        Map the vector file, creating or resizing it as needed.
+
+        Must be called inside a transaction. Returns False when the cache
+        has never been written and ``dimensions`` is unknown, and None when
+        ``readonly`` and the index would have to be written first.
+        """
+        db = self._connect()
+        meta = self._meta()
+
+        if meta.get('model_name', self.model_name) != self.model_name or (
+            dimensions and 'dimensions' in meta and int(meta['dimensions']) != dimensions
+        ):
+            if readonly:
+                return None
+            logger.warning(f"Embedding cache at {self.path} belongs to another model, resetting")
+            db.execute("DELETE FROM entries")
+            db.execute("DELETE FROM meta")
+            meta = {}
+            self._vectors = None
+
+        if 'dimensions' not in meta:
+            if not dimensions:
+                return False
+            if readonly:
+                return None
+            db.executemany(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                [('model_name', self.model_name), ('dimensions', str(dimensions)),
+                 ('capacity', '0')]
+            )
+            meta = self._meta()
+
+        dims = int(meta['dimensions'])
+        capacity = int(meta['capacity'])
+        if capacity != self.max_entries:
+            if readonly:
+                return None
+            self._resize(capacity, dims)
+            capacity = self.max_entries
+
+        if self._vectors is None or self._capacity != capacity:
+            self._vectors = np.memmap(
+                self.path / "vectors.f32", dtype=np.float32, mode='r+',
+                shape=(capacity, dims)
+            )
+        self.dimensions = dims
+        self._capacity = capacity
+        return True
+
+    def _resize(self, capacity: int, dims: int):
+        """Grow or shrink the vector file to max_entries slots."""
+        if self.max_entries < capacity:
+            # Keep the most recently used entries in the surviving slots
+            self._db.execute("""
+                DELETE FROM entries WHERE key IN (
+                    SELECT key FROM entries ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+            self._compact(dims)
+        self._vectors = None
+        with open(self.path / "vectors.f32", 'ab') as f:
+            f.truncate(self.max_entries * dims * 4)
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES ('capacity', ?)",
+            (str(self.max_entries),)
+        )
+
+    def _compact(self, dims: int):
+        """Renumber surviving slots to 0..count-1, moving their vectors."""
+        rows = self._db.execute("SELECT key, slot FROM entries ORDER BY slot").fetchall()
+        if not rows:
+            return
+        old_capacity = int(self._meta()['capacity'])
+        vectors = np.memmap(self.path / "vectors.f32", dtype=np.float32, mode='r+',
+                            shape=(old_capacity, dims))
+        slots = np.array([slot for _, slot in rows])
+        vectors[:len(rows)] = vectors[slots]
+        vectors.flush()
+        del vectors
+        # Two steps so the UNIQUE(slot) constraint never sees a collision
+        self._db.execute("UPDATE entries SET slot = -slot - 1")
+        self._db.executemany(
+            "UPDATE entries SET slot = ? WHERE key = ?",
+            [(i, key) for i, (key, _) in enumerate(rows)]
+        )
+
+    # =========================================================================
+    # ACCESS
+    # =========================================================================
+
+    def get_many(self, texts: Sequence[str]) -> Dict[int, List[float]]:
+        """
+        Look up cached vectors.
+
+        Returns:
+            {position in ``texts``: vector} for the texts found
+        """
+        if not texts or self.max_entries <= 0:
+            return {}
+        keys = [text_key(t) for t in texts]
+
+        # Read-only first; take the write lock only if the files need setting up
+        for mode in ('DEFERRED', 'IMMEDIATE'):
+            with self._transaction(mode) as db:
+                ready = self._open(readonly=mode == 'DEFERRED')
+                if ready is None:
+                    continue
+                if not ready:
+                    self.misses += len(texts)
+                    return {}
+                slots: Dict[bytes, int] = {}
+                unique = list(set(keys))
+                for i in range(0, len(unique), 500):
+                    chunk = unique[i:i + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    slots.update(db.execute(
+                        f"SELECT key, slot FROM entries WHERE key IN ({placeholders})", chunk
+                    ).fetchall())
+                found = {
+                    pos: self._vectors[slots[key]].tolist()
+                    for pos, key in enumerate(keys) if key in slots
+                }
+                now = time.time()
+                self._touched.update((key, now) for key in slots)
+                self.hits += len(found)
+                self.misses += len(texts) - len(found)
+            break
+
+        if len(self._touched) >= self.TOUCH_BATCH or \
+                time.monotonic() - self._touched_flushed >= self.TOUCH_INTERVAL:
+            with self._transaction() as db:
+                self._write_touches(db)
+        return found
+
+    def _write_touches(self, db: sqlite3.Connection):
+        """Write last-use times of hits (inside a write transaction)."""
+        if self._touched:
+            db.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()]
+            )
+            self._touched = {}
+        self._touched_flushed = time.monotonic()
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]):
+        """Store vectors, evicting least recently used entries when full."""
+        if not texts or self.max_entries <= 0:
+            return
+        matrix = np.asarray(vectors, dtype=np.float32)
+        entries: Dict[bytes, int] = {}
+        for i, text in enumerate(texts):
+            entries.setdefault(text_key(text), i)
+        # The newest entries win if there are more than fit
+        items = list(entries.items())[-self.max_entries:]
+
+        with self._transaction('EXCLUSIVE') as db:
+            self._open(matrix.shape[1])
+            # Recent hits count for eviction
+            self._write_touches(db)
+            keys = [key for key, _ in items]
+            existing = set()
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                existing.update(k for (k,) in db.execute(
+                    f"SELECT key FROM entries WHERE key IN ({placeholders})", chunk
+                ).fetchall())
+            items = [(key, i) for key, i in items if key not in existing]
+            if not items:
+                return
+
+            count = db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            free = min(self._capacity - count, len(items))
+            slots = list(range(count, count + free))
+            if len(items) > free:
+                evicted = db.execute(
+                    "SELECT key, slot FROM entries ORDER BY last_used LIMIT ?",
+                    (len(items) - free,)
+                ).fetchall()
+                db.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k, _ in evicted])
+                slots.extend(slot for _, slot in evicted)
+
+            now = time.time()
+            db.executemany(
+                "INSERT INTO entries (key, slot, last_used) VALUES (?, ?, ?)",
+                [(key, slot, now) for (key, _), slot in zip(items, slots)]
+            )
+            # Index rows first: if they fail, no slot has been overwritten
+            for (_, i), slot in zip(items, slots):
+                self._vectors[slot] = matrix[i]
+
+    def clear(self):
+        """Drop every cached vector."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM entries")
+            self._touched = {}
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, capacity and hit/miss counters for this process."""
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {
+            'entries': entries,
+            'capacity': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def close(self):
+        """Write pending last-use times, flush the vector file and close the index."""
+        if self._touched and self._db is not None:
+            with self._transaction() as db:
+                self._write_touches(db)
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        if self._db is not None:
+            self._db.close()
+            self._db = None
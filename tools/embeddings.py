@@ -14,13 +14,44 @@ Supports multiple backends:
 
 import asyncio
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple, Callable
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import numpy as np
 
+from .embedding_cache import EmbeddingCache, DEFAULT_MAX_ENTRIES
+
 logger = logging.getLogger(__name__)
 
+# Default scratch memory for one block of the similarity matrix
+SIMILARITY_MEMORY_BUDGET_MB = 256
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in place; zero rows stay zero."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def to_matrix(vectors) -> np.ndarray:
+    """
+    Stack vectors into a row-normalized float32 matrix.
+
+    The result can be passed to EmbeddingService.top_k_similar as a
+    pre-normalized candidate matrix.
+    """
+    if isinstance(vectors, np.ndarray) and vectors.ndim == 2:
+        matrix = vectors.astype(np.float32, copy=True)
+    else:
+        vectors = list(vectors)
+        if not vectors:
+            return np.empty((0, 0), dtype=np.float32)
+        matrix = np.array(vectors, dtype=np.float32, ndmin=2)
+    return normalize_rows(matrix)
+
 
 @dataclass
 class EmbeddingResult:
@@ -127,7 +158,7 @@ class EmbeddingService:
 
     Handles:
     - Embedding computation with configurable backend
-    - Caching (optional)
+    - Persistent caching keyed on text content (optional)
     - Similarity computation
     - Batch processing
     """
@@ -135,18 +166,28 @@ class EmbeddingService:
     def __init__(
         self,
         backend: Optional[EmbeddingBackend] = None,
-        cache_enabled: bool = True
+        cache_enabled: bool = True,
+        cache_dir: Optional[Path] = None,
+        cache_max_entries: int = DEFAULT_MAX_ENTRIES
     ):
         """
         Initialize the embedding service.
 
         Args:
             backend: Embedding backend to use (default: SentenceTransformer)
-            cache_enabled: Whether to cache embeddings in memory
+            cache_enabled: Whether to cache embeddings on disk
+            cache_dir: Cache root directory (default: data/embedding_cache)
+            cache_max_entries: Cache capacity in vectors before LRU eviction
         """
         self.backend = backend or SentenceTransformerBackend()
         self.cache_enabled = cache_enabled
-        self._cache: Dict[str, List[float]] = {}
+        self.cache: Optional[EmbeddingCache] = None
+        if cache_enabled:
+            self.cache = EmbeddingCache(
+                self.backend.model_name,
+                cache_dir=cache_dir,
+                max_entries=cache_max_entries
+            )
 
     @property
     def dimensions(self) -> int:
@@ -158,11 +199,6 @@ class EmbeddingService:
         """Get model name"""
         return self.backend.model_name
 
-    def _cache_key(self, text: str) -> str:
-        """Generate cache key for text"""
-        # Use first 100 chars + length as simple key
-        return f"{text[:100]}_{len(text)}"
-
     async def embed(self, text: str) -> EmbeddingResult:
         """
         Embed a single text.
@@ -183,28 +219,28 @@ class EmbeddingService:
             )
 
         # Check cache
-        if self.cache_enabled:
-            cache_key = self._cache_key(text)
-            if cache_key in self._cache:
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get_many, [text])
+            if cached:
                 return EmbeddingResult(
                     text=text,
-                    vector=self._cache[cache_key],
+                    vector=cached[0],
                     model=self.model_name,
-                    dimensions=self.dimensions
+                    dimensions=len(cached[0])
                 )
 
         # Compute embedding
         vector = await self.backend.embed(text)
 
         # Cache result
-        if self.cache_enabled:
-            self._cache[cache_key] = vector
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put_many, [text], [vector])
 
         return EmbeddingResult(
             text=text,
             vector=vector,
             model=self.model_name,
-            dimensions=self.dimensions
+            dimensions=len(vector)
         )
 
     async def embed_batch(
@@ -230,6 +266,11 @@ class EmbeddingService:
         uncached_indices = []
         uncached_texts = []
 
+        nonempty = [i for i, text in enumerate(texts) if text and text.strip()]
+        cached = {}
+        if self.cache is not None and nonempty:
+            cached = await asyncio.to_thread(self.cache.get_many, [texts[i] for i in nonempty])
+
         for i, text in enumerate(texts):
             if not text or not text.strip():
                 results[i] = EmbeddingResult(
@@ -238,21 +279,18 @@ class EmbeddingService:
                     model=self.model_name,
                     dimensions=self.dimensions
                 )
-            elif self.cache_enabled:
-                cache_key = self._cache_key(text)
-                if cache_key in self._cache:
-                    results[i] = EmbeddingResult(
-                        text=text,
-                        vector=self._cache[cache_key],
-                        model=self.model_name,
-                        dimensions=self.dimensions
-                    )
-                else:
-                    uncached_indices.append(i)
-                    uncached_texts.append(text)
+
+        for pos, i in enumerate(nonempty):
+            if pos in cached:
+                results[i] = EmbeddingResult(
+                    text=texts[i],
+                    vector=cached[pos],
+                    model=self.model_name,
+                    dimensions=len(cached[pos])
+                )
             else:
                 uncached_indices.append(i)
-                uncached_texts.append(text)
+                uncached_texts.append(texts[i])
 
         # Batch embed uncached texts
         if uncached_texts:
@@ -261,16 +299,15 @@ class EmbeddingService:
 
             vectors = await self.backend.embed_batch(uncached_texts)
 
-            for idx, text, vector in zip(uncached_indices, uncached_texts, vectors):
-                # Cache
-                if self.cache_enabled:
-                    self._cache[self._cache_key(text)] = vector
+            if self.cache is not None:
+                await asyncio.to_thread(self.cache.put_many, uncached_texts, vectors)
 
+            for idx, text, vector in zip(uncached_indices, uncached_texts, vectors):
                 results[idx] = EmbeddingResult(
                     text=text,
                     vector=vector,
                     model=self.model_name,
-                    dimensions=self.dimensions
+                    dimensions=len(vector)
                 )
 
         return results
@@ -290,8 +327,8 @@ class EmbeddingService:
         Returns:
             Similarity score between -1 and 1
         """
-        a = np.array(vec1)
-        b = np.array(vec2)
+        a = np.asarray(vec1, dtype=np.float32)
+        b = np.asarray(vec2, dtype=np.float32)
 
         norm_a = np.linalg.norm(a)
         norm_b = np.linalg.norm(b)
@@ -301,6 +338,69 @@ class EmbeddingService:
 
         return float(np.dot(a, b) / (norm_a * norm_b))
 
+    def top_k_similar(
+        self,
+        queries: np.ndarray,
+        candidates: np.ndarray,
+        top_k: int = 10,
+        threshold: float = -1.0,
+        mask_fn: Optional[Callable[[int, int], np.ndarray]] = None,
+        memory_budget_mb: float = SIMILARITY_MEMORY_BUDGET_MB
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Batched top-k cosine similarity over pre-normalized matrices.
+
+        Scores are computed as one matmul per block of query rows; the block
+        size is chosen so the (block x candidates) score matrix fits in
+        ``memory_budget_mb``. Top-k selection uses argpartition.
+
+        Args:
+            queries: (m, d) float32 matrix of normalized query vectors
+            candidates: (n, d) float32 matrix of normalized candidate vectors
+            top_k: Results per query
+            threshold: Minimum similarity
+            mask_fn: Optional callback ``mask_fn(start, stop)`` returning a
+                boolean (stop - start, n) array of allowed pairs for query
+                rows ``start:stop``
+            memory_budget_mb: Scratch memory for one score block
+
+        Returns:
+            For each query row, a list of (candidate_row, similarity) tuples
+            sorted by similarity
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis, :]
+        m, n = len(queries), len(candidates)
+        results: List[List[Tuple[int, float]]] = [[] for _ in range(m)]
+        if m == 0 or n == 0 or top_k <= 0:
+            return results
+
+        k = min(top_k, n)
+        # Score matrix plus mask, 4 + 1 bytes per pair
+        block = max(1, int(memory_budget_mb * 1024 * 1024 // (n * 5)))
+
+        for start in range(0, m, block):
+            stop = min(m, start + block)
+            scores = queries[start:stop] @ candidates.T
+            if mask_fn is not None:
+                scores[~mask_fn(start, stop)] = -np.inf
+
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            for row in range(stop - start):
+                keep = top_scores[row] >= threshold
+                results[start + row] = list(zip(
+                    top[row][keep].tolist(),
+                    top_scores[row][keep].tolist()
+                ))
+
+        return results
+
     def find_similar(
         self,
         query_vector: List[float],
@@ -320,17 +420,15 @@ class EmbeddingService:
         Returns:
             List of (id, similarity) tuples, sorted by similarity
         """
-        similarities = []
-
-        for item_id, vector in candidates:
-            sim = self.cosine_similarity(query_vector, vector)
-            if sim >= threshold:
-                similarities.append((item_id, sim))
+        if not candidates:
+            return []
 
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        ids = [item_id for item_id, _ in candidates]
+        matrix = to_matrix([vector for _, vector in candidates])
+        query = to_matrix([query_vector])
 
-        return similarities[:top_k]
+        hits = self.top_k_similar(query, matrix, top_k=top_k, threshold=threshold)[0]
+        return [(ids[row], sim) for row, sim in hits]
 
     async def semantic_search(
         self,
@@ -373,9 +471,16 @@ class EmbeddingService:
 
     def clear_cache(self):
         """Clear the embedding cache"""
-        self._cache.clear()
+        if self.cache is not None:
+            self.cache.clear()
         logger.info("Embedding cache cleared")
 
+    def cache_stats(self) -> Dict[str, int]:
+        """Entry count, capacity and hit/miss counters of the cache"""
+        if self.cache is None:
+            return {}
+        return self.cache.stats()
+
 
 # Singleton instance for global use
 _embedding_service: Optional[EmbeddingService] = None
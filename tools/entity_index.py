@@ -0,0 +1,205 @@
+"""
+CIPHER Entity Index
+
+Inverted index from normalized entity to the claims that mention it.
+
+Connection discovery used to compare each new claim against a window of
+recent claims, rebuilding lowercase entity sets for every pair. With the
+index, candidates are the union of the postings lists of the claim's
+entities, so the cost grows with the number of shared entities instead of
+the corpus size, and every claim in the corpus is reachable.
+
+The index lives in memory and is mirrored in ``synthesis.claim_entities``
+(see sql/migrations/003_entity_index.sql). Claims staged in the batch
+writer are posted under their pending key and re-keyed to their database
+ID once flushed. Claims inserted by code paths that do not maintain the
+table are indexed by backfill() (``cli.py index-entities``).
+"""
+
+import json
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# A claim reference: database ID or pending batch-writer key
+Ref = Union[int, str]
+
+
+def normalize_entities(entities: Iterable[str]) -> FrozenSet[str]:
+    """Lowercase and strip entities, dropping empties."""
+    return frozenset(
+        e.strip().lower() for e in entities or []
+        if isinstance(e, str) and e.strip()
+    )
+
+
+class EntityIndex:
+    """
+    entity -> claim postings, kept in sync with synthesis.claim_entities.
+
+    Usage:
+        index = EntityIndex()
+        await index.load(pool)
+        for ref, overlap in index.candidates(claim.entities, limit=1000):
+            ...
+        index.add(claim_id, claim.entities)
+        await index.persist(pool, [claim_id])
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Set[Ref]] = defaultdict(set)
+        self.entities: Dict[Ref, FrozenSet[str]] = {}
+        # False when the mirror table is missing (migration not applied)
+        self.persistent = True
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def add(self, ref: Ref, entities: Iterable[str]):
+        """Post a claim under each of its entities."""
+        normalized = normalize_entities(entities)
+        if not normalized:
+            return
+        self.remove(ref)
+        self.entities[ref] = normalized
+        for entity in normalized:
+            self.postings[entity].add(ref)
+
+    def remove(self, ref: Ref):
+        """Drop a claim from every postings list."""
+        for entity in self.entities.pop(ref, ()):
+            posting = self.postings.get(entity)
+            if posting is not None:
+                posting.discard(ref)
+                if not posting:
+                    del self.postings[entity]
+
+    def resolve(self, keys: Dict[str, int]):
+        """Re-key pending claims to their database IDs after a flush."""
+        for key, claim_id in keys.items():
+            entities = self.entities.get(key)
+            if entities is None:
+                continue
+            self.remove(key)
+            merged = entities | self.entities.get(claim_id, frozenset())
+            self.entities[claim_id] = merged
+            for entity in merged:
+                self.postings[entity].add(claim_id)
+
+    def candidates(
+        self,
+        entities: Iterable[str],
+        exclude: Optional[Ref] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[Ref, int]]:
+        """
+        Claims sharing at least one entity, with the number shared.
+
+        Args:
+            entities: Entities of the query claim
+            exclude: Reference to skip (the query claim itself)
+            limit: Keep only the claims with the largest overlap
+
+        Returns:
+            (ref, overlap) pairs, largest overlap first
+        """
+        counts: Counter = Counter()
+        for entity in normalize_entities(entities):
+            counts.update(self.postings.get(entity, ()))
+        counts.pop(exclude, None)
+        return counts.most_common(limit)
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    async def load(self, pool: asyncpg.Pool):
+        """
+        Load postings from synthesis.claim_entities.
+
+        Falls back to building the index from synthesis.claims when the
+        table does not exist.
+        """
+        self.postings.clear()
+        self.entities.clear()
+
+        async with pool.acquire() as conn:
+            try:
+                rows = await conn.fetch('''
+                    SELECT claim_id, array_agg(entity) AS entities
+                    FROM synthesis.claim_entities
+                    GROUP BY claim_id
+                ''')
+                self.persistent = True
+            except asyncpg.UndefinedTableError:
+                logger.warning("synthesis.claim_entities missing, building entity index in memory only")
+                self.persistent = False
+                rows = await conn.fetch('''
+                    SELECT id AS claim_id, entities
+                    FROM synthesis.claims
+                    WHERE entities IS NOT NULL
+                ''')
+
+        for row in rows:
+            entities = row['entities']
+            if isinstance(entities, str):
+                entities = json.loads(entities)
+            self.add(row['claim_id'], entities if isinstance(entities, list) else [])
+
+        logger.info(f"Entity index loaded: {len(self.entities)} claims, {len(self.postings)} entities")
+
+    @staticmethod
+    async def backfill(pool: asyncpg.Pool) -> int:
+        """
+        Post claims that have entities but no rows in synthesis.claim_entities.
+
+        For claims inserted by code paths that do not maintain the table;
+        scans every claim, so it is run on demand rather than on load.
+
+        Returns:
+            Number of postings added
+        """
+        async with pool.acquire() as conn:
+            status = await conn.execute('''
+                INSERT INTO synthesis.claim_entities (entity, claim_id)
+                SELECT DISTINCT synthesis.normalize_entity(e), c.id
+                FROM synthesis.claims c,
+                     jsonb_array_elements_text(c.entities) AS e
+                WHERE jsonb_typeof(c.entities) = 'array'
+                  AND synthesis.normalize_entity(e) IS NOT NULL
+                  AND NOT EXISTS (
+                      SELECT 1 FROM synthesis.claim_entities ce WHERE ce.claim_id = c.id
+                  )
+                ON CONFLICT DO NOTHING
+            ''')
+        return int(status.split()[-1])
+
+    async def persist(self, pool: asyncpg.Pool, claim_ids: Iterable[int]):
+        """Mirror the postings of the given claims to synthesis.claim_entities."""
+        if not self.persistent:
+            return
+        rows = [
+            (entity, claim_id)
+            for claim_id in claim_ids
+            for entity in self.entities.get(claim_id, ())
+        ]
+        if not rows:
+            return
+        async with pool.acquire() as conn:
+            await conn.executemany('''
+                INSERT INTO synthesis.claim_entities (entity, claim_id)
+                VALUES ($1, $2)
+                ON CONFLICT DO NOTHING
+            ''', rows)
+
+    def stats(self) -> Dict[str, int]:
+        """Index size and largest postings list."""
+        return {
+            'claims': len(self.entities),
+            'entities': len(self.postings),
+            'max_posting': max((len(p) for p in self.postings.values()), default=0),
+        }
@@ -0,0 +1,918 @@
+"""
+CIPHER Compact Graph (CSR)
+
+Array-backed knowledge graph for GraphEngine's ``csr`` backend.
+
+The dict backend keeps a GraphNode per claim and a GraphEdge per
+connection, which stops fitting in memory around a few million edges.
+Here claim IDs are remapped to dense ints and edges live in numpy CSR
+arrays, about 22 bytes per edge including the reverse index:
+
+    indptr[v]:indptr[v+1]   out-edge positions of node v
+    indices[e]              target node of edge e
+    strength[e]             float32 connection strength
+    types[e]                int8 code into ``type_names``
+    cross[e]                cross_domain flag
+
+Algorithms are vectorized (PageRank, BFS frontiers, Brandes levels) or
+loop over nodes with numpy per-node work (clustering, Leiden).
+Betweenness can also be split across processes that read the arrays
+from shared memory (``parallel_betweenness``).
+
+Cross-domain bridge: Math (sparse linear algebra) ↔ Neuro (connectome matrices)
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional, List, Dict, Tuple, Iterable
+
+import numpy as np
+
+from .domain_mask import domain_mask, mask_domain_ids
+
+logger = logging.getLogger(__name__)
+
+
+def _ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate arange(s, e) for each pair, vectorized."""
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+    return offsets + np.arange(total)
+
+
+def _build_csr(n: int, src: np.ndarray, dst: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row pointers and a stable src-major edge order."""
+    order = np.argsort(src, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, order
+
+
+def _brandes_dependency(
+    indptr: np.ndarray,
+    src: np.ndarray,
+    indices: np.ndarray,
+    source: int
+) -> np.ndarray:
+    """Brandes dependency of every node on shortest paths from ``source``."""
+    n = len(indptr) - 1
+    level = np.full(n, -1, dtype=np.int32)
+    sigma = np.zeros(n)
+    level[source] = 0
+    sigma[source] = 1.0
+    frontier = np.array([source], dtype=np.int64)
+    dag: List[Tuple[np.ndarray, np.ndarray]] = []
+    depth = 0
+
+    while frontier.size:
+        edges = _ranges(indptr[frontier], indptr[frontier + 1])
+        tails = src[edges]
+        heads = indices[edges]
+        new = np.unique(heads[level[heads] < 0])
+        level[new] = depth + 1
+        on_dag = level[heads] == depth + 1
+        tails, heads = tails[on_dag], heads[on_dag]
+        # sigma of this level is final: all its in-edges came from the last one
+        np.add.at(sigma, heads, sigma[tails])
+        dag.append((tails, heads))
+        frontier = new.astype(np.int64)
+        depth += 1
+
+    delta = np.zeros(n)
+    for tails, heads in reversed(dag):
+        np.add.at(delta, tails, sigma[tails] / sigma[heads] * (1.0 + delta[heads]))
+    delta[source] = 0.0
+    return delta
+
+
+# =============================================================================
+# PARALLEL BETWEENNESS
+# =============================================================================
+
+# Arrays a Brandes worker needs, attached from shared memory once per process
+_BRANDES_FIELDS = ('indptr', 'src', 'indices')
+_worker_arrays: Dict[str, np.ndarray] = {}
+_worker_segments: List[shared_memory.SharedMemory] = []
+
+
+def _attach_worker(spec: Dict[str, Tuple[str, Tuple[int, ...], str]]):
+    """Map the published CSR arrays into this worker without copying."""
+    for name, (segment, shape, dtype) in spec.items():
+        shm = shared_memory.SharedMemory(name=segment)
+        _worker_segments.append(shm)
+        _worker_arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _betweenness_chunk(sources: List[int]) -> np.ndarray:
+    """Summed dependencies for a chunk of sources (runs in a worker)."""
+    indptr = _worker_arrays['indptr']
+    src = _worker_arrays['src']
+    indices = _worker_arrays['indices']
+    total = np.zeros(len(indptr) - 1)
+    for s in sources:
+        total += _brandes_dependency(indptr, src, indices, s)
+    return total
+
+
+class SharedCSR:
+    """
+    CSR arrays copied into named shared memory segments.
+
+    Workers attach by name (see ``spec``) and read the graph in place, so
+    the edge arrays are copied once rather than pickled per task.
+    """
+
+    def __init__(self, graph: 'CSRGraph', fields: Iterable[str] = _BRANDES_FIELDS):
+        self.spec: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+        self._segments: List[shared_memory.SharedMemory] = []
+        for name in fields:
+            array = getattr(graph, name)
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            self._segments.append(shm)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+            self.spec[name] = (shm.name, array.shape, array.dtype.str)
+
+    def close(self):
+        """Release and unlink the segments."""
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+        self._segments = []
+
+    def __enter__(self) -> 'SharedCSR':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def betweenness_sample_size(n: int, epsilon: float, delta: float) -> int:
+    """
+    Sources needed so every normalized score is within ``epsilon`` of exact
+    with probability at least 1 - ``delta``.
+
+    Each sampled source contributes a per-node term bounded in [0, 1] after
+    normalization, so Hoeffding's inequality with a union bound over the n
+    nodes gives k >= ln(2n / delta) / (2 epsilon^2).
+    """
+    if n <= 2:
+        return n
+    return math.ceil(math.log(2 * n / delta) / (2 * epsilon ** 2))
+
+
+def parallel_betweenness(
+    graph: 'CSRGraph',
+    sources: Optional[Iterable[int]] = None,
+    processes: Optional[int] = None,
+    chunks: int = 64
+) -> np.ndarray:
+    """
+    Summed Brandes dependencies over ``sources``, split across processes.
+
+    The graph is published once in shared memory; each task returns the
+    partial dependency vector of its chunk of sources and the partials are
+    added up here in chunk order. Chunking does not depend on the number
+    of processes, so results are bit-identical for any pool size.
+
+    Args:
+        graph: Graph to analyse
+        sources: Source nodes (default: all nodes, i.e. exact)
+        processes: Worker processes (default: CPU count; 1 runs in-process)
+        chunks: Number of tasks the sources are split into
+
+    Returns:
+        Unnormalized betweenness per node
+    """
+    sources = list(range(graph.n)) if sources is None else [int(s) for s in sources]
+    size = max(1, -(-len(sources) // chunks))
+    batches = [sources[i:i + size] for i in range(0, len(sources), size)]
+    processes = min(processes or os.cpu_count() or 1, max(len(batches), 1))
+
+    total = np.zeros(graph.n)
+    if processes <= 1:
+        for batch in batches:
+            total += graph.betweenness(batch)
+        return total
+
+    with SharedCSR(graph) as shared:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_attach_worker,
+            initargs=(shared.spec,)
+        ) as executor:
+            for partial in executor.map(_betweenness_chunk, batches):
+                total += partial
+    return total
+
+
+class CSRGraph:
+    """
+    Directed claim graph in CSR form, plus a reverse (in-edge) index.
+
+    Usage:
+        graph = await CSRGraph.load(conn)
+        pr = graph.pagerank()
+        top = graph.ids[np.argsort(pr)[::-1][:20]]
+    """
+
+    # Chunk size when streaming rows from Postgres
+    LOAD_CHUNK = 100000
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        src: np.ndarray,
+        dst: np.ndarray,
+        strength: np.ndarray,
+        types: np.ndarray,
+        cross: np.ndarray,
+        type_names: List[str],
+        masks: Optional[np.ndarray] = None,
+        confidence: Optional[np.ndarray] = None,
+        texts: Optional[List[str]] = None
+    ):
+        """
+        Build from dense edge lists.
+
+        Args:
+            ids: Sorted claim IDs; node ``i`` is claim ``ids[i]``
+            src, dst: Dense endpoints per edge
+            strength, types, cross: Per-edge attributes
+            type_names: Connection type for each code in ``types``
+            masks: Domain bitmask per node
+            confidence: Claim confidence per node
+            texts: Truncated claim text per node (for display)
+        """
+        self.ids = np.asarray(ids, dtype=np.int64)
+        n = len(self.ids)
+        self.type_names = list(type_names)
+        self.masks = masks if masks is not None else np.zeros(n, dtype=np.int64)
+        self.confidence = confidence if confidence is not None else np.full(n, 0.5, dtype=np.float32)
+        self.texts = texts if texts is not None else [''] * n
+
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        index_dtype = np.int32 if n < 2 ** 31 else np.int64
+
+        self.indptr, order = _build_csr(n, src, dst)
+        self.src = src[order].astype(index_dtype)
+        self.indices = dst[order].astype(index_dtype)
+        self.strength = np.asarray(strength, dtype=np.float32)[order]
+        self.types = np.asarray(types, dtype=np.int8)[order]
+        self.cross = np.asarray(cross, dtype=bool)[order]
+
+        # Reverse index: in-edges of v are edge positions redges[rindptr[v]:rindptr[v+1]]
+        self.rindptr, rorder = _build_csr(n, self.indices.astype(np.int64), self.src)
+        self.redges = rorder.astype(np.int32 if len(rorder) < 2 ** 31 else np.int64)
+
+        self.out_degree = np.diff(self.indptr)
+        self.in_degree = np.diff(self.rindptr)
+
+    # =========================================================================
+    # CONSTRUCTION
+    # =========================================================================
+
+    @classmethod
+    def from_edges(
+        cls,
+        ids: Iterable[int],
+        sources: Iterable[int],
+        targets: Iterable[int],
+        strength: Iterable[float],
+        types: Iterable[str],
+        cross: Iterable[bool],
+        domains: Optional[List[List[int]]] = None,
+        confidence: Optional[Iterable[float]] = None,
+        texts: Optional[List[str]] = None
+    ) -> 'CSRGraph':
+        """Build from claim-ID edge lists; edges with unknown endpoints are dropped."""
+        ids = np.asarray(list(ids), dtype=np.int64)
+        order = np.argsort(ids, kind='stable')
+        ids = ids[order]
+
+        sources = np.asarray(list(sources), dtype=np.int64)
+        targets = np.asarray(list(targets), dtype=np.int64)
+        codes: Dict[str, int] = {}
+        type_codes = np.asarray(
+            [codes.setdefault(t, len(codes)) for t in types], dtype=np.int8
+        )
+        type_names = sorted(codes, key=codes.get)
+
+        src, src_ok = cls._dense(ids, sources)
+        dst, dst_ok = cls._dense(ids, targets)
+        keep = src_ok & dst_ok
+
+        masks = confidences = None
+        if domains is not None:
+            masks = np.asarray([domain_mask(d) for d in domains], dtype=np.int64)[order]
+        if confidence is not None:
+            confidences = np.asarray(list(confidence), dtype=np.float32)[order]
+        if texts is not None:
+            texts = [texts[i] for i in order]
+
+        return cls(
+            ids, src[keep], dst[keep],
+            np.asarray(list(strength), dtype=np.float32)[keep],
+            type_codes[keep],
+            np.asarray(list(cross), dtype=bool)[keep],
+            type_names, masks, confidences, texts
+        )
+
+    @staticmethod
+    def _dense(ids: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Map claim IDs to dense indexes; returns (index, found)."""
+        if len(ids) == 0:
+            return np.zeros(len(values), dtype=np.int64), np.zeros(len(values), dtype=bool)
+        pos = np.searchsorted(ids, values)
+        pos = np.minimum(pos, len(ids) - 1)
+        return pos, ids[pos] == values
+
+    @classmethod
+    def from_engine(cls, engine) -> 'CSRGraph':
+        """Convert a dict-backend GraphEngine's in-memory graph."""
+        nodes = list(engine._nodes.values())
+        edges = [edge for adj in engine._adjacency.values() for _, edge in adj]
+        return cls.from_edges(
+            ids=[node.id for node in nodes],
+            sources=[e.source_id for e in edges],
+            targets=[e.target_id for e in edges],
+            strength=[e.strength for e in edges],
+            types=[e.connection_type for e in edges],
+            cross=[e.cross_domain for e in edges],
+            domains=[node.domains for node in nodes],
+            confidence=[node.confidence for node in nodes],
+            texts=[node.claim_text[:100] for node in nodes]
+        )
+
+    @classmethod
+    async def load(cls, conn, min_confidence: float = 0.0) -> 'CSRGraph':
+        """
+        Stream claims and connections from Postgres into arrays.
+
+        Rows are read through server-side cursors in LOAD_CHUNK batches so
+        no full record list is held in memory.
+        """
+        ids, masks, confidence, texts = [], [], [], []
+        sources, targets, strength, type_codes, cross = [], [], [], [], []
+        codes: Dict[str, int] = {}
+
+        async with conn.transaction():
+            cursor = conn.cursor("""
+                SELECT id, domains, confidence, LEFT(claim_text, 100) AS text
+                FROM synthesis.claims
+                WHERE confidence >= $1
+                ORDER BY id
+            """, min_confidence, prefetch=cls.LOAD_CHUNK)
+            async for row in cursor:
+                ids.append(row['id'])
+                masks.append(domain_mask(row['domains']))
+                confidence.append(row['confidence'] or 0.5)
+                texts.append(row['text'] or '')
+
+            cursor = conn.cursor("""
+                SELECT source_claim_id, target_claim_id, connection_type,
+                       strength, cross_domain
+                FROM synthesis.connections
+            """, prefetch=cls.LOAD_CHUNK)
+            async for row in cursor:
+                sources.append(row['source_claim_id'] or 0)
+                targets.append(row['target_claim_id'] or 0)
+                type_codes.append(codes.setdefault(row['connection_type'] or 'related', len(codes)))
+                strength.append(row['strength'] or 0.5)
+                cross.append(row['cross_domain'] or False)
+
+        ids = np.asarray(ids, dtype=np.int64)
+        src, src_ok = cls._dense(ids, np.asarray(sources, dtype=np.int64))
+        dst, dst_ok = cls._dense(ids, np.asarray(targets, dtype=np.int64))
+        keep = src_ok & dst_ok
+
+        graph = cls(
+            ids, src[keep], dst[keep],
+            np.asarray(strength, dtype=np.float32)[keep],
+            np.asarray(type_codes, dtype=np.int8)[keep],
+            np.asarray(cross, dtype=bool)[keep],
+            sorted(codes, key=codes.get),
+            np.asarray(masks, dtype=np.int64),
+            np.asarray(confidence, dtype=np.float32),
+            texts
+        )
+        logger.info(f"Loaded CSR graph: {graph.n} nodes, {graph.m} edges")
+        return graph
+
+    # =========================================================================
+    # ACCESS
+    # =========================================================================
+
+    @property
+    def n(self) -> int:
+        return len(self.ids)
+
+    @property
+    def m(self) -> int:
+        return len(self.indices)
+
+    def index(self, claim_id: int) -> Optional[int]:
+        """Dense index of a claim, or None."""
+        pos = int(np.searchsorted(self.ids, claim_id))
+        if pos < self.n and self.ids[pos] == claim_id:
+            return pos
+        return None
+
+    def domains(self, v: int) -> List[int]:
+        """Domain ids of node v (decoded from its bitmask)."""
+        return mask_domain_ids(self.masks[v])
+
+    def neighbors(self, v: int) -> np.ndarray:
+        return self.indices[self.indptr[v]:self.indptr[v + 1]]
+
+    def edge(self, u: int, v: int) -> Optional[int]:
+        """Position of the strongest u -> v edge, or None."""
+        start, end = self.indptr[u], self.indptr[u + 1]
+        hits = np.nonzero(self.indices[start:end] == v)[0]
+        if hits.size == 0:
+            return None
+        return int(start + hits[np.argmax(self.strength[start + hits])])
+
+    def nbytes(self) -> int:
+        """Memory held by the edge and node arrays."""
+        arrays = (self.ids, self.masks, self.confidence, self.indptr, self.src,
+                  self.indices, self.strength, self.types, self.cross,
+                  self.rindptr, self.redges)
+        return sum(a.nbytes for a in arrays)
+
+    # =========================================================================
+    # ALGORITHMS
+    # =========================================================================
+
+    def pagerank(
+        self,
+        damping: float = 0.85,
+        iterations: int = 100,
+        tolerance: float = 1e-6,
+        warm_start: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """PageRank by power iteration (same formulation as the dict backend)."""
+        n = self.n
+        if n == 0:
+            return np.zeros(0)
+
+        inv_out = np.zeros(n)
+        nonzero = self.out_degree > 0
+        inv_out[nonzero] = 1.0 / self.out_degree[nonzero]
+
+        pr = np.array(warm_start, dtype=np.float64) if warm_start is not None else np.full(n, 1.0 / n)
+        for _ in range(iterations):
+            contrib = (pr * inv_out)[self.src]
+            new = (1 - damping) / n + damping * np.bincount(self.indices, weights=contrib, minlength=n)
+            diff = np.abs(new - pr).sum()
+            pr = new
+            if diff < tolerance:
+                break
+        return pr
+
+    def bfs(self, source: int, target: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Level-synchronous BFS over out-edges.
+
+        Returns:
+            (level, parent_edge) arrays; -1 where unreached. Stops early
+            once ``target`` is reached.
+        """
+        level = np.full(self.n, -1, dtype=np.int32)
+        parent_edge = np.full(self.n, -1, dtype=np.int64)
+        level[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        depth = 0
+
+        while frontier.size and (target is None or level[target] < 0):
+            edges = _ranges(self.indptr[frontier], self.indptr[frontier + 1])
+            dst = self.indices[edges]
+            fresh = level[dst] < 0
+            edges, dst = edges[fresh], dst[fresh]
+            # First edge wins as the parent of each newly reached node
+            dst, first = np.unique(dst, return_index=True)
+            depth += 1
+            level[dst] = depth
+            parent_edge[dst] = edges[first]
+            frontier = dst.astype(np.int64)
+
+        return level, parent_edge
+
+    def shortest_path(self, source: int, target: int) -> Optional[List[int]]:
+        """
+        Edge positions along a shortest (fewest hops) path, or None.
+
+        Bidirectional level-synchronous BFS: each round expands whichever
+        frontier has fewer edges, out-edges forward and in-edges backward,
+        recording the edge that reached each node. A node is checked
+        against the other side as soon as it is reached, so the first
+        meeting closes a shortest path.
+        """
+        if source == target:
+            return []
+        n = self.n
+        parent_f = np.full(n, -1, dtype=np.int64)
+        parent_b = np.full(n, -1, dtype=np.int64)
+        seen_f = np.zeros(n, dtype=bool)
+        seen_b = np.zeros(n, dtype=bool)
+        seen_f[source] = seen_b[target] = True
+        front_f = np.array([source], dtype=np.int64)
+        front_b = np.array([target], dtype=np.int64)
+
+        while front_f.size and front_b.size:
+            work_f = int((self.indptr[front_f + 1] - self.indptr[front_f]).sum())
+            work_b = int((self.rindptr[front_b + 1] - self.rindptr[front_b]).sum())
+            if work_f <= work_b:
+                edges = _ranges(self.indptr[front_f], self.indptr[front_f + 1])
+                reached = self.indices[edges]
+                seen, parent, other = seen_f, parent_f, seen_b
+            else:
+                edges = self.redges[_ranges(self.rindptr[front_b], self.rindptr[front_b + 1])]
+                reached = self.src[edges]
+                seen, parent, other = seen_b, parent_b, seen_f
+
+            fresh = ~seen[reached]
+            reached, first = np.unique(reached[fresh], return_index=True)
+            seen[reached] = True
+            parent[reached] = edges[fresh][first]
+            reached = reached.astype(np.int64)
+
+            meet = reached[other[reached]]
+            if meet.size:
+                return self._join_paths(int(meet[0]), parent_f, parent_b, source, target)
+            if work_f <= work_b:
+                front_f = reached
+            else:
+                front_b = reached
+
+        return None
+
+    def _join_paths(
+        self,
+        meet: int,
+        parent_f: np.ndarray,
+        parent_b: np.ndarray,
+        source: int,
+        target: int
+    ) -> List[int]:
+        """Edge positions source -> meet -> target from the two parent arrays."""
+        path = []
+        v = meet
+        while v != source:
+            e = int(parent_f[v])
+            path.append(e)
+            v = int(self.src[e])
+        path.reverse()
+        v = meet
+        while v != target:
+            e = int(parent_b[v])
+            path.append(e)
+            v = int(self.indices[e])
+        return path
+
+    def out_edges(self, v: int, cost: np.ndarray) -> List[Tuple[int, int, float]]:
+        """(head, edge position, cost) for each out-edge of v."""
+        start, end = int(self.indptr[v]), int(self.indptr[v + 1])
+        return list(zip(self.indices[start:end].tolist(), range(start, end), cost[start:end].tolist()))
+
+    def in_edges(self, v: int, cost: np.ndarray) -> List[Tuple[int, int, float]]:
+        """(tail, edge position, cost) for each in-edge of v."""
+        edges = self.redges[self.rindptr[v]:self.rindptr[v + 1]]
+        return list(zip(self.src[edges].tolist(), edges.tolist(), cost[edges].tolist()))
+
+    def domain_changes(self) -> np.ndarray:
+        """Per edge: flagged cross-domain or entering a domain the tail lacks."""
+        return self.cross | ((self.masks[self.indices] & ~self.masks[self.src]) != 0)
+
+    def betweenness(self, sources: Optional[Iterable[int]] = None) -> np.ndarray:
+        """
+        Unnormalized betweenness: summed Brandes dependencies.
+
+        Args:
+            sources: Source nodes (default: all nodes, i.e. exact)
+        """
+        total = np.zeros(self.n)
+        for s in (range(self.n) if sources is None else sources):
+            total += _brandes_dependency(self.indptr, self.src, self.indices, int(s))
+        return total
+
+    def clustering(self) -> np.ndarray:
+        """
+        Local clustering coefficient per node (neighbors = in ∪ out).
+
+        Counts directed edges among the neighbors over k(k-1), matching the
+        dict backend.
+        """
+        n = self.n
+        result = np.zeros(n)
+        in_src = self.src[self.redges]
+        for v in range(n):
+            out = self.indices[self.indptr[v]:self.indptr[v + 1]]
+            inn = in_src[self.rindptr[v]:self.rindptr[v + 1]]
+            nbrs = np.union1d(out, inn)
+            k = nbrs.size
+            if k < 2:
+                continue
+            edges = _ranges(self.indptr[nbrs], self.indptr[nbrs + 1])
+            src = self.src[edges]
+            dst = self.indices[edges]
+            links = np.count_nonzero(np.isin(dst, nbrs, assume_unique=False) & (dst != src))
+            result[v] = links / (k * (k - 1))
+        return result
+
+    def undirected(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Symmetric weighted adjacency (strengths of u->v and v->u summed).
+
+        Returns:
+            (indptr, indices, weights) in CSR form
+        """
+        n = self.n
+        u = np.concatenate([self.src, self.indices]).astype(np.int64)
+        v = np.concatenate([self.indices, self.src]).astype(np.int64)
+        w = np.concatenate([self.strength, self.strength]).astype(np.float64)
+
+        # Merge parallel edges (different types, both directions)
+        key = u * n + v
+        key, inverse = np.unique(key, return_inverse=True)
+        weights = np.bincount(inverse, weights=w)
+        u, v = key // n, key % n
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(u, minlength=n), out=indptr[1:])
+        return indptr, v, weights
+
+    def louvain(
+        self,
+        resolution: float = 1.0,
+        seed: int = 0,
+        max_levels: int = 10,
+        refine: bool = True
+    ) -> np.ndarray:
+        """
+        Leiden communities on the undirected weighted graph (see louvain()).
+
+        Returns:
+            Community label per node (dense, 0..k-1)
+        """
+        indptr, indices, weights = self.undirected()
+        return louvain(indptr, indices, weights, resolution, seed, max_levels, refine)
+
+
+# =============================================================================
+# COMMUNITY DETECTION
+# =============================================================================
+
+def _row_sums(indptr: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    n = len(indptr) - 1
+    return np.bincount(np.repeat(np.arange(n), np.diff(indptr)), weights=weights, minlength=n)
+
+
+def _local_moving(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    m2: float,
+    resolution: float,
+    order: np.ndarray,
+    initial: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, bool]:
+    """
+    Move nodes between communities while modularity improves.
+
+    Community totals live in a list updated on every move, so evaluating
+    a node costs O(degree). Nodes are queued in ``order``; when a node
+    moves, neighbors outside its new community are queued again (the
+    Leiden fast local move), so later sweeps only touch changed regions.
+    Starts from ``initial`` labels (0..n-1), or from singletons.
+
+    Returns:
+        (labels, whether any node moved)
+    """
+    n = len(indptr) - 1
+    degree_arr = _row_sums(indptr, weights)
+    degree = degree_arr.tolist()
+    if initial is None:
+        labels = list(range(n))
+        totals = list(degree)
+    else:
+        labels = initial.tolist()
+        totals = np.bincount(initial, weights=degree_arr, minlength=n).tolist()
+    queued = [True] * n
+    queue = deque(order.tolist())
+    moved = False
+
+    while queue:
+        v = queue.popleft()
+        queued[v] = False
+        start, end = indptr[v], indptr[v + 1]
+        if start == end:
+            continue
+        nbrs = indices[start:end].tolist()
+
+        links: Dict[int, float] = {}
+        for u, w in zip(nbrs, weights[start:end].tolist()):
+            if u != v:
+                c = labels[u]
+                links[c] = links.get(c, 0.0) + w
+
+        current = labels[v]
+        k_v = degree[v]
+        totals[current] -= k_v
+        scale = resolution * k_v / m2
+        best = current
+        best_gain = links.get(current, 0.0) - totals[current] * scale
+        for c, k_in in links.items():
+            gain = k_in - totals[c] * scale
+            if gain > best_gain + 1e-12:
+                best, best_gain = c, gain
+        totals[best] += k_v
+
+        if best != current:
+            labels[v] = best
+            moved = True
+            for u in nbrs:
+                if not queued[u] and labels[u] != best:
+                    queued[u] = True
+                    queue.append(u)
+
+    return np.asarray(labels, dtype=np.int64), moved
+
+
+def _refine(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    m2: float,
+    resolution: float,
+    partition: np.ndarray,
+    order: np.ndarray
+) -> np.ndarray:
+    """
+    Leiden refinement of ``partition``.
+
+    Starts from singletons and, within each community C of the partition,
+    merges nodes that are still singletons into refined communities of C.
+    Both sides must be well connected to the rest of C (edge weight to
+    C - S at least resolution * K_S * (K_C - K_S) / 2m), and a merge must
+    increase modularity. Leiden picks among improving merges at random;
+    this takes the best one, so results depend only on ``order``.
+
+    Refined communities only grow along edges, so each is connected, and
+    a community of ``partition`` may split into several of them.
+
+    Returns:
+        Refined label per node (a node id of the community, not dense)
+    """
+    n = len(indptr) - 1
+    degree_arr = _row_sums(indptr, weights)
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    same = (partition[rows] == partition[indices]) & (rows != indices)
+    # Weight from each node to the rest of its community, and community totals
+    to_community = np.bincount(rows[same], weights=weights[same], minlength=n).tolist()
+    community_total = np.bincount(partition, weights=degree_arr).tolist()
+    part = partition.tolist()
+    degree = degree_arr.tolist()
+
+    refined = list(range(n))
+    size = [1] * n
+    totals = list(degree)
+    # Weight from each refined community to the rest of its community
+    external = list(to_community)
+
+    for v in order.tolist():
+        if size[refined[v]] > 1:
+            continue
+        c = part[v]
+        k_v = degree[v]
+        k_c = community_total[c]
+        if to_community[v] < resolution * k_v * (k_c - k_v) / m2:
+            continue
+
+        start, end = indptr[v], indptr[v + 1]
+        links: Dict[int, float] = {}
+        for u, w in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            if u != v and part[u] == c:
+                r = refined[u]
+                links[r] = links.get(r, 0.0) + w
+
+        best, best_gain = v, 0.0
+        for r, k_in in links.items():
+            if external[r] < resolution * totals[r] * (k_c - totals[r]) / m2:
+                continue
+            gain = k_in - resolution * k_v * totals[r] / m2
+            if gain > best_gain + 1e-12:
+                best, best_gain = r, gain
+
+        if best != v:
+            external[best] += to_community[v] - 2 * links[best]
+            totals[best] += k_v
+            size[best] += 1
+            size[v] = 0
+            refined[v] = best
+
+    return np.asarray(refined, dtype=np.int64)
+
+
+def _aggregate(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    labels: np.ndarray,
+    k: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collapse each community into one node; internal weight becomes a self-loop."""
+    n = len(indptr) - 1
+    rows = labels[np.repeat(np.arange(n), np.diff(indptr))]
+    cols = labels[indices]
+    key, inverse = np.unique(rows * k + cols, return_inverse=True)
+    new_weights = np.bincount(inverse, weights=weights)
+    rows, cols = key // k, key % k
+    new_indptr = np.zeros(k + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=k), out=new_indptr[1:])
+    return new_indptr, cols, new_weights
+
+
+def louvain(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    resolution: float = 1.0,
+    seed: int = 0,
+    max_levels: int = 10,
+    refine: bool = True
+) -> np.ndarray:
+    """
+    Leiden community detection (multi-level Louvain when ``refine`` is off).
+
+    Each level runs fast local moving in a seeded random node order, which
+    gives a partition P. With ``refine``, P is refined (see _refine) and the
+    graph is aggregated by the refined communities, each aggregate node
+    starting the next level in its community of P; this keeps communities
+    connected. Without it the graph is aggregated by P, as in Louvain.
+    Stops when aggregation would not shrink the graph.
+
+    Args:
+        indptr, indices, weights: Symmetric weighted adjacency (CSR)
+        resolution: Higher values give more, smaller communities
+        seed: Node order seed; same seed and graph give the same result
+        max_levels: Maximum aggregation levels
+        refine: Refine each level's partition before aggregating
+
+    Returns:
+        Community label per node (dense, 0..k-1)
+    """
+    n = len(indptr) - 1
+    membership = np.arange(n)
+    m2 = float(np.sum(weights))
+    if n == 0 or m2 == 0:
+        return membership
+
+    rng = np.random.default_rng(seed)
+    initial = None
+    for _ in range(max_levels):
+        size = len(indptr) - 1
+        labels, _ = _local_moving(indptr, indices, weights, m2, resolution, rng.permutation(size), initial)
+        _, labels = np.unique(labels, return_inverse=True)
+        nodes = labels
+        if refine:
+            nodes = _refine(indptr, indices, weights, m2, resolution, labels, rng.permutation(size))
+            _, nodes = np.unique(nodes, return_inverse=True)
+        k = int(nodes.max()) + 1
+        membership = nodes[membership]
+        # Community (of P) of each aggregate node
+        initial = np.empty(k, dtype=np.int64)
+        initial[nodes] = labels
+        if k == size:
+            break
+        indptr, indices, weights = _aggregate(indptr, indices, weights, nodes, k)
+
+    _, membership = np.unique(initial[membership], return_inverse=True)
+    return membership
+
+
+def modularity(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    labels: np.ndarray,
+    resolution: float = 1.0
+) -> float:
+    """Modularity of a partition of the symmetric weighted graph."""
+    n = len(indptr) - 1
+    m2 = float(np.sum(weights))
+    if m2 == 0:
+        return 0.0
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    internal = float(weights[labels[rows] == labels[indices]].sum())
+    totals = np.bincount(labels, weights=_row_sums(indptr, weights))
+    return internal / m2 - resolution * float(((totals / m2) ** 2).sum())
@@ -5,10 +5,16 @@ Native graph operations for the knowledge network.
 Provides graph-native querying and algorithms using:
 1. PostgreSQL recursive CTEs for path finding
 2. In-memory graph algorithms for complex operations
-3. Centrality measures for identifying key claims
+3. Centrality measures for identifying key claims, stored in
+   synthesis.graph_scores and updated incrementally from the
+   synthesis.connection_changes log
 4. Community detection for finding knowledge clusters
 5. Cross-domain bridge analysis
 
+Two in-memory backends: ``dict`` (GraphNode/GraphEdge objects, supports
+incremental refresh) and ``csr`` (numpy arrays, see graph_csr.py) for
+graphs with millions of edges. ``auto`` picks by connection count.
+
 Cross-domain bridge: Math (graph theory) ↔ Neuro (connectomics) ↔ Biology (networks)
 """
 
@@ -17,11 +23,17 @@ import logging
 import math
 from collections import defaultdict, deque
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Set, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple, Callable, Iterable
 from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
 import heapq
 
+import numpy as np
+
+from .domain_mask import DomainMask, domain_mask, mask_domain_ids
+from .graph_csr import CSRGraph, betweenness_sample_size, parallel_betweenness
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +64,11 @@ class GraphNode:
     clustering_coefficient: float = 0.0
     community_id: Optional[int] = None
 
+    @cached_property
+    def domain_mask(self) -> DomainMask:
+        """Bitmask of ``domains``."""
+        return domain_mask(self.domains)
+
 
 @dataclass
 class GraphEdge:
@@ -86,6 +103,18 @@ class Community:
     coherence: float
 
 
+@dataclass
+class GraphDelta:
+    """Nodes and edge endpoints touched since a point in the change log"""
+    new_nodes: Set[int] = field(default_factory=set)
+    sources: Set[int] = field(default_factory=set)   # Out-degree may have changed
+    targets: Set[int] = field(default_factory=set)   # Gained or lost an in-edge
+
+    @property
+    def empty(self) -> bool:
+        return not (self.new_nodes or self.sources or self.targets)
+
+
 @dataclass
 class GraphStats:
     """Statistics about the knowledge graph"""
@@ -100,6 +129,126 @@ class GraphStats:
     diameter: Optional[int] = None
 
 
+# =============================================================================
+# GENERIC SEARCH
+# =============================================================================
+# Searches take neighbor callbacks returning (neighbor, edge, cost) so the
+# same code runs over the dict backend (edge = GraphEdge) and the CSR
+# backend (edge = edge position). Paths are rebuilt from parent pointers.
+
+Expand = Callable[[int], Iterable[Tuple[int, Any, float]]]
+Parents = Dict[int, Optional[Tuple[int, Any]]]
+
+
+def _trace(node: int, parent: Parents) -> Tuple[List[int], List[Any]]:
+    """Nodes and edges from the search root to ``node``."""
+    nodes, edges = [node], []
+    while parent[node] is not None:
+        node, edge = parent[node]
+        nodes.append(node)
+        edges.append(edge)
+    nodes.reverse()
+    edges.reverse()
+    return nodes, edges
+
+
+def _join(meet: int, forward: Parents, backward: Parents) -> Tuple[List[int], List[Any]]:
+    """Join a forward and a backward search tree at ``meet``."""
+    nodes, edges = _trace(meet, forward)
+    node = meet
+    while backward[node] is not None:
+        node, edge = backward[node]
+        nodes.append(node)
+        edges.append(edge)
+    return nodes, edges
+
+
+def _bidirectional_dijkstra(
+    source: int,
+    target: int,
+    forward: Expand,
+    backward: Expand
+) -> Optional[Tuple[List[int], List[Any]]]:
+    """
+    Least-cost path (non-negative costs), searching from both ends.
+
+    Each step settles the side with the smaller heap top; the search stops
+    once the two tops together cannot beat the best meeting found.
+    """
+    if source == target:
+        return [source], []
+    dist = ({source: 0.0}, {target: 0.0})
+    parent: Tuple[Parents, Parents] = ({source: None}, {target: None})
+    heaps = ([(0.0, source)], [(0.0, target)])
+    expand = (forward, backward)
+    best, meet = math.inf, None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, u = heapq.heappop(heaps[side])
+        if d > dist[side][u]:
+            continue
+        near, far = dist[side], dist[1 - side]
+        for v, edge, cost in expand[side](u):
+            nd = d + cost
+            if nd < near.get(v, math.inf):
+                near[v] = nd
+                parent[side][v] = (u, edge)
+                heapq.heappush(heaps[side], (nd, v))
+            if v in far and near[v] + far[v] < best:
+                best, meet = near[v] + far[v], v
+
+    if meet is None:
+        return None
+    return _join(meet, *parent)
+
+
+def _multi_source_dijkstra(
+    sources: Iterable[int],
+    is_goal: Callable[[int], bool],
+    expand: Expand,
+    limit: int = 1
+) -> List[Tuple[List[int], List[Any], float]]:
+    """
+    Cheapest paths from any of ``sources`` to the first ``limit`` goals.
+
+    Goal nodes end a path and are not expanded further, so each path
+    reaches a distinct goal; paths come out cheapest first.
+
+    Returns:
+        (nodes, edges, cost) per goal reached
+    """
+    dist: Dict[int, float] = {}
+    parent: Parents = {}
+    for s in sources:
+        dist[s] = 0.0
+        parent[s] = None
+    heap = [(0.0, s) for s in dist]
+    heapq.heapify(heap)
+    settled: Set[int] = set()
+    found = []
+
+    while heap and len(found) < limit:
+        d, u = heapq.heappop(heap)
+        if u in settled:
+            continue
+        settled.add(u)
+        if is_goal(u):
+            nodes, edges = _trace(u, parent)
+            found.append((nodes, edges, d))
+            continue
+        for v, edge, cost in expand(u):
+            nd = d + cost
+            if v not in settled and nd < dist.get(v, math.inf):
+                dist[v] = nd
+                parent[v] = (u, edge)
+                heapq.heappush(heap, (nd, v))
+
+    return found
+
+
 class GraphEngine:
     """
     Graph-native operations for the CIPHER knowledge network.
@@ -107,7 +256,7 @@ class GraphEngine:
     Implements graph algorithms optimized for knowledge synthesis:
     - Path finding (shortest, strongest connections)
     - Centrality measures (degree, betweenness, PageRank)
-    - Community detection (Louvain-like algorithm)
+    - Community detection (Leiden algorithm)
     - Cross-domain bridge analysis
     """
 
@@ -116,29 +265,70 @@ class GraphEngine:
     PAGERANK_ITERATIONS = 100
     PAGERANK_TOLERANCE = 1e-6
 
+    # Parallel betweenness: exact up to this many nodes, otherwise sampled
+    # so scores are within EPSILON of exact with probability 1 - DELTA
+    BETWEENNESS_EXACT_NODES = 20000
+    BETWEENNESS_EPSILON = 0.02
+    BETWEENNESS_DELTA = 0.1
+    BETWEENNESS_SEED = 0
+
+    # Cross-domain search: extra cost for an edge that stays within the
+    # current claim's domains (edge cost is otherwise 1 - strength)
+    CROSS_DOMAIN_STAY_COST = 0.5
+
     # Community detection parameters
     COMMUNITY_RESOLUTION = 1.0  # Higher = more communities
-
-    def __init__(self, db_connection_string: str):
+    COMMUNITY_SEED = 0
+
+    # Backend selection: 'auto' switches to CSR above this many connections
+    BACKENDS = ('dict', 'csr', 'auto')
+    CSR_AUTO_EDGES = 20000
+
+    # Stored score metric -> (graph_scores column, GraphNode attribute)
+    SCORE_COLUMNS = {
+        'pagerank': ('pagerank', 'pagerank'),
+        'betweenness': ('betweenness', 'betweenness'),
+        'clustering': ('clustering', 'clustering_coefficient'),
+    }
+    # graph_state row recording how far connection_changes was pruned
+    CHANGE_LOG_STATE = 'change_log'
+
+    def __init__(self, db_connection_string: str, backend: str = 'dict'):
         """
         Initialize the Graph Engine.
 
         Args:
             db_connection_string: PostgreSQL connection string
+            backend: 'dict', 'csr', or 'auto' (CSR above CSR_AUTO_EDGES)
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown graph backend: {backend}")
         self.db_connection_string = db_connection_string
+        self.backend = backend
         self._conn = None
 
+        # Compact backend, set instead of _nodes/_adjacency when in use
+        self._csr: Optional[CSRGraph] = None
+        self._csr_scores: Dict[str, np.ndarray] = {}
+        self._csr_costs: Dict[str, np.ndarray] = {}
+
         # In-memory graph representation
         self._nodes: Dict[int, GraphNode] = {}
         self._adjacency: Dict[int, List[Tuple[int, GraphEdge]]] = defaultdict(list)
         self._reverse_adjacency: Dict[int, List[Tuple[int, GraphEdge]]] = defaultdict(list)
+        self._edge_keys: Set[Tuple[int, int, str]] = set()
         self._loaded = False
 
+        # Position in synthesis.connection_changes the in-memory graph
+        # reflects (None if the change log table is missing)
+        self._min_confidence = 0.0
+        self._last_change_id: Optional[int] = None
+        self._max_claim_id = 0
+
     async def connect(self):
         """Establish database connection."""
-        import asyncpg
-        self._conn = await asyncpg.connect(self.db_connection_string)
+        from .pgvector_codec import connect
+        self._conn = await connect(self.db_connection_string)
 
     async def close(self):
         """Close database connection."""
@@ -155,6 +345,24 @@ class GraphEngine:
         """
         logger.info("Loading knowledge graph into memory...")
 
+        self._nodes.clear()
+        self._adjacency.clear()
+        self._reverse_adjacency.clear()
+        self._edge_keys.clear()
+        self._csr = None
+        self._csr_scores.clear()
+        self._csr_costs.clear()
+        self._min_confidence = min_confidence
+
+        # Changes logged after this point are picked up by refresh_graph()
+        self._last_change_id = await self._current_change_id()
+
+        if await self._use_csr():
+            self._csr = await CSRGraph.load(self._conn, min_confidence)
+            self._max_claim_id = int(self._csr.ids[-1]) if self._csr.n else 0
+            self._loaded = True
+            return
+
         # Load nodes (claims)
         rows = await self._conn.fetch("""
             SELECT id, claim_text, claim_type, domains, confidence
@@ -163,13 +371,7 @@ class GraphEngine:
         """, min_confidence)
 
         for row in rows:
-            self._nodes[row['id']] = GraphNode(
-                id=row['id'],
-                claim_text=row['claim_text'],
-                claim_type=row['claim_type'] or 'unknown',
-                domains=row['domains'] or [],
-                confidence=row['confidence'] or 0.5
-            )
+            self._add_node(row)
 
         # Load edges (connections)
         edges = await self._conn.fetch("""
@@ -179,42 +381,369 @@ class GraphEngine:
         """)
 
         for row in edges:
-            source_id = row['source_claim_id']
-            target_id = row['target_claim_id']
+            self._add_edge(row)
 
-            if source_id not in self._nodes or target_id not in self._nodes:
-                continue
+        self._loaded = True
+        logger.info(f"Loaded {len(self._nodes)} nodes and {len(self._edge_keys)} edges")
+
+    async def refresh_graph(self) -> GraphDelta:
+        """
+        Apply claims and connections changed since the graph was loaded.
+
+        New claims are picked up by ID; connection inserts and deletes come
+        from synthesis.connection_changes. Falls back to a full reload when
+        the change log is not available, or was pruned past the position
+        the graph was loaded at (see _prune_changes).
+
+        Returns:
+            GraphDelta of what changed
+        """
+        self._ensure_loaded()
 
-            edge = GraphEdge(
-                source_id=source_id,
-                target_id=target_id,
-                connection_type=row['connection_type'] or 'related',
-                strength=row['strength'] or 0.5,
-                cross_domain=row['cross_domain'] or False,
-                reasoning=row['reasoning']
+        if self._csr is not None:
+            before = set(self._csr.ids.tolist())
+            await self.load_graph(self._min_confidence)
+            after = set(self._csr.ids.tolist())
+            return GraphDelta(new_nodes=after - before, sources=after, targets=after)
+
+        async def reload() -> GraphDelta:
+            before = set(self._nodes)
+            await self.load_graph(self._min_confidence)
+            return GraphDelta(
+                new_nodes=set(self._nodes) - before,
+                sources=set(self._nodes),
+                targets=set(self._nodes)
             )
 
-            self._adjacency[source_id].append((target_id, edge))
-            self._reverse_adjacency[target_id].append((source_id, edge))
+        if self._last_change_id is None:
+            return await reload()
 
-            # Update degrees
-            self._nodes[source_id].out_degree += 1
-            self._nodes[target_id].in_degree += 1
-            self._nodes[source_id].degree += 1
-            self._nodes[target_id].degree += 1
+        delta = GraphDelta()
 
-        self._loaded = True
-        logger.info(f"Loaded {len(self._nodes)} nodes and {sum(len(adj) for adj in self._adjacency.values())} edges")
+        rows = await self._conn.fetch("""
+            SELECT id, claim_text, claim_type, domains, confidence
+            FROM synthesis.claims
+            WHERE id > $1 AND confidence >= $2
+        """, self._max_claim_id, self._min_confidence)
+        for row in rows:
+            if row['id'] not in self._nodes:
+                self._add_node(row)
+                delta.new_nodes.add(row['id'])
+
+        changes = await self._fetch_changes(self._last_change_id)
+        # Checked after the fetch, so a prune committed in between is seen
+        if await self._pruned_change_id() > self._last_change_id:
+            logger.info("Connection change log pruned past the loaded graph; reloading")
+            return await reload()
+        for row in changes:
+            if row['op'] == 'I':
+                if row['live_id'] is None:
+                    continue  # Deleted again later in the log
+                added = self._add_edge(row)
+            else:
+                added = self._remove_edge(
+                    row['source_claim_id'], row['target_claim_id'], row['connection_type']
+                )
+            if added:
+                delta.sources.add(row['source_claim_id'])
+                delta.targets.add(row['target_claim_id'])
+            self._last_change_id = row['id']
+
+        logger.info(
+            f"Graph refreshed: {len(delta.new_nodes)} new nodes, "
+            f"{len(changes)} connection changes"
+        )
+        return delta
+
+    async def _use_csr(self) -> bool:
+        """Resolve the configured backend against the connection count."""
+        if self.backend != 'auto':
+            return self.backend == 'csr'
+        # Planner estimate; exact COUNT(*) is itself slow on large tables
+        estimate = await self._conn.fetchval(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = 'synthesis.connections'::regclass"
+        )
+        return (estimate or 0) > self.CSR_AUTO_EDGES
+
+    async def _current_change_id(self) -> Optional[int]:
+        """Latest connection change ID, or None without the change log."""
+        from asyncpg import UndefinedTableError
+        try:
+            return await self._conn.fetchval(
+                "SELECT COALESCE(MAX(id), 0) FROM synthesis.connection_changes"
+            )
+        except UndefinedTableError:
+            logger.warning("synthesis.connection_changes missing; run migration 004 for incremental updates")
+            return None
+
+    async def _pruned_change_id(self) -> int:
+        """Change ID up to which synthesis.connection_changes was pruned."""
+        pruned = await self._conn.fetchval(
+            "SELECT last_change_id FROM synthesis.graph_state WHERE metric = $1",
+            self.CHANGE_LOG_STATE
+        )
+        return pruned or 0
+
+    async def _prune_changes(self, upto: int):
+        """
+        Delete connection changes up to ``upto`` from the log.
+
+        Only the incremental PageRank update reads changes from a stored
+        position, so callers pass the position saved for PageRank. The
+        newest row is kept: staleness checks compare graph_state against
+        MAX(id). Engines loaded before the pruned position find out via the
+        CHANGE_LOG_STATE row and reload.
+        """
+        pruned = await self._conn.fetchval("""
+            WITH gone AS (
+                DELETE FROM synthesis.connection_changes
+                WHERE id <= $1
+                  AND id < (SELECT MAX(id) FROM synthesis.connection_changes)
+                RETURNING id
+            )
+            SELECT MAX(id) FROM gone
+        """, upto)
+        if pruned is None:
+            return
+        await self._conn.execute("""
+            INSERT INTO synthesis.graph_state (metric, last_change_id, computed_at)
+            VALUES ($1, $2, NOW())
+            ON CONFLICT (metric) DO UPDATE SET
+                last_change_id = GREATEST(synthesis.graph_state.last_change_id, EXCLUDED.last_change_id),
+                computed_at = NOW()
+        """, self.CHANGE_LOG_STATE, pruned)
+        logger.info(f"Pruned connection change log up to {pruned}")
+
+    async def _fetch_changes(self, after: int, upto: Optional[int] = None):
+        """Connection changes in (after, upto], with current edge data for inserts."""
+        return await self._conn.fetch("""
+            SELECT ch.id, ch.op, ch.source_claim_id, ch.target_claim_id,
+                   ch.connection_type, c.id AS live_id, c.strength, c.cross_domain, c.reasoning
+            FROM synthesis.connection_changes ch
+            LEFT JOIN synthesis.connections c
+                   ON ch.op = 'I' AND c.id = ch.connection_id
+            WHERE ch.id > $1 AND ($2::bigint IS NULL OR ch.id <= $2)
+            ORDER BY ch.id
+        """, after, upto)
+
+    def _add_node(self, row):
+        self._nodes[row['id']] = GraphNode(
+            id=row['id'],
+            claim_text=row['claim_text'],
+            claim_type=row['claim_type'] or 'unknown',
+            domains=row['domains'] or [],
+            confidence=row['confidence'] or 0.5
+        )
+        self._max_claim_id = max(self._max_claim_id, row['id'])
+
+    def _add_edge(self, row) -> bool:
+        """Add a connection row; returns False if skipped or already present."""
+        source_id = row['source_claim_id']
+        target_id = row['target_claim_id']
+
+        if source_id not in self._nodes or target_id not in self._nodes:
+            return False
+
+        key = (source_id, target_id, row['connection_type'] or 'related')
+        if key in self._edge_keys:
+            return False
+        self._edge_keys.add(key)
+
+        edge = GraphEdge(
+            source_id=source_id,
+            target_id=target_id,
+            connection_type=key[2],
+            strength=row['strength'] or 0.5,
+            cross_domain=row['cross_domain'] or False,
+            reasoning=row['reasoning']
+        )
+
+        self._adjacency[source_id].append((target_id, edge))
+        self._reverse_adjacency[target_id].append((source_id, edge))
+
+        # Update degrees
+        self._nodes[source_id].out_degree += 1
+        self._nodes[target_id].in_degree += 1
+        self._nodes[source_id].degree += 1
+        self._nodes[target_id].degree += 1
+        return True
+
+    def _remove_edge(self, source_id: int, target_id: int, connection_type: Optional[str]) -> bool:
+        """Remove a connection; returns False if it was not in the graph."""
+        key = (source_id, target_id, connection_type or 'related')
+        if key not in self._edge_keys:
+            return False
+        self._edge_keys.discard(key)
+
+        self._adjacency[source_id] = [
+            (t, e) for t, e in self._adjacency[source_id]
+            if not (t == target_id and e.connection_type == key[2])
+        ]
+        self._reverse_adjacency[target_id] = [
+            (s, e) for s, e in self._reverse_adjacency[target_id]
+            if not (s == source_id and e.connection_type == key[2])
+        ]
+
+        self._nodes[source_id].out_degree -= 1
+        self._nodes[target_id].in_degree -= 1
+        self._nodes[source_id].degree -= 1
+        self._nodes[target_id].degree -= 1
+        return True
 
     def _ensure_loaded(self):
         """Ensure graph is loaded."""
         if not self._loaded:
             raise RuntimeError("Graph not loaded. Call load_graph() first.")
 
+    def _require_dict(self, operation: str):
+        """Ensure graph is loaded into the dict backend."""
+        self._ensure_loaded()
+        if self._csr is not None:
+            raise RuntimeError(f"{operation} needs the dict backend (GraphEngine(..., backend='dict'))")
+
+    def _csr_dict(self, values: np.ndarray) -> Dict[int, float]:
+        """Per-node CSR scores keyed by claim ID."""
+        return dict(zip(self._csr.ids.tolist(), values.tolist()))
+
+    def _csr_path(self, edges: List[int], path_type: str) -> GraphPath:
+        """GraphPath from CSR edge positions."""
+        csr = self._csr
+        graph_edges = [
+            GraphEdge(
+                source_id=int(csr.ids[csr.src[e]]),
+                target_id=int(csr.ids[csr.indices[e]]),
+                connection_type=csr.type_names[csr.types[e]],
+                strength=float(csr.strength[e]),
+                cross_domain=bool(csr.cross[e])
+            )
+            for e in edges
+        ]
+        dense = [int(csr.src[e]) for e in edges[:1]] + [int(csr.indices[e]) for e in edges]
+        return GraphPath(
+            nodes=[int(csr.ids[v]) for v in dense],
+            edges=graph_edges,
+            total_weight=sum(e.strength for e in graph_edges),
+            path_type=path_type,
+            domains_traversed=set(mask_domain_ids(np.bitwise_or.reduce(csr.masks[dense])))
+        )
+
     # =========================================================================
     # PATH FINDING - Using PostgreSQL Recursive CTEs
     # =========================================================================
 
+    # Edge rows with both endpoints' domains (view from migration 005)
+    GRAPH_EDGES_VIEW = "synthesis.graph_edges"
+    GRAPH_EDGES_INLINE = """(
+        SELECT c.id, c.source_claim_id, c.target_claim_id,
+               COALESCE(c.connection_type, 'related') AS connection_type,
+               COALESCE(c.strength, 0.5) AS strength,
+               COALESCE(c.cross_domain, FALSE) AS cross_domain,
+               c.reasoning,
+               COALESCE(s.domains, '{}') AS source_domains,
+               COALESCE(t.domains, '{}') AS target_domains
+        FROM synthesis.connections c
+        JOIN synthesis.claims s ON s.id = c.source_claim_id
+        JOIN synthesis.claims t ON t.id = c.target_claim_id
+    )"""
+
+    # Recursive path search over graph_edges. Each row carries everything
+    # needed for a GraphPath (nodes, edge attributes, domains), so results
+    # need no follow-up queries. {start} filters the first edge, {stop}
+    # ends expansion at matching rows, {finish} selects result rows.
+    PATH_SEARCH_SQL = """
+        WITH RECURSIVE path_search AS (
+            SELECT
+                e.target_claim_id,
+                ARRAY[e.source_claim_id, e.target_claim_id] AS path,
+                ARRAY[e.connection_type::text] AS types,
+                ARRAY[e.strength::float8] AS strengths,
+                ARRAY[e.cross_domain] AS crosses,
+                e.source_domains || e.target_domains AS domains,
+                e.target_domains AS last_domains,
+                1 AS depth,
+                e.strength::float8 AS total_strength
+            FROM {edges} e
+            WHERE {start}
+
+            UNION ALL
+
+            SELECT
+                e.target_claim_id,
+                ps.path || e.target_claim_id,
+                ps.types || e.connection_type::text,
+                ps.strengths || e.strength::float8,
+                ps.crosses || e.cross_domain,
+                ps.domains || e.target_domains,
+                e.target_domains,
+                ps.depth + 1,
+                ps.total_strength + e.strength
+            FROM path_search ps
+            JOIN {edges} e ON e.source_claim_id = ps.target_claim_id
+            WHERE NOT e.target_claim_id = ANY(ps.path)  -- Simple paths only
+              AND ps.depth < {max_depth}
+              AND NOT ({stop})
+        ),
+        found AS (
+            SELECT * FROM path_search ps
+            WHERE {finish}
+            ORDER BY ps.depth ASC, ps.total_strength DESC
+            LIMIT {limit}
+        )
+        SELECT f.*,
+               ARRAY(
+                   SELECT c.reasoning
+                   FROM unnest(f.path[1:f.depth], f.path[2:f.depth + 1], f.types)
+                        WITH ORDINALITY AS u(src, tgt, ctype, ord)
+                   LEFT JOIN synthesis.connections c
+                          ON c.source_claim_id = u.src
+                         AND c.target_claim_id = u.tgt
+                         AND COALESCE(c.connection_type, 'related') = u.ctype
+                   ORDER BY u.ord
+               ) AS reasonings
+        FROM found f
+        ORDER BY f.depth ASC, f.total_strength DESC
+    """
+
+    async def _search_paths(self, start: str, stop: str, finish: str, *args,
+                            max_depth: str, limit: str):
+        """Run PATH_SEARCH_SQL, falling back to an inline edge query without migration 005."""
+        from asyncpg import UndefinedTableError
+
+        def build(edges: str) -> str:
+            return self.PATH_SEARCH_SQL.format(
+                edges=edges, start=start, stop=stop, finish=finish,
+                max_depth=max_depth, limit=limit
+            )
+
+        try:
+            return await self._conn.fetch(build(self.GRAPH_EDGES_VIEW), *args)
+        except UndefinedTableError:
+            logger.warning("synthesis.graph_edges missing; run migration 005 for indexed path queries")
+            return await self._conn.fetch(build(self.GRAPH_EDGES_INLINE), *args)
+
+    @staticmethod
+    def _path_from_row(row, path_type: str) -> GraphPath:
+        """GraphPath from a PATH_SEARCH_SQL row."""
+        path = list(row['path'])
+        edges = [
+            GraphEdge(
+                source_id=path[i],
+                target_id=path[i + 1],
+                connection_type=row['types'][i],
+                strength=row['strengths'][i],
+                cross_domain=row['crosses'][i],
+                reasoning=row['reasonings'][i]
+            )
+            for i in range(len(path) - 1)
+        ]
+        return GraphPath(
+            nodes=path,
+            edges=edges,
+            total_weight=row['total_strength'],
+            path_type=path_type,
+            domains_traversed=set(row['domains'] or [])
+        )
+
     async def find_path_cte(
         self,
         source_id: int,
@@ -224,84 +753,19 @@ class GraphEngine:
         """
         Find shortest path using PostgreSQL recursive CTE.
 
-        This is efficient for large graphs as it runs in the database.
+        This is efficient for large graphs as it runs in the database, and
+        returns edges and domains from the same query.
         """
-        rows = await self._conn.fetch("""
-            WITH RECURSIVE path_search AS (
-                -- Base case: start from source
-                SELECT
-                    source_claim_id,
-                    target_claim_id,
-                    ARRAY[source_claim_id] as path,
-                    1 as depth,
-                    strength as total_strength
-                FROM synthesis.connections
-                WHERE source_claim_id = $1
-
-                UNION ALL
-
-                -- Recursive case: extend path
-                SELECT
-                    c.source_claim_id,
-                    c.target_claim_id,
-                    ps.path || c.source_claim_id,
-                    ps.depth + 1,
-                    ps.total_strength + c.strength
-                FROM synthesis.connections c
-                INNER JOIN path_search ps ON c.source_claim_id = ps.target_claim_id
-                WHERE NOT c.source_claim_id = ANY(ps.path)  -- Avoid cycles
-                AND ps.depth < $3
-            )
-            SELECT path || target_claim_id as full_path, depth, total_strength
-            FROM path_search
-            WHERE target_claim_id = $2
-            ORDER BY depth ASC, total_strength DESC
-            LIMIT 1
-        """, source_id, target_id, max_depth)
-
+        rows = await self._search_paths(
+            "e.source_claim_id = $1",
+            "ps.target_claim_id = $2",
+            "ps.target_claim_id = $2",
+            source_id, target_id, max_depth,
+            max_depth="$3", limit="1"
+        )
         if not rows:
             return None
-
-        row = rows[0]
-        path_ids = row['full_path']
-
-        # Build path object
-        edges = []
-        domains = set()
-
-        for i in range(len(path_ids) - 1):
-            src, tgt = path_ids[i], path_ids[i + 1]
-            # Get edge info
-            edge_row = await self._conn.fetchrow("""
-                SELECT connection_type, strength, cross_domain, reasoning
-                FROM synthesis.connections
-                WHERE source_claim_id = $1 AND target_claim_id = $2
-            """, src, tgt)
-
-            if edge_row:
-                edges.append(GraphEdge(
-                    source_id=src,
-                    target_id=tgt,
-                    connection_type=edge_row['connection_type'] or 'related',
-                    strength=edge_row['strength'] or 0.5,
-                    cross_domain=edge_row['cross_domain'] or False,
-                    reasoning=edge_row['reasoning']
-                ))
-
-            # Get domains
-            node_row = await self._conn.fetchrow(
-                "SELECT domains FROM synthesis.claims WHERE id = $1", src
-            )
-            if node_row and node_row['domains']:
-                domains.update(node_row['domains'])
-
-        return GraphPath(
-            nodes=path_ids,
-            edges=edges,
-            total_weight=row['total_strength'],
-            path_type='shortest',
-            domains_traversed=domains
-        )
+        return self._path_from_row(rows[0], 'shortest')
 
     async def find_all_paths_cte(
         self,
@@ -311,62 +775,104 @@ class GraphEngine:
         limit: int = 10
     ) -> List[GraphPath]:
         """Find all paths between two nodes (limited)."""
-        rows = await self._conn.fetch("""
-            WITH RECURSIVE path_search AS (
-                SELECT
-                    source_claim_id,
-                    target_claim_id,
-                    ARRAY[source_claim_id] as path,
-                    1 as depth,
-                    strength as total_strength,
-                    cross_domain as has_cross_domain
-                FROM synthesis.connections
-                WHERE source_claim_id = $1
-
-                UNION ALL
-
-                SELECT
-                    c.source_claim_id,
-                    c.target_claim_id,
-                    ps.path || c.source_claim_id,
-                    ps.depth + 1,
-                    ps.total_strength + c.strength,
-                    ps.has_cross_domain OR c.cross_domain
-                FROM synthesis.connections c
-                INNER JOIN path_search ps ON c.source_claim_id = ps.target_claim_id
-                WHERE NOT c.source_claim_id = ANY(ps.path)
-                AND ps.depth < $3
-            )
-            SELECT path || target_claim_id as full_path, depth, total_strength, has_cross_domain
-            FROM path_search
-            WHERE target_claim_id = $2
-            ORDER BY depth ASC, total_strength DESC
-            LIMIT $4
-        """, source_id, target_id, max_depth, limit)
-
-        paths = []
-        for row in rows:
-            paths.append(GraphPath(
-                nodes=row['full_path'],
-                edges=[],  # Simplified for performance
-                total_weight=row['total_strength'],
-                path_type='cross_domain' if row['has_cross_domain'] else 'shortest',
-                domains_traversed=set()
-            ))
-
-        return paths
+        rows = await self._search_paths(
+            "e.source_claim_id = $1",
+            "ps.target_claim_id = $2",
+            "ps.target_claim_id = $2",
+            source_id, target_id, max_depth, limit,
+            max_depth="$3", limit="$4"
+        )
+        return [
+            self._path_from_row(row, 'cross_domain' if any(row['crosses']) else 'shortest')
+            for row in rows
+        ]
 
     # =========================================================================
     # IN-MEMORY GRAPH ALGORITHMS
     # =========================================================================
 
+    def _dict_path(self, nodes: List[int], edges: List[GraphEdge], path_type: str) -> GraphPath:
+        """GraphPath from dict-backend nodes and edges."""
+        mask = 0
+        for nid in nodes:
+            mask |= self._nodes[nid].domain_mask
+        return GraphPath(
+            nodes=nodes,
+            edges=edges,
+            total_weight=sum(e.strength for e in edges),
+            path_type=path_type,
+            domains_traversed=set(mask_domain_ids(mask))
+        )
+
+    def _has_node(self, node_id: int) -> bool:
+        if self._csr is not None:
+            return self._csr.index(node_id) is not None
+        return node_id in self._nodes
+
+    def _expanders(self, weighting: str) -> Tuple[Expand, Expand]:
+        """
+        Forward and backward neighbor callbacks for the loaded backend.
+
+        Args:
+            weighting: 'strength' (cost 1 - strength) or 'cross_domain'
+                (plus CROSS_DOMAIN_STAY_COST on edges that change no domain)
+
+        CSR callbacks work on dense indexes, dict callbacks on claim IDs.
+        """
+        stay = self.CROSS_DOMAIN_STAY_COST
+
+        if self._csr is not None:
+            csr = self._csr
+            cost = self._csr_costs.get(weighting)
+            if cost is None:
+                cost = np.maximum(1.0 - csr.strength.astype(np.float64), 0.0)
+                if weighting == 'cross_domain':
+                    cost = cost + np.where(csr.domain_changes(), 0.0, stay)
+                self._csr_costs[weighting] = cost
+            return (lambda u: csr.out_edges(u, cost)), (lambda v: csr.in_edges(v, cost))
+
+        nodes = self._nodes
+
+        def edge_cost(edge: GraphEdge) -> float:
+            cost = max(1.0 - edge.strength, 0.0)
+            if weighting == 'cross_domain':
+                # Same test as CSRGraph.domain_changes: the head adds a domain
+                changes = edge.cross_domain or (
+                    nodes[edge.target_id].domain_mask & ~nodes[edge.source_id].domain_mask
+                ) != 0
+                if not changes:
+                    cost += stay
+            return cost
+
+        def forward(u: int):
+            return [(v, e, edge_cost(e)) for v, e in self._adjacency.get(u, ())]
+
+        def backward(v: int):
+            return [(u, e, edge_cost(e)) for u, e in self._reverse_adjacency.get(v, ())]
+
+        return forward, backward
+
+    def _search_result(self, nodes: List[int], edges: List[Any], path_type: str) -> GraphPath:
+        """GraphPath from a generic search result on the loaded backend."""
+        if self._csr is None:
+            return self._dict_path(nodes, edges, path_type)
+        if edges:
+            return self._csr_path(edges, path_type)
+        return GraphPath(
+            nodes=[int(self._csr.ids[nodes[0]])], edges=[], total_weight=0.0,
+            path_type=path_type, domains_traversed=set(self._csr.domains(nodes[0]))
+        )
+
     def find_shortest_path(
         self,
         source_id: int,
         target_id: int
     ) -> Optional[GraphPath]:
         """
-        Find shortest path using BFS (in-memory).
+        Find shortest path using bidirectional BFS (in-memory).
+
+        Both ends are searched level by level, always expanding the smaller
+        frontier, with parent pointers instead of per-node path copies.
 
         Args:
             source_id: Starting node ID
@@ -377,33 +883,37 @@ class GraphEngine:
         """
         self._ensure_loaded()
 
-        if source_id not in self._nodes or target_id not in self._nodes:
+        if not self._has_node(source_id) or not self._has_node(target_id):
             return None
 
-        # BFS
-        queue = deque([(source_id, [source_id], [])])
-        visited = {source_id}
-
-        while queue:
-            current, path, edges = queue.popleft()
-
-            if current == target_id:
-                domains = set()
-                for nid in path:
-                    domains.update(self._nodes[nid].domains)
-
-                return GraphPath(
-                    nodes=path,
-                    edges=edges,
-                    total_weight=sum(e.strength for e in edges),
-                    path_type='shortest',
-                    domains_traversed=domains
-                )
-
-            for neighbor, edge in self._adjacency[current]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor], edges + [edge]))
+        if self._csr is not None:
+            source, target = self._csr.index(source_id), self._csr.index(target_id)
+            edges = self._csr.shortest_path(source, target)
+            if edges is None:
+                return None
+            return self._search_result([source], edges, 'shortest')
+
+        if source_id == target_id:
+            return self._dict_path([source_id], [], 'shortest')
+
+        parent: Tuple[Parents, Parents] = ({source_id: None}, {target_id: None})
+        frontier = ([source_id], [target_id])
+        adjacency = (self._adjacency, self._reverse_adjacency)
+
+        while frontier[0] and frontier[1]:
+            side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+            seen, other = parent[side], parent[1 - side]
+            next_frontier = []
+            for u in frontier[side]:
+                for v, edge in adjacency[side].get(u, ()):
+                    if v in seen:
+                        continue
+                    seen[v] = (u, edge)
+                    # Checked on arrival, so the first meeting is shortest
+                    if v in other:
+                        return self._dict_path(*_join(v, *parent), 'shortest')
+                    next_frontier.append(v)
+            frontier = (next_frontier, frontier[1]) if side == 0 else (frontier[0], next_frontier)
 
         return None
 
@@ -413,7 +923,8 @@ class GraphEngine:
         target_id: int
     ) -> Optional[GraphPath]:
         """
-        Find path with maximum total strength using Dijkstra (inverted weights).
+        Find path with maximum total strength using bidirectional Dijkstra
+        (edge cost 1 - strength).
 
         Args:
             source_id: Starting node ID
@@ -424,62 +935,17 @@ class GraphEngine:
         """
         self._ensure_loaded()
 
-        if source_id not in self._nodes or target_id not in self._nodes:
+        if not self._has_node(source_id) or not self._has_node(target_id):
             return None
 
-        # Dijkstra with inverted weights (1 - strength)
-        dist = {source_id: 0}
-        prev = {}
-        prev_edge = {}
-        pq = [(0, source_id)]
-
-        while pq:
-            d, current = heapq.heappop(pq)
-
-            if current == target_id:
-                break
-
-            if d > dist.get(current, float('inf')):
-                continue
+        source, target = source_id, target_id
+        if self._csr is not None:
+            source, target = self._csr.index(source_id), self._csr.index(target_id)
 
-            for neighbor, edge in self._adjacency[current]:
-                # Invert strength so higher strength = lower cost
-                weight = 1.0 - edge.strength
-                new_dist = d + weight
-
-                if new_dist < dist.get(neighbor, float('inf')):
-                    dist[neighbor] = new_dist
-                    prev[neighbor] = current
-                    prev_edge[neighbor] = edge
-                    heapq.heappush(pq, (new_dist, neighbor))
-
-        if target_id not in prev:
+        result = _bidirectional_dijkstra(source, target, *self._expanders('strength'))
+        if result is None:
             return None
-
-        # Reconstruct path
-        path = []
-        edges = []
-        current = target_id
-
-        while current != source_id:
-            path.append(current)
-            edges.append(prev_edge[current])
-            current = prev[current]
-        path.append(source_id)
-        path.reverse()
-        edges.reverse()
-
-        domains = set()
-        for nid in path:
-            domains.update(self._nodes[nid].domains)
-
-        return GraphPath(
-            nodes=path,
-            edges=edges,
-            total_weight=sum(e.strength for e in edges),
-            path_type='strongest',
-            domains_traversed=domains
-        )
+        return self._search_result(*result, 'strongest')
 
     def find_cross_domain_path(
         self,
@@ -489,90 +955,93 @@ class GraphEngine:
         """
         Find path that maximizes domain diversity.
 
-        Prefers paths that cross multiple domains.
+        Bidirectional Dijkstra where edges that do not move into a new
+        domain cost CROSS_DOMAIN_STAY_COST extra, so domain-changing edges
+        are preferred over equally strong edges within one domain.
         """
         self._ensure_loaded()
 
-        if source_id not in self._nodes or target_id not in self._nodes:
+        if not self._has_node(source_id) or not self._has_node(target_id):
             return None
 
-        # Modified Dijkstra: prefer cross-domain edges
-        dist = {source_id: 0}
-        prev = {}
-        prev_edge = {}
-        pq = [(0, source_id, set(self._nodes[source_id].domains))]
-
-        while pq:
-            d, current, domains_seen = heapq.heappop(pq)
-
-            if current == target_id:
-                break
-
-            if d > dist.get(current, float('inf')):
-                continue
-
-            for neighbor, edge in self._adjacency[current]:
-                neighbor_domains = set(self._nodes[neighbor].domains)
-                new_domains = domains_seen | neighbor_domains
+        source, target = source_id, target_id
+        if self._csr is not None:
+            source, target = self._csr.index(source_id), self._csr.index(target_id)
 
-                # Reward crossing into new domains
-                domain_bonus = len(new_domains - domains_seen) * 0.5
-                weight = (1.0 - edge.strength) - domain_bonus
-
-                new_dist = d + weight
-
-                if new_dist < dist.get(neighbor, float('inf')):
-                    dist[neighbor] = new_dist
-                    prev[neighbor] = current
-                    prev_edge[neighbor] = edge
-                    heapq.heappush(pq, (new_dist, neighbor, new_domains))
-
-        if target_id not in prev:
+        result = _bidirectional_dijkstra(source, target, *self._expanders('cross_domain'))
+        if result is None:
             return None
+        return self._search_result(*result, 'cross_domain')
 
-        # Reconstruct path
-        path = []
-        edges = []
-        current = target_id
+    def find_domain_bridges_memory(
+        self,
+        domain_a: int,
+        domain_b: int,
+        limit: int = 20
+    ) -> List[GraphPath]:
+        """
+        Cheapest paths from claims in ``domain_a`` to claims in ``domain_b``.
 
-        while current != source_id:
-            path.append(current)
-            edges.append(prev_edge[current])
-            current = prev[current]
-        path.append(source_id)
-        path.reverse()
-        edges.reverse()
+        One multi-source search seeded with every domain-A claim (that is
+        not already in domain B), using cross-domain edge costs. Each path
+        ends at a distinct domain-B claim, cheapest first.
+        """
+        self._ensure_loaded()
 
-        domains = set()
-        for nid in path:
-            domains.update(self._nodes[nid].domains)
+        forward, _ = self._expanders('cross_domain')
+        bit_a, bit_b = domain_mask([domain_a]), domain_mask([domain_b])
 
-        return GraphPath(
-            nodes=path,
-            edges=edges,
-            total_weight=sum(e.strength for e in edges),
-            path_type='cross_domain',
-            domains_traversed=domains
-        )
+        if self._csr is not None:
+            masks = self._csr.masks
+            sources = np.nonzero((masks & bit_a != 0) & (masks & bit_b == 0))[0].tolist()
+            is_goal = lambda v: bool(int(masks[v]) & bit_b)
+        else:
+            sources = [
+                nid for nid, node in self._nodes.items()
+                if node.domain_mask & bit_a and not node.domain_mask & bit_b
+            ]
+            is_goal = lambda v: bool(self._nodes[v].domain_mask & bit_b)
+
+        return [
+            self._search_result(nodes, edges, 'cross_domain')
+            for nodes, edges, _ in _multi_source_dijkstra(sources, is_goal, forward, limit)
+        ]
 
     # =========================================================================
     # CENTRALITY MEASURES
     # =========================================================================
 
-    def compute_pagerank(self) -> Dict[int, float]:
+    def compute_pagerank(self, warm_start: Optional[Dict[int, float]] = None) -> Dict[int, float]:
         """
         Compute PageRank for all nodes.
 
         Identifies the most "important" claims based on connection structure.
+
+        Args:
+            warm_start: Previous scores to iterate from (new nodes start at 1/n)
         """
         self._ensure_loaded()
 
+        if self._csr is not None:
+            start = None
+            if warm_start:
+                default = 1.0 / self._csr.n
+                start = np.array([warm_start.get(nid, default) for nid in self._csr.ids.tolist()])
+            scores = self._csr.pagerank(
+                self.PAGERANK_DAMPING, self.PAGERANK_ITERATIONS, self.PAGERANK_TOLERANCE, start
+            )
+            self._csr_scores['pagerank'] = scores
+            return self._csr_dict(scores)
+
         n = len(self._nodes)
         if n == 0:
             return {}
 
         # Initialize
-        pagerank = {nid: 1.0 / n for nid in self._nodes}
+        if warm_start:
+            pagerank = {nid: warm_start.get(nid, 1.0 / n) for nid in self._nodes}
+        else:
+            pagerank = {nid: 1.0 / n for nid in self._nodes}
         damping = self.PAGERANK_DAMPING
 
         for _ in range(self.PAGERANK_ITERATIONS):
@@ -602,6 +1071,87 @@ class GraphEngine:
 
         return pagerank
 
+    def update_pagerank(
+        self,
+        previous: Dict[int, float],
+        previous_n: int,
+        delta: GraphDelta
+    ) -> Dict[int, float]:
+        """
+        Update converged PageRank scores after a small graph change.
+
+        Works on the unnormalized ranks q = n * pr, which satisfy
+        q[v] = (1 - d) + d * sum(q[u] / out(u)) independently of n. Only
+        nodes touched by ``delta`` can violate that equation. Their
+        residuals are pushed along out-edges until every residual is below
+        the tolerance (Gauss-Southwell), so the cost follows the size of the
+        affected region rather than the graph.
+
+        Args:
+            previous: Converged scores before the change
+            previous_n: Node count those scores were normalized by
+            delta: Nodes and edge endpoints touched since then
+
+        Returns:
+            Updated scores (falls back to a warm-started full run if the
+            push does not settle)
+        """
+        self._require_dict("update_pagerank")
+
+        n = len(self._nodes)
+        if n == 0:
+            return {}
+        damping = self.PAGERANK_DAMPING
+        tolerance = self.PAGERANK_TOLERANCE
+
+        q = {nid: previous.get(nid, 0.0) * previous_n for nid in self._nodes}
+
+        touched = set(delta.new_nodes) | delta.targets
+        touched.update(nid for nid in self._nodes if nid not in previous)
+        for source_id in delta.sources:
+            touched.update(t for t, _ in self._adjacency.get(source_id, ()))
+
+        residual: Dict[int, float] = {}
+        for v in touched:
+            if v not in self._nodes:
+                continue
+            incoming = sum(
+                q[u] / self._nodes[u].out_degree
+                for u, _ in self._reverse_adjacency[v]
+                if self._nodes[u].out_degree > 0
+            )
+            residual[v] = (1 - damping) + damping * incoming - q[v]
+
+        queue = deque(v for v, r in residual.items() if abs(r) > tolerance)
+        budget = 50 * n
+        while queue:
+            budget -= 1
+            if budget < 0:
+                logger.info("PageRank push did not settle, running warm-started iteration")
+                return self.compute_pagerank(warm_start={k: v / n for k, v in q.items()})
+
+            v = queue.popleft()
+            r = residual.get(v, 0.0)
+            if abs(r) <= tolerance:
+                continue
+            residual[v] = 0.0
+            q[v] += r
+
+            out_degree = self._nodes[v].out_degree
+            if out_degree == 0:
+                continue
+            share = damping * r / out_degree
+            for w, _ in self._adjacency[v]:
+                residual[w] = residual.get(w, 0.0) + share
+                if abs(residual[w]) > tolerance:
+                    queue.append(w)
+
+        pagerank = {nid: rank / n for nid, rank in q.items()}
+        for node_id, pr in pagerank.items():
+            self._nodes[node_id].pagerank = pr
+
+        return pagerank
+
     def compute_betweenness_centrality(self, sample_size: int = 100) -> Dict[int, float]:
         """
         Compute betweenness centrality (sampled for large graphs).
@@ -610,11 +1160,21 @@ class GraphEngine:
         """
         self._ensure_loaded()
 
+        import random
+
+        if self._csr is not None:
+            n = self._csr.n
+            sample = random.sample(range(n), min(sample_size, n))
+            scores = self._csr.betweenness(sample)
+            if n > 2:
+                scores /= (n - 1) * (n - 2)
+            self._csr_scores['betweenness'] = scores
+            return self._csr_dict(scores)
+
         betweenness = {nid: 0.0 for nid in self._nodes}
         node_ids = list(self._nodes.keys())
 
         # Sample nodes for efficiency
-        import random
         sample = random.sample(node_ids, min(sample_size, len(node_ids)))
 
         for source in sample:
@@ -657,6 +1217,54 @@ class GraphEngine:
 
         return betweenness
 
+    def compute_betweenness_parallel(
+        self,
+        processes: Optional[int] = None,
+        epsilon: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> Dict[int, float]:
+        """
+        Betweenness centrality across a process pool.
+
+        Exact (every node a source) up to BETWEENNESS_EXACT_NODES nodes or
+        when the sample would cover the graph anyway. Larger graphs use a
+        seeded sample of k sources scaled by n/k, with k chosen so every
+        score is within ``epsilon`` of exact with probability
+        1 - BETWEENNESS_DELTA. Same seed and graph give the same scores.
+
+        Args:
+            processes: Worker processes (default: CPU count)
+            epsilon: Absolute error bound on normalized scores
+            seed: Source sampling seed
+        """
+        self._ensure_loaded()
+
+        graph = self._csr if self._csr is not None else CSRGraph.from_engine(self)
+        n = graph.n
+        epsilon = epsilon or self.BETWEENNESS_EPSILON
+        k = betweenness_sample_size(n, epsilon, self.BETWEENNESS_DELTA)
+
+        if n <= self.BETWEENNESS_EXACT_NODES or k >= n:
+            scores = parallel_betweenness(graph, processes=processes)
+            logger.info(f"Exact betweenness over {n} sources")
+        else:
+            rng = np.random.default_rng(self.BETWEENNESS_SEED if seed is None else seed)
+            sources = np.sort(rng.choice(n, size=k, replace=False))
+            scores = parallel_betweenness(graph, sources, processes) * (n / k)
+            logger.info(f"Sampled betweenness over {k}/{n} sources (±{epsilon} w.p. {1 - self.BETWEENNESS_DELTA})")
+
+        if n > 2:
+            scores /= (n - 1) * (n - 2)
+
+        if self._csr is not None:
+            self._csr_scores['betweenness'] = scores
+            return self._csr_dict(scores)
+
+        betweenness = dict(zip(graph.ids.tolist(), scores.tolist()))
+        for node_id, score in betweenness.items():
+            self._nodes[node_id].betweenness = score
+        return betweenness
+
     def compute_clustering_coefficients(self) -> Dict[int, float]:
         """
         Compute local clustering coefficient for each node.
@@ -665,6 +1273,11 @@ class GraphEngine:
         """
         self._ensure_loaded()
 
+        if self._csr is not None:
+            scores = self._csr.clustering()
+            self._csr_scores['clustering'] = scores
+            return self._csr_dict(scores)
+
         clustering = {}
 
         for node_id in self._nodes:
@@ -696,89 +1309,38 @@ class GraphEngine:
 
     def detect_communities(self, max_iterations: int = 10) -> List[Community]:
         """
-        Detect communities using a Louvain-like algorithm.
+        Detect communities with the Leiden algorithm (see graph_csr.louvain).
 
-        Groups claims into coherent clusters.
+        Groups claims into coherent, connected clusters. Node order is seeded with
+        COMMUNITY_SEED, so repeated runs give the same communities.
 
         Args:
-            max_iterations: Maximum iterations for convergence (default 10)
+            max_iterations: Maximum aggregation levels (default 10)
         """
         self._ensure_loaded()
 
-        # Skip community detection for very large graphs
-        edge_count = sum(len(adj) for adj in self._adjacency.values())
-        if edge_count > 20000:
-            logger.warning(f"Graph too large ({edge_count} edges) for community detection. Returning empty.")
-            return []
-
-        # Initialize: each node is its own community
-        community = {nid: nid for nid in self._nodes}
-        total_weight = sum(
-            sum(e.strength for _, e in adj)
-            for adj in self._adjacency.values()
-        )
+        if self._csr is not None:
+            labels = self._csr.louvain(self.COMMUNITY_RESOLUTION, self.COMMUNITY_SEED, max_iterations)
+            return self._csr_communities(labels)
 
-        if total_weight == 0:
-            # No edges, each node is its own community
-            communities = []
-            for nid, node in self._nodes.items():
-                communities.append(Community(
-                    id=nid,
-                    node_ids=[nid],
-                    size=1,
-                    density=0.0,
-                    dominant_domains=node.domains[:2] if node.domains else [],
-                    bridge_nodes=[],
-                    coherence=1.0
-                ))
-            return communities
-
-        improved = True
-        iteration = 0
-        while improved and iteration < max_iterations:
-            improved = False
-            iteration += 1
-
-            for node_id in self._nodes:
-                current_comm = community[node_id]
-
-                # Calculate modularity gain for each neighbor's community
-                best_comm = current_comm
-                best_gain = 0.0
-
-                neighbor_comms = set()
-                for neighbor, edge in self._adjacency[node_id]:
-                    neighbor_comms.add(community[neighbor])
-                for neighbor, edge in self._reverse_adjacency[node_id]:
-                    neighbor_comms.add(community[neighbor])
-
-                for new_comm in neighbor_comms:
-                    if new_comm == current_comm:
-                        continue
-
-                    # Calculate modularity gain (simplified)
-                    gain = self._modularity_gain(
-                        node_id, new_comm, community, total_weight
-                    )
-
-                    if gain > best_gain:
-                        best_gain = gain
-                        best_comm = new_comm
-
-                if best_comm != current_comm:
-                    community[node_id] = best_comm
-                    improved = True
+        # Same Leiden implementation as the CSR backend, on a compact copy
+        csr = CSRGraph.from_engine(self)
+        labels = csr.louvain(self.COMMUNITY_RESOLUTION, self.COMMUNITY_SEED, max_iterations)
+        community = dict(zip(csr.ids.tolist(), labels.tolist()))
 
         # Build community objects
         comm_nodes = defaultdict(list)
-        for node_id, comm_id in community.items():
-            comm_nodes[comm_id].append(node_id)
-            self._nodes[node_id].community_id = comm_id
+        for node_id, label in community.items():
+            comm_nodes[label].append(node_id)
+        for node_ids in comm_nodes.values():
+            for node_id in node_ids:
+                self._nodes[node_id].community_id = min(node_ids)
 
         communities = []
-        for comm_id, node_ids in comm_nodes.items():
+        for node_ids in comm_nodes.values():
             if not node_ids:
                 continue
+            comm_id = min(node_ids)
 
             # Calculate community properties
             density = self._compute_community_density(node_ids)
@@ -799,38 +1361,52 @@ class GraphEngine:
         communities.sort(key=lambda c: c.size, reverse=True)
         return communities
 
-    def _modularity_gain(
-        self,
-        node_id: int,
-        new_comm: int,
-        community: Dict[int, int],
-        total_weight: float
-    ) -> float:
-        """Calculate modularity gain for moving a node to a new community."""
-        if total_weight == 0:
-            return 0.0
+    def _csr_communities(self, labels: np.ndarray) -> List[Community]:
+        """Community objects from CSR labels, with stats computed per array pass."""
+        csr = self._csr
+        if csr.n == 0:
+            return []
+        comm_labels, inverse = np.unique(labels, return_inverse=True)
+        k = len(comm_labels)
+        sizes = np.bincount(inverse, minlength=k)
 
-        # Sum of edge weights to new community
-        k_in = 0.0
-        for neighbor, edge in self._adjacency[node_id]:
-            if community[neighbor] == new_comm:
-                k_in += edge.strength
-        for neighbor, edge in self._reverse_adjacency[node_id]:
-            if community[neighbor] == new_comm:
-                k_in += edge.strength
-
-        # Node degree
-        k_i = sum(e.strength for _, e in self._adjacency[node_id])
-        k_i += sum(e.strength for _, e in self._reverse_adjacency[node_id])
-
-        # Community total degree
-        sigma_tot = sum(
-            sum(e.strength for _, e in self._adjacency[n]) +
-            sum(e.strength for _, e in self._reverse_adjacency[n])
-            for n, c in community.items() if c == new_comm
-        )
+        src_comm = inverse[csr.src]
+        internal = src_comm == inverse[csr.indices]
+        internal_edges = np.bincount(src_comm[internal], minlength=k)
+        pairs = sizes * (sizes - 1)
+        density = np.divide(internal_edges, pairs, out=np.zeros(k), where=pairs > 0)
+
+        coherence = np.bincount(inverse, weights=csr.confidence, minlength=k) / sizes
+        coherence[sizes < 2] = 1.0
+
+        bits = max(int(csr.masks.max()).bit_length(), 1)
+        domain_counts = np.stack([
+            np.bincount(inverse, weights=(csr.masks >> d) & 1, minlength=k)
+            for d in range(bits)
+        ], axis=1)
+
+        is_bridge = np.zeros(csr.n, dtype=bool)
+        is_bridge[csr.src[~internal]] = True
+
+        order = np.argsort(inverse, kind='stable')
+        members = np.split(order, np.cumsum(sizes)[:-1])
+
+        communities = []
+        for c, nodes in enumerate(members):
+            counts = domain_counts[c]
+            dominant = [int(d) for d in np.argsort(-counts, kind='stable')[:3] if counts[d] > 0]
+            communities.append(Community(
+                id=int(csr.ids[nodes[0]]),
+                node_ids=csr.ids[nodes].tolist(),
+                size=int(sizes[c]),
+                density=float(density[c]),
+                dominant_domains=dominant,
+                bridge_nodes=csr.ids[nodes[is_bridge[nodes]]].tolist(),
+                coherence=float(coherence[c])
+            ))
 
-        return k_in / total_weight - (sigma_tot * k_i) / (2 * total_weight ** 2)
+        communities.sort(key=lambda c: c.size, reverse=True)
+        return communities
 
     def _compute_community_density(self, node_ids: List[int]) -> float:
         """Compute edge density within a community."""
@@ -892,59 +1468,18 @@ class GraphEngine:
         """
         Find all paths that bridge two domains.
 
-        Uses recursive CTE for efficiency.
+        Uses recursive CTE for efficiency; paths start at a claim in
+        ``domain_a`` (GIN-indexed domains lookup) and end at the first
+        claim in ``domain_b``.
         """
-        rows = await self._conn.fetch("""
-            WITH RECURSIVE bridge_search AS (
-                -- Start from claims in domain A
-                SELECT
-                    c.source_claim_id,
-                    c.target_claim_id,
-                    ARRAY[c.source_claim_id] as path,
-                    1 as depth,
-                    c.strength as total_strength,
-                    cl.domains as current_domains
-                FROM synthesis.connections c
-                JOIN synthesis.claims cl ON c.source_claim_id = cl.id
-                WHERE $1 = ANY(cl.domains)
-
-                UNION ALL
-
-                SELECT
-                    c.source_claim_id,
-                    c.target_claim_id,
-                    bs.path || c.source_claim_id,
-                    bs.depth + 1,
-                    bs.total_strength + c.strength,
-                    cl.domains
-                FROM synthesis.connections c
-                JOIN synthesis.claims cl ON c.target_claim_id = cl.id
-                INNER JOIN bridge_search bs ON c.source_claim_id = bs.target_claim_id
-                WHERE NOT c.source_claim_id = ANY(bs.path)
-                AND bs.depth < 5
-            )
-            SELECT DISTINCT ON (path)
-                path || target_claim_id as full_path,
-                depth,
-                total_strength
-            FROM bridge_search bs
-            JOIN synthesis.claims cl ON bs.target_claim_id = cl.id
-            WHERE $2 = ANY(cl.domains)
-            ORDER BY path, total_strength DESC
-            LIMIT 20
-        """, domain_a, domain_b)
-
-        paths = []
-        for row in rows:
-            paths.append(GraphPath(
-                nodes=row['full_path'],
-                edges=[],
-                total_weight=row['total_strength'],
-                path_type='cross_domain',
-                domains_traversed={domain_a, domain_b}
-            ))
-
-        return paths
+        rows = await self._search_paths(
+            "e.source_domains @> ARRAY[$1]::int[]",
+            "$2 = ANY(ps.last_domains)",
+            "$2 = ANY(ps.last_domains)",
+            domain_a, domain_b,
+            max_depth="5", limit="20"
+        )
+        return [self._path_from_row(row, 'cross_domain') for row in rows]
 
     async def get_cross_domain_hubs(self, min_domains: int = 2) -> List[Tuple[int, int, List[int]]]:
         """
@@ -990,6 +1525,9 @@ class GraphEngine:
         """
         self._ensure_loaded()
 
+        if self._csr is not None:
+            return self._csr_graph_stats(fast)
+
         node_count = len(self._nodes)
         edge_count = sum(len(adj) for adj in self._adjacency.values())
 
@@ -1049,6 +1587,40 @@ class GraphEngine:
             cross_domain_edge_ratio=cross_domain_ratio
         )
 
+    def _csr_graph_stats(self, fast: bool) -> GraphStats:
+        """compute_graph_stats for the CSR backend (no edge-count cutoff)."""
+        csr = self._csr
+        n, m = csr.n, csr.m
+        if n == 0:
+            return GraphStats(
+                node_count=0, edge_count=0, density=0.0, avg_degree=0.0,
+                avg_clustering=0.0, num_communities=0, largest_community_size=0,
+                cross_domain_edge_ratio=0.0
+            )
+
+        max_edges = n * (n - 1)
+        stats = GraphStats(
+            node_count=n,
+            edge_count=m,
+            density=m / max_edges if max_edges > 0 else 0.0,
+            avg_degree=2 * m / n,
+            avg_clustering=0.0,
+            num_communities=0,
+            largest_community_size=0,
+            cross_domain_edge_ratio=float(csr.cross.mean()) if m else 0.0
+        )
+        if fast:
+            return stats
+
+        if 'clustering' not in self._csr_scores:
+            self.compute_clustering_coefficients()
+        stats.avg_clustering = float(self._csr_scores['clustering'].mean())
+
+        communities = self.detect_communities()
+        stats.num_communities = len(communities)
+        stats.largest_community_size = max((c.size for c in communities), default=0)
+        return stats
+
     def get_top_nodes_by_centrality(
         self,
         metric: str = 'pagerank',
@@ -1066,6 +1638,21 @@ class GraphEngine:
         """
         self._ensure_loaded()
 
+        if self._csr is not None:
+            csr = self._csr
+            if metric == 'degree':
+                values = csr.out_degree + csr.in_degree
+            elif metric in self.SCORE_COLUMNS:
+                if metric not in self._csr_scores:
+                    {'pagerank': self.compute_pagerank,
+                     'betweenness': self.compute_betweenness_centrality,
+                     'clustering': self.compute_clustering_coefficients}[metric]()
+                values = self._csr_scores[metric]
+            else:
+                raise ValueError(f"Unknown metric: {metric}")
+            top = np.argsort(-values, kind='stable')[:limit]
+            return [(int(csr.ids[v]), float(values[v]), csr.texts[v]) for v in top]
+
         if metric == 'pagerank':
             if all(n.pagerank == 0 for n in self._nodes.values()):
                 self.compute_pagerank()
@@ -1090,11 +1677,139 @@ class GraphEngine:
             for n in sorted_nodes[:limit]
         ]
 
+    # =========================================================================
+    # STORED SCORES
+    # =========================================================================
+
+    async def get_stored_centrality(
+        self,
+        metric: str = 'pagerank',
+        limit: int = 20,
+        allow_stale: bool = False
+    ) -> Optional[List[Tuple[int, float, str]]]:
+        """
+        Top nodes from synthesis.graph_scores, without loading the graph.
+
+        Returns None when the metric was never stored, or when connections
+        changed since it was computed (unless ``allow_stale``).
+        """
+        from asyncpg import UndefinedTableError
+
+        column = self.SCORE_COLUMNS[metric][0]
+        try:
+            state = await self._conn.fetchrow(
+                "SELECT last_change_id FROM synthesis.graph_state WHERE metric = $1", metric
+            )
+            if state is None:
+                return None
+            if not allow_stale:
+                latest = await self._current_change_id()
+                if latest is None or latest > state['last_change_id']:
+                    return None
+
+            rows = await self._conn.fetch(f"""
+                SELECT s.claim_id, s.{column} AS score, c.claim_text
+                FROM synthesis.graph_scores s
+                JOIN synthesis.claims c ON c.id = s.claim_id
+                WHERE s.{column} IS NOT NULL
+                ORDER BY s.{column} DESC
+                LIMIT $1
+            """, limit)
+        except UndefinedTableError:
+            return None
+
+        return [(r['claim_id'], r['score'], r['claim_text'][:100]) for r in rows]
+
+    async def load_scores(self, metric: str) -> Dict[int, float]:
+        """All stored scores for a metric."""
+        column = self.SCORE_COLUMNS[metric][0]
+        rows = await self._conn.fetch(f"""
+            SELECT claim_id, {column} AS score
+            FROM synthesis.graph_scores
+            WHERE {column} IS NOT NULL
+        """)
+        return {r['claim_id']: r['score'] for r in rows}
+
+    async def save_scores(self, metric: str):
+        """Store the in-memory scores for a metric and mark it current."""
+        column, attr = self.SCORE_COLUMNS[metric]
+        if self._csr is not None:
+            ids = self._csr.ids.tolist()
+            values = self._csr_scores[metric].tolist()
+        else:
+            ids = list(self._nodes.keys())
+            values = [getattr(self._nodes[nid], attr) for nid in ids]
+
+        async with self._conn.transaction():
+            await self._conn.execute(f"""
+                INSERT INTO synthesis.graph_scores (claim_id, {column}, updated_at)
+                SELECT * , NOW() FROM unnest($1::int[], $2::float8[])
+                ON CONFLICT (claim_id) DO UPDATE SET
+                    {column} = EXCLUDED.{column},
+                    updated_at = NOW()
+            """, ids, values)
+            await self._conn.execute("""
+                INSERT INTO synthesis.graph_state (metric, last_change_id, node_count, computed_at)
+                VALUES ($1, $2, $3, NOW())
+                ON CONFLICT (metric) DO UPDATE SET
+                    last_change_id = EXCLUDED.last_change_id,
+                    node_count = EXCLUDED.node_count,
+                    computed_at = NOW()
+            """, metric, self._last_change_id, len(ids))
+            if metric == 'pagerank':
+                await self._prune_changes(self._last_change_id)
+
+    async def refresh_scores(self, metric: str = 'pagerank', full: bool = False) -> Dict[int, float]:
+        """
+        Bring the stored scores for a metric up to date with the graph.
+
+        PageRank is updated incrementally from the stored scores and the
+        connection change log (warm-started on the CSR backend); other
+        metrics are recomputed, betweenness across a process pool. Scores are
+        only persisted for the full graph (min_confidence 0) and when the
+        migration 004 tables exist.
+
+        Args:
+            metric: 'pagerank', 'betweenness' or 'clustering'
+            full: Recompute from scratch instead of updating
+        """
+        self._ensure_loaded()
+        persist = self._last_change_id is not None and self._min_confidence <= 0.0
+
+        if metric == 'pagerank':
+            state = None
+            if persist and not full:
+                state = await self._conn.fetchrow(
+                    "SELECT last_change_id, node_count FROM synthesis.graph_state WHERE metric = 'pagerank'"
+                )
+            if state is None:
+                scores = self.compute_pagerank()
+            elif self._csr is not None:
+                # Full power iteration is cheap on CSR; start from the stored scores
+                scores = self.compute_pagerank(warm_start=await self.load_scores('pagerank'))
+            else:
+                previous = await self.load_scores('pagerank')
+                delta = GraphDelta(new_nodes=set(self._nodes) - set(previous))
+                for row in await self._fetch_changes(state['last_change_id'], self._last_change_id):
+                    delta.sources.add(row['source_claim_id'])
+                    delta.targets.add(row['target_claim_id'])
+                scores = self.update_pagerank(previous, state['node_count'], delta)
+        elif metric == 'betweenness':
+            scores = self.compute_betweenness_parallel()
+        elif metric == 'clustering':
+            scores = self.compute_clustering_coefficients()
+        else:
+            raise ValueError(f"Unknown metric: {metric}")
+
+        if persist:
+            await self.save_scores(metric)
+        return scores
+
 
 # Convenience functions
-async def get_graph_engine(db_connection_string: str) -> GraphEngine:
+async def get_graph_engine(db_connection_string: str, backend: str = 'dict') -> GraphEngine:
     """Get a connected and loaded GraphEngine instance."""
-    engine = GraphEngine(db_connection_string)
+    engine = GraphEngine(db_connection_string, backend)
     await engine.connect()
     await engine.load_graph()
     return engine
@@ -0,0 +1,125 @@
+"""
+CIPHER MinHash
+
+MinHash signatures and LSH band keys for near-duplicate detection.
+
+The signature of a set of shingles holds, for each of ``num_perm`` hash
+functions h(x) = (a*x + b) mod p, the minimum over the set. Two sets agree
+on a signature position with probability equal to their Jaccard
+similarity. LSH splits the signature into ``bands`` of ``rows`` positions
+and hashes each band; sets with similarity s share at least one band key
+with probability 1 - (1 - s^rows)^bands, so near-duplicates are found by
+key lookup instead of pairwise comparison.
+
+Hash parameters come from a fixed seed, so signatures and band keys are
+stable across processes and can be persisted.
+"""
+
+import hashlib
+import re
+from typing import Iterable, List, Sequence, Set
+
+import numpy as np
+
+# Mersenne prime 2^31 - 1: products a*x stay below 2^62, values fit in int32
+PRIME = (1 << 31) - 1
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, replace punctuation with spaces and collapse whitespace."""
+    return ' '.join(re.sub(r'[\W_]+', ' ', (text or '').lower()).split())
+
+
+def shingles(text: str, size: int = 5) -> Set[str]:
+    """Character n-grams of the normalized text."""
+    text = normalize_text(text)
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Exact Jaccard similarity of two sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """
+    Fixed family of ``num_perm`` hash functions.
+
+    Usage:
+        hasher = MinHasher(num_perm=32)
+        sig = hasher.signature(shingles(title))
+        keys = hasher.band_keys(sig, bands=8)
+    """
+
+    def __init__(self, num_perm: int = 32, seed: int = 1):
+        self.num_perm = num_perm
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, PRIME, num_perm).astype(np.uint64)
+        self.b = rng.randint(0, PRIME, num_perm).astype(np.uint64)
+
+    def signature(self, items: Iterable[str]) -> np.ndarray:
+        """MinHash signature (uint32 array of num_perm values)."""
+        x = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little') % PRIME
+             for s in items),
+            dtype=np.uint64
+        )
+        if not len(x):
+            return np.full(self.num_perm, PRIME, dtype=np.uint32)
+        return ((np.outer(x, self.a) + self.b) % PRIME).min(axis=0).astype(np.uint32)
+
+    def signatures(self, sets: Sequence[Iterable[str]]) -> np.ndarray:
+        """
+        Signatures of many sets at once, shape (len(sets), num_perm).
+
+        Same values as signature() per set; empty sets get PRIME in every
+        position.
+        """
+        sizes = np.zeros(len(sets), dtype=np.int64)
+        hashes = []
+        for i, items in enumerate(sets):
+            for s in items:
+                hashes.append(int.from_bytes(
+                    hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little'
+                ) % PRIME)
+                sizes[i] += 1
+        result = np.full((len(sets), self.num_perm), PRIME, dtype=np.uint32)
+        if not hashes:
+            return result
+        x = np.array(hashes, dtype=np.uint64)
+        values = (np.outer(x, self.a) + self.b) % PRIME
+        nonempty = sizes > 0
+        starts = (np.cumsum(sizes) - sizes)[nonempty]
+        result[nonempty] = np.minimum.reduceat(values, starts, axis=0)
+        return result
+
+    @staticmethod
+    def band_hashes(signatures: np.ndarray, bands: int) -> np.ndarray:
+        """
+        32-bit hash per band of each signature row, shape (n, bands).
+
+        A vectorized alternative to band_keys() for bulk indexing; equal
+        bands of equal signatures always hash equal.
+        """
+        signatures = np.atleast_2d(signatures).astype(np.uint64)
+        rows = signatures.shape[1] // bands
+        h = np.tile(np.arange(bands, dtype=np.uint64) + np.uint64(0xcbf29ce484222325),
+                    (len(signatures), 1))
+        for r in range(rows):
+            # FNV-1a style mixing, wrapping at 2^64
+            h = (h ^ signatures[:, r::rows][:, :bands]) * np.uint64(0x100000001b3)
+        return (h >> np.uint64(32)).astype(np.uint32)
+
+    def band_keys(self, signature: np.ndarray, bands: int) -> List[str]:
+        """One hex key per band, prefixed with the band number."""
+        rows = self.num_perm // bands
+        return [
+            f"{i}:" + hashlib.blake2b(
+                signature[i * rows:(i + 1) * rows].astype('<u4').tobytes(), digest_size=8
+            ).hexdigest()
+            for i in range(bands)
+        ]
@@ -8,10 +8,18 @@ Advanced claim extraction using spaCy for:
 - Confidence scoring based on hedging/certainty markers
 
 Improves on regex-based extraction with linguistic understanding.
+
+Batches of abstracts go through nlp.pipe; NLPProcessPool runs those batches
+in worker processes (model loaded once per worker) so extraction scales
+with cores and never blocks the event loop.
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
@@ -22,6 +30,11 @@ logger = logging.getLogger(__name__)
 _nlp = None
 _nlp_model = "en_core_web_sm"
 
+# Components claim extraction reads from: sentences, dependencies and
+# noun_chunks (parser), pos_ (tagger/attribute_ruler), lemma_ (lemmatizer),
+# ents (ner). Anything else in the model is disabled.
+CLAIM_PIPES = ('tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner')
+
 
 def get_nlp():
     """Lazy load spaCy model."""
@@ -31,6 +44,9 @@ def get_nlp():
             import spacy
             logger.info(f"Loading spaCy model: {_nlp_model}")
             _nlp = spacy.load(_nlp_model)
+            unused = [name for name in _nlp.pipe_names if name not in CLAIM_PIPES]
+            if unused:
+                _nlp.select_pipes(disable=unused)
             logger.info("spaCy model loaded successfully")
         except OSError:
             logger.warning(f"spaCy model {_nlp_model} not found. Run: python -m spacy download {_nlp_model}")
@@ -217,8 +233,44 @@ class NLPExtractor:
             return []
 
         nlp = get_nlp()
-        doc = nlp(text)
+        return self._claims_from_doc(nlp(text), min_confidence)
+
+    def extract_claims_batch(
+        self,
+        items: List[Tuple[str, str]],
+        min_confidence: float = 0.3,
+        batch_size: int = 32,
+        n_process: int = 1
+    ) -> List[List[ExtractedClaim]]:
+        """
+        Extract claims from many texts with nlp.pipe.
+
+        Args:
+            items: (text, title) pairs
+            min_confidence: Minimum confidence threshold
+            batch_size: Documents per nlp.pipe batch
+            n_process: spaCy worker processes (1 = in this process)
+
+        Returns:
+            One list of ExtractedClaim per item, in input order
+        """
+        results: List[List[ExtractedClaim]] = [[] for _ in items]
+        todo = [i for i, (text, _) in enumerate(items) if text and len(text.strip()) >= 20]
+        if not todo:
+            return results
 
+        nlp = get_nlp()
+        docs = nlp.pipe(
+            (items[i][0] for i in todo),
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        for i, doc in zip(todo, docs):
+            results[i] = self._claims_from_doc(doc, min_confidence)
+        return results
+
+    def _claims_from_doc(self, doc, min_confidence: float) -> List[ExtractedClaim]:
+        """Extract claims from a parsed document."""
         claims = []
 
         for sent in doc.sents:
@@ -703,6 +755,96 @@ def get_nlp_extractor() -> NLPExtractor:
     return _extractor
 
 
+# =========================================================================
+# PROCESS POOL
+# =========================================================================
+
+def _init_worker(model_name: str):
+    """Process pool initializer: load the model once per worker."""
+    global _extractor
+    _extractor = NLPExtractor(model_name)
+    get_nlp()
+
+
+def _extract_in_worker(
+    items: List[Tuple[str, str]],
+    min_confidence: float,
+    batch_size: int
+) -> List[List[ExtractedClaim]]:
+    return _extractor.extract_claims_batch(items, min_confidence, batch_size)
+
+
+class NLPProcessPool:
+    """
+    Claim extraction in a pool of worker processes.
+
+    Each worker loads the spaCy model once and runs nlp.pipe over the
+    chunk of texts it receives. Workers are spawned (not forked) so they
+    do not inherit the event loop or embedding model threads.
+
+    Usage:
+        pool = NLPProcessPool(processes=4)
+        results = await pool.extract_claims_batch([(abstract, title), ...])
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        model_name: str = "en_core_web_sm",
+        processes: Optional[int] = None,
+        batch_size: int = 32
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            model_name: spaCy model to load in each worker
+            processes: Worker processes (default: CPU count)
+            batch_size: Documents per nlp.pipe batch
+        """
+        self.model_name = model_name
+        self.processes = processes or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(model_name,)
+        )
+
+    async def extract_claims_batch(
+        self,
+        items: List[Tuple[str, str]],
+        min_confidence: float = 0.3
+    ) -> List[List[ExtractedClaim]]:
+        """
+        Extract claims from (text, title) pairs across the workers.
+
+        Returns:
+            One list of ExtractedClaim per item, in input order
+        """
+        if not items:
+            return []
+
+        # Spread the items over the workers, but keep chunks at least one
+        # nlp.pipe batch long so small calls do not fan out needlessly
+        size = max(self.batch_size, -(-len(items) // self.processes))
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(
+                self._executor, _extract_in_worker, chunk, min_confidence, self.batch_size
+            )
+            for chunk in chunks
+        ])
+        return [claims for chunk in results for claims in chunk]
+
+    def close(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 # Convenience functions
 def extract_claims(text: str, title: str = "") -> List[ExtractedClaim]:
     """Extract claims from text using default extractor."""
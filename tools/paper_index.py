@@ -0,0 +1,397 @@
+"""
+CIPHER Paper Index
+
+Persistent cross-run duplicate detection for fetched papers.
+
+Every stored source is indexed under several keys in
+``synthesis.paper_keys`` (see sql/migrations/007_paper_keys.sql):
+
+    id:<external_id>           the source's own identifier
+    doi:<doi>                  normalized DOI
+    arxiv:<id>, pmid:<id>      cross-source identifiers from the metadata
+    title:<hash>               normalized title
+    band:<i>:<hash>            MinHash LSH bands of the title's shingles
+
+A paper is known when an identifier or its title key matches a stored
+source, or when a band matches a stored title whose shingle Jaccard
+similarity is at least ``title_threshold``. That catches the same paper
+fetched from arXiv and PubMed under different IDs, and titles that differ
+only in punctuation or a word.
+
+All keys are also added to an in-memory Bloom filter loaded at startup, so
+a paper never seen before (the common case) is answered without a database
+round trip; only Bloom hits are confirmed against the table. Papers
+admitted during a run are kept in memory until their source row is flushed.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Union
+
+import asyncpg
+import numpy as np
+
+from .minhash import MinHasher, jaccard, normalize_text, shingles
+
+logger = logging.getLogger(__name__)
+
+# A source reference: database ID or pending external_id
+Ref = Union[int, str]
+
+# Titles shorter than this ("Editorial", "Introduction") are not indexed
+MIN_TITLE_LENGTH = 20
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Lowercase DOI without resolver prefix."""
+    if not doi:
+        return None
+    doi = re.sub(r'^(https?://(dx\.)?doi\.org/|doi:)', '', doi.strip().lower())
+    return doi or None
+
+
+@dataclass
+class PaperFingerprint:
+    """Dedup keys of one paper"""
+    external_id: str
+    keys: List[str]                      # Exact-match keys (ids, DOI, title)
+    bands: List[str] = field(default_factory=list)
+    shingles: Set[str] = field(default_factory=set)
+
+    @property
+    def all_keys(self) -> List[str]:
+        return self.keys + self.bands
+
+
+class BloomFilter:
+    """
+    Bit-array Bloom filter with double hashing over BLAKE2b.
+
+    No false negatives; false positives at about ``error_rate`` once
+    ``capacity`` keys have been added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+
+    def add_many(self, keys: Sequence[str]):
+        if not len(keys):
+            return
+        digests = np.frombuffer(b''.join(self._digest(k) for k in keys), dtype='<u8').reshape(-1, 2)
+        h1, h2 = digests[:, :1], digests[:, 1:] | np.uint64(1)
+        steps = np.arange(self.hashes, dtype=np.uint64)
+        positions = ((h1 + steps * h2) % np.uint64(self.size)).ravel()
+        np.bitwise_or.at(
+            self.bits, positions >> np.uint64(3),
+            np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)
+        )
+        self.count += len(keys)
+
+    def __contains__(self, key: str) -> bool:
+        digest = self._digest(key)
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            position = ((h1 + i * h2) & 0xFFFFFFFFFFFFFFFF) % self.size
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class PaperIndex:
+    """
+    Known-paper index: Bloom filter in memory, keys in synthesis.paper_keys.
+
+    Usage:
+        index = PaperIndex()
+        await index.load(pool)
+        new = await index.admit(pool, [paper.to_dict() for paper in papers])
+        ...
+        await index.persist(pool, writer.source_ids)
+    """
+
+    # Keys read per round trip when loading the Bloom filter
+    LOAD_BATCH = 50000
+
+    def __init__(
+        self,
+        title_threshold: float = 0.8,
+        num_perm: int = 32,
+        bands: int = 8,
+        min_capacity: int = 1000000
+    ):
+        """
+        Args:
+            title_threshold: Shingle Jaccard similarity at which two titles
+                are the same paper
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm / bands rows each)
+            min_capacity: Smallest Bloom filter capacity in keys
+        """
+        self.title_threshold = title_threshold
+        self.bands = bands
+        self.min_capacity = min_capacity
+        self.hasher = MinHasher(num_perm)
+        self.bloom = BloomFilter(min_capacity)
+
+        # Papers admitted but not yet persisted (or everything, when the
+        # table is missing): key -> refs, ref -> fingerprint
+        self._memory: Dict[str, Set[Ref]] = defaultdict(set)
+        self._fingerprints: Dict[Ref, PaperFingerprint] = {}
+        self._pending: Dict[str, PaperFingerprint] = {}
+
+        # False when the table is missing (migration not applied)
+        self.persistent = True
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return self.bloom.count
+
+    # =========================================================================
+    # KEYS
+    # =========================================================================
+
+    def fingerprint(self, paper: Dict[str, Any]) -> PaperFingerprint:
+        """Keys of a paper dict (Paper.to_dict() or a synthesis.sources row)."""
+        external_id = paper.get('external_id') or ''
+        metadata = paper.get('metadata') or {}
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+
+        keys = [f"id:{external_id}"] if external_id else []
+        doi = normalize_doi(metadata.get('doi') or paper.get('doi'))
+        if doi:
+            keys.append(f"doi:{doi}")
+        arxiv_id = metadata.get('arxiv_id')
+        if arxiv_id:
+            keys.append(f"arxiv:{re.sub(r'v[0-9]+$', '', arxiv_id.lower())}")
+        if metadata.get('pmid'):
+            keys.append(f"pmid:{metadata['pmid']}")
+
+        fp = PaperFingerprint(external_id, keys)
+        title = normalize_text(paper.get('title') or '')
+        if len(title) >= MIN_TITLE_LENGTH:
+            fp.keys.append("title:" + hashlib.blake2b(title.encode('utf-8'), digest_size=12).hexdigest())
+            fp.shingles = shingles(title)
+            fp.bands = [
+                f"band:{key}"
+                for key in self.hasher.band_keys(self.hasher.signature(fp.shingles), self.bands)
+            ]
+        return fp
+
+    def _remember(self, ref: Ref, fp: PaperFingerprint):
+        self._fingerprints[ref] = fp
+        for key in fp.all_keys:
+            self._memory[key].add(ref)
+
+    def _forget(self, ref: Ref):
+        fp = self._fingerprints.pop(ref, None)
+        if fp is None:
+            return
+        for key in fp.all_keys:
+            refs = self._memory.get(key)
+            if refs is not None:
+                refs.discard(ref)
+                if not refs:
+                    del self._memory[key]
+
+    def _matches(self, fp: PaperFingerprint, key: str, title_shingles: Optional[Set[str]]) -> bool:
+        """Whether a stored key hit means ``fp`` is the same paper."""
+        if not key.startswith('band:'):
+            return True
+        return title_shingles is not None and jaccard(fp.shingles, title_shingles) >= self.title_threshold
+
+    def _known_in_memory(self, fp: PaperFingerprint) -> bool:
+        for key in fp.all_keys:
+            for ref in self._memory.get(key, ()):
+                if self._matches(fp, key, self._fingerprints[ref].shingles):
+                    return True
+        return False
+
+    # =========================================================================
+    # LOOKUP
+    # =========================================================================
+
+    async def admit(self, pool: asyncpg.Pool, papers: Sequence[Dict[str, Any]]) -> List[bool]:
+        """
+        Check papers against the index and stage the new ones.
+
+        Papers are admitted in order, so the second copy of a paper within
+        ``papers`` (or from an earlier call in this run) is rejected too.
+
+        Returns:
+            One flag per paper: True if it is new
+        """
+        fingerprints = [self.fingerprint(p) for p in papers]
+
+        # Only keys the Bloom filter may contain need the database
+        probe = sorted({
+            key for fp in fingerprints for key in fp.all_keys if key in self.bloom
+        }) if self.persistent else []
+        stored: Dict[str, List[Optional[Set[str]]]] = defaultdict(list)
+        if probe:
+            async with pool.acquire() as conn:
+                rows = await conn.fetch('''
+                    SELECT k.key, s.title
+                    FROM synthesis.paper_keys k
+                    JOIN synthesis.sources s ON s.id = k.source_id
+                    WHERE k.key = ANY($1)
+                ''', probe)
+            for row in rows:
+                key = row['key']
+                stored[key].append(shingles(row['title']) if key.startswith('band:') else None)
+
+        admitted = []
+        for fp in fingerprints:
+            known = self._known_in_memory(fp) or any(
+                self._matches(fp, key, title_shingles)
+                for key in fp.all_keys
+                for title_shingles in stored.get(key, ())
+            )
+            if known:
+                self.rejected += 1
+            else:
+                self.stage(fp)
+            admitted.append(not known)
+        return admitted
+
+    def stage(self, paper: Union[PaperFingerprint, Dict[str, Any]]):
+        """Remember a paper that is about to be stored."""
+        fp = paper if isinstance(paper, PaperFingerprint) else self.fingerprint(paper)
+        if not fp.external_id or fp.external_id in self._fingerprints:
+            return
+        self._remember(fp.external_id, fp)
+        self._pending[fp.external_id] = fp
+        self.bloom.add_many(fp.all_keys)
+
+    @property
+    def pending(self) -> List[PaperFingerprint]:
+        """Papers staged but not yet persisted."""
+        return list(self._pending.values())
+
+    def release(self, external_ids: Iterable[str]):
+        """Forget staged papers that will not be stored after all."""
+        for external_id in external_ids:
+            if self._pending.pop(external_id, None) is not None:
+                self._forget(external_id)
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    async def load(self, pool: asyncpg.Pool):
+        """
+        Fill the Bloom filter from synthesis.paper_keys.
+
+        Sources without keys (stored before the table existed, or by code
+        paths that bypass the index) are indexed first. Falls back to an
+        in-memory index over synthesis.sources when the table is missing.
+        """
+        self._memory.clear()
+        self._fingerprints.clear()
+
+        async with pool.acquire() as conn:
+            try:
+                missing = await conn.fetch('''
+                    SELECT s.id, s.external_id, s.title, s.metadata
+                    FROM synthesis.sources s
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM synthesis.paper_keys k WHERE k.source_id = s.id
+                    )
+                ''')
+                self.persistent = True
+            except asyncpg.UndefinedTableError:
+                logger.warning("synthesis.paper_keys missing, keeping the paper index in memory only")
+                self.persistent = False
+                rows = await conn.fetch('SELECT id, external_id, title, metadata FROM synthesis.sources')
+                self.bloom = BloomFilter(max(self.min_capacity, 2 * len(rows) * (self.bands + 4)))
+                for row in rows:
+                    fp = self.fingerprint(dict(row))
+                    self._remember(row['id'], fp)
+                    self.bloom.add_many(fp.all_keys)
+                logger.info(f"Paper index loaded: {len(rows)} sources (memory only)")
+                return
+
+            if missing:
+                await self._insert_keys(conn, [
+                    (row['id'], self.fingerprint(dict(row))) for row in missing
+                ])
+                logger.info(f"Paper index: indexed {len(missing)} sources without keys")
+
+            total = await conn.fetchval('SELECT COUNT(*) FROM synthesis.paper_keys')
+            self.bloom = BloomFilter(max(self.min_capacity, 2 * total))
+            async with conn.transaction():
+                batch = []
+                async for record in conn.cursor(
+                    'SELECT key FROM synthesis.paper_keys', prefetch=self.LOAD_BATCH
+                ):
+                    batch.append(record['key'])
+                    if len(batch) >= self.LOAD_BATCH:
+                        self.bloom.add_many(batch)
+                        batch = []
+                self.bloom.add_many(batch)
+
+        # Papers staged before the reload are still pending
+        for external_id, fp in self._pending.items():
+            self._remember(external_id, fp)
+            self.bloom.add_many(fp.all_keys)
+
+        logger.info(f"Paper index loaded: {self.bloom.count} keys")
+
+    async def persist(self, pool: asyncpg.Pool, source_ids: Dict[str, int]):
+        """
+        Store keys of staged papers whose source row now exists.
+
+        Args:
+            pool: asyncpg pool
+            source_ids: external_id -> synthesis.sources id (BatchWriter.source_ids)
+        """
+        flushed = [
+            (source_ids[external_id], fp)
+            for external_id, fp in self._pending.items()
+            if external_id in source_ids
+        ]
+        if not flushed:
+            return
+        if self.persistent:
+            async with pool.acquire() as conn:
+                await self._insert_keys(conn, flushed)
+        for source_id, fp in flushed:
+            del self._pending[fp.external_id]
+            self._forget(fp.external_id)
+            if not self.persistent:
+                self._remember(source_id, fp)
+
+    async def _insert_keys(self, conn, entries: Iterable[tuple]):
+        keys, ids = [], []
+        for source_id, fp in entries:
+            for key in fp.all_keys:
+                keys.append(key)
+                ids.append(source_id)
+        await conn.execute('''
+            INSERT INTO synthesis.paper_keys (key, source_id)
+            SELECT * FROM unnest($1::text[], $2::int[])
+            ON CONFLICT DO NOTHING
+        ''', keys, ids)
+
+    def stats(self) -> Dict[str, int]:
+        """Bloom filter size, pending papers and rejections this process."""
+        return {
+            'keys': self.bloom.count,
+            'bloom_bytes': int(self.bloom.bits.nbytes),
+            'pending': len(self._pending),
+            'rejected': self.rejected,
+        }
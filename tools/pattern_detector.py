@@ -20,9 +20,14 @@ import json
 import math
 
 import asyncpg
+import numpy as np
 
 from .cipher_brain import Domain, Claim, Connection, Pattern, STOPWORDS
 from .hash_learning import HashLearning
+from .pgvector_codec import create_pool
+from .batch_writer import BatchWriter
+from .domain_mask import domain_mask, mask_domain_ids, shares_domain
+from .claim_lsh import ClaimLSH
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +58,90 @@ class CrossDomainInsight:
     supporting_claims: List[int]
 
 
+# Verbs/relations compared by _detect_structural_analogies (see _pattern_bits)
+PATTERN_WORDS = ('increase', 'decrease', 'cause', 'correlate', 'predict',
+                 'affect', 'influence', 'lead', 'result', 'produce',
+                 'enhance', 'reduce', 'modulate', 'regulate')
+
+_PATTERN_WORD_SET = frozenset(PATTERN_WORDS)
+
+# Words ignored when matching hypotheses to findings
+GAP_STOPWORDS = frozenset({'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be',
+                           'to', 'of', 'and', 'in', 'that', 'this', 'for', 'with'})
+
+
+def relation_words(text: str) -> Set[str]:
+    """PATTERN_WORDS in a text (shingles of the 'relations' LSH index)."""
+    return set(text.lower().split()) & _PATTERN_WORD_SET
+
+
+def meaningful_words(text: str) -> Set[str]:
+    """Words of a text minus GAP_STOPWORDS (shingles of the 'words' LSH index)."""
+    return set(text.lower().split()) - GAP_STOPWORDS
+
+
+def mask_domains(mask: int) -> List[Domain]:
+    """Domains in a bitmask, lowest id first."""
+    return [Domain(d) for d in mask_domain_ids(mask)]
+
+
+@dataclass
+class ClaimTable:
+    """
+    Columnar in-memory copy of synthesis.claims for pattern detection.
+
+    Row i of every array describes the same claim. Claim texts are one
+    UTF-8 blob with start offsets; entities are interned and stored as
+    postings (rows per entity) in CSR form. The table is read-only once
+    built, so detection strategies can share it from several threads.
+    """
+    ids: np.ndarray                  # int64 claim ids, ascending
+    masks: np.ndarray                # int16 domain bitmasks (see domain_mask.py)
+    confidence: np.ndarray           # float32
+    types: np.ndarray                # int16 codes into type_names
+    type_names: List[str]
+    text_blob: bytes                 # Claim texts, each followed by b'\n'
+    text_lower: bytes                # text_blob.lower(); same offsets
+    text_starts: np.ndarray          # int64 byte offset of each text, plus the end
+    entity_names: List[str]          # Interned, normalized entities
+    entity_offsets: np.ndarray       # int64; postings of entity e are
+    entity_rows: np.ndarray          # entity_rows[entity_offsets[e]:entity_offsets[e + 1]]
+    hypotheses: List[Tuple[int, str, int]] = field(default_factory=list)  # (id, text, mask)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def text(self, row: int) -> str:
+        return self.text_blob[self.text_starts[row]:self.text_starts[row + 1] - 1].decode('utf-8')
+
+    def type_code(self, name: str) -> int:
+        return self.type_names.index(name) if name in self.type_names else -1
+
+    def rows_of(self, claim_ids: np.ndarray) -> np.ndarray:
+        """Rows of the given claim ids, skipping ids not in the table."""
+        if not len(self.ids):
+            return np.empty(0, dtype=np.int64)
+        rows = np.minimum(np.searchsorted(self.ids, claim_ids), len(self.ids) - 1)
+        return rows[self.ids[rows] == claim_ids]
+
+    def entity_postings(self, e: int) -> np.ndarray:
+        return self.entity_rows[self.entity_offsets[e]:self.entity_offsets[e + 1]]
+
+    def rows_containing(self, term: str) -> np.ndarray:
+        """Rows whose text contains ``term`` (ASCII case-insensitive), ascending."""
+        needle = term.lower().encode('utf-8')
+        haystack = self.text_lower
+        positions = []
+        pos = haystack.find(needle)
+        while pos != -1:
+            positions.append(pos)
+            pos = haystack.find(needle, pos + 1)
+        if not positions:
+            return np.empty(0, dtype=np.int64)
+        rows = np.searchsorted(self.text_starts, np.array(positions), side='right') - 1
+        return np.unique(rows)
+
+
 class PatternDetector:
     """
     Detects patterns and connections across the 6 domains.
@@ -76,9 +165,15 @@ class PatternDetector:
         self.pool: Optional[asyncpg.Pool] = None
         self.hash_learner = HashLearning()
 
-        # Cache for efficiency
-        self._entity_index: Dict[str, List[int]] = {}  # entity -> claim_ids
-        self._domain_claims: Dict[Domain, List[int]] = {}
+        # Columnar claim table, loaded once by _build_indices
+        self.claims: Optional[ClaimTable] = None
+
+        # MinHash LSH indexes over the claim table, persisted across runs.
+        # Analogies need relation-word similarity above 0.5, which 2-row
+        # bands catch almost always; a hypothesis and a finding sharing
+        # three words are far less similar, hence 1-row bands for words.
+        self.relation_lsh = ClaimLSH('relations', relation_words, num_perm=32, bands=16)
+        self.word_lsh = ClaimLSH('words', meaningful_words, num_perm=32, bands=32)
 
         # Cross-domain concept mappings (known bridges)
         self.known_bridges = {
@@ -101,7 +196,7 @@ class PatternDetector:
 
     async def connect(self):
         """Establish database connection."""
-        self.pool = await asyncpg.create_pool(
+        self.pool = await create_pool(
             self.db_url,
             min_size=2,
             max_size=10
@@ -113,62 +208,111 @@ class PatternDetector:
         if self.pool:
             await self.pool.close()
 
+    # Rows read per round trip while building the claim table
+    LOAD_BATCH = 10000
+
     async def _build_indices(self):
-        """Build in-memory indices for fast lookup."""
+        """
+        Load every claim into a columnar ClaimTable.
+
+        One pass over synthesis.claims (plus the open hypotheses) replaces
+        the per-entity and per-strategy queries the detectors used to run.
+        """
+        ids, masks, confidence, types, starts = [], [], [], [], [0]
+        texts: List[bytes] = []
+        type_codes: Dict[str, int] = {}
+        postings: Dict[str, List[int]] = {}
+
         async with self.pool.acquire() as conn:
-            # Index entities to claims
-            rows = await conn.fetch('''
-                SELECT id, entities, domains
-                FROM synthesis.claims
-                WHERE entities IS NOT NULL
+            async with conn.transaction():
+                cursor = conn.cursor('''
+                    SELECT id, claim_text, claim_type, confidence, domains, entities
+                    FROM synthesis.claims
+                    ORDER BY id
+                ''', prefetch=self.LOAD_BATCH)
+                async for row in cursor:
+                    i = len(ids)
+                    ids.append(row['id'])
+                    masks.append(domain_mask(row['domains']))
+                    confidence.append(row['confidence'] or 0.0)
+                    types.append(type_codes.setdefault(row['claim_type'] or '', len(type_codes)))
+                    text = (row['claim_text'] or '').encode('utf-8')
+                    texts.append(text)
+                    starts.append(starts[-1] + len(text) + 1)
+
+                    entities = json.loads(row['entities']) if row['entities'] else []
+                    for entity in {e.lower().strip() for e in entities if isinstance(e, str)}:
+                        # Skip stopwords, short entities, and purely numeric entities
+                        if (entity in STOPWORDS or
+                            len(entity) < 3 or
+                            entity.isdigit()):
+                            continue
+                        postings.setdefault(entity, []).append(i)
+
+            hypotheses = await conn.fetch('''
+                SELECT id, hypothesis_text, domains
+                FROM synthesis.hypotheses
+                WHERE status = 'proposed'
             ''')
 
-            for row in rows:
-                entities = json.loads(row['entities']) if row['entities'] else []
-                domains = [Domain(d) for d in (row['domains'] or [])]
-
-                for entity in entities:
-                    entity_lower = entity.lower().strip()
-                    # Skip stopwords, short entities, and purely numeric entities
-                    if (entity_lower in STOPWORDS or
-                        len(entity_lower) < 3 or
-                        entity_lower.isdigit()):
-                        continue
-                    if entity_lower not in self._entity_index:
-                        self._entity_index[entity_lower] = []
-                    self._entity_index[entity_lower].append(row['id'])
-
-                for domain in domains:
-                    if domain not in self._domain_claims:
-                        self._domain_claims[domain] = []
-                    self._domain_claims[domain].append(row['id'])
-
-        logger.info(f"Built indices: {len(self._entity_index)} entities, "
-                   f"{len(self._domain_claims)} domains")
+        entity_names = list(postings)
+        offsets = np.zeros(len(entity_names) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(postings[e]) for e in entity_names])
+        text_blob = b''.join(text + b'\n' for text in texts)
+        self.claims = ClaimTable(
+            ids=np.array(ids, dtype=np.int64),
+            masks=np.array(masks, dtype=np.int16),
+            confidence=np.array(confidence, dtype=np.float32),
+            types=np.array(types, dtype=np.int16),
+            type_names=list(type_codes),
+            text_blob=text_blob,
+            text_lower=text_blob.lower(),   # bytes.lower() keeps offsets
+            text_starts=np.array(starts, dtype=np.int64),
+            entity_names=entity_names,
+            entity_offsets=offsets,
+            entity_rows=np.fromiter(
+                (r for e in entity_names for r in postings[e]),
+                dtype=np.int64, count=int(offsets[-1])
+            ),
+            hypotheses=[
+                (h['id'], h['hypothesis_text'], domain_mask(h['domains'])) for h in hypotheses
+            ]
+        )
+
+        logger.info(f"Built claim table: {len(self.claims)} claims, "
+                    f"{len(entity_names)} entities, {len(self.claims.hypotheses)} hypotheses")
+
+        # Catch the LSH indexes up with claims added or edited since the last run
+        texts = [self.claims.text(r) for r in range(len(self.claims))]
+        for index in (self.relation_lsh, self.word_lsh):
+            await index.load(self.pool)
+            index.restrict(self.claims.ids)
+            index.update(self.claims.ids, texts)
+            await index.persist(self.pool)
 
     async def detect_all_patterns(self) -> List[CrossDomainInsight]:
         """
         Run all pattern detection strategies.
 
+        The strategies only read the claim table, so they run concurrently
+        in worker threads without further database round trips.
+
         Returns list of cross-domain insights discovered.
         """
-        insights = []
-
-        # Strategy 1: Entity bridging
-        entity_insights = await self._detect_entity_bridges()
-        insights.extend(entity_insights)
-
-        # Strategy 2: Known concept bridges
-        bridge_insights = await self._detect_concept_bridges()
-        insights.extend(bridge_insights)
-
-        # Strategy 3: Structural analogies
-        analogy_insights = await self._detect_structural_analogies()
-        insights.extend(analogy_insights)
-
-        # Strategy 4: Gap analysis
-        gap_insights = await self._detect_knowledge_gaps()
-        insights.extend(gap_insights)
+        if self.claims is None:
+            await self._build_indices()
+
+        results = await asyncio.gather(
+            # Strategy 1: Entity bridging
+            asyncio.to_thread(self._detect_entity_bridges),
+            # Strategy 2: Known concept bridges
+            asyncio.to_thread(self._detect_concept_bridges),
+            # Strategy 3: Structural analogies
+            asyncio.to_thread(self._detect_structural_analogies),
+            # Strategy 4: Gap analysis
+            asyncio.to_thread(self._detect_knowledge_gaps)
+        )
+        insights = [insight for strategy in results for insight in strategy]
 
         # Deduplicate and rank
         unique_insights = self._deduplicate_insights(insights)
@@ -180,7 +324,7 @@ class PatternDetector:
 
         return ranked_insights
 
-    async def _detect_entity_bridges(self) -> List[CrossDomainInsight]:
+    def _detect_entity_bridges(self) -> List[CrossDomainInsight]:
         """
         Find entities that appear in multiple domains.
 
@@ -188,58 +332,38 @@ class PatternDetector:
         in different fields.
         """
         insights = []
+        table = self.claims
 
-        for entity, claim_ids in self._entity_index.items():
-            if len(claim_ids) < 2:
+        for e, entity in enumerate(table.entity_names):
+            rows = table.entity_postings(e)
+            if len(rows) < 2:
                 continue
 
-            # Skip stopwords, short entities, and purely numeric entities
-            entity_lower = entity.lower().strip()
-            if (entity_lower in STOPWORDS or
-                len(entity_lower) < 3 or
-                entity_lower.isdigit() or
-                all(word in STOPWORDS for word in entity_lower.split())):
+            # Skip entities made only of stopwords
+            if all(word in STOPWORDS for word in entity.split()):
                 continue
 
-            # Get domains for these claims
-            async with self.pool.acquire() as conn:
-                rows = await conn.fetch('''
-                    SELECT id, claim_text, domains, confidence
-                    FROM synthesis.claims
-                    WHERE id = ANY($1)
-                ''', claim_ids)
-
-            domains = set()
-            claims_by_domain: Dict[Domain, List[Dict]] = defaultdict(list)
-
-            for row in rows:
-                claim_domains = [Domain(d) for d in (row['domains'] or [])]
-                for domain in claim_domains:
-                    domains.add(domain)
-                    claims_by_domain[domain].append({
-                        'id': row['id'],
-                        'text': row['claim_text'],
-                        'confidence': row['confidence']
-                    })
-
             # Only interested if entity spans 2+ domains
+            masks = table.masks[rows]
+            domains = mask_domains(int(np.bitwise_or.reduce(masks)))
             if len(domains) < 2:
                 continue
 
-            # Create insight for significant bridges
-            domain_list = list(domains)
-            for i, source_domain in enumerate(domain_list):
-                for target_domain in domain_list[i+1:]:
-                    source_claims = claims_by_domain[source_domain]
-                    target_claims = claims_by_domain[target_domain]
+            rows_by_domain = {
+                domain: rows[(masks & domain_mask([domain])) != 0]
+                for domain in domains
+            }
 
-                    if not source_claims or not target_claims:
-                        continue
+            # Create insight for significant bridges
+            for i, source_domain in enumerate(domains):
+                for target_domain in domains[i+1:]:
+                    source_rows = rows_by_domain[source_domain]
+                    target_rows = rows_by_domain[target_domain]
 
                     # Calculate confidence based on claim quality
-                    avg_confidence = (
-                        sum(c['confidence'] for c in source_claims) / len(source_claims) +
-                        sum(c['confidence'] for c in target_claims) / len(target_claims)
+                    avg_confidence = float(
+                        table.confidence[source_rows].mean() +
+                        table.confidence[target_rows].mean()
                     ) / 2
 
                     insights.append(CrossDomainInsight(
@@ -247,8 +371,8 @@ class PatternDetector:
                         description=(
                             f"The concept '{entity}' appears in both {source_domain.name} "
                             f"and {target_domain.name}, suggesting a potential cross-domain connection. "
-                            f"Found {len(source_claims)} claims in {source_domain.name} and "
-                            f"{len(target_claims)} claims in {target_domain.name}."
+                            f"Found {len(source_rows)} claims in {source_domain.name} and "
+                            f"{len(target_rows)} claims in {target_domain.name}."
                         ),
                         source_domain=source_domain,
                         target_domain=target_domain,
@@ -263,51 +387,42 @@ class PatternDetector:
                             f"Is '{entity}' in {source_domain.name} causally related to '{entity}' in {target_domain.name}?",
                             f"Can insights about '{entity}' from {source_domain.name} inform {target_domain.name} research?"
                         ],
-                        supporting_claims=[c['id'] for c in source_claims + target_claims]
+                        supporting_claims=table.ids[np.concatenate([source_rows, target_rows])].tolist()
                     ))
 
         return insights
 
-    async def _detect_concept_bridges(self) -> List[CrossDomainInsight]:
+    def _detect_concept_bridges(self) -> List[CrossDomainInsight]:
         """
         Use known cross-domain concepts to find bridges.
 
         These are concepts known to span multiple fields.
         """
         insights = []
+        table = self.claims
 
         for concept, expected_domains in self.known_bridges.items():
-            # Search for claims mentioning this concept
-            async with self.pool.acquire() as conn:
-                rows = await conn.fetch('''
-                    SELECT id, claim_text, domains, confidence
-                    FROM synthesis.claims
-                    WHERE LOWER(claim_text) LIKE $1
-                    LIMIT 100
-                ''', f'%{concept}%')
+            # Claims mentioning this concept, most confident first
+            rows = table.rows_containing(concept)
+            rows = rows[np.argsort(-table.confidence[rows], kind='stable')][:100]
 
             if len(rows) < 2:
                 continue
 
             # Group by domain
-            found_domains: Dict[Domain, List[Dict]] = defaultdict(list)
-            for row in rows:
-                claim_domains = [Domain(d) for d in (row['domains'] or [])]
-                for domain in claim_domains:
-                    if domain in expected_domains:
-                        found_domains[domain].append({
-                            'id': row['id'],
-                            'text': row['claim_text'],
-                            'confidence': row['confidence']
-                        })
+            found_domains: Dict[Domain, np.ndarray] = {}
+            for domain in expected_domains:
+                in_domain = rows[(table.masks[rows] & domain_mask([domain])) != 0]
+                if len(in_domain):
+                    found_domains[domain] = in_domain
 
             # Create insights for domain pairs
             domains_found = list(found_domains.keys())
             if len(domains_found) >= 2:
                 for i, source in enumerate(domains_found):
                     for target in domains_found[i+1:]:
-                        claims = found_domains[source] + found_domains[target]
-                        avg_confidence = sum(c['confidence'] for c in claims) / len(claims)
+                        claims = np.concatenate([found_domains[source], found_domains[target]])
+                        avg_confidence = float(table.confidence[claims].mean())
 
                         insights.append(CrossDomainInsight(
                             title=f"'{concept.title()}' as bridge between {source.name} and {target.name}",
@@ -329,177 +444,145 @@ class PatternDetector:
                                 f"What distinguishes '{concept}' in {source.name} from {target.name}?",
                                 f"Is there a more fundamental principle underlying '{concept}'?"
                             ],
-                            supporting_claims=[c['id'] for c in claims]
+                            supporting_claims=table.ids[claims].tolist()
                         ))
 
         return insights
 
-    async def _detect_structural_analogies(self) -> List[CrossDomainInsight]:
+    def _detect_structural_analogies(self) -> List[CrossDomainInsight]:
         """
         Find structural analogies between domains.
 
         Look for claims with similar structure but different content.
+        Claims are visited most confident first, as before, but over the
+        whole corpus: partners come from the relation-word LSH index
+        instead of comparing every pair, and are confirmed with the exact
+        pattern-word similarity.
         """
         insights = []
+        table = self.claims
 
-        # Get claims with high confidence
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch('''
-                SELECT id, claim_text, claim_type, domains, entities, confidence
-                FROM synthesis.claims
-                WHERE confidence >= 0.6
-                ORDER BY confidence DESC
-                LIMIT 500
-            ''')
-
-        # Group by claim type
-        by_type: Dict[str, List[Dict]] = defaultdict(list)
-        for row in rows:
-            by_type[row['claim_type']].append({
-                'id': row['id'],
-                'text': row['claim_text'],
-                'domains': [Domain(d) for d in (row['domains'] or [])],
-                'entities': json.loads(row['entities']) if row['entities'] else [],
-                'confidence': row['confidence']
-            })
-
-        # Look for analogies within same claim type
-        for claim_type, claims in by_type.items():
-            if claim_type != 'finding':  # Focus on findings for now
+        # High-confidence findings with a domain, most confident first
+        rows = np.flatnonzero(
+            (table.confidence >= 0.6) &
+            (table.types == table.type_code('finding')) &
+            (table.masks != 0)
+        )
+        rows = rows[np.argsort(-table.confidence[rows], kind='stable')]
+        if len(rows) < 2:
+            return insights
+
+        rank = np.full(len(table), -1, dtype=np.int64)
+        rank[rows] = np.arange(len(rows))
+        patterns: Dict[int, int] = {}
+        popcount = np.array([bin(p).count('1') for p in range(1 << len(PATTERN_WORDS))])
+
+        def pattern_bits(row: int) -> int:
+            if row not in patterns:
+                patterns[row] = self._pattern_bits(table.text(row))
+            return patterns[row]
+
+        for i, row in enumerate(rows):
+            bits = pattern_bits(row)
+            if not bits:
                 continue
 
-            for i, claim1 in enumerate(claims):
-                for claim2 in claims[i+1:]:
-                    # Different domains?
-                    domains1 = set(claim1['domains'])
-                    domains2 = set(claim2['domains'])
-
-                    if domains1 == domains2 or not domains1 or not domains2:
-                        continue
-
-                    # Check for structural similarity
-                    similarity = self._compute_structural_similarity(
-                        claim1['text'], claim2['text']
-                    )
-
-                    if similarity > 0.5:
-                        insights.append(CrossDomainInsight(
-                            title=f"Structural analogy between {list(domains1)[0].name} and {list(domains2)[0].name}",
-                            description=(
-                                f"Found structurally similar claims across domains:\n"
-                                f"- {list(domains1)[0].name}: '{claim1['text'][:100]}...'\n"
-                                f"- {list(domains2)[0].name}: '{claim2['text'][:100]}...'"
-                            ),
-                            source_domain=list(domains1)[0],
-                            target_domain=list(domains2)[0],
-                            mechanism=f"Structural similarity score: {similarity:.2f}",
-                            confidence=(claim1['confidence'] + claim2['confidence']) / 2,
-                            novelty=0.7 + similarity * 0.2,
-                            implications=[
-                                "This structural parallel may indicate a deeper principle",
-                                "Methods from one domain may transfer to the other"
-                            ],
-                            research_questions=[
-                                "What generates this structural similarity?",
-                                "Are there other instances of this pattern?"
-                            ],
-                            supporting_claims=[claim1['id'], claim2['id']]
-                        ))
-
-        return insights[:20]  # Limit to top analogies
-
-    def _compute_structural_similarity(self, text1: str, text2: str) -> float:
-        """
-        Compute structural similarity between two claim texts.
-
-        Uses pattern matching to find similar sentence structures.
-        """
-        # Simple approach: compare word patterns
-        # A more sophisticated version would use parse trees
-
-        # Extract pattern words (verbs, relations)
-        pattern_words = {'increase', 'decrease', 'cause', 'correlate', 'predict',
-                        'affect', 'influence', 'lead', 'result', 'produce',
-                        'enhance', 'reduce', 'modulate', 'regulate'}
-
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-
-        patterns1 = words1 & pattern_words
-        patterns2 = words2 & pattern_words
+            # Later-ranked candidates in different domains, in rank order
+            others = table.rows_of(self.relation_lsh.candidates(int(table.ids[row])))
+            others = others[(rank[others] > i) & (table.masks[others] != table.masks[row])]
+            others = others[np.argsort(rank[others])]
+            if not len(others):
+                continue
 
-        if not patterns1 or not patterns2:
-            return 0.0
+            # Jaccard similarity of pattern words
+            other_bits = np.array([pattern_bits(r) for r in others], dtype=np.int64)
+            similarity = popcount[other_bits & bits] / np.maximum(popcount[other_bits | bits], 1)
+
+            for other, score in zip(others[similarity > 0.5], similarity[similarity > 0.5]):
+                score = float(score)
+                source = mask_domains(int(table.masks[row]))[0]
+                target = mask_domains(int(table.masks[other]))[0]
+                text1, text2 = table.text(row), table.text(other)
+
+                insights.append(CrossDomainInsight(
+                    title=f"Structural analogy between {source.name} and {target.name}",
+                    description=(
+                        f"Found structurally similar claims across domains:\n"
+                        f"- {source.name}: '{text1[:100]}...'\n"
+                        f"- {target.name}: '{text2[:100]}...'"
+                    ),
+                    source_domain=source,
+                    target_domain=target,
+                    mechanism=f"Structural similarity score: {score:.2f}",
+                    confidence=float(table.confidence[row] + table.confidence[other]) / 2,
+                    novelty=0.7 + score * 0.2,
+                    implications=[
+                        "This structural parallel may indicate a deeper principle",
+                        "Methods from one domain may transfer to the other"
+                    ],
+                    research_questions=[
+                        "What generates this structural similarity?",
+                        "Are there other instances of this pattern?"
+                    ],
+                    supporting_claims=[int(table.ids[row]), int(table.ids[other])]
+                ))
+
+                if len(insights) >= 20:  # Limit to top analogies
+                    return insights
 
-        # Jaccard similarity of pattern words
-        intersection = len(patterns1 & patterns2)
-        union = len(patterns1 | patterns2)
+        return insights
 
-        return intersection / union if union > 0 else 0.0
+    @staticmethod
+    def _pattern_bits(text: str) -> int:
+        """Bitmask of the PATTERN_WORDS occurring in a claim text."""
+        words = set(text.lower().split())
+        return sum(1 << k for k, word in enumerate(PATTERN_WORDS) if word in words)
 
-    async def _detect_knowledge_gaps(self) -> List[CrossDomainInsight]:
+    def _detect_knowledge_gaps(self) -> List[CrossDomainInsight]:
         """
         Find knowledge gaps that could be filled by cross-domain transfer.
 
         Looks for:
         - Questions in one domain answered in another
         - Methods in one domain applicable to another's problems
+
+        Every open hypothesis is matched against every high-confidence
+        finding through the word LSH index; candidates are confirmed by
+        shared meaningful words. LSH recall drops for pairs that share
+        only a small fraction of their vocabulary.
         """
         insights = []
+        table = self.claims
 
-        # Get hypotheses (represent open questions)
-        async with self.pool.acquire() as conn:
-            hypotheses = await conn.fetch('''
-                SELECT id, hypothesis_text, domains
-                FROM synthesis.hypotheses
-                WHERE status = 'proposed'
-                LIMIT 100
-            ''')
-
-            # Get high-confidence findings (potential answers)
-            findings = await conn.fetch('''
-                SELECT id, claim_text, domains, entities
-                FROM synthesis.claims
-                WHERE claim_type = 'finding' AND confidence >= 0.7
-                LIMIT 500
-            ''')
-
-        # For each hypothesis, look for relevant findings in OTHER domains
-        for hyp in hypotheses:
-            hyp_domains = set(Domain(d) for d in (hyp['domains'] or []))
-            hyp_text = hyp['hypothesis_text'].lower()
+        # High-confidence findings (potential answers)
+        eligible = (table.types == table.type_code('finding')) & (table.confidence >= 0.7)
 
-            for finding in findings:
-                finding_domains = set(Domain(d) for d in (finding['domains'] or []))
+        # For each hypothesis (open question), look for relevant findings in OTHER domains
+        for hyp_id, hyp_text, hyp_mask in table.hypotheses:
+            hyp_words = meaningful_words(hyp_text)
+            hyp_domains = mask_domains(hyp_mask)
 
+            rows = table.rows_of(self.word_lsh.query(hyp_text))
+            for row in rows[eligible[rows]]:
                 # Only interested in cross-domain
-                if hyp_domains & finding_domains:
+                finding_mask = int(table.masks[row])
+                if shares_domain(hyp_mask, finding_mask):
                     continue
 
-                # Check for conceptual relevance
-                finding_text = finding['claim_text'].lower()
-                entities = json.loads(finding['entities']) if finding['entities'] else []
-
-                # Simple relevance: shared words
-                hyp_words = set(hyp_text.split())
-                finding_words = set(finding_text.split())
-                common_words = hyp_words & finding_words
-
-                # Filter out common stopwords
-                stopwords = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be',
-                            'to', 'of', 'and', 'in', 'that', 'this', 'for', 'with'}
-                common_meaningful = common_words - stopwords
+                # Simple relevance: shared meaningful words
+                common_meaningful = hyp_words & meaningful_words(table.text(row))
 
                 if len(common_meaningful) >= 3:
-                    source = list(finding_domains)[0] if finding_domains else Domain.BIOLOGY
-                    target = list(hyp_domains)[0] if hyp_domains else Domain.BIOLOGY
+                    finding_domains = mask_domains(finding_mask)
+                    source = finding_domains[0] if finding_domains else Domain.BIOLOGY
+                    target = hyp_domains[0] if hyp_domains else Domain.BIOLOGY
 
                     insights.append(CrossDomainInsight(
                         title=f"Potential knowledge transfer: {source.name} -> {target.name}",
                         description=(
                             f"A finding in {source.name} may address a hypothesis in {target.name}:\n"
-                            f"- Hypothesis: '{hyp['hypothesis_text'][:100]}...'\n"
-                            f"- Finding: '{finding['claim_text'][:100]}...'"
+                            f"- Hypothesis: '{hyp_text[:100]}...'\n"
+                            f"- Finding: '{table.text(row)[:100]}...'"
                         ),
                         source_domain=source,
                         target_domain=target,
@@ -514,10 +597,13 @@ class PatternDetector:
                             f"Does the {source.name} finding apply in {target.name} context?",
                             "What modifications are needed for cross-domain transfer?"
                         ],
-                        supporting_claims=[finding['id']]
+                        supporting_claims=[int(table.ids[row])]
                     ))
 
-        return insights[:20]
+                    if len(insights) >= 20:
+                        return insights
+
+        return insights
 
     def _deduplicate_insights(self, insights: List[CrossDomainInsight]) -> List[CrossDomainInsight]:
         """Remove duplicate or highly similar insights."""
@@ -536,26 +622,22 @@ class PatternDetector:
         return unique
 
     async def save_insights(self, insights: List[CrossDomainInsight]):
-        """Save discovered insights to database."""
-        async with self.pool.acquire() as conn:
-            for insight in insights:
-                await conn.execute('''
-                    INSERT INTO synthesis.patterns
-                    (pattern_name, pattern_type, description, domains, claim_ids,
-                     confidence, novelty_score, implications, questions_raised, entropy_hash)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                ''',
-                    insight.title,
-                    'cross_domain',
-                    insight.description,
-                    [insight.source_domain.value, insight.target_domain.value],
-                    insight.supporting_claims,
-                    insight.confidence,
-                    insight.novelty,
-                    '\n'.join(insight.implications),
-                    insight.research_questions,
-                    self.hash_learner.compute_shake256(insight.description)
-                )
+        """Save discovered insights to database in one batch."""
+        writer = BatchWriter(self.pool)
+        for insight in insights:
+            writer.add_pattern(
+                name=insight.title,
+                pattern_type='cross_domain',
+                description=insight.description,
+                domains=[insight.source_domain.value, insight.target_domain.value],
+                claim_ids=insight.supporting_claims,
+                confidence=insight.confidence,
+                novelty_score=insight.novelty,
+                implications='\n'.join(insight.implications),
+                questions_raised=insight.research_questions,
+                entropy_hash=self.hash_learner.compute_shake256(insight.description)
+            )
+        await writer.flush()
 
     async def get_domain_overlap_matrix(self) -> Dict[str, Dict[str, int]]:
         """
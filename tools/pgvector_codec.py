@@ -0,0 +1,86 @@
+"""
+CIPHER pgvector Codec
+
+Binary asyncpg codec for the pgvector ``vector`` type.
+
+Without a codec asyncpg exchanges vectors as text ('[0.1,0.2,...]'), which
+means formatting and parsing every float in Python. The binary wire format
+is a small header followed by big-endian float32s, so vectors decode
+straight into numpy float32 arrays and encode with a single tobytes().
+
+Wire format (pgvector vector_send/vector_recv):
+    int16 dim | int16 unused | float32[dim] (network byte order)
+
+Use ``create_pool`` / ``connect`` from this module instead of the asyncpg
+functions of the same name so every connection gets the codec.
+"""
+
+import logging
+import struct
+from typing import Optional
+
+import asyncpg
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct('>HH')
+_WIRE_DTYPE = np.dtype('>f4')
+
+
+def encode_vector(value) -> bytes:
+    """Encode a sequence/ndarray (or pgvector text literal) to binary."""
+    if isinstance(value, str):
+        arr = np.fromstring(value.strip('[]'), dtype=np.float32, sep=',')
+    else:
+        arr = np.asarray(value, dtype=np.float32)
+    return _HEADER.pack(arr.shape[0], 0) + arr.astype(_WIRE_DTYPE, copy=False).tobytes()
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    """Decode binary vector data into a native float32 array."""
+    dim, _ = _HEADER.unpack_from(data)
+    return np.frombuffer(data, dtype=_WIRE_DTYPE, count=dim, offset=_HEADER.size).astype(np.float32)
+
+
+async def register_vector_codec(conn: asyncpg.Connection):
+    """
+    Register the binary vector codec on a connection.
+
+    Does nothing if the pgvector extension is not installed.
+    """
+    schema = await conn.fetchval('''
+        SELECT n.nspname
+        FROM pg_type t
+        JOIN pg_namespace n ON n.oid = t.typnamespace
+        WHERE t.typname = 'vector'
+        LIMIT 1
+    ''')
+    if schema is None:
+        logger.debug("pgvector not installed, vector codec not registered")
+        return
+
+    await conn.set_type_codec(
+        'vector',
+        schema=schema,
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format='binary'
+    )
+
+
+async def create_pool(dsn: str, init=None, **kwargs) -> asyncpg.Pool:
+    """asyncpg.create_pool with the vector codec registered on every connection."""
+    async def _init(conn):
+        await register_vector_codec(conn)
+        if init is not None:
+            await init(conn)
+
+    return await asyncpg.create_pool(dsn, init=_init, **kwargs)
+
+
+async def connect(dsn: Optional[str] = None, **kwargs) -> asyncpg.Connection:
+    """asyncpg.connect with the vector codec registered."""
+    conn = await asyncpg.connect(dsn, **kwargs)
+    await register_vector_codec(conn)
+    return conn
@@ -23,6 +23,12 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 import asyncpg
+import numpy as np
+
+from .embeddings import get_embedding_service
+from .domain_mask import mask_domain_ids
+from .vector_index import VectorIndex
+from .pgvector_codec import create_pool
 
 logger = logging.getLogger(__name__)
 
@@ -126,7 +132,7 @@ class TemporalTracker:
 
     async def connect(self):
         """Establish database connection."""
-        self.pool = await asyncpg.create_pool(
+        self.pool = await create_pool(
             self.db_url,
             min_size=2,
             max_size=10
@@ -544,66 +550,81 @@ class TemporalTracker:
 
     async def find_supersession_candidates(
         self,
-        similarity_threshold: float = 0.8
+        similarity_threshold: float = 0.8,
+        min_gap_days: int = 30,
+        per_claim: int = 5,
+        since_days: Optional[int] = None,
+        neighbours: int = 50,
+        index: Optional[VectorIndex] = None
     ) -> List[Tuple[int, int, float]]:
         """
         Find claims that might supersede older claims.
 
         Uses semantic similarity to find newer claims that may replace older ones.
+        Each active claim is looked up in the ANN index over claim embeddings
+        for its ``neighbours`` nearest claims sharing a domain; of those, active
+        claims at least ``min_gap_days`` older are kept. Each lookup scans a few
+        index cells instead of the whole corpus, so candidates are approximate.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity
+            min_gap_days: Minimum age gap between the old and the new claim
+            per_claim: Maximum candidates per new claim
+            since_days: Only consider new claims created in the last
+                ``since_days`` days (None = all claims)
+            neighbours: ANN neighbours examined per new claim
+            index: Synced VectorIndex to search (default: load the on-disk
+                index and sync it with the database)
 
         Returns:
             List of (old_claim_id, new_claim_id, similarity) tuples
         """
-        candidates = []
+        if index is None:
+            service = get_embedding_service()
+            index = VectorIndex.load(dimensions=service.dimensions, model_name=service.model_name)
+            await index.sync(self.pool)
+            index.save_if_dirty()
 
         async with self.pool.acquire() as conn:
-            # Find pairs of similar claims where one is significantly newer
             rows = await conn.fetch('''
-                SELECT
-                    c1.id as old_id,
-                    c2.id as new_id,
-                    c1.claim_text as old_text,
-                    c2.claim_text as new_text,
-                    c1.created_at as old_date,
-                    c2.created_at as new_date,
-                    c1.embedding as old_emb,
-                    c2.embedding as new_emb
-                FROM synthesis.claims c1
-                JOIN synthesis.claims c2 ON c1.id < c2.id
-                WHERE c1.embedding IS NOT NULL
-                AND c2.embedding IS NOT NULL
-                AND c2.created_at > c1.created_at + INTERVAL '30 days'
-                AND c1.status != 'superseded'
-                AND (c1.domains && c2.domains)  -- Same domain
-                LIMIT 1000
+                SELECT id, created_at
+                FROM synthesis.claims
+                WHERE embedding IS NOT NULL
+                AND (status IS NULL OR status != 'superseded')
             ''')
 
-            for row in rows:
-                # Calculate similarity
-                if row['old_emb'] and row['new_emb']:
-                    # Parse embeddings
-                    old_emb = row['old_emb']
-                    new_emb = row['new_emb']
-
-                    if isinstance(old_emb, str):
-                        old_vec = [float(x) for x in old_emb.strip('[]').split(',')]
-                        new_vec = [float(x) for x in new_emb.strip('[]').split(',')]
-                    else:
-                        old_vec = list(old_emb)
-                        new_vec = list(new_emb)
-
-                    # Cosine similarity
-                    import numpy as np
-                    old_arr = np.array(old_vec)
-                    new_arr = np.array(new_vec)
-                    similarity = float(np.dot(old_arr, new_arr) / (
-                        np.linalg.norm(old_arr) * np.linalg.norm(new_arr)
-                    ))
-
-                    if similarity >= similarity_threshold:
-                        candidates.append((row['old_id'], row['new_id'], similarity))
-
-        return candidates
+        if len(rows) < 2:
+            return []
+
+        created = {
+            row['id']: row['created_at'].timestamp() if row['created_at'] else 0.0
+            for row in rows
+        }
+        gap = min_gap_days * 86400.0
+        cutoff = (datetime.now() - timedelta(days=since_days)).timestamp() if since_days is not None else None
+
+        def scan() -> List[Tuple[int, int, float]]:
+            candidates = []
+            for row in np.flatnonzero(np.isin(index.ids, list(created))):
+                new_id = int(index.ids[row])
+                mask = int(index.masks[row])
+                if not mask or (cutoff is not None and created[new_id] < cutoff):
+                    continue
+                hits = index.search(
+                    index.vectors[row],
+                    k=neighbours + 1,
+                    threshold=similarity_threshold,
+                    domains=mask_domain_ids(mask)
+                )
+                older = [
+                    (old_id, similarity) for old_id, similarity in hits
+                    if old_id in created and created[new_id] > created[old_id] + gap
+                ]
+                for old_id, similarity in older[:per_claim]:
+                    candidates.append((old_id, new_id, similarity))
+            return candidates
+
+        return await asyncio.to_thread(scan)
 
     async def detect_paradigm_shifts(
         self,
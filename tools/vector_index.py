@@ -0,0 +1,488 @@
+"""
+CIPHER Vector Index
+
+Persistent approximate-nearest-neighbour index over claim embeddings.
+
+IVF-style (inverted file) index backed by numpy:
+- Vectors are L2-normalized float32, so cosine similarity is a dot product
+- Small corpora are searched exactly (one matrix-vector product)
+- Larger corpora are partitioned by k-means into ``nlist`` cells; a query
+  only scans the ``nprobe`` cells closest to it
+- Each vector carries a domain bitmask for cheap pre-filtering
+- The index is saved to disk as a single .npz file and kept in sync with
+  ``synthesis.claims.embedding`` incrementally; claims whose embedding or
+  domains changed are re-added (``vector_version``, see
+  sql/migrations/012_claim_vector_version.sql)
+
+Cross-domain bridge: Math (vector quantization) ↔ Neuro (place cells / sparse coding)
+"""
+
+import logging
+import os
+import json
+from pathlib import Path
+from typing import Optional, List, Tuple, Iterable, Sequence
+
+import asyncpg
+import numpy as np
+
+from config.settings import config
+from .domain_mask import domain_mask
+from .embeddings import normalize_rows
+
+logger = logging.getLogger(__name__)
+
+
+def parse_vector(value) -> Optional[np.ndarray]:
+    """
+    Convert a pgvector value to a float32 array.
+
+    Connections from pgvector_codec already decode to ndarrays; text is
+    only seen on connections without the codec.
+    """
+    if value is None:
+        return None
+    if isinstance(value, np.ndarray):
+        return value.astype(np.float32, copy=False)
+    if isinstance(value, str):
+        return np.fromstring(value.strip('[]'), dtype=np.float32, sep=',')
+    return np.asarray(value, dtype=np.float32)
+
+
+class VectorIndex:
+    """
+    IVF approximate nearest neighbour index for claim embeddings.
+
+    Below ``TRAIN_THRESHOLD`` vectors the index is flat (exact search).
+    Above it, k-means centroids are trained and vectors are bucketed into
+    inverted lists. Centroids are retrained when the corpus grows by
+    ``RETRAIN_GROWTH`` since the last training run.
+    """
+
+    TRAIN_THRESHOLD = 20000
+    RETRAIN_GROWTH = 2.0
+    KMEANS_ITERATIONS = 15
+    KMEANS_SAMPLE = 100000
+    SYNC_BATCH = 5000
+
+    def __init__(
+        self,
+        dimensions: int = 384,
+        model_name: str = "all-MiniLM-L6-v2",
+        path: Optional[Path] = None,
+        nprobe: int = 8,
+        seed: int = 42
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            dimensions: Embedding dimensions
+            model_name: Embedding model the vectors come from
+            path: File the index is persisted to (default: config.paths.index_path)
+            nprobe: Number of inverted lists scanned per query
+            seed: Random seed for k-means initialisation
+        """
+        self.dimensions = dimensions
+        self.model_name = model_name
+        self.path = Path(path) if path else config.paths.index_path
+        self.nprobe = nprobe
+        self.seed = seed
+
+        self.ids = np.empty(0, dtype=np.int64)
+        self.vectors = np.empty((0, dimensions), dtype=np.float32)
+        self.masks = np.empty(0, dtype=np.int64)
+        # synthesis.claims.vector_version each vector was read at (0 = unknown)
+        self.versions = np.empty(0, dtype=np.int64)
+
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments = np.empty(0, dtype=np.int32)
+        self._trained_size = 0
+
+        # Inverted lists, rebuilt lazily from assignments
+        self._list_order: Optional[np.ndarray] = None
+        self._list_offsets: Optional[np.ndarray] = None
+
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    # =========================================================================
+    # MUTATION
+    # =========================================================================
+
+    def add(
+        self,
+        ids: Sequence[int],
+        vectors,
+        domains: Sequence[Iterable[int]] = None,
+        versions: Sequence[int] = None
+    ):
+        """
+        Add (or replace) vectors in the index.
+
+        Args:
+            ids: Claim IDs
+            vectors: Matrix or list of embedding vectors
+            domains: Per-claim domain id lists (optional)
+            versions: Per-claim vector_version (optional)
+        """
+        if len(ids) == 0:
+            return
+
+        ids_arr = np.asarray(ids, dtype=np.int64)
+        mat = normalize_rows(np.array(vectors, dtype=np.float32, ndmin=2))
+        if mat.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Vector dimensions {mat.shape[1]} do not match index ({self.dimensions})"
+            )
+        masks = np.array(
+            [domain_mask(d) for d in (domains or [[]] * len(ids_arr))],
+            dtype=np.int64
+        )
+
+        versions = np.zeros(len(ids_arr), dtype=np.int64) if versions is None else \
+            np.asarray(versions, dtype=np.int64)
+
+        # Replace existing entries for these IDs
+        self.remove(ids_arr)
+
+        self.ids = np.concatenate([self.ids, ids_arr])
+        self.vectors = np.concatenate([self.vectors, mat])
+        self.masks = np.concatenate([self.masks, masks])
+        self.versions = np.concatenate([self.versions, versions])
+
+        if self.is_trained:
+            self.assignments = np.concatenate([self.assignments, self._assign(mat)])
+            self._list_order = None
+
+        self._dirty = True
+        self._maybe_train()
+
+    def remove(self, ids: Sequence[int]):
+        """Remove vectors by claim ID."""
+        if len(self.ids) == 0 or len(ids) == 0:
+            return
+        keep = ~np.isin(self.ids, np.asarray(ids, dtype=np.int64))
+        if keep.all():
+            return
+        self.ids = self.ids[keep]
+        self.vectors = self.vectors[keep]
+        self.masks = self.masks[keep]
+        self.versions = self.versions[keep]
+        if self.is_trained:
+            self.assignments = self.assignments[keep]
+            self._list_order = None
+        self._dirty = True
+
+    # =========================================================================
+    # TRAINING (k-means coarse quantizer)
+    # =========================================================================
+
+    def _maybe_train(self):
+        n = len(self.ids)
+        if n < self.TRAIN_THRESHOLD:
+            return
+        if not self.is_trained or n >= self._trained_size * self.RETRAIN_GROWTH:
+            self.train()
+
+    def train(self, nlist: Optional[int] = None):
+        """
+        Train the coarse quantizer with spherical k-means.
+
+        Args:
+            nlist: Number of inverted lists (default: 4 * sqrt(n))
+        """
+        n = len(self.ids)
+        if n == 0:
+            return
+        nlist = nlist or max(1, min(n, int(4 * np.sqrt(n))))
+        rng = np.random.default_rng(self.seed)
+
+        sample = self.vectors
+        if n > self.KMEANS_SAMPLE:
+            sample = self.vectors[rng.choice(n, self.KMEANS_SAMPLE, replace=False)]
+
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(self.KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=nlist)
+            empty = counts == 0
+            # Re-seed empty cells from random sample points
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = normalize_rows(sums)
+
+        self.centroids = centroids.astype(np.float32)
+        self.assignments = self._assign(self.vectors)
+        self._trained_size = n
+        self._list_order = None
+        self._dirty = True
+        logger.info(f"Vector index trained: {n} vectors, {nlist} lists")
+
+    def _assign(self, mat: np.ndarray) -> np.ndarray:
+        """Assign vectors to their nearest centroid."""
+        out = np.empty(len(mat), dtype=np.int32)
+        # Chunk to keep the (chunk x nlist) score matrix small
+        for start in range(0, len(mat), 8192):
+            chunk = mat[start:start + 8192]
+            out[start:start + len(chunk)] = np.argmax(chunk @ self.centroids.T, axis=1)
+        return out
+
+    def _build_lists(self):
+        order = np.argsort(self.assignments, kind='stable')
+        counts = np.bincount(self.assignments, minlength=len(self.centroids))
+        self._list_order = order
+        self._list_offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    # =========================================================================
+    # SEARCH
+    # =========================================================================
+
+    def _candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """Row indices in the ``nprobe`` inverted lists nearest to query."""
+        if self._list_order is None:
+            self._build_lists()
+        nlist = len(self.centroids)
+        nprobe = min(nprobe, nlist)
+        cell_scores = self.centroids @ query
+        cells = np.argpartition(-cell_scores, nprobe - 1)[:nprobe]
+        offs = self._list_offsets
+        return np.concatenate([self._list_order[offs[c]:offs[c + 1]] for c in cells])
+
+    def search(
+        self,
+        query,
+        k: int = 10,
+        threshold: float = -1.0,
+        domains: Iterable[int] = None,
+        nprobe: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the top-k most similar vectors.
+
+        Args:
+            query: Query embedding
+            k: Number of results
+            threshold: Minimum cosine similarity
+            domains: Only return claims sharing at least one of these domains
+            nprobe: Override number of inverted lists to scan
+
+        Returns:
+            List of (claim_id, similarity) tuples, most similar first
+        """
+        if len(self.ids) == 0 or k <= 0:
+            return []
+
+        q = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return []
+        q = q / norm
+
+        want = domain_mask(domains) if domains else 0
+
+        if self.is_trained:
+            probe = nprobe or self.nprobe
+            while True:
+                rows = self._candidates(q, probe)
+                if want:
+                    rows = rows[(self.masks[rows] & want) != 0]
+                # Widen the probe if the filter left too few candidates
+                if len(rows) >= k or probe >= len(self.centroids):
+                    break
+                probe *= 2
+        else:
+            rows = np.flatnonzero((self.masks & want) != 0) if want else None
+
+        if rows is None:
+            scores = self.vectors @ q
+            row_ids = None
+        else:
+            if len(rows) == 0:
+                return []
+            scores = self.vectors[rows] @ q
+            row_ids = rows
+
+        top = min(k, len(scores))
+        idx = np.argpartition(-scores, top - 1)[:top]
+        idx = idx[np.argsort(-scores[idx])]
+
+        results = []
+        for i in idx:
+            score = float(scores[i])
+            if score < threshold:
+                break
+            row = row_ids[i] if row_ids is not None else i
+            results.append((int(self.ids[row]), score))
+        return results
+
+    # =========================================================================
+    # DATABASE SYNC
+    # =========================================================================
+
+    async def sync(self, pool) -> int:
+        """
+        Bring the index in line with synthesis.claims.embedding.
+
+        Adds claims whose embedding is not yet indexed, re-adds claims whose
+        ``vector_version`` changed (re-embedded or reclassified) and drops
+        claims that were deleted or lost their embedding. Without migration
+        012 changed claims are not detected.
+
+        Args:
+            pool: asyncpg pool
+
+        Returns:
+            Number of vectors added or replaced
+        """
+        async with pool.acquire() as conn:
+            try:
+                rows = await conn.fetch('''
+                    SELECT id, COALESCE(vector_version, 0) AS version
+                    FROM synthesis.claims
+                    WHERE embedding IS NOT NULL
+                ''')
+                versioned = True
+            except asyncpg.UndefinedColumnError:
+                logger.warning("synthesis.claims.vector_version missing, re-embedded claims are not re-indexed")
+                rows = await conn.fetch('''
+                    SELECT id, 0 AS version
+                    FROM synthesis.claims
+                    WHERE embedding IS NOT NULL
+                ''')
+                versioned = False
+        db_ids = np.fromiter((r['id'] for r in rows), dtype=np.int64, count=len(rows))
+        db_versions = np.fromiter((r['version'] for r in rows), dtype=np.int64, count=len(rows))
+
+        stale = np.setdiff1d(self.ids, db_ids, assume_unique=True)
+        if len(stale):
+            self.remove(stale)
+
+        todo = np.setdiff1d(db_ids, self.ids, assume_unique=True)
+        changed = 0
+        if versioned and len(self.ids):
+            order = np.argsort(self.ids)
+            pos = np.minimum(np.searchsorted(self.ids, db_ids, sorter=order), len(self.ids) - 1)
+            rows_in_index = order[pos]
+            outdated = (self.ids[rows_in_index] == db_ids) & (self.versions[rows_in_index] != db_versions)
+            changed = int(outdated.sum())
+            todo = np.union1d(todo, db_ids[outdated])
+
+        added = 0
+        for start in range(0, len(todo), self.SYNC_BATCH):
+            batch = todo[start:start + self.SYNC_BATCH].tolist()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(f'''
+                    SELECT id, embedding, domains, {'COALESCE(vector_version, 0)' if versioned else '0'} AS version
+                    FROM synthesis.claims
+                    WHERE id = ANY($1) AND embedding IS NOT NULL
+                ''', batch)
+            if not rows:
+                continue
+            self.add(
+                [r['id'] for r in rows],
+                np.stack([parse_vector(r['embedding']) for r in rows]),
+                [r['domains'] or [] for r in rows],
+                [r['version'] for r in rows]
+            )
+            added += len(rows)
+
+        if added or len(stale):
+            logger.info(
+                f"Vector index synced: +{added - changed} / ~{changed} / -{len(stale)} ({len(self)} total)"
+            )
+        return added
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    def save(self, path: Optional[Path] = None):
+        """Write the index to disk atomically."""
+        path = Path(path) if path else self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            'dimensions': self.dimensions,
+            'model_name': self.model_name,
+            'trained_size': self._trained_size,
+        }
+        tmp = path.with_suffix('.tmp.npz')
+        np.savez(
+            tmp,
+            meta=np.array(json.dumps(meta)),
+            ids=self.ids,
+            vectors=self.vectors,
+            masks=self.masks,
+            versions=self.versions,
+            centroids=self.centroids if self.is_trained else np.empty((0, self.dimensions), dtype=np.float32),
+            assignments=self.assignments,
+        )
+        os.replace(tmp, path)
+        self._dirty = False
+        logger.debug(f"Vector index saved to {path} ({len(self)} vectors)")
+
+    def save_if_dirty(self):
+        if self._dirty:
+            self.save()
+
+    @classmethod
+    def load(
+        cls,
+        path: Optional[Path] = None,
+        dimensions: int = 384,
+        model_name: str = "all-MiniLM-L6-v2",
+        **kwargs
+    ) -> 'VectorIndex':
+        """
+        Load an index from disk, or return an empty one.
+
+        An index built with a different model or dimensionality is discarded.
+        """
+        index = cls(dimensions=dimensions, model_name=model_name, path=path, **kwargs)
+        if not index.path.exists():
+            return index
+
+        try:
+            with np.load(index.path) as data:
+                meta = json.loads(str(data['meta']))
+                if meta['model_name'] != model_name or meta['dimensions'] != dimensions:
+                    logger.warning(
+                        f"Vector index at {index.path} built for "
+                        f"{meta['model_name']}/{meta['dimensions']}d, rebuilding"
+                    )
+                    return index
+                index.ids = data['ids']
+                index.vectors = data['vectors']
+                index.masks = data['masks']
+                # Indexes saved before versions were tracked: re-read on sync
+                index.versions = data['versions'] if 'versions' in data else \
+                    np.full(len(index.ids), -1, dtype=np.int64)
+                if len(data['centroids']):
+                    index.centroids = data['centroids']
+                    index.assignments = data['assignments']
+                index._trained_size = meta.get('trained_size', 0)
+        except Exception as e:
+            logger.warning(f"Could not load vector index from {index.path}: {e}")
+            return cls(dimensions=dimensions, model_name=model_name, path=path, **kwargs)
+
+        logger.info(f"Vector index loaded: {len(index)} vectors")
+        return index
+
+    def stats(self) -> dict:
+        return {
+            'vectors': len(self),
+            'dimensions': self.dimensions,
+            'model_name': self.model_name,
+            'trained': self.is_trained,
+            'lists': len(self.centroids) if self.is_trained else 0,
+            'nprobe': self.nprobe,
+            'path': str(self.path),
+        }